@@ -1,11 +1,19 @@
 import logging
+from typing import TYPE_CHECKING
 
 # Keep '*' imports for enhanced development velocity
-from .agent import *
 from .base import *
-from .main import *
-from .parsers import *
-from .providers import *
+from .utils.lazy_imports import lazy_exports
+
+# The agents, app, parsers and providers are only imported once used, so
+# that `import core` does not load every provider SDK and parser library.
+from . import agent, main, parsers, providers  # isort: skip
+
+if TYPE_CHECKING:
+    from .agent import *
+    from .main import *
+    from .parsers import *
+    from .providers import *
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -177,3 +185,12 @@ __all__ = [
     "R2RIngestionProvider",
     "ChunkingStrategy",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        name: f".{package.__name__.rpartition('.')[2]}"
+        for package in (agent, main, parsers, providers)
+        for name in package.__all__
+    },
+)
@@ -1,23 +1,26 @@
 # FIXME: Once the agent is properly type annotated, remove the type: ignore comments
-from .base import (  # type: ignore
-    R2RAgent,
-    R2RStreamingAgent,
-    R2RXMLStreamingAgent,
-)
-from .rag import (  # type: ignore
-    R2RRAGAgent,
-    R2RStreamingRAGAgent,
-    R2RXMLToolsRAGAgent,
-    R2RXMLToolsStreamingRAGAgent,
-)
+from typing import TYPE_CHECKING
 
-# Import the concrete implementations
-from .research import (
-    R2RResearchAgent,
-    R2RStreamingResearchAgent,
-    R2RXMLToolsResearchAgent,
-    R2RXMLToolsStreamingResearchAgent,
-)
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import (  # type: ignore
+        R2RAgent,
+        R2RStreamingAgent,
+        R2RXMLStreamingAgent,
+    )
+    from .rag import (  # type: ignore
+        R2RRAGAgent,
+        R2RStreamingRAGAgent,
+        R2RXMLToolsRAGAgent,
+        R2RXMLToolsStreamingRAGAgent,
+    )
+    from .research import (
+        R2RResearchAgent,
+        R2RStreamingResearchAgent,
+        R2RXMLToolsResearchAgent,
+        R2RXMLToolsStreamingResearchAgent,
+    )
 
 __all__ = [
     # Base
@@ -34,3 +37,20 @@ __all__ = [
     "R2RXMLToolsResearchAgent",
     "R2RXMLToolsStreamingResearchAgent",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "R2RAgent": ".base",
+        "R2RStreamingAgent": ".base",
+        "R2RXMLStreamingAgent": ".base",
+        "R2RRAGAgent": ".rag",
+        "R2RStreamingRAGAgent": ".rag",
+        "R2RXMLToolsRAGAgent": ".rag",
+        "R2RXMLToolsStreamingRAGAgent": ".rag",
+        "R2RResearchAgent": ".research",
+        "R2RStreamingResearchAgent": ".research",
+        "R2RXMLToolsResearchAgent": ".research",
+        "R2RXMLToolsStreamingResearchAgent": ".research",
+    },
+)
@@ -426,12 +426,7 @@ class R2RStreamingAgent(R2RAgent):
                             accumulated_thinking += delta.thinking
 
                             # Emit SSE "thinking" event
-                            async for (
-                                line
-                            ) in SSEFormatter.yield_thinking_event(
-                                delta.thinking
-                            ):
-                                yield line
+                            yield SSEFormatter.thinking_event(delta.thinking)
 
                         # Add this new handler for thinking signatures
                         if hasattr(delta, "thinking_signature"):
@@ -445,10 +440,7 @@ class R2RStreamingAgent(R2RAgent):
                             partial_text_buffer += delta.content
 
                             # (a) Now emit the newly streamed text as a "message" event
-                            async for line in SSEFormatter.yield_message_event(
-                                delta.content
-                            ):
-                                yield line
+                            yield SSEFormatter.message_event(delta.content)
 
                             # (b) Find new citation spans in the accumulated text
                             new_citation_spans = find_new_citation_spans(
@@ -645,10 +637,7 @@ class R2RStreamingAgent(R2RAgent):
                     )
 
                     # Send the summary as a message event
-                    async for line in SSEFormatter.yield_message_event(
-                        summary
-                    ):
-                        yield line
+                    yield SSEFormatter.message_event(summary)
 
                     # Add summary to conversation with citations metadata
                     await self.conversation.add_message(
@@ -879,12 +868,7 @@ class R2RXMLStreamingAgent(R2RStreamingAgent):
                             accumulated_thinking += delta.thinking
 
                             # Emit SSE "thinking" event
-                            async for (
-                                line
-                            ) in SSEFormatter.yield_thinking_event(
-                                delta.thinking
-                            ):
-                                yield line
+                            yield SSEFormatter.thinking_event(delta.thinking)
 
                         # Add this new handler for thinking signatures
                         if hasattr(delta, "thinking_signature"):
@@ -906,19 +890,13 @@ class R2RXMLStreamingAgent(R2RStreamingAgent):
                                 # Emit the first chunk
                                 if self.THOUGHT_OPEN.findall(iteration_buffer):
                                     is_thinking = True
-                                    async for (
-                                        line
-                                    ) in SSEFormatter.yield_thinking_event(
+                                    yield SSEFormatter.thinking_event(
                                         iteration_buffer
-                                    ):
-                                        yield line
+                                    )
                                 else:
-                                    async for (
-                                        line
-                                    ) in SSEFormatter.yield_message_event(
+                                    yield SSEFormatter.message_event(
                                         iteration_buffer
-                                    ):
-                                        yield line
+                                    )
 
                                 # Mark as yielded
                                 yielded_first_event = True
@@ -931,12 +909,9 @@ class R2RXMLStreamingAgent(R2RStreamingAgent):
                                     iteration_buffer
                                 ):
                                     # Emit SSE "thinking" event
-                                    async for (
-                                        line
-                                    ) in SSEFormatter.yield_thinking_event(
+                                    yield SSEFormatter.thinking_event(
                                         delta.content
-                                    ):
-                                        yield line
+                                    )
 
                                     continue
                                 # Done thinking, so emit the last thinking event
@@ -945,12 +920,9 @@ class R2RXMLStreamingAgent(R2RStreamingAgent):
                                     thought_text = delta.content.split(
                                         "</Thought>"
                                     )[0].split("</think>")[0]
-                                    async for (
-                                        line
-                                    ) in SSEFormatter.yield_thinking_event(
+                                    yield SSEFormatter.thinking_event(
                                         thought_text
-                                    ):
-                                        yield line
+                                    )
                                     post_thought_text = delta.content.split(
                                         "</Thought>"
                                     )[-1].split("</think>")[-1]
@@ -1033,20 +1005,12 @@ class R2RXMLStreamingAgent(R2RStreamingAgent):
                                     "</Action>"
                                 )[-1]
                                 if post_action_text:
-                                    async for (
-                                        line
-                                    ) in SSEFormatter.yield_message_event(
+                                    yield SSEFormatter.message_event(
                                         post_action_text
-                                    ):
-                                        yield line
+                                    )
 
                             else:
-                                async for (
-                                    line
-                                ) in SSEFormatter.yield_message_event(
-                                    delta.content
-                                ):
-                                    yield line
+                                yield SSEFormatter.message_event(delta.content)
 
                         elif finish_reason == "stop":
                             break
@@ -1222,10 +1186,7 @@ class R2RXMLStreamingAgent(R2RStreamingAgent):
                     )
 
                     # Send the summary as a message event
-                    async for line in SSEFormatter.yield_message_event(
-                        summary
-                    ):
-                        yield line
+                    yield SSEFormatter.message_event(summary)
 
                     # Add summary to conversation with citations metadata
                     await self.conversation.add_message(
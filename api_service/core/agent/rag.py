@@ -1,6 +1,8 @@
 # type: ignore
+from __future__ import annotations
+
 import logging
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from uuid import UUID
 
 from core.base import (
@@ -15,12 +17,6 @@ from core.base.abstractions import (
 )
 from core.base.agent import Tool
 from core.base.providers import DatabaseProvider
-from core.providers import (
-    AnthropicCompletionProvider,
-    LiteLLMCompletionProvider,
-    OpenAICompletionProvider,
-    R2RCompletionProvider,
-)
 from core.utils import (
     SearchResultsCollector,
     generate_id,
@@ -37,6 +33,14 @@ from .base import (
     R2RXMLToolsAgent,
 )
 
+if TYPE_CHECKING:
+    from core.providers import (
+        AnthropicCompletionProvider,
+        LiteLLMCompletionProvider,
+        OpenAICompletionProvider,
+        R2RCompletionProvider,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -1,21 +1,17 @@
+from __future__ import annotations
+
 import logging
 import os
 import subprocess
 import sys
 import tempfile
 from copy import copy
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from core.base import AppConfig
 from core.base.abstractions import GenerationConfig, Message, SearchSettings
 from core.base.agent import Tool
 from core.base.providers import DatabaseProvider
-from core.providers import (
-    AnthropicCompletionProvider,
-    LiteLLMCompletionProvider,
-    OpenAICompletionProvider,
-    R2RCompletionProvider,
-)
 from core.utils import extract_citations
 
 from ..base.agent.agent import RAGAgentConfig  # type: ignore
@@ -29,6 +25,14 @@ from .rag import (  # type: ignore
     RAGAgentMixin,
 )
 
+if TYPE_CHECKING:
+    from core.providers import (
+        AnthropicCompletionProvider,
+        LiteLLMCompletionProvider,
+        OpenAICompletionProvider,
+        R2RCompletionProvider,
+    )
+
 logger = logging.getLogger(__name__)
 
 
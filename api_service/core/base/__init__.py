@@ -98,6 +98,7 @@ __all__ = [
     "DatabaseProvider",
     "Handler",
     "PostgresConfigurationSettings",
+    "PromotedMetadataKey",
     # Embedding provider
     "EmbeddingConfig",
     "EmbeddingProvider",
@@ -282,6 +282,17 @@ class RAGAgentConfig(AgentConfig):
         "python_executor",
     ]
 
+    # Conversation history sent to the agent each turn. Older turns are
+    # folded into a running summary instead.
+    conversation_history_max_tokens: int = 8_000
+    conversation_history_max_messages: int = 200
+    summarize_conversation_history: bool = True
+
+    # The rendered document-context block of the agent system prompt is
+    # cached per user and collection set. Set the TTL to 0 to disable.
+    document_context_cache_ttl: int = 60
+    document_context_cache_size: int = 1024
+
     @classmethod
     def create(cls: Type["AgentConfig"], **kwargs: Any) -> "AgentConfig":
         base_args = cls.model_fields.keys()
@@ -8,6 +8,7 @@ from .database import (
     Handler,
     LimitSettings,
     PostgresConfigurationSettings,
+    PromotedMetadataKey,
 )
 from .email import EmailConfig, EmailProvider
 from .embedding import EmbeddingConfig, EmbeddingProvider
@@ -44,6 +45,7 @@ __all__ = [
     "DatabaseConfig",
     "LimitSettings",
     "PostgresConfigurationSettings",
+    "PromotedMetadataKey",
     "DatabaseProvider",
     "Handler",
     # Embedding provider
@@ -1,9 +1,21 @@
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Type
 
 from pydantic import BaseModel
 
 
+def litellm_authentication_errors() -> tuple[type[Exception], ...]:
+    """litellm's `AuthenticationError`, for `except` clauses that must not
+    retry on bad credentials.
+
+    Looked up only once a provider has imported litellm (which is slow to
+    import); before that no call can have raised it and this is empty.
+    """
+    litellm = sys.modules.get("litellm")
+    return (litellm.AuthenticationError,) if litellm is not None else ()
+
+
 class InnerConfig(BaseModel, ABC):
     """A base provider configuration class."""
 
@@ -42,6 +54,11 @@ class AppConfig(InnerConfig):
     reasoning_llm: Optional[str] = None
     planning_llm: Optional[str] = None
 
+    # Streaming: deltas are coalesced into one SSE frame per flush interval
+    # or once a frame reaches this size, whichever comes first.
+    sse_flush_interval_ms: float = 30
+    sse_max_frame_bytes: int = 16_384
+
     # File extension to max-size mapping
     # These are examples; adjust sizes as needed.
     max_upload_size_by_type: dict[str, int] = {
@@ -1,6 +1,7 @@
 """Base classes for database providers."""
 
 import logging
+import re
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Sequence, cast
 from uuid import UUID
@@ -37,6 +38,7 @@ class DatabaseConnectionManager(ABC):
         self,
         query: str,
         params: Optional[dict[str, Any] | Sequence[Any]] = None,
+        prepared: bool = False,
     ):
         pass
 
@@ -45,6 +47,7 @@ class DatabaseConnectionManager(ABC):
         self,
         query: str,
         params: Optional[dict[str, Any] | Sequence[Any]] = None,
+        prepared: bool = False,
     ):
         pass
 
@@ -94,6 +97,10 @@ class PostgresConfigurationSettings(BaseModel):
     min_wal_size: Optional[int] = 80
     shared_buffers: Optional[int] = 16384
     statement_cache_size: Optional[int] = 100
+    # "cache" uses asyncpg's statement cache, "pgbouncer" disables it and
+    # prepares hot queries with content-derived names, "off" never prepares.
+    prepared_statement_mode: Optional[str] = "cache"
+    hot_statement_cache_size: Optional[int] = 64
     random_page_cost: Optional[float] = 4
     wal_buffers: Optional[int] = 512
     work_mem: Optional[int] = 4096
@@ -120,6 +127,26 @@ class MaintenanceSettings(BaseModel):
     vacuum_full: bool = False
 
 
+class PromotedMetadataKey(BaseModel):
+    """A chunk metadata key materialized as a typed, indexed column.
+
+    The chunks table gets a generated `meta_<key>` column (B-tree for
+    "text", GIN for "text[]") and metadata filters on the key are compiled
+    against it instead of `metadata->>'<key>'`. Each value listed in
+    `partial_vector_indexes` gets its own HNSW index restricted to rows with
+    that value (e.g. one per access level), which filtered searches on that
+    value can use without losing recall.
+    """
+
+    key: str
+    type: str = "text"
+    partial_vector_indexes: list[str] = []
+
+    @property
+    def column(self) -> str:
+        return f"meta_{self.key}"
+
+
 class DatabaseConfig(ProviderConfig):
     """A base database configuration class."""
 
@@ -159,9 +186,26 @@ class DatabaseConfig(ProviderConfig):
     route_limits: dict[str, LimitSettings] = {}
     user_limits: dict[UUID, LimitSettings] = {}
 
+    # Hot metadata filter keys promoted to indexed chunk columns
+    promoted_metadata_keys: list[PromotedMetadataKey] = []
+
     def validate_config(self) -> None:
         if self.provider not in self.supported_providers:
             raise ValueError(f"Provider '{self.provider}' is not supported.")
+        for promoted in self.promoted_metadata_keys:
+            # Keys are interpolated into DDL and filter SQL as identifiers
+            if not re.fullmatch(r"[a-z_][a-z0-9_]{0,57}", promoted.key):
+                raise ValueError(
+                    f"Invalid promoted metadata key '{promoted.key}'."
+                )
+            if promoted.type not in ("text", "text[]"):
+                raise ValueError(
+                    f"Unsupported type '{promoted.type}' for promoted metadata key '{promoted.key}'."
+                )
+            if promoted.partial_vector_indexes and promoted.type != "text":
+                raise ValueError(
+                    f"Partial vector indexes require a 'text' promoted key, got '{promoted.key}'."
+                )
 
     @property
     def supported_providers(self) -> list[str]:
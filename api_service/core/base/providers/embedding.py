@@ -4,16 +4,14 @@ import random
 import time
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Optional
-
-from litellm import AuthenticationError
+from typing import Any, Awaitable, Callable, Optional
 
 from core.base.abstractions import VectorQuantizationSettings
 
 from ..abstractions import (
     ChunkSearchResult,
 )
-from .base import Provider, ProviderConfig
+from .base import Provider, ProviderConfig, litellm_authentication_errors
 
 logger = logging.getLogger()
 
@@ -24,10 +22,20 @@ class EmbeddingConfig(ProviderConfig):
     base_dimension: int | float
     rerank_model: Optional[str] = None
     rerank_url: Optional[str] = None
+    # Local cross-encoder reranking (`rerank_model = "local/<path>"`)
+    rerank_max_candidates: int = 64
+    rerank_batch_size: int = 32
+    rerank_batch_wait_ms: float = 2.0
+    rerank_max_length: int = 512
+    rerank_cache_size: int = 10_000
     batch_size: int = 1
     prefixes: Optional[dict[str, str]] = None
     add_title_as_prefix: bool = True
     concurrent_request_limit: int = 256
+    # Single-text embedding requests issued concurrently are coalesced into
+    # one batched provider call. Set `coalesce_max_batch_size` to 1 to disable.
+    coalesce_max_batch_size: int = 64
+    coalesce_wait_ms: float = 2.0
     max_retries: int = 3
     initial_backoff: float = 1
     max_backoff: float = 64.0
@@ -44,6 +52,127 @@ class EmbeddingConfig(ProviderConfig):
         return ["litellm", "openai", "ollama"]
 
 
+class EmbeddingRequestCoalescer:
+    """Micro-batches concurrent single-text embedding requests.
+
+    Requests are queued per `(stage, model, kwargs)` key. A worker per key
+    collects texts for up to `wait_ms` (or until `max_batch_size` texts are
+    queued), sends them through `execute` as a single batch, and resolves
+    each caller's future with its own embedding. Identical texts within a
+    batch are embedded once.
+
+    Each batch runs in its own task, so a batch that is slow or retrying
+    does not hold back the ones after it; at most `max_concurrent_batches`
+    are in flight, and while they are all busy new requests keep
+    accumulating into the next batch.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[dict[str, Any]], Awaitable[list[list[float]]]],
+        max_batch_size: int = 64,
+        wait_ms: float = 2.0,
+        max_concurrent_batches: int = 256,
+    ):
+        self.execute = execute
+        self.max_batch_size = max_batch_size
+        self.wait = wait_ms / 1000
+        self.max_concurrent_batches = max_concurrent_batches
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._batches: set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _queue_key(task: dict[str, Any]) -> str:
+        kwargs = task.get("kwargs") or {}
+        return repr((task["stage"], sorted(kwargs.items(), key=str)))
+
+    def _ensure_worker(self, key: str, task: dict[str, Any]) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queues = {}
+            self._workers = {}
+            self._batches = set()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Queue()
+        worker = self._workers.get(key)
+        if worker is None or worker.done():
+            self._workers[key] = loop.create_task(
+                self._batch_loop(queue, task["stage"], task.get("kwargs", {}))
+            )
+        return queue
+
+    async def _batch_loop(
+        self, queue: asyncio.Queue, stage: Any, kwargs: dict[str, Any]
+    ) -> None:
+        # Exits once the queue drains; `_ensure_worker` restarts it on demand.
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore
+        assert semaphore is not None
+        while not queue.empty():
+            await semaphore.acquire()
+            batch = [await queue.get()]
+            deadline = loop.time() + self.wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+
+            task = loop.create_task(self._run_batch(batch, stage, kwargs))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+            task.add_done_callback(lambda _: semaphore.release())
+
+    async def _run_batch(
+        self,
+        batch: list[tuple[str, asyncio.Future]],
+        stage: Any,
+        kwargs: dict[str, Any],
+    ) -> None:
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            embeddings = await self.execute(
+                {"texts": texts, "stage": stage, "kwargs": kwargs}
+            )
+            if len(embeddings) != len(texts):
+                raise ValueError(
+                    f"Expected {len(texts)} embeddings, got {len(embeddings)}."
+                )
+            by_text = dict(zip(texts, embeddings, strict=True))
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(by_text[text])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # A cancelled batch must not leave its callers waiting forever.
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def submit(self, task: dict[str, Any]) -> list[float]:
+        """Embed `task["texts"][0]` as part of the next coalesced batch."""
+        (text,) = task["texts"]
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_worker(self._queue_key(task), task).put_nowait(
+            (text, future)
+        )
+        return await future
+
+
 class EmbeddingProvider(Provider):
     class Step(Enum):
         BASE = 1
@@ -60,6 +189,12 @@ class EmbeddingProvider(Provider):
         self.config: EmbeddingConfig = config
         self.semaphore = asyncio.Semaphore(config.concurrent_request_limit)
         self.current_requests = 0
+        self.coalescer = EmbeddingRequestCoalescer(
+            self._execute_with_backoff_async,
+            max_batch_size=config.coalesce_max_batch_size,
+            wait_ms=config.coalesce_wait_ms,
+            max_concurrent_batches=config.concurrent_request_limit,
+        )
 
     async def _execute_with_backoff_async(self, task: dict[str, Any]):
         retries = 0
@@ -68,7 +203,7 @@ class EmbeddingProvider(Provider):
             try:
                 async with self.semaphore:
                     return await self._execute_task(task)
-            except AuthenticationError:
+            except litellm_authentication_errors():
                 raise
             except Exception as e:
                 logger.warning(
@@ -80,13 +215,21 @@ class EmbeddingProvider(Provider):
                 await asyncio.sleep(random.uniform(0, backoff))
                 backoff = min(backoff * 2, self.config.max_backoff)
 
+    async def _execute_coalesced_async(
+        self, task: dict[str, Any]
+    ) -> list[float]:
+        """Embed the single text in `task`, batching with concurrent callers."""
+        if self.config.coalesce_max_batch_size <= 1:
+            return (await self._execute_with_backoff_async(task))[0]
+        return await self.coalescer.submit(task)
+
     def _execute_with_backoff_sync(self, task: dict[str, Any]):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
             try:
                 return self._execute_task_sync(task)
-            except AuthenticationError:
+            except litellm_authentication_errors():
                 raise
             except Exception as e:
                 logger.warning(
@@ -150,6 +293,12 @@ class EmbeddingProvider(Provider):
         }
         return self._execute_with_backoff_sync(task)
 
+    @property
+    def has_reranker(self) -> bool:
+        """Whether `rerank` reorders results with a rerank model, rather than
+        just truncating them to `limit`."""
+        return bool(self.config.rerank_model)
+
     @abstractmethod
     def rerank(
         self,
@@ -6,15 +6,13 @@ from abc import abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, AsyncGenerator, Generator, Optional
 
-from litellm import AuthenticationError
-
 from core.base.abstractions import (
     GenerationConfig,
     LLMChatCompletion,
     LLMChatCompletionChunk,
 )
 
-from .base import Provider, ProviderConfig
+from .base import Provider, ProviderConfig, litellm_authentication_errors
 
 logger = logging.getLogger()
 
@@ -70,7 +68,7 @@ class CompletionProvider(Provider):
                         raise Exception(
                             f"Request timed out after {self.config.request_timeout} seconds"
                         ) from e
-            except AuthenticationError:
+            except litellm_authentication_errors():
                 raise
             except Exception as e:
                 logger.warning(
@@ -93,7 +91,7 @@ class CompletionProvider(Provider):
                     async for chunk in await self._execute_task(task):
                         yield chunk
                 return  # Successful completion of the stream
-            except AuthenticationError:
+            except litellm_authentication_errors():
                 raise
             except Exception as e:
                 logger.warning(
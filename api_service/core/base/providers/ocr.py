@@ -6,9 +6,7 @@ from abc import abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
-from litellm import AuthenticationError
-
-from .base import Provider, ProviderConfig
+from .base import Provider, ProviderConfig, litellm_authentication_errors
 
 logger = logging.getLogger()
 
@@ -53,7 +51,7 @@ class OCRProvider(Provider):
             try:
                 async with self.semaphore:
                     return await self._execute_task(task)
-            except AuthenticationError:
+            except litellm_authentication_errors():
                 raise
             except Exception as e:
                 logger.warning(
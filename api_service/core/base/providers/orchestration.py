@@ -17,13 +17,20 @@ class OrchestrationConfig(ProviderConfig):
     ingestion_concurrency_limit: int = 16
     graph_search_results_concurrency_limit: int = 8
 
+    # Job queue settings for the `postgres` provider
+    job_workers: int = 4
+    job_max_attempts: int = 3
+    job_lease_seconds: int = 300
+    job_poll_interval: float = 2.0
+    job_retry_backoff_seconds: float = 10.0
+
     def validate_config(self) -> None:
         if self.provider not in self.supported_providers:
             raise ValueError(f"Provider {self.provider} is not supported.")
 
     @property
     def supported_providers(self) -> list[str]:
-        return ["hatchet", "simple"]
+        return ["hatchet", "postgres", "simple"]
 
 
 class OrchestrationProvider(Provider):
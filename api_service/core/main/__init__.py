@@ -1,11 +1,15 @@
-from .abstractions import R2RProviders
-from .api import *
-from .app import *
+from typing import TYPE_CHECKING
 
-# from .app_entry import r2r_app
-from .assembly import *
-from .orchestration import *
-from .services import *
+from core.utils.lazy_imports import lazy_exports
+
+from . import assembly, orchestration, services
+
+if TYPE_CHECKING:
+    from .abstractions import R2RProviders
+    from .app import R2RApp
+    from .assembly import *
+    from .orchestration import *
+    from .services import *
 
 __all__ = [
     # R2R Primary
@@ -23,3 +27,16 @@ __all__ = [
     "RetrievalService",
     "GraphService",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "R2RProviders": ".abstractions",
+        "R2RApp": ".app",
+        **{
+            name: f".{package.__name__.rpartition('.')[2]}"
+            for package in (assembly, orchestration, services)
+            for name in package.__all__
+        },
+    },
+)
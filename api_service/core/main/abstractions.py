@@ -3,29 +3,16 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 
-from core.providers import (
-    AnthropicCompletionProvider,
-    APSchedulerProvider,
-    AsyncSMTPEmailProvider,
-    ClerkAuthProvider,
-    ConsoleMockEmailProvider,
-    HatchetOrchestrationProvider,
-    JwtAuthProvider,
-    LiteLLMCompletionProvider,
-    LiteLLMEmbeddingProvider,
-    MailerSendEmailProvider,
-    MistralOCRProvider,
-    OllamaEmbeddingProvider,
-    OpenAICompletionProvider,
-    OpenAIEmbeddingProvider,
-    PostgresDatabaseProvider,
-    R2RAuthProvider,
-    R2RCompletionProvider,
-    R2RIngestionProvider,
-    SendGridEmailProvider,
-    SimpleOrchestrationProvider,
-    SupabaseAuthProvider,
-    UnstructuredIngestionProvider,
+from core.base import (
+    AuthProvider,
+    CompletionProvider,
+    DatabaseProvider,
+    EmailProvider,
+    EmbeddingProvider,
+    IngestionProvider,
+    OCRProvider,
+    OrchestrationProvider,
+    SchedulerProvider,
 )
 
 if TYPE_CHECKING:
@@ -37,42 +24,89 @@ if TYPE_CHECKING:
     from core.main.services.retrieval_service import (  # type: ignore
         RetrievalService,  # type: ignore
     )
+    from core.providers import (
+        AnthropicCompletionProvider,
+        APSchedulerProvider,
+        AsyncSMTPEmailProvider,
+        ClerkAuthProvider,
+        ConsoleMockEmailProvider,
+        HatchetOrchestrationProvider,
+        JwtAuthProvider,
+        LiteLLMCompletionProvider,
+        LiteLLMEmbeddingProvider,
+        MailerSendEmailProvider,
+        MistralOCRProvider,
+        OllamaEmbeddingProvider,
+        OpenAICompletionProvider,
+        OpenAIEmbeddingProvider,
+        PostgresDatabaseProvider,
+        PostgresOrchestrationProvider,
+        R2RAuthProvider,
+        R2RCompletionProvider,
+        R2RIngestionProvider,
+        SendGridEmailProvider,
+        SimpleOrchestrationProvider,
+        SupabaseAuthProvider,
+        UnstructuredIngestionProvider,
+    )
 
-
-class R2RProviders(BaseModel):
-    auth: (
+    AuthProviders = (
         R2RAuthProvider
         | SupabaseAuthProvider
         | JwtAuthProvider
         | ClerkAuthProvider
     )
-    database: PostgresDatabaseProvider
-    ingestion: R2RIngestionProvider | UnstructuredIngestionProvider
-    email: (
+    DatabaseProviders = PostgresDatabaseProvider
+    IngestionProviders = R2RIngestionProvider | UnstructuredIngestionProvider
+    EmailProviders = (
         AsyncSMTPEmailProvider
         | ConsoleMockEmailProvider
         | SendGridEmailProvider
         | MailerSendEmailProvider
     )
-    embedding: (
+    EmbeddingProviders = (
         LiteLLMEmbeddingProvider
         | OpenAIEmbeddingProvider
         | OllamaEmbeddingProvider
     )
-    completion_embedding: (
-        LiteLLMEmbeddingProvider
-        | OpenAIEmbeddingProvider
-        | OllamaEmbeddingProvider
-    )
-    llm: (
+    CompletionProviders = (
         AnthropicCompletionProvider
         | LiteLLMCompletionProvider
         | OpenAICompletionProvider
         | R2RCompletionProvider
     )
-    ocr: MistralOCRProvider
-    orchestration: HatchetOrchestrationProvider | SimpleOrchestrationProvider
-    scheduler: APSchedulerProvider
+    OCRProviders = MistralOCRProvider
+    OrchestrationProviders = (
+        HatchetOrchestrationProvider
+        | PostgresOrchestrationProvider
+        | SimpleOrchestrationProvider
+    )
+    SchedulerProviders = APSchedulerProvider
+else:
+    # Validated against the base classes at runtime so that building the
+    # model does not import every concrete provider.
+    AuthProviders = AuthProvider
+    DatabaseProviders = DatabaseProvider
+    IngestionProviders = IngestionProvider
+    EmailProviders = EmailProvider
+    EmbeddingProviders = EmbeddingProvider
+    CompletionProviders = CompletionProvider
+    OCRProviders = OCRProvider
+    OrchestrationProviders = OrchestrationProvider
+    SchedulerProviders = SchedulerProvider
+
+
+class R2RProviders(BaseModel):
+    auth: AuthProviders
+    database: DatabaseProviders
+    ingestion: IngestionProviders
+    email: EmailProviders
+    embedding: EmbeddingProviders
+    completion_embedding: EmbeddingProviders
+    llm: CompletionProviders
+    ocr: OCRProviders
+    orchestration: OrchestrationProviders
+    scheduler: SchedulerProviders
 
     class Config:
         arbitrary_types_allowed = True
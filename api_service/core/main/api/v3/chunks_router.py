@@ -1,7 +1,7 @@
 import json
 import logging
 import textwrap
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import Body, Depends, Path, Query
@@ -376,6 +376,14 @@ class ChunksRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="An opaque cursor returned as `next_cursor` by the previous page. When set, `offset` is ignored.",
+            ),
+            total_entries: Literal["exact", "estimated", "none"] = Query(
+                "exact",
+                description="How to compute `total_entries`: an exact count, a planner estimate, or not at all.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedChunksResponse:
             """List chunks with pagination support.
@@ -403,6 +411,8 @@ class ChunksRouter(BaseRouterV3):
                 include_vectors=include_vectors,
                 offset=offset,
                 limit=limit,
+                cursor=cursor,
+                total_entries=total_entries,
             )
 
             # Convert to response format
@@ -419,4 +429,10 @@ class ChunksRouter(BaseRouterV3):
                 for chunk in results["results"]
             ]
 
-            return (chunks, {"total_entries": results["total_entries"]})  # type: ignore
+            return (  # type: ignore
+                chunks,
+                {
+                    "total_entries": results["total_entries"],
+                    "next_cursor": results["next_cursor"],
+                },
+            )
@@ -1,7 +1,7 @@
 import logging
 import textwrap
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import Body, Depends, Path, Query
@@ -338,6 +338,14 @@ class CollectionsRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="An opaque cursor returned as `next_cursor` by the previous page. When set, `offset` is ignored.",
+            ),
+            total_entries: Literal["exact", "estimated", "none"] = Query(
+                "exact",
+                description="How to compute `total_entries`: an exact count, a planner estimate, or not at all.",
+            ),
             owner_only: bool = Query(
                 False,
                 description="If true, only returns collections owned by the user, not all accessible collections.",
@@ -368,6 +376,8 @@ class CollectionsRouter(BaseRouterV3):
                     offset=offset,
                     limit=limit,
                     owner_only=owner_only,
+                    cursor=cursor,
+                    total_entries=total_entries,
                 )
             )
 
@@ -376,7 +386,10 @@ class CollectionsRouter(BaseRouterV3):
                 {
                     "total_entries": collections_overview_response[
                         "total_entries"
-                    ]
+                    ],
+                    "next_cursor": collections_overview_response[
+                        "next_cursor"
+                    ],
                 },
             )
 
@@ -740,6 +753,14 @@ class CollectionsRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="An opaque cursor returned as `next_cursor` by the previous page. When set, `offset` is ignored.",
+            ),
+            total_entries: Literal["exact", "estimated", "none"] = Query(
+                "exact",
+                description="How to compute `total_entries`: an exact count, a planner estimate, or not at all.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedDocumentsResponse:
             """Get all documents in a collection with pagination and sorting
@@ -755,14 +776,19 @@ class CollectionsRouter(BaseRouterV3):
 
             documents_in_collection_response = (
                 await self.services.management.documents_in_collection(
-                    id, offset, limit
+                    id,
+                    offset,
+                    limit,
+                    cursor=cursor,
+                    total_entries=total_entries,
                 )
             )
 
             return documents_in_collection_response["results"], {  # type: ignore
                 "total_entries": documents_in_collection_response[
                     "total_entries"
-                ]
+                ],
+                "next_cursor": documents_in_collection_response["next_cursor"],
             }
 
         @self.router.delete(
@@ -1,6 +1,6 @@
 import logging
 import textwrap
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import Body, Depends, Path, Query
@@ -153,6 +153,14 @@ class ConversationsRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="An opaque cursor returned as `next_cursor` by the previous page. When set, `offset` is ignored.",
+            ),
+            total_entries: Literal["exact", "estimated", "none"] = Query(
+                "exact",
+                description="How to compute `total_entries`: an exact count, a planner estimate, or not at all.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedConversationsResponse:
             """List conversations with pagination and sorting options.
@@ -174,10 +182,13 @@ class ConversationsRouter(BaseRouterV3):
                     limit=limit,
                     conversation_ids=conversation_uuids,
                     user_ids=requesting_user_id,
+                    cursor=cursor,
+                    total_entries=total_entries,
                 )
             )
             return conversations_response["results"], {  # type: ignore
-                "total_entries": conversations_response["total_entries"]
+                "total_entries": conversations_response["total_entries"],
+                "next_cursor": conversations_response["next_cursor"],
             }
 
         @self.router.post(
@@ -4,7 +4,7 @@ import mimetypes
 import textwrap
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from urllib.parse import quote
 from uuid import UUID
 
@@ -974,6 +974,14 @@ class DocumentsRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="An opaque cursor returned as `next_cursor` by the previous page. When set, `offset` is ignored.",
+            ),
+            total_entries: Literal["exact", "estimated", "none"] = Query(
+                "exact",
+                description="How to compute `total_entries`: an exact count, a planner estimate, or not at all.",
+            ),
             include_summary_embeddings: bool = Query(
                 False,
                 description="Specifies whether or not to include embeddings of each document summary.",
@@ -1011,6 +1019,8 @@ class DocumentsRouter(BaseRouterV3):
                     offset=offset,
                     limit=limit,
                     owner_only=owner_only,
+                    cursor=cursor,
+                    total_entries=total_entries,
                 )
             )
             if not include_summary_embeddings:
@@ -1022,7 +1032,8 @@ class DocumentsRouter(BaseRouterV3):
                 {
                     "total_entries": documents_overview_response[
                         "total_entries"
-                    ]
+                    ],
+                    "next_cursor": documents_overview_response["next_cursor"],
                 },
             )
 
@@ -1170,6 +1181,14 @@ class DocumentsRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="An opaque cursor returned as `next_cursor` by the previous page. When set, `offset` is ignored.",
+            ),
+            total_entries: Literal["exact", "estimated", "none"] = Query(
+                "exact",
+                description="How to compute `total_entries`: an exact count, a planner estimate, or not at all.",
+            ),
             include_vectors: Optional[bool] = Query(
                 False,
                 description="Whether to include vector embeddings in the response.",
@@ -1193,6 +1212,8 @@ class DocumentsRouter(BaseRouterV3):
                     offset=offset,
                     limit=limit,
                     include_vectors=include_vectors or False,
+                    cursor=cursor,
+                    total_entries=total_entries,
                 )
             )
 
@@ -1227,7 +1248,10 @@ class DocumentsRouter(BaseRouterV3):
 
             return (  # type: ignore
                 list_document_chunks["results"],
-                {"total_entries": list_document_chunks["total_entries"]},
+                {
+                    "total_entries": list_document_chunks["total_entries"],
+                    "next_cursor": list_document_chunks["next_cursor"],
+                },
             )
 
         @self.router.get(
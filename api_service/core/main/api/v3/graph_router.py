@@ -48,7 +48,7 @@ class GraphRouter(BaseRouterV3):
 
     def _register_workflows(self):
         workflow_messages = {}
-        if self.providers.orchestration.config.provider == "hatchet":
+        if self.providers.orchestration.config.provider != "simple":
             workflow_messages["graph-extraction"] = (
                 "Document extraction task queued successfully."
             )
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Literal, Optional
+from typing import Any, AsyncIterable, Literal, Optional
 from uuid import UUID
 
 from fastapi import Body, Depends
@@ -21,6 +21,7 @@ from core.base.api.models import (
     WrappedRAGResponse,
     WrappedSearchResponse,
 )
+from core.utils import coalesce_sse_events
 
 from ...abstractions import R2RProviders, R2RServices
 from ...config import R2RConfig
@@ -83,6 +84,21 @@ class RetrievalRouter(BaseRouterV3):
         )
         return effective_settings
 
+    def _stream_response(
+        self, events: AsyncIterable[str], compact: bool = False
+    ) -> StreamingResponse:
+        """Stream SSE events, coalescing message and thinking deltas into
+        frames sized by `sse_flush_interval_ms` and `sse_max_frame_bytes`."""
+        return StreamingResponse(
+            coalesce_sse_events(
+                events,
+                flush_interval=self.config.app.sse_flush_interval_ms / 1000,
+                max_frame_bytes=self.config.app.sse_max_frame_bytes,
+                compact=compact,
+            ),
+            media_type="text/event-stream",
+        )
+
     def _setup_routes(self):
         @self.router.post(
             "/retrieval/search",
@@ -236,6 +252,10 @@ class RetrievalRouter(BaseRouterV3):
                 default=False,
                 description="Include web search results provided to the LLM.",
             ),
+            compact_stream: bool = Body(
+                default=False,
+                description='When streaming, send message and thinking deltas as `{"id", "v"}` instead of the full delta object.',
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedRAGResponse:
             """Execute a RAG (Retrieval-Augmented Generation) query.
@@ -277,6 +297,9 @@ class RetrievalRouter(BaseRouterV3):
             - `citation`: Citation metadata when sources are referenced
             - `final_answer`: Complete answer with structured citations
 
+            Consecutive `message` deltas are coalesced into a single event every ~30 ms.
+            Set `compact_stream: true` to receive them as `{"id": ..., "v": ...}`.
+
             **Example Response:**
             ```json
             {
@@ -311,21 +334,7 @@ class RetrievalRouter(BaseRouterV3):
 
             if rag_generation_config.stream:
                 # ========== Streaming path ==========
-                async def stream_generator():
-                    try:
-                        async for chunk in response:
-                            if len(chunk) > 1024:
-                                for i in range(0, len(chunk), 1024):
-                                    yield chunk[i : i + 1024]
-                            else:
-                                yield chunk
-                    except GeneratorExit:
-                        # Clean up if needed, then return
-                        return
-
-                return StreamingResponse(
-                    stream_generator(), media_type="text/event-stream"
-                )  # type: ignore
+                return self._stream_response(response, compact_stream)  # type: ignore
             else:
                 # ========== Non-streaming path ==========
                 return response
@@ -428,6 +437,10 @@ class RetrievalRouter(BaseRouterV3):
                 default=None,
                 description="If true, the system will automatically assign a conversation name if not already specified previously.",
             ),
+            compact_stream: bool = Body(
+                default=False,
+                description='When streaming, send message and thinking deltas as `{"id", "v"}` instead of the full delta object.',
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedAgentResponse:
             """
@@ -534,22 +547,7 @@ class RetrievalRouter(BaseRouterV3):
                 )
 
                 if effective_generation_config.stream:
-
-                    async def stream_generator():
-                        try:
-                            async for chunk in response:
-                                if len(chunk) > 1024:
-                                    for i in range(0, len(chunk), 1024):
-                                        yield chunk[i : i + 1024]
-                                else:
-                                    yield chunk
-                        except GeneratorExit:
-                            # Clean up if needed, then return
-                            return
-
-                    return StreamingResponse(  # type: ignore
-                        stream_generator(), media_type="text/event-stream"
-                    )
+                    return self._stream_response(response, compact_stream)  # type: ignore
                 else:
                     return response
             except Exception as e:
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 
 import psutil
 from fastapi import Depends
+from fastapi.responses import PlainTextResponse
 
 from core.base import R2RException
 from core.base.api.models import (
@@ -12,9 +13,12 @@ from core.base.api.models import (
     WrappedServerStatsResponse,
     WrappedSettingsResponse,
 )
+from core.utils.profiling import stage_metrics
+from core.utils.shared_cache import get_shared_cache
 
 from ...abstractions import R2RProviders, R2RServices
 from ...config import R2RConfig
+from ...warmup import is_ready
 from .base_router import BaseRouterV3
 
 
@@ -74,6 +78,30 @@ class SystemRouter(BaseRouterV3):
         async def health_check() -> WrappedGenericMessageResponse:
             return GenericMessageResponse(message="ok")  # type: ignore
 
+        @self.router.get(
+            "/health/ready",
+            openapi_extra={
+                "x-codeSamples": [
+                    {
+                        "lang": "cURL",
+                        "source": textwrap.dedent("""
+                            curl -X GET "https://api.example.com/v3/health/ready"
+                            """),
+                    },
+                ]
+            },
+        )
+        @self.base_endpoint
+        async def readiness_check() -> WrappedGenericMessageResponse:
+            """Readiness probe: succeeds only once this worker process is
+            warm and, when configured, the shared cache is reachable."""
+            if not is_ready():
+                raise R2RException("The server is still warming up.", 503)
+            shared_cache = get_shared_cache()
+            if shared_cache is not None and not await shared_cache.ping():
+                raise R2RException("The shared cache is unreachable.", 503)
+            return GenericMessageResponse(message="ready")  # type: ignore
+
         @self.router.get(
             "/system/settings",
             dependencies=[Depends(self.rate_limit_dependency)],
@@ -184,3 +212,33 @@ class SystemRouter(BaseRouterV3):
                 "cpu_usage": psutil.cpu_percent(),
                 "memory_usage": psutil.virtual_memory().percent,
             }
+
+        @self.router.get(
+            "/system/metrics",
+            response_class=PlainTextResponse,
+            openapi_extra={
+                "x-codeSamples": [
+                    {
+                        "lang": "cURL",
+                        "source": textwrap.dedent("""
+                            curl -X GET "https://api.example.com/v3/system/metrics" \\
+                                 -H "Authorization: Bearer YOUR_API_KEY"
+                            """),
+                    },
+                ]
+            },
+        )
+        async def metrics(
+            auth_user=Depends(self.providers.auth.auth_wrapper()),
+        ) -> PlainTextResponse:
+            """Per-stage retrieval latency histograms in the Prometheus text
+            exposition format."""
+            if not auth_user.is_superuser:
+                raise R2RException(
+                    "Only a superuser can call the `system/metrics` endpoint.",
+                    403,
+                )
+            return PlainTextResponse(
+                stage_metrics.render(),
+                media_type="text/plain; version=0.0.4",
+            )
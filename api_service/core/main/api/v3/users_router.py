@@ -2,7 +2,7 @@ import logging
 import os
 import textwrap
 import urllib.parse
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 import requests
@@ -758,6 +758,14 @@ class UsersRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="An opaque cursor returned as `next_cursor` by the previous page. When set, `offset` is ignored.",
+            ),
+            total_entries: Literal["exact", "estimated", "none"] = Query(
+                "exact",
+                description="How to compute `total_entries`: an exact count, a planner estimate, or not at all.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedUsersResponse:
             """List all users with pagination and filtering options.
@@ -775,11 +783,16 @@ class UsersRouter(BaseRouterV3):
 
             users_overview_response = (
                 await self.services.management.users_overview(
-                    user_ids=user_uuids, offset=offset, limit=limit
+                    user_ids=user_uuids,
+                    offset=offset,
+                    limit=limit,
+                    cursor=cursor,
+                    total_entries=total_entries,
                 )
             )
             return users_overview_response["results"], {  # type: ignore
-                "total_entries": users_overview_response["total_entries"]
+                "total_entries": users_overview_response["total_entries"],
+                "next_cursor": users_overview_response["next_cursor"],
             }
 
         @self.router.get(
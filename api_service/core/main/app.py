@@ -1,13 +1,13 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 
 from core.base import R2RException
-from core.providers import (
-    HatchetOrchestrationProvider,
-    SimpleOrchestrationProvider,
-)
 from core.utils.sentry import init_sentry
 
 from .abstractions import R2RServices
@@ -23,6 +23,12 @@ from .api.v3.system_router import SystemRouter
 from .api.v3.users_router import UsersRouter
 from .config import R2RConfig
 
+if TYPE_CHECKING:
+    from core.providers import (
+        HatchetOrchestrationProvider,
+        SimpleOrchestrationProvider,
+    )
+
 
 class R2RApp:
     def __init__(
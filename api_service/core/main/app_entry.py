@@ -11,7 +11,8 @@ from fastapi.responses import JSONResponse
 from core.base import R2RException
 from core.utils.logging_config import configure_logging
 
-from .assembly import R2RBuilder, R2RConfig
+from .assembly import R2RBuilder
+from .warmup import mark_not_ready, mark_ready, warm_process
 
 log_file = configure_logging()
 
@@ -40,9 +41,11 @@ async def lifespan(app: FastAPI):
     # Start the Hatchet worker
     await r2r_app.orchestration_provider.start_worker()
 
+    mark_ready()
     yield
 
     # # Shutdown
+    mark_not_ready()
     scheduler.shutdown()
 
 
@@ -50,7 +53,9 @@ async def create_r2r_app(
     config_name: Optional[str] = "default",
     config_path: Optional[str] = None,
 ):
-    config = R2RConfig.load(config_name=config_name, config_path=config_path)
+    # Already done in the gunicorn master when serving with pre-forked
+    # workers (see `core.main.gunicorn_conf`).
+    config = warm_process(config_name=config_name, config_path=config_path)
 
     if (
         config.embedding.provider == "openai"
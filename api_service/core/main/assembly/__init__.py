@@ -1,6 +1,12 @@
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
 from ..config import R2RConfig
-from .builder import R2RBuilder
-from .factory import R2RProviderFactory
+
+if TYPE_CHECKING:
+    from .builder import R2RBuilder
+    from .factory import R2RProviderFactory
 
 __all__ = [
     # Builder
@@ -10,3 +16,11 @@ __all__ = [
     # Factory
     "R2RProviderFactory",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "R2RBuilder": ".builder",
+        "R2RProviderFactory": ".factory",
+    },
+)
@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import logging
 import math
 import os
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from core.base import (
     AuthConfig,
@@ -17,47 +19,117 @@ from core.base import (
     OrchestrationConfig,
     SchedulerConfig,
 )
-from core.providers import (
-    AnthropicCompletionProvider,
-    APSchedulerProvider,
-    AsyncSMTPEmailProvider,
-    BcryptCryptoConfig,
-    BCryptCryptoProvider,
-    ClerkAuthProvider,
-    ConsoleMockEmailProvider,
-    HatchetOrchestrationProvider,
-    JwtAuthProvider,
-    LiteLLMCompletionProvider,
-    LiteLLMEmbeddingProvider,
-    MailerSendEmailProvider,
-    MistralOCRProvider,
-    NaClCryptoConfig,
-    NaClCryptoProvider,
-    OllamaEmbeddingProvider,
-    OpenAICompletionProvider,
-    OpenAIEmbeddingProvider,
-    PostgresDatabaseProvider,
-    R2RAuthProvider,
-    R2RCompletionProvider,
-    R2RIngestionConfig,
-    R2RIngestionProvider,
-    SendGridEmailProvider,
-    SimpleOrchestrationProvider,
-    SupabaseAuthProvider,
-    UnstructuredIngestionConfig,
-    UnstructuredIngestionProvider,
-)
 
 from ..abstractions import R2RProviders
 from ..config import R2RConfig
 
+if TYPE_CHECKING:
+    from core.providers import (
+        AnthropicCompletionProvider,
+        APSchedulerProvider,
+        AsyncSMTPEmailProvider,
+        BCryptCryptoProvider,
+        ClerkAuthProvider,
+        ConsoleMockEmailProvider,
+        HatchetOrchestrationProvider,
+        JwtAuthProvider,
+        LiteLLMCompletionProvider,
+        LiteLLMEmbeddingProvider,
+        MailerSendEmailProvider,
+        MistralOCRProvider,
+        NaClCryptoProvider,
+        OllamaEmbeddingProvider,
+        OpenAICompletionProvider,
+        OpenAIEmbeddingProvider,
+        PostgresDatabaseProvider,
+        PostgresOrchestrationProvider,
+        R2RAuthProvider,
+        R2RCompletionProvider,
+        R2RIngestionProvider,
+        SendGridEmailProvider,
+        SimpleOrchestrationProvider,
+        SupabaseAuthProvider,
+        UnstructuredIngestionProvider,
+    )
+
 logger = logging.getLogger()
 
 
 class R2RProviderFactory:
+    # The `core.providers` class for each config section and `provider`
+    # value. Provider modules are imported only once selected, so a
+    # deployment never loads the SDKs of providers it does not use.
+    PROVIDER_CLASSES: dict[str, dict[str, str]] = {
+        "auth": {
+            "r2r": "R2RAuthProvider",
+            "supabase": "SupabaseAuthProvider",
+            "jwt": "JwtAuthProvider",
+            "clerk": "ClerkAuthProvider",
+        },
+        "crypto": {
+            "bcrypt": "BCryptCryptoProvider",
+            "nacl": "NaClCryptoProvider",
+        },
+        "database": {"postgres": "PostgresDatabaseProvider"},
+        "email": {
+            "smtp": "AsyncSMTPEmailProvider",
+            "console_mock": "ConsoleMockEmailProvider",
+            "sendgrid": "SendGridEmailProvider",
+            "mailersend": "MailerSendEmailProvider",
+        },
+        "embedding": {
+            "openai": "OpenAIEmbeddingProvider",
+            "litellm": "LiteLLMEmbeddingProvider",
+            "ollama": "OllamaEmbeddingProvider",
+        },
+        "completion": {
+            "anthropic": "AnthropicCompletionProvider",
+            "litellm": "LiteLLMCompletionProvider",
+            "openai": "OpenAICompletionProvider",
+            "r2r": "R2RCompletionProvider",
+        },
+        "ingestion": {
+            "r2r": "R2RIngestionProvider",
+            "unstructured_local": "UnstructuredIngestionProvider",
+            "unstructured_api": "UnstructuredIngestionProvider",
+        },
+        "ocr": {"mistral": "MistralOCRProvider"},
+        "orchestration": {
+            "hatchet": "HatchetOrchestrationProvider",
+            "postgres": "PostgresOrchestrationProvider",
+            "simple": "SimpleOrchestrationProvider",
+        },
+        "scheduler": {"apscheduler": "APSchedulerProvider"},
+    }
+
     def __init__(self, config: R2RConfig):
         self.config = config
 
+    @staticmethod
+    def provider_class(section: str, provider: Optional[str]) -> Any:
+        """Import and return the provider class for a config section."""
+        import core.providers
+
+        class_name = R2RProviderFactory.PROVIDER_CLASSES[section].get(
+            provider or ""
+        )
+        if class_name is None:
+            raise ValueError(
+                f"{section.capitalize()} provider {provider} not supported."
+            )
+        return getattr(core.providers, class_name)
+
+    @staticmethod
+    def import_providers(config: R2RConfig) -> None:
+        """Import every provider class `config` selects, without creating
+        any provider (e.g. to warm a process before it forks)."""
+        sections = {"completion_embedding": "embedding"}
+        for attr in [*R2RProviderFactory.PROVIDER_CLASSES, *sections]:
+            provider = getattr(config, attr).provider
+            section = sections.get(attr, attr)
+            if provider in R2RProviderFactory.PROVIDER_CLASSES[section]:
+                R2RProviderFactory.provider_class(section, provider)
+
     @staticmethod
     async def create_auth_provider(
         auth_config: AuthConfig,
@@ -77,38 +149,26 @@ class R2RProviderFactory:
         | JwtAuthProvider
         | ClerkAuthProvider
     ):
+        auth_provider = R2RProviderFactory.provider_class(
+            "auth", auth_config.provider
+        )(auth_config, crypto_provider, database_provider, email_provider)
         if auth_config.provider == "r2r":
-            r2r_auth = R2RAuthProvider(
-                auth_config, crypto_provider, database_provider, email_provider
-            )
-            await r2r_auth.initialize()
-            return r2r_auth
-        elif auth_config.provider == "supabase":
-            return SupabaseAuthProvider(
-                auth_config, crypto_provider, database_provider, email_provider
-            )
-        elif auth_config.provider == "jwt":
-            return JwtAuthProvider(
-                auth_config, crypto_provider, database_provider, email_provider
-            )
-        elif auth_config.provider == "clerk":
-            return ClerkAuthProvider(
-                auth_config, crypto_provider, database_provider, email_provider
-            )
-        else:
-            raise ValueError(
-                f"Auth provider {auth_config.provider} not supported."
-            )
+            await auth_provider.initialize()
+        return auth_provider
 
     @staticmethod
     def create_crypto_provider(
         crypto_config: CryptoConfig, *args, **kwargs
     ) -> BCryptCryptoProvider | NaClCryptoProvider:
         if crypto_config.provider == "bcrypt":
+            from core.providers import BcryptCryptoConfig, BCryptCryptoProvider
+
             return BCryptCryptoProvider(
                 BcryptCryptoConfig(**crypto_config.model_dump())
             )
         if crypto_config.provider == "nacl":
+            from core.providers import NaClCryptoConfig, NaClCryptoProvider
+
             return NaClCryptoProvider(
                 NaClCryptoConfig(**crypto_config.model_dump())
             )
@@ -124,10 +184,9 @@ class R2RProviderFactory:
         if isinstance(config, dict):
             config = OCRConfig(**config)
 
-        if config.provider == "mistral":
-            return MistralOCRProvider(config)
-        else:
-            raise ValueError(f"OCR provider {config.provider} not supported")
+        return R2RProviderFactory.provider_class("ocr", config.provider)(
+            config
+        )
 
     @staticmethod
     def create_ingestion_provider(
@@ -152,6 +211,8 @@ class R2RProviderFactory:
         extra_fields = config_dict.pop("extra_fields", {})
 
         if config_dict["provider"] == "r2r":
+            from core.providers import R2RIngestionConfig, R2RIngestionProvider
+
             r2r_ingestion_config = R2RIngestionConfig(
                 **config_dict, **extra_fields
             )
@@ -165,6 +226,11 @@ class R2RProviderFactory:
             "unstructured_local",
             "unstructured_api",
         ]:
+            from core.providers import (
+                UnstructuredIngestionConfig,
+                UnstructuredIngestionProvider,
+            )
+
             unstructured_ingestion_config = UnstructuredIngestionConfig(
                 **config_dict, **extra_fields
             )
@@ -182,12 +248,29 @@ class R2RProviderFactory:
 
     @staticmethod
     def create_orchestration_provider(
-        config: OrchestrationConfig, *args, **kwargs
-    ) -> HatchetOrchestrationProvider | SimpleOrchestrationProvider:
+        config: OrchestrationConfig,
+        database_provider: Optional[PostgresDatabaseProvider] = None,
+        *args,
+        **kwargs,
+    ) -> (
+        HatchetOrchestrationProvider
+        | PostgresOrchestrationProvider
+        | SimpleOrchestrationProvider
+    ):
         if config.provider == "hatchet":
+            from core.providers import HatchetOrchestrationProvider
+
             orchestration_provider = HatchetOrchestrationProvider(config)
             orchestration_provider.get_worker("r2r-worker")
             return orchestration_provider
+        elif config.provider == "postgres":
+            if database_provider is None:
+                raise ValueError(
+                    "The postgres orchestration provider requires a database provider."
+                )
+            from core.providers import PostgresOrchestrationProvider
+
+            return PostgresOrchestrationProvider(config, database_provider)
         elif config.provider == "simple":
             from core.providers import SimpleOrchestrationProvider
 
@@ -214,6 +297,8 @@ class R2RProviderFactory:
             self.config.embedding.quantization_settings.quantization_type
         )
         if db_config.provider == "postgres":
+            from core.providers import PostgresDatabaseProvider
+
             database_provider = PostgresDatabaseProvider(
                 db_config,
                 dimension,
@@ -272,21 +357,14 @@ class R2RProviderFactory:
         | OpenAICompletionProvider
         | R2RCompletionProvider
     ):
-        llm_provider: Optional[CompletionProvider] = None
-        if llm_config.provider == "anthropic":
-            llm_provider = AnthropicCompletionProvider(llm_config)
-        elif llm_config.provider == "litellm":
-            llm_provider = LiteLLMCompletionProvider(llm_config)
-        elif llm_config.provider == "openai":
-            llm_provider = OpenAICompletionProvider(llm_config)
-        elif llm_config.provider == "r2r":
-            llm_provider = R2RCompletionProvider(llm_config)
-        else:
+        completion_classes = R2RProviderFactory.PROVIDER_CLASSES["completion"]
+        if llm_config.provider not in completion_classes:
             raise ValueError(
                 f"Language model provider {llm_config.provider} not supported"
             )
-        if not llm_provider:
-            raise ValueError("Language model provider not found")
+        llm_provider: CompletionProvider = R2RProviderFactory.provider_class(
+            "completion", llm_config.provider
+        )(llm_config)
         return llm_provider
 
     @staticmethod
@@ -304,30 +382,18 @@ class R2RProviderFactory:
                 "No email configuration provided for email provider, please add `[email]` to your `r2r.toml`."
             )
 
-        if email_config.provider == "smtp":
-            return AsyncSMTPEmailProvider(email_config)
-        elif email_config.provider == "console_mock":
-            return ConsoleMockEmailProvider(email_config)
-        elif email_config.provider == "sendgrid":
-            return SendGridEmailProvider(email_config)
-        elif email_config.provider == "mailersend":
-            return MailerSendEmailProvider(email_config)
-        else:
-            raise ValueError(
-                f"Email provider {email_config.provider} not supported."
-            )
+        return R2RProviderFactory.provider_class(
+            "email", email_config.provider
+        )(email_config)
 
     @staticmethod
     async def create_scheduler_provider(
         scheduler_config: SchedulerConfig, *args, **kwargs
     ) -> APSchedulerProvider:
         """Creates a scheduler provider based on configuration."""
-        if scheduler_config.provider == "apscheduler":
-            return APSchedulerProvider(scheduler_config)
-        else:
-            raise ValueError(
-                f"Scheduler provider {scheduler_config.provider} not supported."
-            )
+        return R2RProviderFactory.provider_class(
+            "scheduler", scheduler_config.provider
+        )(scheduler_config)
 
     async def create_providers(
         self,
@@ -444,7 +510,9 @@ class R2RProviderFactory:
 
         orchestration_provider = (
             orchestration_provider_override
-            or self.create_orchestration_provider(self.config.orchestration)
+            or self.create_orchestration_provider(
+                self.config.orchestration, database_provider
+            )
         )
 
         scheduler_provider = (
@@ -0,0 +1,41 @@
+"""Gunicorn settings for serving the API with pre-forked workers.
+
+    gunicorn core.main.app_entry:app -c python:core.main.gunicorn_conf
+
+The app module is preloaded and `warm_process` runs in the master before
+the workers fork, so every worker starts from a warm copy-on-write image
+and only builds its own connections and clients. Each worker answers
+`GET /v3/health/ready` once its app is built.
+
+Configured by the environment:
+
+- `R2R_HOST` / `R2R_PORT`: bind address, as for the single-process server.
+- `R2R_WORKERS`: number of worker processes (default: one per CPU core).
+- `R2R_WORKER_TIMEOUT`: seconds before a silent worker is restarted
+  (default 120).
+"""
+
+import gc
+import os
+
+bind = (
+    f"{os.getenv('R2R_HOST', os.getenv('HOST', '0.0.0.0'))}:"
+    f"{os.getenv('R2R_PORT', '7272')}"
+)
+workers = int(os.getenv("R2R_WORKERS", os.cpu_count() or 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("R2R_WORKER_TIMEOUT", "120"))
+graceful_timeout = 30
+
+
+def on_starting(server):
+    from core.main import app_entry
+    from core.main.warmup import warm_process
+
+    warm_process(
+        config_name=app_entry.config_name, config_path=app_entry.config_path
+    )
+    # Keep the collector from touching (and so copying) the warmed objects
+    # in every worker.
+    gc.freeze()
@@ -1,12 +1,17 @@
 # FIXME: Once the Hatchet workflows are type annotated, remove the type: ignore comments
-from .hatchet.graph_workflow import (  # type: ignore
-    hatchet_graph_search_results_factory,
-)
-from .hatchet.ingestion_workflow import (  # type: ignore
-    hatchet_ingestion_factory,
-)
-from .simple.graph_workflow import simple_graph_search_results_factory
-from .simple.ingestion_workflow import simple_ingestion_factory
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .hatchet.graph_workflow import (  # type: ignore
+        hatchet_graph_search_results_factory,
+    )
+    from .hatchet.ingestion_workflow import (  # type: ignore
+        hatchet_ingestion_factory,
+    )
+    from .simple.graph_workflow import simple_graph_search_results_factory
+    from .simple.ingestion_workflow import simple_ingestion_factory
 
 __all__ = [
     "hatchet_ingestion_factory",
@@ -14,3 +19,13 @@ __all__ = [
     "simple_ingestion_factory",
     "simple_graph_search_results_factory",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "hatchet_graph_search_results_factory": ".hatchet.graph_workflow",
+        "hatchet_ingestion_factory": ".hatchet.ingestion_workflow",
+        "simple_graph_search_results_factory": ".simple.graph_workflow",
+        "simple_ingestion_factory": ".simple.ingestion_workflow",
+    },
+)
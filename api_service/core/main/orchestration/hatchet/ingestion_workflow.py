@@ -127,6 +127,19 @@ def hatchet_ingestion_factory(
                         [extraction.to_dict() for extraction in extractions],
                     )
 
+                # Incremental updates only embed chunks whose text changed
+                chunks_to_embed = [
+                    extraction.to_dict() for extraction in extractions
+                ]
+                removed_chunk_ids: list[UUID] = []
+                if ingestion_config.get("incremental_update", False):
+                    (
+                        chunks_to_embed,
+                        removed_chunk_ids,
+                    ) = await self.ingestion_service.diff_document_chunks(
+                        document_info.id, chunks_to_embed
+                    )
+
                 await self.ingestion_service.update_document_status(
                     document_info,
                     status=IngestionStatus.EMBEDDING,
@@ -135,7 +148,7 @@ def hatchet_ingestion_factory(
                 # extractions = context.step_output("parse")["extractions"]
 
                 embedding_generator = self.ingestion_service.embed_document(
-                    [extraction.to_dict() for extraction in extractions]
+                    chunks_to_embed
                 )
 
                 embeddings = []
@@ -153,6 +166,7 @@ def hatchet_ingestion_factory(
 
                 async for _ in storage_generator:
                     pass
+                await self.ingestion_service.delete_chunks(removed_chunk_ids)
 
                 await self.ingestion_service.finalize_ingestion(document_info)
 
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator, Optional, TypeVar
 from uuid import UUID
 
 import tiktoken
@@ -22,6 +24,13 @@ from ...services import IngestionService
 
 logger = logging.getLogger()
 
+T = TypeVar("T")
+
+# Parsed chunks buffered ahead of embedding, and embedding batches in flight,
+# for the streaming `ingest_files` pipeline.
+STREAM_QUEUE_SIZE = 64
+MAX_PENDING_EMBEDDING_BATCHES = 16
+
 
 # FIXME: No need to duplicate this function between the workflows, consolidate it into a shared module
 def count_tokens_for_text(text: str, model: str = "gpt-4o") -> int:
@@ -34,6 +43,42 @@ def count_tokens_for_text(text: str, model: str = "gpt-4o") -> int:
     return len(encoding.encode(text, disallowed_special=()))
 
 
+async def prefetch(
+    source: AsyncIterator[T], maxsize: int
+) -> AsyncGenerator[T, None]:
+    """Runs `source` ahead of its consumer in a task, buffering at most
+    `maxsize` items in a bounded queue. Closing the generator (or an error
+    in the consumer) stops the task and closes `source`."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(("item", item))
+            await queue.put(("done", None))
+        except Exception as e:
+            await queue.put(("error", e))
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            kind, value = await queue.get()
+            if kind == "done":
+                break
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
 def simple_ingestion_factory(service: IngestionService):
     async def ingest_files(input_data):
         document_info = None
@@ -59,46 +104,105 @@ def simple_ingestion_factory(service: IngestionService):
             )
 
             ingestion_config = parsed_data["ingestion_config"]
-            extractions_generator = service.parse_file(
-                document_info=document_info,
-                ingestion_config=ingestion_config,
+            summary_chunk_limit = (
+                service.config.ingestion.chunks_for_document_summary
             )
-            extractions = [
-                extraction.model_dump()
-                async for extraction in extractions_generator
-            ]
-
-            # 2) Sum tokens
+            summary_chunks: list[dict] = []
+            summary_task: Optional[asyncio.Task] = None
             total_tokens = 0
-            for chunk_dict in extractions:
-                text_data = chunk_dict["data"]
-                if not isinstance(text_data, str):
-                    text_data = text_data.decode("utf-8", errors="ignore")
-                total_tokens += count_tokens_for_text(text_data)
-            document_info.total_tokens = total_tokens
-
-            if not ingestion_config.get("skip_document_summary", False):
-                await service.update_document_status(
-                    document_info=document_info,
-                    status=IngestionStatus.AUGMENTING,
-                )
-                await service.augment_document_info(document_info, extractions)
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.EMBEDDING
-            )
-            embedding_generator = service.embed_document(extractions)
-            embeddings = [
-                embedding.model_dump()
-                async for embedding in embedding_generator
-            ]
+            def start_summary():
+                nonlocal summary_task
+                if summary_task is None and not ingestion_config.get(
+                    "skip_document_summary", False
+                ):
+                    summary_task = asyncio.create_task(
+                        service.augment_document_info(
+                            document_info, summary_chunks
+                        )
+                    )
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.STORING
-            )
-            storage_generator = service.store_embeddings(embeddings)
-            async for _ in storage_generator:
-                pass
+            async def parsed_chunks():
+                # 1) Parse, counting tokens and keeping the summary prefix
+                # as the chunks stream past
+                nonlocal total_tokens
+                async with aclosing(
+                    service.parse_file(
+                        document_info=document_info,
+                        ingestion_config=ingestion_config,
+                    )
+                ) as extractions:
+                    async for extraction in extractions:
+                        text_data = extraction.data
+                        if not isinstance(text_data, str):
+                            text_data = text_data.decode(
+                                "utf-8", errors="ignore"
+                            )
+                        total_tokens += count_tokens_for_text(text_data)
+                        if len(summary_chunks) < summary_chunk_limit:
+                            summary_chunks.append({"data": text_data})
+                            if len(summary_chunks) == summary_chunk_limit:
+                                start_summary()
+                        yield extraction
+
+            parsed_stream = prefetch(parsed_chunks(), STREAM_QUEUE_SIZE)
+            embedding_generator = storage_generator = None
+            try:
+                chunk_stream = parsed_stream
+
+                # Incremental updates only embed chunks whose text changed.
+                # The diff needs every chunk, but not their vectors.
+                removed_chunk_ids: list[UUID] = []
+                if ingestion_config.get("incremental_update", False):
+                    extractions = [
+                        extraction async for extraction in chunk_stream
+                    ]
+                    (
+                        chunk_stream,
+                        removed_chunk_ids,
+                    ) = await service.diff_document_chunks(
+                        document_info.id, extractions
+                    )
+
+                # 2) Embed and store as one pipeline
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.EMBEDDING
+                )
+                embedding_generator = service.embed_document(
+                    chunk_stream,
+                    max_pending_batches=MAX_PENDING_EMBEDDING_BATCHES,
+                )
+                storage_generator = service.store_embeddings(
+                    embedding_generator
+                )
+                async for _ in storage_generator:
+                    pass
+                document_info.total_tokens = total_tokens
+
+                # 3) The summary only needs the first chunks, so it may
+                # already be running
+                start_summary()
+                if summary_task is not None:
+                    await service.update_document_status(
+                        document_info=document_info,
+                        status=IngestionStatus.AUGMENTING,
+                    )
+                    await summary_task
+
+                await service.delete_chunks(removed_chunk_ids)
+            finally:
+                # If a step fails midway, stop the parser, the in-flight
+                # embedding batches and the summary instead of leaving them
+                # running after the workflow has returned.
+                for generator in (
+                    storage_generator,
+                    embedding_generator,
+                    parsed_stream,
+                ):
+                    if generator is not None:
+                        await generator.aclose()
+                if summary_task is not None and not summary_task.done():
+                    summary_task.cancel()
 
             await service.finalize_ingestion(document_info)
 
@@ -1,9 +1,14 @@
-from .auth_service import AuthService
-from .graph_service import GraphService
-from .ingestion_service import IngestionService, IngestionServiceAdapter
-from .maintenance_service import MaintenanceService
-from .management_service import ManagementService
-from .retrieval_service import RetrievalService  # type: ignore
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .auth_service import AuthService
+    from .graph_service import GraphService
+    from .ingestion_service import IngestionService, IngestionServiceAdapter
+    from .maintenance_service import MaintenanceService
+    from .management_service import ManagementService
+    from .retrieval_service import RetrievalService  # type: ignore
 
 __all__ = [
     "AuthService",
@@ -14,3 +19,16 @@ __all__ = [
     "GraphService",
     "RetrievalService",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AuthService": ".auth_service",
+        "GraphService": ".graph_service",
+        "IngestionService": ".ingestion_service",
+        "IngestionServiceAdapter": ".ingestion_service",
+        "MaintenanceService": ".maintenance_service",
+        "ManagementService": ".management_service",
+        "RetrievalService": ".retrieval_service",
+    },
+)
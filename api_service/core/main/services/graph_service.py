@@ -1191,16 +1191,12 @@ class GraphService(Service):
             desc_elem = element.find("description")
             category = type_elem.text if type_elem is not None else None
             desc = desc_elem.text if desc_elem is not None else None
-            desc_embed = await self.providers.embedding.async_get_embedding(
-                desc or ""
-            )
             ent = Entity(
                 category=category,
                 description=desc,
                 name=name_attr,
                 parent_id=doc_id,
                 chunk_ids=chunk_ids,
-                description_embedding=desc_embed,
                 attributes={},
             )
             entities_list.append(ent)
@@ -1224,9 +1220,6 @@ class GraphService(Service):
                     if isinstance(weight_elem, Element) and weight_elem.text
                     else ""
                 )
-                embed = await self.providers.embedding.async_get_embedding(
-                    desc or ""
-                )
 
                 rel = Relationship(
                     subject=subject,
@@ -1237,38 +1230,56 @@ class GraphService(Service):
                     parent_id=doc_id,
                     chunk_ids=chunk_ids,
                     attributes={},
-                    description_embedding=embed,
                 )
                 relationships_list.append(rel)
             except Exception:
                 continue
+
+        # Embed every description from the chunk group in one batched call
+        extracted: list[Entity | Relationship] = [
+            *entities_list,
+            *relationships_list,
+        ]
+        if extracted:
+            texts = list(
+                dict.fromkeys(item.description or "" for item in extracted)
+            )
+            embeddings = await self.providers.embedding.async_get_embeddings(
+                texts
+            )
+            by_text = dict(zip(texts, embeddings, strict=True))
+            for item in extracted:
+                item.description_embedding = by_text[item.description or ""]
+
         return entities_list, relationships_list
 
     async def store_graph_search_results_extractions(
         self,
         graph_search_results_extractions: list[GraphExtraction],
     ):
-        """Stores a batch of knowledge graph extractions in the DB."""
+        """Stores a batch of knowledge graph extractions in the DB.
+
+        Entities and relationships of each extraction are written with one
+        bulk insert apiece; entity ids come back from the entity insert and
+        are used to link the relationships.
+        """
+        graphs_handler = self.providers.database.graphs_handler
         for extraction in graph_search_results_extractions:
-            # Map name->id after creation
-            entities_id_map = {}
+            entities = []
             for e in extraction.entities:
                 if e.parent_id is not None:
-                    result = await self.providers.database.graphs_handler.entities.create(
-                        name=e.name,
-                        parent_id=e.parent_id,
-                        store_type=StoreType.DOCUMENTS,
-                        category=e.category,
-                        description=e.description,
-                        description_embedding=e.description_embedding,
-                        chunk_ids=e.chunk_ids,
-                        metadata=e.metadata,
-                    )
-                    entities_id_map[e.name] = result.id
+                    entities.append(e)
                 else:
                     logger.warning(f"Skipping entity with None parent_id: {e}")
 
+            created = await graphs_handler.entities.create_many(
+                entities, store_type=StoreType.DOCUMENTS
+            )
+            # Map name->id after creation
+            entities_id_map = {e.name: e.id for e in created}
+
             # Insert relationships
+            relationships = []
             for rel in extraction.relationships:
                 subject_id = entities_id_map.get(rel.subject)
                 object_id = entities_id_map.get(rel.object)
@@ -1284,19 +1295,13 @@ class GraphService(Service):
                 assert isinstance(object_id, UUID)
                 assert isinstance(parent_id, UUID)
 
-                await self.providers.database.graphs_handler.relationships.create(
-                    subject=rel.subject,
-                    subject_id=subject_id,
-                    predicate=rel.predicate,
-                    object=rel.object,
-                    object_id=object_id,
-                    parent_id=parent_id,
-                    description=rel.description,
-                    description_embedding=rel.description_embedding,
-                    weight=rel.weight,
-                    metadata=rel.metadata,
-                    store_type=StoreType.DOCUMENTS,
-                )
+                rel.subject_id = subject_id
+                rel.object_id = object_id
+                relationships.append(rel)
+
+            await graphs_handler.relationships.create_many(
+                relationships, store_type=StoreType.DOCUMENTS
+            )
 
     async def deduplicate_document_entities(
         self,
@@ -1,8 +1,9 @@
 import asyncio
+import hashlib
 import json
 import logging
 from datetime import datetime
-from typing import Any, AsyncGenerator, Optional, Sequence
+from typing import Any, AsyncGenerator, AsyncIterable, Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -39,6 +40,10 @@ logger = logging.getLogger()
 STARTING_VERSION = "v0"
 
 
+def hash_chunk_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 class IngestionService:
     """A refactored IngestionService that inlines all pipe logic for parsing,
     embedding, and vector storage directly in its methods."""
@@ -329,17 +334,22 @@ class IngestionService:
 
     async def embed_document(
         self,
-        chunked_documents: list[dict],
+        chunked_documents: Sequence[DocumentChunk | dict]
+        | AsyncIterable[DocumentChunk | dict],
         embedding_batch_size: int = 8,
+        max_pending_batches: Optional[int] = None,
     ) -> AsyncGenerator[VectorEntry, None]:
         """Inline replacement for the old embedding_pipe.run(...).
 
-        Batches the embedding calls and yields VectorEntry objects.
+        Batches the embedding calls and yields VectorEntry objects. Chunks may
+        be streamed in as an async iterator; at most `max_pending_batches`
+        batches (default: the embedding concurrency limit) are in flight, so
+        the input is only pulled as fast as embeddings complete.
         """
         if not chunked_documents:
             return
 
-        concurrency_limit = (
+        concurrency_limit = max_pending_batches or (
             self.providers.embedding.config.concurrent_request_limit or 5
         )
         extraction_batch: list[DocumentChunk] = []
@@ -384,107 +394,253 @@ class IngestionService:
         async def run_process_batch(batch: list[DocumentChunk]):
             return await process_batch(batch)
 
+        if isinstance(chunked_documents, AsyncIterable):
+            chunks = chunked_documents
+        else:
+
+            async def iterate_chunks():
+                for chunk in chunked_documents:
+                    yield chunk
+
+            chunks = iterate_chunks()
+
         # Convert each chunk dict to a DocumentChunk
-        for chunk_dict in chunked_documents:
-            extraction = DocumentChunk.from_dict(chunk_dict)
-            extraction_batch.append(extraction)
+        try:
+            async for chunk in chunks:
+                extraction = (
+                    chunk
+                    if isinstance(chunk, DocumentChunk)
+                    else DocumentChunk.from_dict(chunk)
+                )
+                extraction_batch.append(extraction)
+
+                # If we hit a batch threshold, spawn a task
+                if len(extraction_batch) >= embedding_batch_size:
+                    tasks.add(
+                        asyncio.create_task(
+                            run_process_batch(extraction_batch)
+                        )
+                    )
+                    extraction_batch = []
 
-            # If we hit a batch threshold, spawn a task
-            if len(extraction_batch) >= embedding_batch_size:
+                # If tasks are at concurrency limit, wait for the first to finish
+                while len(tasks) >= concurrency_limit:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for t in done:
+                        for vector_entry in await t:
+                            yield vector_entry
+
+            # Handle any leftover items
+            if extraction_batch:
                 tasks.add(
                     asyncio.create_task(run_process_batch(extraction_batch))
                 )
-                extraction_batch = []
 
-            # If tasks are at concurrency limit, wait for the first to finish
-            while len(tasks) >= concurrency_limit:
-                done, tasks = await asyncio.wait(
-                    tasks, return_when=asyncio.FIRST_COMPLETED
+            # Gather remaining tasks
+            for future_task in asyncio.as_completed(tasks):
+                for vector_entry in await future_task:
+                    yield vector_entry
+        finally:
+            # A failed batch or a consumer that stops early must not leave
+            # the other batches running.
+            for task in tasks:
+                task.cancel()
+
+    async def diff_document_chunks(
+        self,
+        document_id: UUID,
+        chunked_documents: list[dict] | list[DocumentChunk],
+    ) -> tuple[list, list[UUID]]:
+        """Compares freshly parsed chunks against the stored chunks of a
+        document so that only new or changed text needs to be embedded.
+
+        Stored chunks whose text hash matches a new chunk are kept, and their
+        metadata is refreshed in place from the new chunk where it changed
+        (`chunk_order` when the text moved, `version`, `title`, ...). Returns
+        the new chunks that still need embedding and the ids of stored chunks
+        that no longer appear in the document.
+
+        Chunk ids are derived from the chunk's position, so a new chunk may
+        carry the id of a stored chunk that is kept or about to be removed.
+        Such chunks get a new id from their position id and text, so storing
+        them can neither overwrite a kept chunk nor be undone by deleting the
+        removed ones.
+        """
+        stored = (
+            await self.providers.database.chunks_handler.list_document_chunks(
+                document_id=document_id,
+                offset=0,
+                limit=-1,
+            )
+        )["results"]
+        if not stored:
+            return chunked_documents, []
+
+        taken_ids = {str(chunk["id"]) for chunk in stored}
+        stored_by_hash: dict[str, list[dict]] = {}
+        for idx, chunk in enumerate(stored):
+            chunk["position"] = chunk["metadata"].get("chunk_order", idx)
+            stored_by_hash.setdefault(
+                hash_chunk_text(chunk["text"]), []
+            ).append(chunk)
+
+        to_embed: list = []
+        refreshed: list[tuple[UUID, dict]] = []
+        for idx, chunk in enumerate(chunked_documents):
+            if isinstance(chunk, DocumentChunk):
+                text, metadata = chunk.data, chunk.metadata
+            else:
+                text, metadata = chunk["data"], chunk["metadata"]
+            if not isinstance(text, str):
+                text = text.decode("utf-8", errors="ignore")
+            position = metadata.get("chunk_order", idx)
+            text_hash = hash_chunk_text(text)
+            candidates = stored_by_hash.get(text_hash)
+            if not candidates:
+                to_embed.append(
+                    self._with_unique_id(chunk, text_hash, taken_ids)
                 )
-                for t in done:
-                    for vector_entry in await t:
-                        yield vector_entry
+                continue
+
+            # Prefer the stored copy at the same position for repeated text.
+            match = next(
+                (c for c in candidates if c["position"] == position),
+                candidates[0],
+            )
+            candidates.remove(match)
+            # Compare as stored (JSON), so values like datetimes match.
+            new_metadata = json.loads(
+                json.dumps({**metadata, "chunk_order": position}, default=str)
+            )
+            if any(
+                match["metadata"].get(key) != value
+                for key, value in new_metadata.items()
+            ):
+                refreshed.append((match["id"], new_metadata))
+
+        if refreshed:
+            await self.providers.database.chunks_handler.update_chunk_metadata(
+                refreshed
+            )
 
-        # Handle any leftover items
-        if extraction_batch:
-            tasks.add(asyncio.create_task(run_process_batch(extraction_batch)))
+        removed_ids = [
+            chunk["id"]
+            for candidates in stored_by_hash.values()
+            for chunk in candidates
+        ]
+        logger.info(
+            f"Incremental update for document {document_id}: "
+            f"{len(chunked_documents) - len(to_embed)} chunks kept, "
+            f"{len(to_embed)} to embed, {len(removed_ids)} removed."
+        )
+        return to_embed, removed_ids
+
+    @staticmethod
+    def _with_unique_id(
+        chunk: dict | DocumentChunk, text_hash: str, taken_ids: set[str]
+    ) -> dict | DocumentChunk:
+        """Re-ids `chunk` if its id is already in `taken_ids`, then records
+        the id it will be stored under."""
+        chunk_id = (
+            chunk.id if isinstance(chunk, DocumentChunk) else chunk["id"]
+        )
+        new_id = UUID(str(chunk_id))
+        attempt = 0
+        while str(new_id) in taken_ids:
+            new_id = generate_id(f"{chunk_id}-{text_hash}-{attempt}")
+            attempt += 1
+        taken_ids.add(str(new_id))
+        if isinstance(chunk, DocumentChunk):
+            chunk.id = new_id
+        else:
+            chunk["id"] = new_id if isinstance(chunk_id, UUID) else str(new_id)
+        return chunk
+
+    async def delete_chunks(self, chunk_ids: list[UUID]) -> None:
+        if chunk_ids:
+            await self.providers.database.chunks_handler.delete(
+                filters={"id": {"$in": [str(id) for id in chunk_ids]}}
+            )
+
+    async def _resolve_chunk_quota(self, owner_id: UUID) -> list[int]:
+        """Returns `[used, limit]` chunk counts for `owner_id`."""
+        user = await self.providers.database.users_handler.get_user_by_id(
+            owner_id
+        )
+        max_chunks = (
+            self.providers.database.config.app.default_max_chunks_per_user
+            if self.providers.database.config.app
+            else 1e10
+        )
+        if user.limits_overrides and "max_chunks" in user.limits_overrides:
+            max_chunks = user.limits_overrides["max_chunks"]
 
-        # Gather remaining tasks
-        for future_task in asyncio.as_completed(tasks):
-            for vector_entry in await future_task:
-                yield vector_entry
+        used = await self.providers.database.chunks_handler.count_owner_chunks(
+            owner_id
+        )
+        return [used, max_chunks]
 
     async def store_embeddings(
         self,
-        embeddings: Sequence[dict | VectorEntry],
-        storage_batch_size: int = 128,
+        embeddings: Sequence[dict | VectorEntry]
+        | AsyncIterable[dict | VectorEntry],
+        storage_batch_size: int = 512,
     ) -> AsyncGenerator[str, None]:
         """Inline replacement for the old vector_storage_pipe.run(...).
 
-        Batches up the vector entries, enforces usage limits, stores them, and
-        yields a success/error string (or you could yield a StorageResult).
+        Stores vector entries in large batches, enforces per-owner chunk
+        limits, and yields a success/error string per document. Each owner's
+        limit and current usage are resolved once per call and then tracked
+        with a running counter. `embeddings` may also be an async iterator
+        (e.g. `embed_document`), in which case entries are written as they
+        arrive.
         """
         if not embeddings:
             return
 
-        vector_entries: list[VectorEntry] = []
-        for item in embeddings:
-            if isinstance(item, VectorEntry):
-                vector_entries.append(item)
-            else:
-                vector_entries.append(VectorEntry.from_dict(item))
+        if isinstance(embeddings, AsyncIterable):
+            entries = embeddings
+        else:
+
+            async def iterate_sequence():
+                for item in embeddings:
+                    yield item
 
+            entries = iterate_sequence()
+
+        quotas: dict[UUID, list[int]] = {}
+        over_quota: set[UUID] = set()
         vector_batch: list[VectorEntry] = []
         document_counts: dict[UUID, int] = {}
 
-        # We'll track usage from the first user we see; if your scenario allows
-        # multiple user owners in a single ingestion, you'd need to refine usage checks.
-        current_usage = None
-        user_id_for_usage_check: UUID | None = None
-
-        count = 0
-
-        for msg in vector_entries:
-            # If we haven't set usage yet, do so on the first chunk
-            if current_usage is None:
-                user_id_for_usage_check = msg.owner_id
-                usage_data = (
-                    await self.providers.database.chunks_handler.list_chunks(
-                        limit=1,
-                        offset=0,
-                        filters={"owner_id": msg.owner_id},
-                    )
-                )
-                current_usage = usage_data["total_entries"]
-
-            # Figure out the user's limit
-            user = await self.providers.database.users_handler.get_user_by_id(
-                msg.owner_id
+        async for item in entries:
+            msg = (
+                item
+                if isinstance(item, VectorEntry)
+                else VectorEntry.from_dict(item)
             )
-            max_chunks = (
-                self.providers.database.config.app.default_max_chunks_per_user
-                if self.providers.database.config.app
-                else 1e10
-            )
-            if user.limits_overrides and "max_chunks" in user.limits_overrides:
-                max_chunks = user.limits_overrides["max_chunks"]
 
-            # Add to our local batch
+            quota = quotas.get(msg.owner_id)  # type: ignore
+            if quota is None:
+                quota = quotas[msg.owner_id] = await self._resolve_chunk_quota(  # type: ignore
+                    msg.owner_id  # type: ignore
+                )
+            used, max_chunks = quota
+            if used >= max_chunks:
+                error_message = f"User {msg.owner_id} has exceeded the maximum number of allowed chunks: {max_chunks}"
+                if msg.owner_id not in over_quota:
+                    over_quota.add(msg.owner_id)  # type: ignore
+                    logger.error(error_message)
+                yield error_message
+                continue
+
+            quota[0] += 1
             vector_batch.append(msg)
             document_counts[msg.document_id] = (
                 document_counts.get(msg.document_id, 0) + 1
             )
-            count += 1
-
-            # Check usage
-            if (
-                current_usage is not None
-                and (current_usage + len(vector_batch) + count) > max_chunks
-            ):
-                error_message = f"User {msg.owner_id} has exceeded the maximum number of allowed chunks: {max_chunks}"
-                logger.error(error_message)
-                yield error_message
-                continue
 
             # Once we hit our batch size, store them
             if len(vector_batch) >= storage_batch_size:
@@ -497,7 +653,7 @@ class IngestionService:
                 except Exception as e:
                     logger.error(f"Failed to store vector batch: {e}")
                     yield f"Error: {e}"
-                vector_batch.clear()
+                vector_batch = []
 
         # Store any leftover items
         if vector_batch:
@@ -832,6 +988,8 @@ class IngestionService:
         limit: int,
         filters: Optional[dict[str, Any]] = None,
         include_vectors: bool = False,
+        cursor: Optional[str] = None,
+        total_entries: str = "exact",
         *args: Any,
         **kwargs: Any,
     ) -> dict:
@@ -840,6 +998,8 @@ class IngestionService:
             limit=limit,
             filters=filters,
             include_vectors=include_vectors,
+            cursor=cursor,
+            total_entries=total_entries,
         )
 
     async def get_chunk(
@@ -907,7 +1067,12 @@ class IngestionServiceAdapter:
             "user": IngestionServiceAdapter._parse_user_data(data["user"]),
             "document_ids": [UUID(doc_id) for doc_id in data["document_ids"]],
             "metadatas": data["metadatas"],
-            "ingestion_config": data["ingestion_config"],
+            # Updates re-embed only changed chunks unless explicitly disabled,
+            # whichever orchestration provider runs them.
+            "ingestion_config": {
+                "incremental_update": True,
+                **(data["ingestion_config"] or {}),
+            },
             "file_sizes_in_bytes": data["file_sizes_in_bytes"],
             "file_datas": data["file_datas"],
         }
@@ -60,11 +60,15 @@ class ManagementService(Service):
         offset: int,
         limit: int,
         user_ids: Optional[list[UUID]] = None,
+        cursor: Optional[str] = None,
+        total_entries: str = "exact",
     ):
         return await self.providers.database.users_handler.get_users_overview(
             offset=offset,
             limit=limit,
             user_ids=user_ids,
+            cursor=cursor,
+            total_entries=total_entries,
         )
 
     async def delete_documents_and_chunks_by_filter(
@@ -385,6 +389,8 @@ class ManagementService(Service):
         collection_ids: Optional[list[UUID]] = None,
         document_ids: Optional[list[UUID]] = None,
         owner_only: bool = False,
+        cursor: Optional[str] = None,
+        total_entries: str = "exact",
     ):
         return await self.providers.database.documents_handler.get_documents_overview(
             offset=offset,
@@ -393,6 +399,8 @@ class ManagementService(Service):
             filter_user_ids=user_ids,
             filter_collection_ids=collection_ids,
             owner_only=owner_only,
+            cursor=cursor,
+            total_entries=total_entries,
         )
 
     async def update_document_metadata(
@@ -413,6 +421,8 @@ class ManagementService(Service):
         offset: int,
         limit: int,
         include_vectors: bool = False,
+        cursor: Optional[str] = None,
+        total_entries: str = "exact",
     ):
         return (
             await self.providers.database.chunks_handler.list_document_chunks(
@@ -420,6 +430,8 @@ class ManagementService(Service):
                 offset=offset,
                 limit=limit,
                 include_vectors=include_vectors,
+                cursor=cursor,
+                total_entries=total_entries,
             )
         )
 
@@ -606,6 +618,8 @@ class ManagementService(Service):
         document_ids: Optional[list[UUID]] = None,
         collection_ids: Optional[list[UUID]] = None,
         owner_only: bool = False,
+        cursor: Optional[str] = None,
+        total_entries: str = "exact",
     ) -> dict[str, list[CollectionResponse] | int]:
         return await self.providers.database.collections_handler.get_collections_overview(
             offset=offset,
@@ -614,6 +628,8 @@ class ManagementService(Service):
             filter_document_ids=document_ids,
             filter_collection_ids=collection_ids,
             owner_only=owner_only,
+            cursor=cursor,
+            total_entries=total_entries,
         )
 
     async def add_user_to_collection(
@@ -640,10 +656,19 @@ class ManagementService(Service):
         )
 
     async def documents_in_collection(
-        self, collection_id: UUID, offset: int = 0, limit: int = 100
+        self,
+        collection_id: UUID,
+        offset: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        total_entries: str = "exact",
     ) -> dict[str, list[DocumentResponse] | int]:
         return await self.providers.database.collections_handler.documents_in_collection(
-            collection_id, offset=offset, limit=limit
+            collection_id,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            total_entries=total_entries,
         )
 
     async def summarize_collection(
@@ -780,12 +805,16 @@ class ManagementService(Service):
         limit: int,
         conversation_ids: Optional[list[UUID]] = None,
         user_ids: Optional[list[UUID]] = None,
+        cursor: Optional[str] = None,
+        total_entries: str = "exact",
     ) -> dict[str, list[dict] | int]:
         return await self.providers.database.conversations_handler.get_conversations_overview(
             offset=offset,
             limit=limit,
             filter_user_ids=user_ids,
             conversation_ids=conversation_ids,
+            cursor=cursor,
+            total_entries=total_entries,
         )
 
     async def add_message(
@@ -1,11 +1,15 @@
 import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict
+from contextlib import ExitStack, aclosing
 from copy import deepcopy
 from datetime import datetime
 from typing import Any, AsyncGenerator, Literal, Optional
 from uuid import UUID
 
+import numpy as np
 from fastapi import HTTPException
 
 from core import (
@@ -47,6 +51,13 @@ from core.utils import (
     find_new_citation_spans,
     num_tokens_from_messages,
 )
+from core.utils.profiling import (
+    collect_timings,
+    sampled_profile,
+    stage_timer,
+    timed_stage,
+)
+from core.utils.shared_cache import get_shared_cache, hash_key
 from shared.api.models.management.responses import MessageResponse
 
 from ..abstractions import R2RProviders
@@ -250,6 +261,13 @@ class RetrievalService(Service):
             config,
             providers,
         )
+        # Background conversation summaries in flight, by conversation id
+        self._summarizing_conversations: dict[UUID, asyncio.Task] = {}
+        # Rendered document-context blocks for agent system prompts, by user
+        # and collection set: (documents generation, expiry, block)
+        self._documents_context_cache: OrderedDict[
+            tuple, tuple[int, float, str]
+        ] = OrderedDict()
 
     async def search(
         self,
@@ -265,22 +283,88 @@ class RetrievalService(Service):
         """
         strategy = search_settings.search_strategy.lower()
 
-        if strategy == "hyde":
-            return await self._hyde_search(query, search_settings)
-        elif strategy == "rag_fusion":
-            return await self._rag_fusion_search(query, search_settings)
-        else:
-            # 'vanilla', 'basic', or anything else...
-            return await self._basic_search(query, search_settings)
+        with (
+            collect_timings(search_settings.include_timings) as timings,
+            sampled_profile("search"),
+            stage_timer("search"),
+        ):
+            if strategy == "hyde":
+                results = await self._hyde_search(query, search_settings)
+            elif strategy == "rag_fusion":
+                results = await self._rag_fusion_search(query, search_settings)
+            else:
+                # 'vanilla', 'basic', or anything else...
+                results = await self._basic_search(query, search_settings)
+
+        if timings is not None:
+            results.timings = dict(timings)
+        return results
+
+    async def _embed_query(self, text: str) -> list[float]:
+        shared_cache = get_shared_cache()
+        cache_key = None
+        if shared_cache is not None and shared_cache.embedding_ttl > 0:
+            embedding_config = self.providers.completion_embedding.config
+            cache_key = (
+                f"embedding:{embedding_config.base_model}:"
+                f"{embedding_config.base_dimension}:{hash_key(text)}"
+            )
+            if (cached := await shared_cache.get_json(cache_key)) is not None:
+                return cached
 
+        with stage_timer("embedding"):
+            embedding = (
+                await self.providers.completion_embedding.async_get_embedding(
+                    text=text
+                )
+            )
+        if shared_cache is not None and cache_key is not None:
+            await shared_cache.set_json(
+                cache_key, embedding, ttl=shared_cache.embedding_ttl
+            )
+        return embedding
+
+    async def _rerank(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        limit: int,
+        score_threshold: Optional[float] = None,
+    ) -> list[ChunkSearchResult]:
+        # Without a rerank model the provider would only truncate.
+        if not self.providers.completion_embedding.has_reranker:
+            return results[:limit]
+
+        # Results come sorted by retrieval score; only the ones at or above
+        # the threshold are worth sending to the reranker.
+        candidates, rest = results, []
+        if score_threshold is not None:
+            cut = next(
+                (
+                    idx
+                    for idx, result in enumerate(results)
+                    if result.score is None or result.score < score_threshold
+                ),
+                len(results),
+            )
+            candidates, rest = results[:cut], results[cut:]
+        if len(candidates) <= 1:
+            return results[:limit]
+
+        with stage_timer("rerank"):
+            reranked = await self.providers.completion_embedding.arerank(
+                query=query, results=candidates, limit=limit
+            )
+        return (reranked + rest)[:limit]
+
+    @timed_stage("basic_search")
     async def _basic_search(
         self, query: str, search_settings: SearchSettings
     ) -> AggregateSearchResult:
         """
         1) Possibly embed the query (if semantic or hybrid).
-        2) Chunk search.
-        3) Graph search.
-        4) Combine into an AggregateSearchResult.
+        2) Chunk search and graph search, concurrently.
+        3) Combine into an AggregateSearchResult.
         """
         # -- 1) Possibly embed the query
         query_vector = None
@@ -288,31 +372,16 @@ class RetrievalService(Service):
             search_settings.use_semantic_search
             or search_settings.use_hybrid_search
         ):
-            query_vector = (
-                await self.providers.completion_embedding.async_get_embedding(
-                    text=query
-                )
-            )
+            query_vector = await self._embed_query(query)
 
-        # -- 2) Chunk search
-        chunk_results = []
-        if search_settings.chunk_settings.enabled:
-            chunk_results = await self._vector_search_logic(
-                query_text=query,
-                search_settings=search_settings,
-                precomputed_vector=query_vector,  # Pass in the vector we just computed (if any)
-            )
-
-        # -- 3) Graph search
-        graph_results = []
-        if search_settings.graph_settings.enabled:
-            graph_results = await self._graph_search_logic(
-                query_text=query,
-                search_settings=search_settings,
-                precomputed_vector=query_vector,  # same idea
-            )
+        # -- 2) Chunk + graph search
+        chunk_results, graph_results = await self._chunk_and_graph_search(
+            query_text=query,
+            search_settings=search_settings,
+            precomputed_vector=query_vector,
+        )
 
-        # -- 4) Combine
+        # -- 3) Combine
         return AggregateSearchResult(
             chunk_search_results=chunk_results,
             graph_search_results=graph_results,
@@ -375,12 +444,10 @@ class RetrievalService(Service):
         # of the fused results by the user’s original query.
         # E.g.:
         if fused_chunk_results:
-            fused_chunk_results = (
-                await self.providers.completion_embedding.arerank(
-                    query=query,
-                    results=fused_chunk_results,
-                    limit=search_settings.limit,
-                )
+            fused_chunk_results = await self._rerank(
+                query=query,
+                results=fused_chunk_results,
+                limit=search_settings.limit,
             )
 
         # Sort or slice the graph results if needed:
@@ -428,10 +495,11 @@ class RetrievalService(Service):
             temperature=0.8,
             stream=False,
         )
-        response = await self.providers.llm.aget_completion(
-            messages=[{"role": "system", "content": prompt}],
-            generation_config=gen_config,
-        )
+        with stage_timer("llm"):
+            response = await self.providers.llm.aget_completion(
+                messages=[{"role": "system", "content": prompt}],
+                generation_config=gen_config,
+            )
         raw_text = (
             response.choices[0].message.content.strip()
             if response.choices[0].message.content is not None
@@ -460,12 +528,12 @@ class RetrievalService(Service):
         if not list_of_rankings:
             return []
 
-        # Build a map of chunk_id => final_rff_score
-        score_map: dict[str, float] = {}
-
-        # We also need to store a reference to the chunk object
-        # (the "first" or "best" instance), so we can reconstruct them later
-        chunk_map: dict[str, Any] = {}
+        # Every distinct chunk gets a slot, holding its first instance; the
+        # 1 / (k + rank) terms are then summed per slot on index arrays.
+        slot_by_id: dict[str, int] = {}
+        chunks: list[ChunkSearchResult] = []
+        slots: list[int] = []
+        ranks: list[int] = []
 
         for ranking_list in list_of_rankings:
             for rank, chunk_result in enumerate(ranking_list, start=1):
@@ -473,30 +541,25 @@ class RetrievalService(Service):
                     # fallback if no chunk_id is present
                     continue
 
-                c_id = chunk_result.id
-                # RRF scoring
-                # score = sum(1 / (k + rank)) for each sub-query ranking
-                # We'll accumulate it.
-                existing_score = score_map.get(str(c_id), 0.0)
-                new_score = existing_score + 1.0 / (k + rank)
-                score_map[str(c_id)] = new_score
+                c_id = str(chunk_result.id)
+                slot = slot_by_id.get(c_id)
+                if slot is None:
+                    slot = slot_by_id[c_id] = len(chunks)
+                    chunks.append(chunk_result)
+                slots.append(slot)
+                ranks.append(rank)
 
-                # Keep a reference to chunk
-                if c_id not in chunk_map:
-                    chunk_map[str(c_id)] = chunk_result
+        if not chunks:
+            return []
 
-        # Now sort by final score
-        fused_items = sorted(
-            score_map.items(), key=lambda x: x[1], reverse=True
-        )
+        scores = np.zeros(len(chunks))
+        np.add.at(scores, slots, 1.0 / (k + np.asarray(ranks, dtype=float)))
 
-        # Rebuild the final list of chunk results with new 'score'
+        # Sort by final score, ties in first-seen order
         fused_chunks = []
-        for c_id, agg_score in fused_items:  # type: ignore
-            # copy the chunk
-            c = chunk_map[str(c_id)]
-            # Optionally store the RRF score if you want
-            c.score = agg_score
+        for slot in np.argsort(-scores, kind="stable"):
+            c = chunks[slot]
+            c.score = float(scores[slot])
             fused_chunks.append(c)
 
         return fused_chunks
@@ -587,7 +650,7 @@ class RetrievalService(Service):
 
         # 3) Re-rank chunk results with the original query
         if chunk_all:
-            chunk_all = await self.providers.completion_embedding.arerank(
+            chunk_all = await self._rerank(
                 query=query,  # final user query
                 results=chunk_all,
                 limit=int(
@@ -619,30 +682,42 @@ class RetrievalService(Service):
         2) chunk search + graph search with that embedding
         """
         # Precompute the embedding of alt_text
-        vec = await self.providers.completion_embedding.async_get_embedding(
-            text=alt_text
+        vec = await self._embed_query(alt_text)
+
+        # user_text is used for text-based search & re-ranking, the alt_text
+        # vector for semantic/hybrid and graph search
+        return await self._chunk_and_graph_search(
+            query_text=user_text,
+            search_settings=search_settings,
+            precomputed_vector=vec,
         )
 
-        # chunk search
-        chunk_results = []
-        if search_settings.chunk_settings.enabled:
-            chunk_results = await self._vector_search_logic(
-                query_text=user_text,  # used for text-based stuff & re-ranking
-                search_settings=search_settings,
-                precomputed_vector=vec,  # use the alt_text vector for semantic/hybrid
-            )
+    async def _chunk_and_graph_search(
+        self,
+        query_text: str,
+        search_settings: SearchSettings,
+        precomputed_vector: Optional[list[float]] = None,
+    ) -> tuple[list[ChunkSearchResult], list[GraphSearchResult]]:
+        """Run chunk search and graph search concurrently.
 
-        # graph search
-        graph_results = []
-        if search_settings.graph_settings.enabled:
-            graph_results = await self._graph_search_logic(
-                query_text=user_text,  # or alt_text if you prefer
+        Each leg takes its own connection; the database provider's pool
+        semaphore bounds how many run at once across requests.
+        """
+        chunk_results, graph_results = await asyncio.gather(
+            self._vector_search_logic(
+                query_text=query_text,
                 search_settings=search_settings,
-                precomputed_vector=vec,
-            )
-
-        return (chunk_results, graph_results)
+                precomputed_vector=precomputed_vector,
+            ),
+            self._graph_search_logic(
+                query_text=query_text,
+                search_settings=search_settings,
+                precomputed_vector=precomputed_vector,
+            ),
+        )
+        return chunk_results, graph_results
 
+    @timed_stage("vector_search")
     async def _vector_search_logic(
         self,
         query_text: str,
@@ -664,10 +739,21 @@ class RetrievalService(Service):
             search_settings.use_semantic_search
             or search_settings.use_hybrid_search
         ):
-            query_vector = (
-                await self.providers.completion_embedding.async_get_embedding(
-                    text=query_text
-                )
+            query_vector = await self._embed_query(query_text)
+
+        # Retrieve more candidates than we return when they get reranked
+        chunk_settings = search_settings.chunk_settings
+        retrieval_settings = search_settings
+        if (
+            chunk_settings.rerank_candidates
+            and chunk_settings.rerank_candidates > search_settings.limit
+            and self.providers.completion_embedding.has_reranker
+        ):
+            retrieval_settings = deepcopy(search_settings)
+            retrieval_settings.limit = chunk_settings.rerank_candidates
+            retrieval_settings.hybrid_settings.full_text_limit = max(
+                retrieval_settings.hybrid_settings.full_text_limit,
+                chunk_settings.rerank_candidates,
             )
 
         # 2) Choose which search to run
@@ -681,14 +767,14 @@ class RetrievalService(Service):
                 await self.providers.database.chunks_handler.hybrid_search(
                     query_vector=query_vector,
                     query_text=query_text,
-                    search_settings=search_settings,
+                    search_settings=retrieval_settings,
                 )
             )
         elif search_settings.use_fulltext_search:
             raw_results = (
                 await self.providers.database.chunks_handler.full_text_search(
                     query_text=query_text,
-                    search_settings=search_settings,
+                    search_settings=retrieval_settings,
                 )
             )
         elif search_settings.use_semantic_search:
@@ -699,7 +785,7 @@ class RetrievalService(Service):
             raw_results = (
                 await self.providers.database.chunks_handler.semantic_search(
                     query_vector=query_vector,
-                    search_settings=search_settings,
+                    search_settings=retrieval_settings,
                 )
             )
         else:
@@ -708,8 +794,15 @@ class RetrievalService(Service):
             )
 
         # 3) Re-rank
-        reranked = await self.providers.completion_embedding.arerank(
-            query=query_text, results=raw_results, limit=search_settings.limit
+        reranked = await self._rerank(
+            query=query_text,
+            results=raw_results,
+            limit=search_settings.limit,
+            score_threshold=(
+                chunk_settings.rerank_score_threshold
+                if search_settings.include_scores
+                else None
+            ),
         )
 
         # 4) Possibly augment text or metadata
@@ -723,6 +816,7 @@ class RetrievalService(Service):
 
         return final_results
 
+    @timed_stage("graph_search")
     async def _graph_search_logic(
         self,
         query_text: str,
@@ -744,86 +838,96 @@ class RetrievalService(Service):
         # 1) Possibly embed
         query_embedding = precomputed_vector
         if query_embedding is None:
-            query_embedding = (
-                await self.providers.completion_embedding.async_get_embedding(
-                    query_text
-                )
-            )
+            query_embedding = await self._embed_query(query_text)
 
         base_limit = search_settings.limit
         graph_limits = search_settings.graph_settings.limits or {}
 
-        # Entity search
-        entity_limit = graph_limits.get("entities", base_limit)
-        entity_cursor = self.providers.database.graphs_handler.graph_search(
-            query_text,
-            search_type="entities",
-            limit=entity_limit,
-            query_embedding=query_embedding,
-            property_names=["name", "description", "id"],
-            filters=search_settings.filters,
+        # Entities, relationships and communities are independent queries;
+        # run them concurrently and keep the results in that order.
+        entities, relationships, communities = await asyncio.gather(
+            self._graph_search_rows(
+                query_text,
+                search_type="entities",
+                limit=graph_limits.get("entities", base_limit),
+                query_embedding=query_embedding,
+                property_names=["name", "description", "id"],
+                filters=search_settings.filters,
+            ),
+            self._graph_search_rows(
+                query_text,
+                search_type="relationships",
+                limit=graph_limits.get("relationships", base_limit),
+                query_embedding=query_embedding,
+                property_names=[
+                    "id",
+                    "subject",
+                    "predicate",
+                    "object",
+                    "description",
+                    "subject_id",
+                    "object_id",
+                ],
+                filters=search_settings.filters,
+            ),
+            self._graph_search_rows(
+                query_text,
+                search_type="communities",
+                limit=graph_limits.get("communities", base_limit),
+                query_embedding=query_embedding,
+                property_names=[
+                    "id",
+                    "name",
+                    "summary",
+                ],
+                filters=search_settings.filters,
+            ),
         )
-        async for ent in entity_cursor:
-            score = ent.get("similarity_score")
-            metadata = ent.get("metadata", {})
+
+        def make_result(
+            row: dict, content: Any, result_type: GraphSearchResultType
+        ) -> GraphSearchResult:
+            score = row.get("similarity_score")
+            metadata = row.get("metadata", {})
             if isinstance(metadata, str):
                 try:
                     metadata = json.loads(metadata)
-                except Exception as e:
+                except Exception:
                     pass
 
+            return GraphSearchResult(
+                id=row.get("id", None),
+                content=content,
+                result_type=result_type,
+                score=score if search_settings.include_scores else None,
+                metadata=(
+                    {
+                        **(metadata or {}),
+                        "associated_query": query_text,
+                    }
+                    if search_settings.include_metadatas
+                    else {}
+                ),
+            )
+
+        for ent in entities:
             results.append(
-                GraphSearchResult(
-                    id=ent.get("id", None),
-                    content=GraphEntityResult(
+                make_result(
+                    ent,
+                    GraphEntityResult(
                         name=ent.get("name", ""),
                         description=ent.get("description", ""),
                         id=ent.get("id", None),
                     ),
-                    result_type=GraphSearchResultType.ENTITY,
-                    score=score if search_settings.include_scores else None,
-                    metadata=(
-                        {
-                            **(metadata or {}),
-                            "associated_query": query_text,
-                        }
-                        if search_settings.include_metadatas
-                        else {}
-                    ),
+                    GraphSearchResultType.ENTITY,
                 )
             )
 
-        # Relationship search
-        rel_limit = graph_limits.get("relationships", base_limit)
-        rel_cursor = self.providers.database.graphs_handler.graph_search(
-            query_text,
-            search_type="relationships",
-            limit=rel_limit,
-            query_embedding=query_embedding,
-            property_names=[
-                "id",
-                "subject",
-                "predicate",
-                "object",
-                "description",
-                "subject_id",
-                "object_id",
-            ],
-            filters=search_settings.filters,
-        )
-        async for rel in rel_cursor:
-            score = rel.get("similarity_score")
-            metadata = rel.get("metadata", {})
-            if isinstance(metadata, str):
-                try:
-                    metadata = json.loads(metadata)
-                except Exception as e:
-                    pass
-
+        for rel in relationships:
             results.append(
-                GraphSearchResult(
-                    id=ent.get("id", None),
-                    content=GraphRelationshipResult(
+                make_result(
+                    rel,
+                    GraphRelationshipResult(
                         id=rel.get("id", None),
                         subject=rel.get("subject", ""),
                         predicate=rel.get("predicate", ""),
@@ -832,65 +936,36 @@ class RetrievalService(Service):
                         object_id=rel.get("object_id", None),
                         description=rel.get("description", ""),
                     ),
-                    result_type=GraphSearchResultType.RELATIONSHIP,
-                    score=score if search_settings.include_scores else None,
-                    metadata=(
-                        {
-                            **(metadata or {}),
-                            "associated_query": query_text,
-                        }
-                        if search_settings.include_metadatas
-                        else {}
-                    ),
+                    GraphSearchResultType.RELATIONSHIP,
                 )
             )
 
-        # Community search
-        comm_limit = graph_limits.get("communities", base_limit)
-        comm_cursor = self.providers.database.graphs_handler.graph_search(
-            query_text,
-            search_type="communities",
-            limit=comm_limit,
-            query_embedding=query_embedding,
-            property_names=[
-                "id",
-                "name",
-                "summary",
-            ],
-            filters=search_settings.filters,
-        )
-        async for comm in comm_cursor:
-            score = comm.get("similarity_score")
-            metadata = comm.get("metadata", {})
-            if isinstance(metadata, str):
-                try:
-                    metadata = json.loads(metadata)
-                except Exception as e:
-                    pass
-
+        for comm in communities:
             results.append(
-                GraphSearchResult(
-                    id=ent.get("id", None),
-                    content=GraphCommunityResult(
+                make_result(
+                    comm,
+                    GraphCommunityResult(
                         id=comm.get("id", None),
                         name=comm.get("name", ""),
                         summary=comm.get("summary", ""),
                     ),
-                    result_type=GraphSearchResultType.COMMUNITY,
-                    score=score if search_settings.include_scores else None,
-                    metadata=(
-                        {
-                            **(metadata or {}),
-                            "associated_query": query_text,
-                        }
-                        if search_settings.include_metadatas
-                        else {}
-                    ),
+                    GraphSearchResultType.COMMUNITY,
                 )
             )
 
         return results
 
+    async def _graph_search_rows(
+        self, query: str, **kwargs: Any
+    ) -> list[dict]:
+        """Drain one `graphs_handler.graph_search` cursor into a list."""
+        return [
+            row
+            async for row in self.providers.database.graphs_handler.graph_search(
+                query, **kwargs
+            )
+        ]
+
     async def _run_hyde_generation(
         self,
         query: str,
@@ -902,12 +977,11 @@ class RetrievalService(Service):
         """
         # Retrieve the prompt template from your database or config:
         # e.g. your "hyde" prompt has placeholders: {message}, {num_outputs}
-        hyde_template = (
-            await self.providers.database.prompts_handler.get_cached_prompt(
+        with stage_timer("prompt"):
+            hyde_template = await self.providers.database.prompts_handler.get_cached_prompt(
                 prompt_name="hyde",
                 inputs={"message": query, "num_outputs": num_sub_queries},
             )
-        )
 
         # Now call the LLM with that as the system or user prompt:
         completion_config = GenerationConfig(
@@ -917,10 +991,11 @@ class RetrievalService(Service):
             stream=False,
         )
 
-        response = await self.providers.llm.aget_completion(
-            messages=[{"role": "system", "content": hyde_template}],
-            generation_config=completion_config,
-        )
+        with stage_timer("llm"):
+            response = await self.providers.llm.aget_completion(
+                messages=[{"role": "system", "content": hyde_template}],
+                generation_config=completion_config,
+            )
 
         # Suppose the LLM returns something like:
         #
@@ -996,251 +1071,279 @@ class RetrievalService(Service):
         3) If not streaming => normal LLM call => return RAGResponse
         4) If streaming => return an async generator of SSE lines
         """
-        # 1) Possibly fix up any UUID filters in search_settings
-        for f, val in list(search_settings.filters.items()):
-            if isinstance(val, UUID):
-                search_settings.filters[f] = str(val)
+        with (
+            collect_timings(search_settings.include_timings) as timings,
+            ExitStack() as request_scope,
+        ):
+            request_scope.enter_context(sampled_profile("rag"))
+            request_scope.enter_context(stage_timer("rag"))
 
-        try:
-            # 2) Perform search => aggregated_results
-            aggregated_results = await self.search(query, search_settings)
-            # 3) Optionally add web search results if flag is enabled
-            if include_web_search:
-                web_results = await self._perform_web_search(query)
-                # Merge web search results with existing aggregated results
-                if web_results and web_results.web_search_results:
-                    if not aggregated_results.web_search_results:
-                        aggregated_results.web_search_results = (
-                            web_results.web_search_results
-                        )
-                    else:
-                        aggregated_results.web_search_results.extend(
-                            web_results.web_search_results
+            # 1) Possibly fix up any UUID filters in search_settings
+            for f, val in list(search_settings.filters.items()):
+                if isinstance(val, UUID):
+                    search_settings.filters[f] = str(val)
+
+            try:
+                # 2) Perform search => aggregated_results
+                aggregated_results = await self.search(query, search_settings)
+                # 3) Optionally add web search results if flag is enabled
+                if include_web_search:
+                    web_results = await self._perform_web_search(query)
+                    # Merge web search results with existing aggregated results
+                    if web_results and web_results.web_search_results:
+                        if not aggregated_results.web_search_results:
+                            aggregated_results.web_search_results = (
+                                web_results.web_search_results
+                            )
+                        else:
+                            aggregated_results.web_search_results.extend(
+                                web_results.web_search_results
+                            )
+                # 3) Build context from aggregator
+                collector = SearchResultsCollector()
+                collector.add_aggregate_result(aggregated_results)
+                context_str = format_search_results_for_llm(
+                    aggregated_results, collector
+                )
+
+                # 4) Prepare system+task messages
+                system_prompt_name = system_prompt_name or "system"
+                task_prompt_name = task_prompt_name or "rag"
+                task_prompt = kwargs.get("task_prompt")
+
+                with stage_timer("prompt"):
+                    messages = await self.providers.database.prompts_handler.get_message_payload(
+                        system_prompt_name=system_prompt_name,
+                        task_prompt_name=task_prompt_name,
+                        task_inputs={"query": query, "context": context_str},
+                        task_prompt=task_prompt,
+                    )
+
+                # 5) Check streaming vs. non-streaming
+                if not rag_generation_config.stream:
+                    # ========== Non-Streaming Logic ==========
+                    with stage_timer("llm"):
+                        response = await self.providers.llm.aget_completion(
+                            messages=messages,
+                            generation_config=rag_generation_config,
                         )
-            # 3) Build context from aggregator
-            collector = SearchResultsCollector()
-            collector.add_aggregate_result(aggregated_results)
-            context_str = format_search_results_for_llm(
-                aggregated_results, collector
-            )
+                    llm_text = response.choices[0].message.content
+
+                    # (a) Extract short-ID references from final text
+                    raw_sids = extract_citations(llm_text or "")
+
+                    # (b) Possibly prune large content out of metadata
+                    metadata = response.dict()
+                    if "choices" in metadata and len(metadata["choices"]) > 0:
+                        metadata["choices"][0]["message"].pop("content", None)
+                    if timings is not None:
+                        metadata["timings"] = timings
+
+                    # (c) Build final RAGResponse
+                    rag_resp = RAGResponse(
+                        generated_answer=llm_text or "",
+                        search_results=aggregated_results,
+                        citations=[
+                            Citation(
+                                id=f"{sid}",
+                                object="citation",
+                                payload=dump_obj(  # type: ignore
+                                    self._find_item_by_shortid(sid, collector)
+                                ),
+                            )
+                            for sid in raw_sids
+                        ],
+                        metadata=metadata,
+                        completion=llm_text or "",
+                    )
+                    return rag_resp
 
-            # 4) Prepare system+task messages
-            system_prompt_name = system_prompt_name or "system"
-            task_prompt_name = task_prompt_name or "rag"
-            task_prompt = kwargs.get("task_prompt")
+                else:
+                    # ========== Streaming SSE Logic ==========
+                    async def sse_generator() -> AsyncGenerator[str, None]:
+                        # 1) Emit search results via SSEFormatter
+                        async for (
+                            line
+                        ) in SSEFormatter.yield_search_results_event(
+                            aggregated_results
+                        ):
+                            yield line
 
-            messages = await self.providers.database.prompts_handler.get_message_payload(
-                system_prompt_name=system_prompt_name,
-                task_prompt_name=task_prompt_name,
-                task_inputs={"query": query, "context": context_str},
-                task_prompt=task_prompt,
-            )
+                        # Initialize citation tracker to manage citation state
+                        citation_tracker = CitationTracker()
 
-            # 5) Check streaming vs. non-streaming
-            if not rag_generation_config.stream:
-                # ========== Non-Streaming Logic ==========
-                response = await self.providers.llm.aget_completion(
-                    messages=messages,
-                    generation_config=rag_generation_config,
-                )
-                llm_text = response.choices[0].message.content
-
-                # (a) Extract short-ID references from final text
-                raw_sids = extract_citations(llm_text or "")
-
-                # (b) Possibly prune large content out of metadata
-                metadata = response.dict()
-                if "choices" in metadata and len(metadata["choices"]) > 0:
-                    metadata["choices"][0]["message"].pop("content", None)
-
-                # (c) Build final RAGResponse
-                rag_resp = RAGResponse(
-                    generated_answer=llm_text or "",
-                    search_results=aggregated_results,
-                    citations=[
-                        Citation(
-                            id=f"{sid}",
-                            object="citation",
-                            payload=dump_obj(  # type: ignore
-                                self._find_item_by_shortid(sid, collector)
-                            ),
+                        # Store citation payloads by ID for reuse
+                        citation_payloads = {}
+
+                        partial_text_buffer = ""
+
+                        # Begin streaming from the LLM
+                        msg_stream = self.providers.llm.aget_completion_stream(
+                            messages=messages,
+                            generation_config=rag_generation_config,
                         )
-                        for sid in raw_sids
-                    ],
-                    metadata=metadata,
-                    completion=llm_text or "",
-                )
-                return rag_resp
 
-            else:
-                # ========== Streaming SSE Logic ==========
-                async def sse_generator() -> AsyncGenerator[str, None]:
-                    # 1) Emit search results via SSEFormatter
-                    async for line in SSEFormatter.yield_search_results_event(
-                        aggregated_results
-                    ):
-                        yield line
-
-                    # Initialize citation tracker to manage citation state
-                    citation_tracker = CitationTracker()
-
-                    # Store citation payloads by ID for reuse
-                    citation_payloads = {}
-
-                    partial_text_buffer = ""
-
-                    # Begin streaming from the LLM
-                    msg_stream = self.providers.llm.aget_completion_stream(
-                        messages=messages,
-                        generation_config=rag_generation_config,
-                    )
+                        try:
+                            async for chunk in msg_stream:
+                                delta = chunk.choices[0].delta
+                                finish_reason = chunk.choices[0].finish_reason
+                                # if delta.thinking:
+                                # check if delta has `thinking` attribute
 
-                    try:
-                        async for chunk in msg_stream:
-                            delta = chunk.choices[0].delta
-                            finish_reason = chunk.choices[0].finish_reason
-                            # if delta.thinking:
-                            # check if delta has `thinking` attribute
-
-                            if hasattr(delta, "thinking") and delta.thinking:
-                                # Emit SSE "thinking" event
-                                async for (
-                                    line
-                                ) in SSEFormatter.yield_thinking_event(
-                                    delta.thinking
+                                if (
+                                    hasattr(delta, "thinking")
+                                    and delta.thinking
                                 ):
-                                    yield line
+                                    # Emit SSE "thinking" event
+                                    yield SSEFormatter.thinking_event(
+                                        delta.thinking
+                                    )
 
-                            if delta.content:
-                                # (b) Emit SSE "message" event for this chunk of text
-                                async for (
-                                    line
-                                ) in SSEFormatter.yield_message_event(
-                                    delta.content
-                                ):
-                                    yield line
+                                if delta.content:
+                                    # (b) Emit SSE "message" event for this chunk of text
+                                    yield SSEFormatter.message_event(
+                                        delta.content
+                                    )
 
-                                # Accumulate new text
-                                partial_text_buffer += delta.content
+                                    # Accumulate new text
+                                    partial_text_buffer += delta.content
 
-                                # (a) Extract citations from updated buffer
-                                #     For each *new* short ID, emit an SSE "citation" event
-                                # Find new citation spans in the accumulated text
-                                new_citation_spans = find_new_citation_spans(
-                                    partial_text_buffer, citation_tracker
-                                )
+                                    # (a) Extract citations from updated buffer
+                                    #     For each *new* short ID, emit an SSE "citation" event
+                                    # Find new citation spans in the accumulated text
+                                    new_citation_spans = (
+                                        find_new_citation_spans(
+                                            partial_text_buffer,
+                                            citation_tracker,
+                                        )
+                                    )
 
-                                # Process each new citation span
-                                for cid, spans in new_citation_spans.items():
-                                    for span in spans:
-                                        # Check if this is the first time we've seen this citation ID
-                                        is_new_citation = (
-                                            citation_tracker.is_new_citation(
+                                    # Process each new citation span
+                                    for (
+                                        cid,
+                                        spans,
+                                    ) in new_citation_spans.items():
+                                        for span in spans:
+                                            # Check if this is the first time we've seen this citation ID
+                                            is_new_citation = citation_tracker.is_new_citation(
                                                 cid
                                             )
-                                        )
 
-                                        # Get payload if it's a new citation
-                                        payload = None
-                                        if is_new_citation:
-                                            source_obj = (
-                                                self._find_item_by_shortid(
-                                                    cid, collector
-                                                )
-                                            )
-                                            if source_obj:
-                                                # Store payload for reuse
-                                                payload = dump_obj(source_obj)
-                                                citation_payloads[cid] = (
-                                                    payload
+                                            # Get payload if it's a new citation
+                                            payload = None
+                                            if is_new_citation:
+                                                source_obj = (
+                                                    self._find_item_by_shortid(
+                                                        cid, collector
+                                                    )
                                                 )
-
-                                        # Create citation event payload
-                                        citation_data = {
-                                            "id": cid,
-                                            "object": "citation",
-                                            "is_new": is_new_citation,
-                                            "span": {
-                                                "start": span[0],
-                                                "end": span[1],
-                                            },
-                                        }
-
-                                        # Only include full payload for new citations
-                                        if is_new_citation and payload:
-                                            citation_data["payload"] = payload
-
-                                        # Emit the citation event
-                                        async for (
-                                            line
-                                        ) in SSEFormatter.yield_citation_event(
-                                            citation_data
-                                        ):
-                                            yield line
-
-                            # If the LLM signals it’s done
-                            if finish_reason == "stop":
-                                # Prepare consolidated citations for final answer event
-                                consolidated_citations = []
-                                # Group citations by ID with all their spans
-                                for (
-                                    cid,
-                                    spans,
-                                ) in citation_tracker.get_all_spans().items():
-                                    if cid in citation_payloads:
-                                        consolidated_citations.append(
-                                            {
+                                                if source_obj:
+                                                    # Store payload for reuse
+                                                    payload = dump_obj(
+                                                        source_obj
+                                                    )
+                                                    citation_payloads[cid] = (
+                                                        payload
+                                                    )
+
+                                            # Create citation event payload
+                                            citation_data = {
                                                 "id": cid,
                                                 "object": "citation",
-                                                "spans": [
-                                                    {
-                                                        "start": s[0],
-                                                        "end": s[1],
-                                                    }
-                                                    for s in spans
-                                                ],
-                                                "payload": citation_payloads[
-                                                    cid
-                                                ],
+                                                "is_new": is_new_citation,
+                                                "span": {
+                                                    "start": span[0],
+                                                    "end": span[1],
+                                                },
                                             }
-                                        )
 
-                                # (c) Emit final answer + all collected citations
-                                final_answer_evt = {
-                                    "id": "msg_final",
-                                    "object": "rag.final_answer",
-                                    "generated_answer": partial_text_buffer,
-                                    "citations": consolidated_citations,
-                                }
-                                async for (
-                                    line
-                                ) in SSEFormatter.yield_final_answer_event(
-                                    final_answer_evt
-                                ):
-                                    yield line
+                                            # Only include full payload for new citations
+                                            if is_new_citation and payload:
+                                                citation_data["payload"] = (
+                                                    payload
+                                                )
 
-                                # (d) Signal the end of the SSE stream
-                                yield SSEFormatter.yield_done_event()
-                                break
+                                            # Emit the citation event
+                                            async for line in SSEFormatter.yield_citation_event(
+                                                citation_data
+                                            ):
+                                                yield line
+
+                                # If the LLM signals it’s done
+                                if finish_reason == "stop":
+                                    # Prepare consolidated citations for final answer event
+                                    consolidated_citations = []
+                                    # Group citations by ID with all their spans
+                                    for (
+                                        cid,
+                                        spans,
+                                    ) in citation_tracker.get_all_spans().items():
+                                        if cid in citation_payloads:
+                                            consolidated_citations.append(
+                                                {
+                                                    "id": cid,
+                                                    "object": "citation",
+                                                    "spans": [
+                                                        {
+                                                            "start": s[0],
+                                                            "end": s[1],
+                                                        }
+                                                        for s in spans
+                                                    ],
+                                                    "payload": citation_payloads[
+                                                        cid
+                                                    ],
+                                                }
+                                            )
 
-                    except Exception as e:
-                        logger.error(f"Error streaming LLM in rag: {e}")
-                        # Optionally yield an SSE "error" event or handle differently
-                        raise
+                                    # (c) Emit final answer + all collected citations
+                                    final_answer_evt = {
+                                        "id": "msg_final",
+                                        "object": "rag.final_answer",
+                                        "generated_answer": partial_text_buffer,
+                                        "citations": consolidated_citations,
+                                    }
+                                    async for (
+                                        line
+                                    ) in SSEFormatter.yield_final_answer_event(
+                                        final_answer_evt
+                                    ):
+                                        yield line
+
+                                    # (d) Signal the end of the SSE stream
+                                    yield SSEFormatter.yield_done_event()
+                                    break
+
+                        except Exception as e:
+                            logger.error(f"Error streaming LLM in rag: {e}")
+                            # Optionally yield an SSE "error" event or handle differently
+                            raise
+
+                    # The request is timed and profiled until the stream
+                    # ends, not just until the generator is returned.
+                    stream_scope = request_scope.pop_all()
+
+                    async def timed_sse_generator() -> AsyncGenerator[
+                        str, None
+                    ]:
+                        with stream_scope:
+                            async with aclosing(sse_generator()) as stream:
+                                async for line in stream:
+                                    yield line
 
-                return sse_generator()
+                    return timed_sse_generator()
 
-        except Exception as e:
-            logger.exception(f"Error in RAG pipeline: {e}")
-            if "NoneType" in str(e):
+            except Exception as e:
+                logger.exception(f"Error in RAG pipeline: {e}")
+                if "NoneType" in str(e):
+                    raise HTTPException(
+                        status_code=502,
+                        detail="Server not reachable or returned an invalid response",
+                    ) from e
                 raise HTTPException(
-                    status_code=502,
-                    detail="Server not reachable or returned an invalid response",
+                    status_code=500,
+                    detail=f"Internal RAG Error - {str(e)}",
                 ) from e
-            raise HTTPException(
-                status_code=500,
-                detail=f"Internal RAG Error - {str(e)}",
-            ) from e
 
     def _find_item_by_shortid(
         self, sid: str, collector: SearchResultsCollector
@@ -1262,6 +1365,67 @@ class RetrievalService(Service):
                         return result_obj  # (source_type, result_obj)
         return None
 
+    def _schedule_conversation_summary(
+        self, conversation_id: UUID, window: dict[str, Any]
+    ) -> None:
+        """Fold turns that have left the history window into the
+        conversation's running summary, in the background.
+
+        Only messages newer than the current summary are summarized, so each
+        turn is summarized once; the updated summary is used from the next
+        turn on.
+        """
+        window_start = window["window_start"]
+        summary_until = window["summary_until"]
+        if window_start is None or (
+            summary_until is not None and summary_until >= window_start
+        ):
+            return
+        if conversation_id in self._summarizing_conversations:
+            return
+
+        async def summarize():
+            try:
+                evicted = await self.providers.database.conversations_handler.get_messages_between(
+                    conversation_id,
+                    after=summary_until,
+                    before=window_start,
+                )
+                if not evicted:
+                    return
+                transcript = "\n".join(
+                    f"{response.message.role}: {response.message.content}"
+                    for response, _ in evicted
+                )
+                prompt = await self.providers.database.prompts_handler.get_cached_prompt(
+                    prompt_name="conversation_summary",
+                    inputs={
+                        "summary": window["summary"] or "",
+                        "messages": transcript,
+                    },
+                )
+                response = await self.providers.llm.aget_completion(
+                    messages=[{"role": "user", "content": prompt}],
+                    generation_config=GenerationConfig(
+                        model=self.config.app.fast_llm, stream=False
+                    ),
+                )
+                await self.providers.database.conversations_handler.update_conversation_summary(
+                    conversation_id,
+                    summary=response.choices[0].message.content,
+                    summary_until=evicted[-1][1],
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error summarizing conversation {conversation_id}: {e}"
+                )
+            finally:
+                self._summarizing_conversations.pop(conversation_id, None)
+
+        self._summarizing_conversations[conversation_id] = asyncio.create_task(
+            summarize()
+        )
+
     async def agent(
         self,
         rag_generation_config: GenerationConfig,
@@ -1380,11 +1544,21 @@ class RetrievalService(Service):
 
             # Process conversation data
             ids = []
+            conversation_messages = None
+            conversation_summary = None
             if conversation_id:  # Fetch the existing conversation
                 try:
-                    conversation_messages = await self.providers.database.conversations_handler.get_conversation(
+                    conversation_window = await self.providers.database.conversations_handler.get_conversation_window(
                         conversation_id=conversation_id,
+                        max_tokens=self.config.agent.conversation_history_max_tokens,
+                        max_messages=self.config.agent.conversation_history_max_messages,
                     )
+                    conversation_messages = conversation_window["messages"]
+                    conversation_summary = conversation_window["summary"]
+                    if self.config.agent.summarize_conversation_history:
+                        self._schedule_conversation_summary(
+                            conversation_id, conversation_window
+                        )
                     if needs_initial_conversation_name is None:
                         overview = await self.providers.database.conversations_handler.get_conversations_overview(
                             offset=0,
@@ -1471,6 +1645,12 @@ class RetrievalService(Service):
                     )
                 )
 
+            if conversation_summary:
+                system_instruction += (
+                    "\n\n### Summary of the earlier conversation:\n"
+                    f"{conversation_summary}"
+                )
+
             # Configure agent with appropriate tools
             agent_config = deepcopy(self.config.agent)
             if mode == "rag":
@@ -1728,8 +1908,9 @@ class RetrievalService(Service):
         Args:
             filters: A dictionary describing the allowed filters
                      (owner_id, collection_ids, document_id).
-            options: A dictionary with extra options, e.g. include_summary_embedding
-                     or any custom flags for additional logic.
+            options: A dictionary with extra options, e.g. include_summary_embedding,
+                     or chunks_per_document to return only the first N chunks
+                     of each document (default: all of them).
 
         Returns:
             A list of dicts, where each dict has:
@@ -1751,19 +1932,17 @@ class RetrievalService(Service):
         if not matching_docs["results"]:
             return []
 
-        # 3. For each document, fetch associated chunks in ascending chunk order
+        # 3. Fetch the chunks of all documents at once, in ascending chunk order
+        chunks_by_document = await self.providers.database.chunks_handler.list_chunks_for_documents(
+            document_ids=[doc.id for doc in matching_docs["results"]],
+            limit_per_document=options.get("chunks_per_document", -1),
+            include_vectors=False,
+        )
+
+        # 4. Build a returned structure that includes doc + chunks
         results = []
         for doc_response in matching_docs["results"]:
-            doc_id = doc_response.id
-            chunk_data = await self.providers.database.chunks_handler.list_document_chunks(
-                document_id=doc_id,
-                offset=0,
-                limit=-1,  # get all chunks
-                include_vectors=False,
-            )
-            chunks = chunk_data["results"]  # already sorted by chunk_order
-            doc_response.chunks = chunks
-            # 4. Build a returned structure that includes doc + chunks
+            doc_response.chunks = chunks_by_document.get(doc_response.id, [])
             results.append(doc_response.model_dump())
 
         return results
@@ -1818,9 +1997,65 @@ class RetrievalService(Service):
     async def _build_documents_context(
         self,
         filter_user_id: Optional[UUID] = None,
+        filter_collection_ids: Optional[list[UUID]] = None,
         max_summary_length: int = 128,
         limit: int = 25,
         reverse_order: bool = True,
+    ) -> str:
+        """
+        Returns the document-context block for the given user and collection
+        set, rendering it only if there is no fresh cached copy. Cached blocks
+        are dropped whenever documents change through the documents handler,
+        and after `document_context_cache_ttl` seconds (writes made by other
+        processes are only picked up then).
+        """
+        ttl = self.config.agent.document_context_cache_ttl
+        if ttl <= 0:
+            return await self._render_documents_context(
+                filter_user_id, max_summary_length, limit, reverse_order
+            )
+
+        cache_key = (
+            filter_user_id,
+            frozenset(str(c) for c in filter_collection_ids or ()),
+            max_summary_length,
+            limit,
+            reverse_order,
+        )
+        # Read the generation before querying, so a write that lands while
+        # the block is being rendered still invalidates it.
+        generation = self.providers.database.documents_handler.generation
+        cached = self._documents_context_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == generation
+            and cached[1] > time.monotonic()
+        ):
+            self._documents_context_cache.move_to_end(cache_key)
+            return cached[2]
+
+        context = await self._render_documents_context(
+            filter_user_id, max_summary_length, limit, reverse_order
+        )
+        self._documents_context_cache[cache_key] = (
+            generation,
+            time.monotonic() + ttl,
+            context,
+        )
+        self._documents_context_cache.move_to_end(cache_key)
+        while (
+            len(self._documents_context_cache)
+            > self.config.agent.document_context_cache_size
+        ):
+            self._documents_context_cache.popitem(last=False)
+        return context
+
+    async def _render_documents_context(
+        self,
+        filter_user_id: Optional[UUID],
+        max_summary_length: int,
+        limit: int,
+        reverse_order: bool,
     ) -> str:
         """
         Fetches documents matching the given filters and returns a formatted string
@@ -1907,6 +2142,7 @@ class RetrievalService(Service):
         if use_system_context:
             doc_context_str = await self._build_documents_context(
                 filter_user_id=filter_user_id,
+                filter_collection_ids=filter_collection_ids,
             )
             logger.debug(f"Loading prompt {prompt_name}")
             # Now fetch the prompt from the database prompts handler
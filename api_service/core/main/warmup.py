@@ -0,0 +1,87 @@
+"""Process warm-up and readiness for the API server.
+
+`warm_process` does the expensive start-up work that is safe to share
+across a fork: loading the config, importing the provider modules the
+config selects (see `R2RProviderFactory.import_providers`), loading tokenizer encodings and parsing the prompt YAML files. When the
+app is served through `core.main.gunicorn_conf`, it runs once in the
+gunicorn master and every worker inherits the result copy-on-write.
+Anything holding sockets, threads or an event loop (database pools, HTTP
+clients, the shared cache connection) is still created in each worker,
+by the app lifespan.
+
+A worker reports ready (`GET /v3/health/ready`) only after it has been
+warmed and its lifespan has finished building the app.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from .config import R2RConfig
+
+logger = logging.getLogger()
+
+WARM_ENCODINGS = ("cl100k_base", "o200k_base")
+
+_warm_configs: dict[tuple[Optional[str], Optional[str]], R2RConfig] = {}
+_warm_seconds: Optional[float] = None
+_ready = False
+
+
+def warm_process(
+    config_name: Optional[str] = None, config_path: Optional[str] = None
+) -> R2RConfig:
+    """Load the config and everything the workers would otherwise load on
+    start-up or on their first requests. Repeated calls are free."""
+    global _warm_seconds
+    key = (config_name, config_path)
+    if key in _warm_configs:
+        return _warm_configs[key]
+
+    start = time.perf_counter()
+    config = R2RConfig.load(config_name=config_name, config_path=config_path)
+
+    # Only the selected providers: their modules pull in litellm, the
+    # LLM SDKs and the parsers.
+    from .assembly.factory import R2RProviderFactory
+
+    R2RProviderFactory.import_providers(config)
+
+    try:
+        import tiktoken
+
+        for encoding in WARM_ENCODINGS:
+            tiktoken.get_encoding(encoding)
+    except Exception as e:
+        logger.warning(f"Could not preload tokenizer encodings: {e}")
+
+    from core.providers.database.prompts_handler import (
+        DEFAULT_PROMPT_DIRECTORY,
+        load_prompt_files,
+    )
+
+    if DEFAULT_PROMPT_DIRECTORY.is_dir():
+        load_prompt_files(DEFAULT_PROMPT_DIRECTORY)
+
+    _warm_configs[key] = config
+    _warm_seconds = time.perf_counter() - start
+    logger.info(f"Warmed API process state in {_warm_seconds:.2f}s")
+    return config
+
+
+def mark_ready() -> None:
+    global _ready
+    _ready = True
+
+
+def mark_not_ready() -> None:
+    global _ready
+    _ready = False
+
+
+def is_ready() -> bool:
+    return _ready and _warm_seconds is not None
+
+
+def warm_seconds() -> Optional[float]:
+    return _warm_seconds
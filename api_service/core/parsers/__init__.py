@@ -1,6 +1,13 @@
-from .media import *
-from .structured import *
-from .text import *
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+from . import media, structured, text
+
+if TYPE_CHECKING:
+    from .media import *
+    from .structured import *
+    from .text import *
 
 __all__ = [
     "AudioParser",
@@ -37,3 +44,12 @@ __all__ = [
     "JSParser",
     "TSParser",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        name: f".{package.__name__.rpartition('.')[2]}"
+        for package in (media, structured, text)
+        for name in package.__all__
+    },
+)
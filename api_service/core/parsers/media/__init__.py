@@ -1,19 +1,24 @@
 # type: ignore
-from .audio_parser import AudioParser
-from .bmp_parser import BMPParser
-from .doc_parser import DOCParser
-from .docx_parser import DOCXParser
-from .img_parser import ImageParser
-from .odt_parser import ODTParser
-from .pdf_parser import (
-    BasicPDFParser,
-    OCRPDFParser,
-    PDFParserUnstructured,
-    VLMPDFParser,
-)
-from .ppt_parser import PPTParser
-from .pptx_parser import PPTXParser
-from .rtf_parser import RTFParser
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .audio_parser import AudioParser
+    from .bmp_parser import BMPParser
+    from .doc_parser import DOCParser
+    from .docx_parser import DOCXParser
+    from .img_parser import ImageParser
+    from .odt_parser import ODTParser
+    from .pdf_parser import (
+        BasicPDFParser,
+        OCRPDFParser,
+        PDFParserUnstructured,
+        VLMPDFParser,
+    )
+    from .ppt_parser import PPTParser
+    from .pptx_parser import PPTXParser
+    from .rtf_parser import RTFParser
 
 __all__ = [
     "AudioParser",
@@ -30,3 +35,22 @@ __all__ = [
     "PPTXParser",
     "RTFParser",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AudioParser": ".audio_parser",
+        "BMPParser": ".bmp_parser",
+        "DOCParser": ".doc_parser",
+        "DOCXParser": ".docx_parser",
+        "ImageParser": ".img_parser",
+        "ODTParser": ".odt_parser",
+        "BasicPDFParser": ".pdf_parser",
+        "OCRPDFParser": ".pdf_parser",
+        "PDFParserUnstructured": ".pdf_parser",
+        "VLMPDFParser": ".pdf_parser",
+        "PPTParser": ".ppt_parser",
+        "PPTXParser": ".pptx_parser",
+        "RTFParser": ".rtf_parser",
+    },
+)
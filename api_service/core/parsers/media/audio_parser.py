@@ -4,8 +4,6 @@ import os
 import tempfile
 from typing import AsyncGenerator
 
-from litellm import atranscription
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -28,7 +26,6 @@ class AudioParser(AsyncParser[bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.atranscription = atranscription
 
     async def ingest(  # type: ignore
         self, data: bytes, **kwargs
@@ -43,6 +40,8 @@ class AudioParser(AsyncParser[bytes]):
         Yields:
             Chunks of transcribed text
         """
+        from litellm import atranscription
+
         try:
             # Create a temporary file to store the audio data
             with tempfile.NamedTemporaryFile(
@@ -52,7 +51,7 @@ class AudioParser(AsyncParser[bytes]):
                 temp_file_path = temp_file.name
 
             # Call Whisper transcription
-            response = await self.atranscription(
+            response = await atranscription(
                 model=self.config.audio_transcription_model
                 or self.config.app.audio_lm,
                 file=open(temp_file_path, "rb"),
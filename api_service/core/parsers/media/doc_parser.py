@@ -3,8 +3,6 @@ import re
 from io import BytesIO
 from typing import AsyncGenerator
 
-import olefile
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -25,12 +23,13 @@ class DOCParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.olefile = olefile
 
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest DOC data and yield text from the document."""
+        import olefile
+
         if isinstance(data, str):
             raise ValueError("DOC data must be in bytes format.")
 
@@ -39,7 +38,7 @@ class DOCParser(AsyncParser[str | bytes]):
 
         try:
             # Open the DOC file using olefile
-            ole = self.olefile.OleFileIO(file_obj)
+            ole = olefile.OleFileIO(file_obj)
 
             # Check if it's a Word document
             if not ole.exists("WordDocument"):
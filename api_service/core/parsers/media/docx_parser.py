@@ -2,8 +2,6 @@
 from io import BytesIO
 from typing import AsyncGenerator
 
-from docx import Document
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -24,15 +22,16 @@ class DOCXParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.Document = Document
 
     async def ingest(
         self, data: str | bytes, *args, **kwargs
     ) -> AsyncGenerator[str, None]:  # type: ignore
         """Ingest DOCX data and yield text from each paragraph."""
+        from docx import Document
+
         if isinstance(data, str):
             raise ValueError("DOCX data must be in bytes format.")
 
-        doc = self.Document(BytesIO(data))
+        doc = Document(BytesIO(data))
         for paragraph in doc.paragraphs:
             yield paragraph.text
@@ -4,10 +4,6 @@ import logging
 from io import BytesIO
 from typing import AsyncGenerator, Optional
 
-import filetype
-import pillow_heif
-from PIL import Image
-
 from core.base.abstractions import GenerationConfig
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
@@ -43,9 +39,6 @@ class ImageParser(AsyncParser[str | bytes]):
         self.llm_provider = llm_provider
         self.config = config
         self.vision_prompt_text = None
-        self.Image = Image
-        self.pillow_heif = pillow_heif
-        self.pillow_heif.register_heif_opener()
 
     def _is_heic(self, data: bytes) -> bool:
         """Detect HEIC format using magic numbers and patterns."""
@@ -70,12 +63,14 @@ class ImageParser(AsyncParser[str | bytes]):
 
     async def _convert_heic_to_jpeg(self, data: bytes) -> bytes:
         """Convert HEIC image to JPEG format."""
+        import pillow_heif
+
         try:
             # Create BytesIO object for input
             input_buffer = BytesIO(data)
 
             # Load HEIC image using pillow_heif
-            heif_file = self.pillow_heif.read_heif(input_buffer)
+            heif_file = pillow_heif.read_heif(input_buffer)
 
             # Get the primary image - API changed, need to get first image
             heif_image = heif_file[0]  # Get first image in the container
@@ -129,6 +124,8 @@ class ImageParser(AsyncParser[str | bytes]):
         Returns:
             str: The MIME type for the image
         """
+        import filetype
+
         try:
             # First, try format-specific detection functions
             if self._is_heic(data):
@@ -7,11 +7,7 @@ import string
 import time
 import unicodedata
 from io import BytesIO
-from typing import AsyncGenerator
-
-import pdf2image
-from mistralai.models import OCRResponse
-from pypdf import PdfReader
+from typing import TYPE_CHECKING, AsyncGenerator
 
 from core.base.abstractions import GenerationConfig
 from core.base.parsers.base_parser import AsyncParser
@@ -22,6 +18,9 @@ from core.base.providers import (
     OCRProvider,
 )
 
+if TYPE_CHECKING:
+    from mistralai.models import OCRResponse
+
 logger = logging.getLogger()
 
 
@@ -235,6 +234,8 @@ class VLMPDFParser(AsyncParser[str | bytes]):
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[dict[str, str | int], None]:
         """Process PDF as images using pdf2image."""
+        import pdf2image
+
         ingest_start = time.perf_counter()
         logger.info("Starting PDF ingestion using VLMPDFParser.")
 
@@ -366,15 +367,16 @@ class BasicPDFParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.PdfReader = PdfReader
 
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest PDF data and yield text from each page."""
+        from pypdf import PdfReader
+
         if isinstance(data, str):
             raise ValueError("PDF data must be in bytes format.")
-        pdf = self.PdfReader(BytesIO(data))
+        pdf = PdfReader(BytesIO(data))
         for page in pdf.pages:
             page_text = page.extract_text()
             if page_text is not None:
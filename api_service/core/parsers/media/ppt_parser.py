@@ -3,8 +3,6 @@ import struct
 from io import BytesIO
 from typing import AsyncGenerator
 
-import olefile
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -25,7 +23,6 @@ class PPTParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.olefile = olefile
 
     def _extract_text_from_record(self, data: bytes) -> str:
         """Extract text from a PPT text record."""
@@ -41,11 +38,13 @@ class PPTParser(AsyncParser[str | bytes]):
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest PPT data and yield text from each slide."""
+        import olefile
+
         if isinstance(data, str):
             raise ValueError("PPT data must be in bytes format.")
 
         try:
-            ole = self.olefile.OleFileIO(BytesIO(data))
+            ole = olefile.OleFileIO(BytesIO(data))
 
             # PPT stores text in PowerPoint Document stream
             if not ole.exists("PowerPoint Document"):
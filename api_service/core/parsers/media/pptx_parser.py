@@ -2,8 +2,6 @@
 from io import BytesIO
 from typing import AsyncGenerator
 
-from pptx import Presentation
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -24,16 +22,17 @@ class PPTXParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.Presentation = Presentation
 
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:  # type: ignore
         """Ingest PPT data and yield text from each slide."""
+        from pptx import Presentation
+
         if isinstance(data, str):
             raise ValueError("PPT data must be in bytes format.")
 
-        prs = self.Presentation(BytesIO(data))
+        prs = Presentation(BytesIO(data))
         for slide in prs.slides:
             for shape in slide.shapes:
                 if hasattr(shape, "text"):
@@ -1,8 +1,6 @@
 # type: ignore
 from typing import AsyncGenerator
 
-from striprtf.striprtf import rtf_to_text
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -23,17 +21,18 @@ class RTFParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.striprtf = rtf_to_text
 
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
+        from striprtf.striprtf import rtf_to_text
+
         if isinstance(data, bytes):
             data = data.decode("utf-8", errors="ignore")
 
         try:
             # Convert RTF to plain text
-            plain_text = self.striprtf(data)
+            plain_text = rtf_to_text(data)
 
             # Split into paragraphs and yield non-empty ones
             paragraphs = plain_text.split("\n\n")
@@ -1,15 +1,20 @@
 # type: ignore
-from .csv_parser import CSVParser, CSVParserAdvanced
-from .eml_parser import EMLParser
-from .epub_parser import EPUBParser
-from .json_parser import JSONParser
-from .msg_parser import MSGParser
-from .org_parser import ORGParser
-from .p7s_parser import P7SParser
-from .rst_parser import RSTParser
-from .tsv_parser import TSVParser
-from .xls_parser import XLSParser
-from .xlsx_parser import XLSXParser, XLSXParserAdvanced
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .csv_parser import CSVParser, CSVParserAdvanced
+    from .eml_parser import EMLParser
+    from .epub_parser import EPUBParser
+    from .json_parser import JSONParser
+    from .msg_parser import MSGParser
+    from .org_parser import ORGParser
+    from .p7s_parser import P7SParser
+    from .rst_parser import RSTParser
+    from .tsv_parser import TSVParser
+    from .xls_parser import XLSParser
+    from .xlsx_parser import XLSXParser, XLSXParserAdvanced
 
 __all__ = [
     "CSVParser",
@@ -26,3 +31,22 @@ __all__ = [
     "XLSXParser",
     "XLSXParserAdvanced",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CSVParser": ".csv_parser",
+        "CSVParserAdvanced": ".csv_parser",
+        "EMLParser": ".eml_parser",
+        "EPUBParser": ".epub_parser",
+        "JSONParser": ".json_parser",
+        "MSGParser": ".msg_parser",
+        "ORGParser": ".org_parser",
+        "P7SParser": ".p7s_parser",
+        "RSTParser": ".rst_parser",
+        "TSVParser": ".tsv_parser",
+        "XLSParser": ".xls_parser",
+        "XLSXParser": ".xlsx_parser",
+        "XLSXParserAdvanced": ".xlsx_parser",
+    },
+)
@@ -2,8 +2,6 @@
 import logging
 from typing import AsyncGenerator
 
-import epub
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -26,7 +24,6 @@ class EPUBParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.epub = epub
 
     def _safe_get_metadata(self, book, field: str) -> str | None:
         """Safely extract metadata field from epub book."""
@@ -57,6 +54,8 @@ class EPUBParser(AsyncParser[str | bytes]):
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest EPUB data and yield book content."""
+        import epub
+
         if isinstance(data, str):
             raise ValueError("EPUB data must be in bytes format.")
 
@@ -65,7 +64,7 @@ class EPUBParser(AsyncParser[str | bytes]):
         file_obj = BytesIO(data)
 
         try:
-            book = self.epub.open_epub(file_obj)
+            book = epub.open_epub(file_obj)
 
             # Safely extract metadata
             metadata = []
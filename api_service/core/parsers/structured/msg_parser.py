@@ -3,8 +3,6 @@ import os
 import tempfile
 from typing import AsyncGenerator
 
-from msg_parser import MsOxMessage
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -30,6 +28,8 @@ class MSGParser(AsyncParser[str | bytes]):
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest MSG data and yield email content."""
+        from msg_parser import MsOxMessage
+
         if isinstance(data, str):
             raise ValueError("MSG data must be in bytes format.")
 
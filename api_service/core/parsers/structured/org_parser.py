@@ -1,8 +1,6 @@
 # type: ignore
 from typing import AsyncGenerator
 
-import orgparse
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -23,7 +21,6 @@ class ORGParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.orgparse = orgparse
 
     def _process_node(self, node) -> list[str]:
         """Process an org-mode node and return its content."""
@@ -43,6 +40,8 @@ class ORGParser(AsyncParser[str | bytes]):
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest ORG data and yield document content."""
+        import orgparse
+
         if isinstance(data, bytes):
             data = data.decode("utf-8")
 
@@ -53,7 +52,7 @@ class ORGParser(AsyncParser[str | bytes]):
             file_obj = StringIO(data)
 
             # Parse the org file
-            root = self.orgparse.load(file_obj)
+            root = orgparse.load(file_obj)
 
             # Process root node if it has content
             if root.body:
@@ -6,10 +6,6 @@ from datetime import datetime
 from email.message import Message
 from typing import AsyncGenerator
 
-from cryptography import x509
-from cryptography.hazmat.primitives.serialization import pkcs7
-from cryptography.x509.oid import NameOID
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -32,9 +28,6 @@ class P7SParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.x509 = x509
-        self.pkcs7 = pkcs7
-        self.NameOID = NameOID
 
     def _format_datetime(self, dt: datetime) -> str:
         """Format datetime in a readable way."""
@@ -49,25 +42,27 @@ class P7SParser(AsyncParser[str | bytes]):
 
     def _extract_cert_info(self, cert) -> dict:
         """Extract relevant information from a certificate."""
+        from cryptography.x509.oid import NameOID
+
         try:
             subject = cert.subject
             issuer = cert.issuer
 
             info = {
                 "common_name": self._get_name_attribute(
-                    subject, self.NameOID.COMMON_NAME
+                    subject, NameOID.COMMON_NAME
                 ),
                 "organization": self._get_name_attribute(
-                    subject, self.NameOID.ORGANIZATION_NAME
+                    subject, NameOID.ORGANIZATION_NAME
                 ),
                 "email": self._get_name_attribute(
-                    subject, self.NameOID.EMAIL_ADDRESS
+                    subject, NameOID.EMAIL_ADDRESS
                 ),
                 "issuer_common_name": self._get_name_attribute(
-                    issuer, self.NameOID.COMMON_NAME
+                    issuer, NameOID.COMMON_NAME
                 ),
                 "issuer_organization": self._get_name_attribute(
-                    issuer, self.NameOID.ORGANIZATION_NAME
+                    issuer, NameOID.ORGANIZATION_NAME
                 ),
                 "serial_number": hex(cert.serial_number)[2:],
                 "not_valid_before": self._format_datetime(
@@ -85,11 +80,13 @@ class P7SParser(AsyncParser[str | bytes]):
 
     def _try_parse_signature(self, data: bytes):
         """Try to parse the signature data as PKCS7 containing certificates."""
+        from cryptography.hazmat.primitives.serialization import pkcs7
+
         exceptions = []
 
         # Try DER format PKCS7
         try:
-            certs = self.pkcs7.load_der_pkcs7_certificates(data)
+            certs = pkcs7.load_der_pkcs7_certificates(data)
             if certs is not None:
                 return certs
         except Exception as e:
@@ -97,7 +94,7 @@ class P7SParser(AsyncParser[str | bytes]):
 
         # Try PEM format PKCS7
         try:
-            certs = self.pkcs7.load_pem_pkcs7_certificates(data)
+            certs = pkcs7.load_pem_pkcs7_certificates(data)
             if certs is not None:
                 return certs
         except Exception as e:
@@ -1,9 +1,6 @@
 # type: ignore
 from typing import AsyncGenerator
 
-from docutils.core import publish_string
-from docutils.writers import html5_polyglot
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -24,20 +21,21 @@ class RSTParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.publish_string = publish_string
-        self.html5_polyglot = html5_polyglot
 
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
+        from docutils.core import publish_string
+        from docutils.writers import html5_polyglot
+
         if isinstance(data, bytes):
             data = data.decode("utf-8")
 
         try:
             # Convert RST to HTML
-            html = self.publish_string(
+            html = publish_string(
                 source=data,
-                writer=self.html5_polyglot.Writer(),
+                writer=html5_polyglot.Writer(),
                 settings_overrides={"report_level": 5},
             )
 
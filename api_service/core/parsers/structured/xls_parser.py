@@ -1,10 +1,6 @@
 # type: ignore
 from typing import AsyncGenerator
 
-import networkx as nx
-import numpy as np
-import xlrd
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -25,16 +21,17 @@ class XLSParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.xlrd = xlrd
 
     async def ingest(
         self, data: bytes, *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest XLS data and yield text from each row."""
+        import xlrd
+
         if isinstance(data, str):
             raise ValueError("XLS data must be in bytes format.")
 
-        wb = self.xlrd.open_workbook(file_contents=data)
+        wb = xlrd.open_workbook(file_contents=data)
         for sheet in wb.sheets():
             for row_idx in range(sheet.nrows):
                 # Get all values in the row
@@ -42,16 +39,16 @@ class XLSParser(AsyncParser[str | bytes]):
                 for col_idx in range(sheet.ncols):
                     cell = sheet.cell(row_idx, col_idx)
                     # Handle different cell types
-                    if cell.ctype == self.xlrd.XL_CELL_DATE:
+                    if cell.ctype == xlrd.XL_CELL_DATE:
                         try:
-                            value = self.xlrd.xldate_as_datetime(
+                            value = xlrd.xldate_as_datetime(
                                 cell.value, wb.datemode
                             ).strftime("%Y-%m-%d")
                         except Exception:
                             value = str(cell.value)
-                    elif cell.ctype == self.xlrd.XL_CELL_BOOLEAN:
+                    elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
                         value = str(bool(cell.value)).lower()
-                    elif cell.ctype == self.xlrd.XL_CELL_ERROR:
+                    elif cell.ctype == xlrd.XL_CELL_ERROR:
                         value = "#ERROR#"
                     else:
                         value = str(cell.value).strip()
@@ -71,15 +68,15 @@ class XLSParserAdvanced(AsyncParser[str | bytes]):
     ):
         self.llm_provider = llm_provider
         self.config = config
-        self.nx = nx
-        self.np = np
-        self.xlrd = xlrd
 
     def connected_components(self, arr):
-        g = self.nx.grid_2d_graph(len(arr), len(arr[0]))
-        empty_cell_indices = list(zip(*self.np.where(arr == ""), strict=False))
+        import networkx as nx
+        import numpy as np
+
+        g = nx.grid_2d_graph(len(arr), len(arr[0]))
+        empty_cell_indices = list(zip(*np.where(arr == ""), strict=False))
         g.remove_nodes_from(empty_cell_indices)
-        components = self.nx.connected_components(g)
+        components = nx.connected_components(g)
         for component in components:
             rows, cols = zip(*component, strict=False)
             min_row, max_row = min(rows), max(rows)
@@ -88,16 +85,18 @@ class XLSParserAdvanced(AsyncParser[str | bytes]):
 
     def get_cell_value(self, cell, workbook):
         """Extract cell value handling different data types."""
-        if cell.ctype == self.xlrd.XL_CELL_DATE:
+        import xlrd
+
+        if cell.ctype == xlrd.XL_CELL_DATE:
             try:
-                return self.xlrd.xldate_as_datetime(
+                return xlrd.xldate_as_datetime(
                     cell.value, workbook.datemode
                 ).strftime("%Y-%m-%d")
             except Exception:
                 return str(cell.value)
-        elif cell.ctype == self.xlrd.XL_CELL_BOOLEAN:
+        elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
             return str(bool(cell.value)).lower()
-        elif cell.ctype == self.xlrd.XL_CELL_ERROR:
+        elif cell.ctype == xlrd.XL_CELL_ERROR:
             return "#ERROR#"
         else:
             return str(cell.value).strip()
@@ -106,14 +105,17 @@ class XLSParserAdvanced(AsyncParser[str | bytes]):
         self, data: bytes, num_col_times_num_rows: int = 100, *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest XLS data and yield text from each connected component."""
+        import numpy as np
+        import xlrd
+
         if isinstance(data, str):
             raise ValueError("XLS data must be in bytes format.")
 
-        workbook = self.xlrd.open_workbook(file_contents=data)
+        workbook = xlrd.open_workbook(file_contents=data)
 
         for sheet in workbook.sheets():
             # Convert sheet to numpy array with proper value handling
-            ws_data = self.np.array(
+            ws_data = np.array(
                 [
                     [
                         self.get_cell_value(sheet.cell(row, col), workbook)
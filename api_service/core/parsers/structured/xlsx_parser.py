@@ -2,10 +2,6 @@
 from io import BytesIO
 from typing import AsyncGenerator
 
-import networkx as nx
-import numpy as np
-from openpyxl import load_workbook
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -26,16 +22,17 @@ class XLSXParser(AsyncParser[str | bytes]):
         self.database_provider = database_provider
         self.llm_provider = llm_provider
         self.config = config
-        self.load_workbook = load_workbook
 
     async def ingest(
         self, data: bytes, *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest XLSX data and yield text from each row."""
+        from openpyxl import load_workbook
+
         if isinstance(data, str):
             raise ValueError("XLSX data must be in bytes format.")
 
-        wb = self.load_workbook(filename=BytesIO(data))
+        wb = load_workbook(filename=BytesIO(data))
         for sheet in wb.worksheets:
             for row in sheet.iter_rows(values_only=True):
                 yield ", ".join(map(str, row))
@@ -50,17 +47,15 @@ class XLSXParserAdvanced(AsyncParser[str | bytes]):
     ):
         self.llm_provider = llm_provider
         self.config = config
-        self.nx = nx
-        self.np = np
-        self.load_workbook = load_workbook
 
     def connected_components(self, arr):
-        g = self.nx.grid_2d_graph(len(arr), len(arr[0]))
-        empty_cell_indices = list(
-            zip(*self.np.where(arr is None), strict=False)
-        )
+        import networkx as nx
+        import numpy as np
+
+        g = nx.grid_2d_graph(len(arr), len(arr[0]))
+        empty_cell_indices = list(zip(*np.where(arr is None), strict=False))
         g.remove_nodes_from(empty_cell_indices)
-        components = self.nx.connected_components(g)
+        components = nx.connected_components(g)
         for component in components:
             rows, cols = zip(*component, strict=False)
             min_row, max_row = min(rows), max(rows)
@@ -73,13 +68,16 @@ class XLSXParserAdvanced(AsyncParser[str | bytes]):
         self, data: bytes, num_col_times_num_rows: int = 100, *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest XLSX data and yield text from each connected component."""
+        import numpy as np
+        from openpyxl import load_workbook
+
         if isinstance(data, str):
             raise ValueError("XLSX data must be in bytes format.")
 
-        workbook = self.load_workbook(filename=BytesIO(data))
+        workbook = load_workbook(filename=BytesIO(data))
 
         for ws in workbook.worksheets:
-            ws_data = self.np.array(
+            ws_data = np.array(
                 [[cell.value for cell in row] for row in ws.iter_rows()]
             )
             for table in self.connected_components(ws_data):
@@ -1,11 +1,16 @@
 # type: ignore
-from .css_parser import CSSParser
-from .html_parser import HTMLParser
-from .js_parser import JSParser
-from .md_parser import MDParser
-from .python_parser import PythonParser
-from .text_parser import TextParser
-from .ts_parser import TSParser
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .css_parser import CSSParser
+    from .html_parser import HTMLParser
+    from .js_parser import JSParser
+    from .md_parser import MDParser
+    from .python_parser import PythonParser
+    from .text_parser import TextParser
+    from .ts_parser import TSParser
 
 __all__ = [
     "MDParser",
@@ -16,3 +21,16 @@ __all__ = [
     "JSParser",
     "TSParser",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CSSParser": ".css_parser",
+        "HTMLParser": ".html_parser",
+        "JSParser": ".js_parser",
+        "MDParser": ".md_parser",
+        "PythonParser": ".python_parser",
+        "TextParser": ".text_parser",
+        "TSParser": ".ts_parser",
+    },
+)
@@ -1,8 +1,6 @@
 # type: ignore
 from typing import AsyncGenerator
 
-from bs4 import BeautifulSoup
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -28,5 +26,7 @@ class HTMLParser(AsyncParser[str | bytes]):
         self, data: str | bytes, *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest HTML data and yield text."""
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(data, "html.parser")
         yield soup.get_text()
@@ -1,8 +1,6 @@
 # type: ignore
 from typing import AsyncGenerator
 
-from bs4 import BeautifulSoup
-
 from core.base.parsers.base_parser import AsyncParser
 from core.base.providers import (
     CompletionProvider,
@@ -32,6 +30,8 @@ class MDParser(AsyncParser[str | bytes]):
         self, data: str | bytes, *args, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest Markdown data and yield text."""
+        from bs4 import BeautifulSoup
+
         if isinstance(data, bytes):
             data = data.decode("utf-8")
         html = self.markdown.markdown(data)
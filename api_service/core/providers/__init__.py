@@ -1,49 +1,55 @@
-from .auth import (
-    ClerkAuthProvider,
-    JwtAuthProvider,
-    R2RAuthProvider,
-    SupabaseAuthProvider,
-)
-from .crypto import (
-    BcryptCryptoConfig,
-    BCryptCryptoProvider,
-    NaClCryptoConfig,
-    NaClCryptoProvider,
-)
-from .database import PostgresDatabaseProvider
-from .email import (
-    AsyncSMTPEmailProvider,
-    ConsoleMockEmailProvider,
-    MailerSendEmailProvider,
-    SendGridEmailProvider,
-)
-from .embeddings import (
-    LiteLLMEmbeddingProvider,
-    OllamaEmbeddingProvider,
-    OpenAIEmbeddingProvider,
-)
-from .ingestion import (  # type: ignore
-    R2RIngestionConfig,
-    R2RIngestionProvider,
-    UnstructuredIngestionConfig,
-    UnstructuredIngestionProvider,
-)
-from .llm import (
-    AnthropicCompletionProvider,
-    LiteLLMCompletionProvider,
-    OpenAICompletionProvider,
-    R2RCompletionProvider,
-)
-from .ocr import (
-    MistralOCRProvider,
-)
-from .orchestration import (
-    HatchetOrchestrationProvider,
-    SimpleOrchestrationProvider,
-)
-from .scheduler import (
-    APSchedulerProvider,
-)
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .auth import (
+        ClerkAuthProvider,
+        JwtAuthProvider,
+        R2RAuthProvider,
+        SupabaseAuthProvider,
+    )
+    from .crypto import (
+        BcryptCryptoConfig,
+        BCryptCryptoProvider,
+        NaClCryptoConfig,
+        NaClCryptoProvider,
+    )
+    from .database import PostgresDatabaseProvider
+    from .email import (
+        AsyncSMTPEmailProvider,
+        ConsoleMockEmailProvider,
+        MailerSendEmailProvider,
+        SendGridEmailProvider,
+    )
+    from .embeddings import (
+        LiteLLMEmbeddingProvider,
+        OllamaEmbeddingProvider,
+        OpenAIEmbeddingProvider,
+    )
+    from .ingestion import (  # type: ignore
+        R2RIngestionConfig,
+        R2RIngestionProvider,
+        UnstructuredIngestionConfig,
+        UnstructuredIngestionProvider,
+    )
+    from .llm import (
+        AnthropicCompletionProvider,
+        LiteLLMCompletionProvider,
+        OpenAICompletionProvider,
+        R2RCompletionProvider,
+    )
+    from .ocr import (
+        MistralOCRProvider,
+    )
+    from .orchestration import (
+        HatchetOrchestrationProvider,
+        PostgresOrchestrationProvider,
+        SimpleOrchestrationProvider,
+    )
+    from .scheduler import (
+        APSchedulerProvider,
+    )
 
 __all__ = [
     # Auth
@@ -81,7 +87,43 @@ __all__ = [
     "MistralOCRProvider",
     # Orchestration
     "HatchetOrchestrationProvider",
+    "PostgresOrchestrationProvider",
     "SimpleOrchestrationProvider",
     # Scheduler
     "APSchedulerProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClerkAuthProvider": ".auth",
+        "JwtAuthProvider": ".auth",
+        "R2RAuthProvider": ".auth",
+        "SupabaseAuthProvider": ".auth",
+        "BcryptCryptoConfig": ".crypto",
+        "BCryptCryptoProvider": ".crypto",
+        "NaClCryptoConfig": ".crypto",
+        "NaClCryptoProvider": ".crypto",
+        "PostgresDatabaseProvider": ".database",
+        "AsyncSMTPEmailProvider": ".email",
+        "ConsoleMockEmailProvider": ".email",
+        "MailerSendEmailProvider": ".email",
+        "SendGridEmailProvider": ".email",
+        "LiteLLMEmbeddingProvider": ".embeddings",
+        "OllamaEmbeddingProvider": ".embeddings",
+        "OpenAIEmbeddingProvider": ".embeddings",
+        "R2RIngestionConfig": ".ingestion",
+        "R2RIngestionProvider": ".ingestion",
+        "UnstructuredIngestionConfig": ".ingestion",
+        "UnstructuredIngestionProvider": ".ingestion",
+        "AnthropicCompletionProvider": ".llm",
+        "LiteLLMCompletionProvider": ".llm",
+        "OpenAICompletionProvider": ".llm",
+        "R2RCompletionProvider": ".llm",
+        "MistralOCRProvider": ".ocr",
+        "HatchetOrchestrationProvider": ".orchestration",
+        "PostgresOrchestrationProvider": ".orchestration",
+        "SimpleOrchestrationProvider": ".orchestration",
+        "APSchedulerProvider": ".scheduler",
+    },
+)
@@ -1,7 +1,12 @@
-from .clerk import ClerkAuthProvider
-from .jwt import JwtAuthProvider
-from .r2r_auth import R2RAuthProvider
-from .supabase import SupabaseAuthProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .clerk import ClerkAuthProvider
+    from .jwt import JwtAuthProvider
+    from .r2r_auth import R2RAuthProvider
+    from .supabase import SupabaseAuthProvider
 
 __all__ = [
     "R2RAuthProvider",
@@ -9,3 +14,13 @@ __all__ = [
     "JwtAuthProvider",
     "ClerkAuthProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClerkAuthProvider": ".clerk",
+        "JwtAuthProvider": ".jwt",
+        "R2RAuthProvider": ".r2r_auth",
+        "SupabaseAuthProvider": ".supabase",
+    },
+)
@@ -18,6 +18,12 @@ from core.base import (
     TokenData,
 )
 from core.base.api.models import User
+from core.utils.shared_cache import (
+    PRINCIPAL_EXCLUDE,
+    get_shared_cache,
+    principal_key,
+    principal_version_key,
+)
 
 from ..database import PostgresDatabaseProvider
 
@@ -180,7 +186,39 @@ class R2RAuthProvider(AuthProvider):
         return user
 
     async def user(self, token: str = Depends(oauth2_scheme)) -> User:
-        """Attempt to authenticate via JWT first, then fallback to API key."""
+        """Attempt to authenticate via JWT first, then fallback to API key.
+
+        With the shared cache enabled, the principal is reused across
+        workers for the same token for a few seconds. Entries carry the
+        user's version counter, so any write to the user row
+        (`invalidate_principals`) makes them stale at once.
+        """
+        shared_cache = get_shared_cache()
+        if shared_cache is None or shared_cache.principal_ttl <= 0:
+            return await self._authenticate(token)
+
+        cache_key = principal_key(token)
+        if (cached := await shared_cache.get_json(cache_key)) is not None:
+            version = await shared_cache.get(
+                principal_version_key(cached["user"]["id"])
+            )
+            if cached["version"] == (version or "0"):
+                return User.model_validate(cached["user"])
+        user = await self._authenticate(token)
+        version = await shared_cache.get(principal_version_key(user.id))
+        await shared_cache.set_json(
+            cache_key,
+            {
+                "version": version or "0",
+                "user": user.model_dump(
+                    mode="json", exclude=PRINCIPAL_EXCLUDE
+                ),
+            },
+            ttl=shared_cache.principal_ttl,
+        )
+        return user
+
+    async def _authenticate(self, token: str) -> User:
         # Try JWT auth
         try:
             token_data = await self.decode_token(token=token)
@@ -419,6 +457,11 @@ class R2RAuthProvider(AuthProvider):
     async def change_password(
         self, user: User, current_password: str, new_password: str
     ) -> dict[str, str]:
+        # The request principal may come from the shared cache, which does
+        # not hold password hashes: check against the stored one.
+        user = await self.database_provider.users_handler.get_user_by_id(
+            id=user.id
+        )
         if not isinstance(user.hashed_password, str):
             logger.error(
                 f"Invalid hashed_password type: {type(user.hashed_password)}"
@@ -544,6 +587,8 @@ class R2RAuthProvider(AuthProvider):
 
     async def logout(self, token: str) -> dict[str, str]:
         await self.database_provider.token_handler.blacklist_token(token=token)
+        if shared_cache := get_shared_cache():
+            await shared_cache.delete(principal_key(token))
         return {"message": "Logged out successfully"}
 
     async def clean_expired_blacklisted_tokens(self):
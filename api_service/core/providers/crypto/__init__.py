@@ -1,5 +1,10 @@
-from .bcrypt import BcryptCryptoConfig, BCryptCryptoProvider
-from .nacl import NaClCryptoConfig, NaClCryptoProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .bcrypt import BcryptCryptoConfig, BCryptCryptoProvider
+    from .nacl import NaClCryptoConfig, NaClCryptoProvider
 
 __all__ = [
     "BCryptCryptoProvider",
@@ -7,3 +12,13 @@ __all__ = [
     "NaClCryptoConfig",
     "NaClCryptoProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BcryptCryptoConfig": ".bcrypt",
+        "BCryptCryptoProvider": ".bcrypt",
+        "NaClCryptoConfig": ".nacl",
+        "NaClCryptoProvider": ".nacl",
+    },
+)
@@ -1,5 +1,17 @@
-from .postgres import PostgresDatabaseProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .postgres import PostgresDatabaseProvider
 
 __all__ = [
     "PostgresDatabaseProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PostgresDatabaseProvider": ".postgres",
+    },
+)
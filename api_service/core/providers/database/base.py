@@ -1,20 +1,117 @@
 import asyncio
+import hashlib
 import logging
+import re
 import textwrap
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional
 
 import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
 
 from core.base.providers import DatabaseConnectionManager
 
 logger = logging.getLogger()
 
+_WRITE_KEYWORDS = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|TRUNCATE|COPY|CALL|DO|LOCK)\b|\bFOR\s+(UPDATE|SHARE|NO\s+KEY|KEY)\b",
+    re.IGNORECASE,
+)
+_LEADING_COMMENTS = re.compile(r"^\s*(--[^\n]*\n\s*)*")
+
+
+@lru_cache(maxsize=1024)
+def is_read_only_statement(query: str) -> bool:
+    """Whether `query` is a single SELECT that can skip BEGIN/COMMIT.
+
+    Deliberately conservative: anything that might write, lock rows or run
+    more than one statement keeps the explicit transaction.
+    """
+    body = _LEADING_COMMENTS.sub("", query).strip().rstrip(";")
+    if ";" in body:
+        return False
+    first_word = body[:6].upper()
+    if not (first_word.startswith("SELECT") or first_word.startswith("WITH")):
+        return False
+    return _WRITE_KEYWORDS.search(body) is None
+
+
+class R2RConnection(asyncpg.Connection):
+    """asyncpg connection that pins prepared statements for hot queries.
+
+    asyncpg's own statement cache is shared by every query and expires
+    entries after `max_cached_statement_lifetime`; it is also disabled behind
+    transaction poolers. Hot-path queries (search, document overview, user
+    lookup) are instead kept in a small per-connection LRU that survives both.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hot_statements: OrderedDict[str, PreparedStatement] = (
+            OrderedDict()
+        )
+        self._unpreparable: set[str] = set()
+
+    async def get_hot_statement(
+        self, query: str, named: bool, max_size: int
+    ) -> Optional[PreparedStatement]:
+        """Return the pinned statement for `query`, preparing it if needed.
+
+        Returns None when a named statement cannot be created, in which case
+        the caller should fall back to an unnamed (unprepared) execution.
+        """
+        if statement := self._hot_statements.get(query):
+            self._hot_statements.move_to_end(query)
+            return statement
+        if query in self._unpreparable:
+            return None
+
+        if named:
+            # Protocol-level prepares with content-derived names are safe
+            # behind PgBouncer >= 1.21 (`max_prepared_statements`), which
+            # tracks them per client and re-prepares on new server links.
+            name = f"r2r_{hashlib.sha1(query.encode()).hexdigest()[:24]}"
+            try:
+                statement = await self.prepare(query, name=name)
+            except asyncpg.exceptions.DuplicatePreparedStatementError:
+                # An older pooler shares server-side names across clients.
+                self._unpreparable.add(query)
+                return None
+        else:
+            statement = await self.prepare(query)
+
+        self._hot_statements[query] = statement
+        while len(self._hot_statements) > max_size:
+            self._hot_statements.popitem(last=False)
+        return statement
+
+    def forget_hot_statement(self, query: str) -> None:
+        self._hot_statements.pop(query, None)
+
 
 class SemaphoreConnectionPool:
     def __init__(self, connection_string, postgres_configuration_settings):
         self.connection_string = connection_string
         self.postgres_configuration_settings = postgres_configuration_settings
+        self.prepared_statement_mode = (
+            postgres_configuration_settings.prepared_statement_mode or "cache"
+        )
+        self.hot_statement_cache_size = (
+            postgres_configuration_settings.hot_statement_cache_size or 0
+        )
+        if self.prepared_statement_mode not in ("cache", "pgbouncer", "off"):
+            raise ValueError(
+                f"Unsupported prepared_statement_mode '{self.prepared_statement_mode}', expected one of 'cache', 'pgbouncer' or 'off'."
+            )
+
+    @property
+    def hot_statements_enabled(self) -> bool:
+        return (
+            self.prepared_statement_mode != "off"
+            and self.hot_statement_cache_size > 0
+        )
 
     async def initialize(self):
         try:
@@ -26,10 +123,19 @@ class SemaphoreConnectionPool:
                 int(self.postgres_configuration_settings.max_connections * 0.9)
             )
 
+            statement_cache_size = (
+                self.postgres_configuration_settings.statement_cache_size
+            )
+            if self.prepared_statement_mode != "cache":
+                # asyncpg's implicit cache names statements per connection,
+                # which collides behind transaction poolers.
+                statement_cache_size = 0
+
             self.pool = await asyncpg.create_pool(
                 self.connection_string,
                 max_size=self.postgres_configuration_settings.max_connections,
-                statement_cache_size=self.postgres_configuration_settings.statement_cache_size,
+                statement_cache_size=statement_cache_size,
+                connection_class=R2RConnection,
             )
 
             logger.info(
@@ -186,17 +292,45 @@ class PostgresConnectionManager(DatabaseConnectionManager):
                 else:
                     return await conn.executemany(query)
 
-    async def fetch_query(self, query, params=None):
+    async def _run(self, conn, method: str, query, params, prepared: bool):
+        args = params or ()
+        if not (prepared and self.pool.hot_statements_enabled):  # type: ignore
+            return await getattr(conn, method)(query, *args)
+
+        statement = await conn.get_hot_statement(
+            query,
+            named=self.pool.prepared_statement_mode == "pgbouncer",  # type: ignore
+            max_size=self.pool.hot_statement_cache_size,  # type: ignore
+        )
+        if statement is None:
+            return await getattr(conn, method)(query, *args)
+        try:
+            return await getattr(statement, method)(*args)
+        except asyncpg.exceptions.InvalidCachedStatementError:
+            # The schema changed underneath the statement; re-prepare once.
+            conn.forget_hot_statement(query)
+            if conn.is_in_transaction():
+                raise
+            return await getattr(conn, method)(query, *args)
+
+    async def _read(self, method: str, query, params, prepared: bool):
+        async with self.pool.get_connection() as conn:  # type: ignore
+            if is_read_only_statement(query):
+                return await self._run(conn, method, query, params, prepared)
+            async with conn.transaction():
+                return await self._run(conn, method, query, params, prepared)
+
+    async def fetch_query(self, query, params=None, prepared: bool = False):
+        """Fetch all rows for `query`.
+
+        Single read-only statements run without an explicit transaction.
+        Pass `prepared=True` for hot-path queries to reuse a pinned
+        per-connection prepared statement.
+        """
         if not self.pool:
             raise ValueError("PostgresConnectionManager is not initialized.")
         try:
-            async with self.pool.get_connection() as conn:
-                async with conn.transaction():
-                    return (
-                        await conn.fetch(query, *params)
-                        if params
-                        else await conn.fetch(query)
-                    )
+            return await self._read("fetch", query, params, prepared)
         except asyncpg.exceptions.DuplicatePreparedStatementError:
             error_msg = textwrap.dedent("""
                 Database Configuration Error
@@ -204,26 +338,22 @@ class PostgresConnectionManager(DatabaseConnectionManager):
                 Your database provider does not support statement caching.
 
                 To fix this, either:
-                • Set R2R_POSTGRES_STATEMENT_CACHE_SIZE=0 in your environment
-                • Add statement_cache_size = 0 to your database configuration:
+                • Set R2R_POSTGRES_PREPARED_STATEMENT_MODE=pgbouncer (or
+                  R2R_POSTGRES_STATEMENT_CACHE_SIZE=0) in your environment
+                • Add it to your database configuration:
 
                     [database.postgres_configuration_settings]
-                    statement_cache_size = 0
+                    prepared_statement_mode = "pgbouncer"
 
                 This is required when using connection poolers like PgBouncer or
                 managed database services like Supabase.
             """).strip()
             raise ValueError(error_msg) from None
 
-    async def fetchrow_query(self, query, params=None):
+    async def fetchrow_query(self, query, params=None, prepared: bool = False):
         if not self.pool:
             raise ValueError("PostgresConnectionManager is not initialized.")
-        async with self.pool.get_connection() as conn:
-            async with conn.transaction():
-                if params:
-                    return await conn.fetchrow(query, *params)
-                else:
-                    return await conn.fetchrow(query)
+        return await self._read("fetchrow", query, params, prepared)
 
     @asynccontextmanager
     async def transaction(self, isolation_level=None):
@@ -1,10 +1,11 @@
 import copy
+import hashlib
 import json
 import logging
 import math
+import re
 import time
-import uuid
-from typing import Any, Optional, TypedDict
+from typing import Any, Optional
 from uuid import UUID
 
 import numpy as np
@@ -16,6 +17,7 @@ from core.base import (
     IndexArgsIVFFlat,
     IndexMeasure,
     IndexMethod,
+    PromotedMetadataKey,
     R2RException,
     SearchSettings,
     VectorEntry,
@@ -26,10 +28,15 @@ from core.base.utils import _decorate_vector_type
 
 from .base import PostgresConnectionManager
 from .filters import apply_filters
-from .utils import psql_quote_literal
+from .utils import TotalEntriesMode, fetch_page, psql_quote_literal
 
 logger = logging.getLogger()
 
+# Sort key for a document's chunks. Chunks stored without a `chunk_order`
+# (e.g. through `ingest_chunks`) sort first, by id, instead of producing a
+# NULL that keyset cursors cannot compare against.
+CHUNK_ORDER_SQL = "COALESCE((metadata->>'chunk_order')::integer, -1)"
+
 
 def index_measure_to_ops(
     measure: IndexMeasure,
@@ -65,15 +72,62 @@ def quantize_vector_to_binary(
     return binary_string.encode("ascii")
 
 
-class HybridSearchIntermediateResult(TypedDict):
-    semantic_rank: int
-    full_text_rank: int
-    data: ChunkSearchResult
-    rrf_score: float
+class ChunkSearchRows:
+    """Chunk search results as fetched, for the internal search pipeline.
+
+    Keeps the database records untouched, with the scores in a NumPy array
+    and the metadata JSON decoded only when a row is turned into a
+    `ChunkSearchResult`. Fusion then works on row indices, and only the
+    results that are actually returned get built.
+    """
+
+    __slots__ = ("records", "scores", "include_metadatas")
+
+    def __init__(
+        self,
+        records: list[Any],
+        scores: np.ndarray,
+        include_metadatas: bool = True,
+    ):
+        self.records = records
+        self.scores = scores
+        self.include_metadatas = include_metadatas
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def metadata(self, index: int) -> dict[str, Any]:
+        if not self.include_metadatas:
+            return {}
+        return json.loads(self.records[index]["metadata"])
+
+    def to_result(
+        self,
+        index: int,
+        score: Optional[float] = None,
+        extra_metadata: Optional[dict[str, Any]] = None,
+    ) -> ChunkSearchResult:
+        record = self.records[index]
+        metadata = self.metadata(index)
+        if extra_metadata:
+            metadata.update(extra_metadata)
+        return ChunkSearchResult(
+            id=UUID(str(record["id"])),
+            document_id=UUID(str(record["document_id"])),
+            owner_id=UUID(str(record["owner_id"])),
+            collection_ids=record["collection_ids"],
+            text=record["text"],
+            score=float(self.scores[index] if score is None else score),
+            metadata=metadata,
+        )
+
+    def to_results(self) -> list[ChunkSearchResult]:
+        return [self.to_result(index) for index in range(len(self.records))]
 
 
 class PostgresChunksHandler(Handler):
     TABLE_NAME = VectorTableName.CHUNKS
+    OWNER_COUNTS_TABLE_NAME = "owner_chunk_counts"
 
     def __init__(
         self,
@@ -81,10 +135,19 @@ class PostgresChunksHandler(Handler):
         connection_manager: PostgresConnectionManager,
         dimension: int | float,
         quantization_type: VectorQuantizationType,
+        promoted_metadata_keys: Optional[list[PromotedMetadataKey]] = None,
     ):
         super().__init__(project_name, connection_manager)
         self.dimension = dimension
         self.quantization_type = quantization_type
+        self.configured_promoted_columns = {
+            promoted.key: promoted for promoted in promoted_metadata_keys or []
+        }
+        # The promoted columns that exist on the table, and so may be used by
+        # filters; see `load_promoted_columns`.
+        self.promoted_columns: dict[str, PromotedMetadataKey] = {}
+        # Whether `owner_chunk_counts` is maintained; see `create_tables`.
+        self.owner_counts_enabled = False
 
     async def create_tables(self):
         # First check if table already exists and validate dimensions
@@ -100,7 +163,8 @@ class PostgresChunksHandler(Handler):
             table_exists_query, (self.project_name, table_name)
         )
 
-        if len(table_exists) > 0 and table_exists[0]["exists"]:
+        chunks_table_existed = bool(table_exists and table_exists[0]["exists"])
+        if chunks_table_existed:
             # Table exists, check vector dimension
             vector_dim_query = """
             SELECT a.atttypmod as dimension
@@ -182,6 +246,212 @@ class PostgresChunksHandler(Handler):
 
         await self.connection_manager.execute_query(query)
 
+        # Per-owner chunk counts start at zero only for a new chunks table;
+        # existing databases get the counter (with a backfill) from the
+        # `add_owner_chunk_counts` migration.
+        if not chunks_table_existed:
+            await self.connection_manager.execute_query(
+                self._owner_chunk_counts_ddl()
+            )
+        counts_exist = await self.connection_manager.fetch_query(
+            table_exists_query,
+            (self.project_name, PostgresChunksHandler.OWNER_COUNTS_TABLE_NAME),
+        )
+        self.owner_counts_enabled = bool(
+            counts_exist and counts_exist[0]["exists"]
+        )
+        if not self.owner_counts_enabled:
+            logger.warning(
+                "Chunk quotas are counted with COUNT(*) because "
+                f"'{self.project_name}.owner_chunk_counts' does not exist. "
+                "Run `alembic upgrade head` in migrations/ to create it."
+            )
+
+        if self.configured_promoted_columns:
+            await self.load_promoted_columns()
+
+    def _owner_chunk_counts_ddl(self) -> str:
+        """Counter table of chunks per owner, kept current by triggers on the
+        chunks table: statement-level for inserts and deletes (one update per
+        owner per batch), row-level only for the rare owner change."""
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        counts = self._get_table_name(
+            PostgresChunksHandler.OWNER_COUNTS_TABLE_NAME
+        )
+        function = self._get_table_name("adjust_owner_chunk_counts")
+        return f"""
+        CREATE TABLE IF NOT EXISTS {counts} (
+            owner_id UUID PRIMARY KEY,
+            chunk_count BIGINT NOT NULL DEFAULT 0
+        );
+
+        CREATE OR REPLACE FUNCTION {function}()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF TG_LEVEL = 'ROW' THEN
+                UPDATE {counts} SET chunk_count = chunk_count - 1
+                WHERE owner_id = OLD.owner_id;
+                IF NEW.owner_id IS NOT NULL THEN
+                    INSERT INTO {counts} (owner_id, chunk_count)
+                    VALUES (NEW.owner_id, 1)
+                    ON CONFLICT (owner_id) DO UPDATE
+                    SET chunk_count = {counts}.chunk_count + 1;
+                END IF;
+            ELSIF TG_OP = 'INSERT' THEN
+                INSERT INTO {counts} (owner_id, chunk_count)
+                SELECT owner_id, COUNT(*) FROM new_chunks
+                WHERE owner_id IS NOT NULL
+                GROUP BY owner_id
+                ON CONFLICT (owner_id) DO UPDATE
+                SET chunk_count = {counts}.chunk_count + EXCLUDED.chunk_count;
+            ELSE
+                UPDATE {counts} c SET chunk_count = c.chunk_count - d.removed
+                FROM (
+                    SELECT owner_id, COUNT(*) AS removed FROM old_chunks
+                    WHERE owner_id IS NOT NULL
+                    GROUP BY owner_id
+                ) d
+                WHERE c.owner_id = d.owner_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$;
+
+        CREATE OR REPLACE TRIGGER owner_chunk_counts_insert
+            AFTER INSERT ON {table_name}
+            REFERENCING NEW TABLE AS new_chunks
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        CREATE OR REPLACE TRIGGER owner_chunk_counts_delete
+            AFTER DELETE ON {table_name}
+            REFERENCING OLD TABLE AS old_chunks
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        CREATE OR REPLACE TRIGGER owner_chunk_counts_update
+            AFTER UPDATE OF owner_id ON {table_name}
+            FOR EACH ROW
+            WHEN (OLD.owner_id IS DISTINCT FROM NEW.owner_id)
+            EXECUTE FUNCTION {function}();
+        """
+
+    async def load_promoted_columns(self) -> None:
+        """Enable filters on the configured promoted keys whose `meta_<key>`
+        column exists.
+
+        Adding the columns rewrites the chunks table, so startup never does
+        it; run `create_promoted_columns` as a maintenance step instead.
+        """
+        query = """
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = $1 AND table_name = $2
+        """
+        rows = await self.connection_manager.fetch_query(
+            query, (self.project_name, PostgresChunksHandler.TABLE_NAME)
+        )
+        existing = {row["column_name"] for row in rows}
+        self.promoted_columns = {
+            key: promoted
+            for key, promoted in self.configured_promoted_columns.items()
+            if promoted.column in existing
+        }
+        if missing := sorted(
+            self.configured_promoted_columns.keys() - self.promoted_columns
+        ):
+            logger.warning(
+                f"Promoted metadata keys {missing} are filtered through "
+                "`metadata` because their columns do not exist. Run "
+                "`scripts/promote_metadata_columns.py` to create them."
+            )
+
+    async def create_promoted_columns(self) -> None:
+        """Materialize promoted metadata keys as generated, indexed columns.
+
+        This is a maintenance step, not part of startup: adding a stored
+        generated column rewrites the chunks table under an exclusive lock.
+        The indexes are built `CONCURRENTLY`, so writes continue while they
+        build. Columns are only added, never altered: changing the type of
+        an existing promoted key requires dropping its `meta_<key>` column.
+        """
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        to_text_array = self._get_table_name("jsonb_to_text_array")
+
+        statements = [
+            f"""
+            CREATE OR REPLACE FUNCTION {to_text_array}(value JSONB)
+            RETURNS TEXT[]
+            LANGUAGE sql
+            IMMUTABLE
+            PARALLEL SAFE
+            AS $$
+                SELECT CASE jsonb_typeof(value)
+                    WHEN 'array' THEN ARRAY(SELECT jsonb_array_elements_text(value))
+                    WHEN 'string' THEN ARRAY[value #>> '{{}}']
+                END
+            $$;
+            """
+        ]
+        indexes: dict[str, str] = {}
+        ops = index_measure_to_ops(IndexMeasure.cosine_distance)
+        for promoted in self.configured_promoted_columns.values():
+            column = promoted.column
+            if promoted.type == "text[]":
+                expression = f"{to_text_array}(metadata -> '{promoted.key}')"
+                index_method = "GIN"
+            else:
+                expression = f"metadata ->> '{promoted.key}'"
+                index_method = "BTREE"
+            statements.append(f"""
+            ALTER TABLE {table_name}
+                ADD COLUMN IF NOT EXISTS {column} {promoted.type.upper()}
+                GENERATED ALWAYS AS ({expression}) STORED;
+            """)
+            indexes[f"idx_vectors_{column}"] = (
+                f"ON {table_name} USING {index_method} ({column})"
+            )
+            for value in promoted.partial_vector_indexes:
+                indexes[self._partial_vector_index_name(column, value)] = (
+                    f"ON {table_name} USING hnsw (vec {ops}) "
+                    f"{self._get_index_options(IndexMethod.hnsw, None)} "
+                    f"WHERE {column} = {psql_quote_literal(value)}"
+                )
+
+        for statement in statements:
+            await self.connection_manager.execute_query(statement)
+
+        # A failed concurrent build leaves an invalid index behind, which
+        # `IF NOT EXISTS` would then keep; drop those so they are rebuilt.
+        invalid = await self.connection_manager.fetch_query(
+            """
+            SELECT c.relname FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = $1 AND c.relname = ANY($2) AND NOT i.indisvalid
+            """,
+            (self.project_name, list(indexes)),
+        )
+        # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction block.
+        async with (
+            self.connection_manager.pool.get_connection() as conn  # type: ignore
+        ):
+            for row in invalid:
+                await conn.execute(
+                    "DROP INDEX CONCURRENTLY IF EXISTS "
+                    f"{self._get_table_name(row['relname'])}"
+                )
+            for index_name, definition in indexes.items():
+                await conn.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                    f"{definition}"
+                )
+
+        await self.load_promoted_columns()
+
+    @staticmethod
+    def _partial_vector_index_name(column: str, value: str) -> str:
+        slug = re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+        digest = hashlib.md5(value.encode()).hexdigest()[:8]
+        return f"idx_vectors_vec_{column}_{slug}"[:50] + f"_{digest}"
+
     async def upsert(self, entry: VectorEntry) -> None:
         """Upsert function that handles vector quantization only when
         quantization_type is INT1.
@@ -327,6 +597,12 @@ class PostgresChunksHandler(Handler):
     async def semantic_search(
         self, query_vector: list[float], search_settings: SearchSettings
     ) -> list[ChunkSearchResult]:
+        rows = await self._semantic_search_rows(query_vector, search_settings)
+        return rows.to_results()
+
+    async def _semantic_search_rows(
+        self, query_vector: list[float], search_settings: SearchSettings
+    ) -> ChunkSearchRows:
         try:
             imeasure_obj = IndexMeasure(
                 search_settings.chunk_settings.index_measure
@@ -383,7 +659,10 @@ class PostgresChunksHandler(Handler):
 
             if search_settings.filters:
                 where_clause, params = apply_filters(
-                    search_settings.filters, params, mode="where_clause"
+                    search_settings.filters,
+                    params,
+                    mode="where_clause",
+                    promoted_columns=self.promoted_columns,
                 )
 
             vector_dim = (
@@ -446,6 +725,7 @@ class PostgresChunksHandler(Handler):
                     search_settings.filters,
                     params,
                     mode="where_clause",  # Get just conditions without WHERE
+                    promoted_columns=self.promoted_columns,
                 )
                 params = new_params
 
@@ -458,32 +738,31 @@ class PostgresChunksHandler(Handler):
             OFFSET ${len(params) + 2}
             """
             params.extend([search_settings.limit, search_settings.offset])
-        results = await self.connection_manager.fetch_query(query, params)
+        results = await self.connection_manager.fetch_query(
+            query, params, prepared=True
+        )
 
-        return [
-            ChunkSearchResult(
-                id=UUID(str(result["id"])),
-                document_id=UUID(str(result["document_id"])),
-                owner_id=UUID(str(result["owner_id"])),
-                collection_ids=result["collection_ids"],
-                text=result["text"],
-                score=(
-                    (1 - float(result["distance"]))
-                    if "distance" in result
-                    else -1
-                ),
-                metadata=(
-                    json.loads(result["metadata"])
-                    if search_settings.include_metadatas
-                    else {}
-                ),
+        if results and "distance" in results[0]:
+            scores = 1 - np.fromiter(
+                (result["distance"] for result in results),
+                dtype=np.float64,
+                count=len(results),
             )
-            for result in results
-        ]
+        else:
+            scores = np.full(len(results), -1.0)
+        return ChunkSearchRows(
+            results, scores, search_settings.include_metadatas
+        )
 
     async def full_text_search(
         self, query_text: str, search_settings: SearchSettings
     ) -> list[ChunkSearchResult]:
+        rows = await self._full_text_search_rows(query_text, search_settings)
+        return rows.to_results()
+
+    async def _full_text_search_rows(
+        self, query_text: str, search_settings: SearchSettings
+    ) -> ChunkSearchRows:
         conditions = []
         params: list[str | int | bytes] = [query_text]
 
@@ -491,7 +770,10 @@ class PostgresChunksHandler(Handler):
 
         if search_settings.filters:
             filter_condition, params = apply_filters(
-                search_settings.filters, params, mode="condition_only"
+                search_settings.filters,
+                params,
+                mode="condition_only",
+                promoted_columns=self.promoted_columns,
             )
             if filter_condition:
                 conditions.append(filter_condition)
@@ -521,19 +803,13 @@ class PostgresChunksHandler(Handler):
             ]
         )
 
-        results = await self.connection_manager.fetch_query(query, params)
-        return [
-            ChunkSearchResult(
-                id=UUID(str(r["id"])),
-                document_id=UUID(str(r["document_id"])),
-                owner_id=UUID(str(r["owner_id"])),
-                collection_ids=r["collection_ids"],
-                text=r["text"],
-                score=float(r["rank"]),
-                metadata=json.loads(r["metadata"]),
-            )
-            for r in results
-        ]
+        results = await self.connection_manager.fetch_query(
+            query, params, prepared=True
+        )
+        scores = np.fromiter(
+            (r["rank"] for r in results), dtype=np.float64, count=len(results)
+        )
+        return ChunkSearchRows(results, scores)
 
     async def hybrid_search(
         self,
@@ -563,12 +839,12 @@ class PostgresChunksHandler(Handler):
             search_settings.offset
         )
 
-        semantic_results: list[ChunkSearchResult] = await self.semantic_search(
+        semantic_rows = await self._semantic_search_rows(
             query_vector, semantic_settings
         )
-        full_text_results: list[
-            ChunkSearchResult
-        ] = await self.full_text_search(query_text, full_text_settings)
+        full_text_rows = await self._full_text_search_rows(
+            query_text, full_text_settings
+        )
 
         semantic_limit = search_settings.limit
         full_text_limit = search_settings.hybrid_settings.full_text_limit
@@ -576,75 +852,78 @@ class PostgresChunksHandler(Handler):
         full_text_weight = search_settings.hybrid_settings.full_text_weight
         rrf_k = search_settings.hybrid_settings.rrf_k
 
-        combined_results: dict[uuid.UUID, HybridSearchIntermediateResult] = {}
-
-        for rank, result in enumerate(semantic_results, 1):
-            combined_results[result.id] = {
-                "semantic_rank": rank,
-                "full_text_rank": full_text_limit,
-                "data": result,
-                "rrf_score": 0.0,  # Initialize with 0, will be calculated later
-            }
-
-        for rank, result in enumerate(full_text_results, 1):
-            if result.id in combined_results:
-                combined_results[result.id]["full_text_rank"] = rank
-            else:
-                combined_results[result.id] = {
-                    "semantic_rank": semantic_limit,
-                    "full_text_rank": rank,
-                    "data": result,
-                    "rrf_score": 0.0,  # Initialize with 0, will be calculated later
-                }
-
-        combined_results = {
-            k: v
-            for k, v in combined_results.items()
-            if v["semantic_rank"] <= semantic_limit * 2
-            and v["full_text_rank"] <= full_text_limit * 2
+        # Fuse on row indices: candidates are the semantic rows followed by
+        # the full-text rows that the semantic search did not return.
+        num_semantic = len(semantic_rows)
+        semantic_index = {
+            record["id"]: index
+            for index, record in enumerate(semantic_rows.records)
         }
+        full_text_only = []
+        semantic_full_text_rank = np.full(num_semantic, full_text_limit)
+        for rank, record in enumerate(full_text_rows.records, 1):
+            index = semantic_index.get(record["id"])
+            if index is None:
+                full_text_only.append(rank - 1)
+            else:
+                semantic_full_text_rank[index] = rank
+        full_text_only_indices = np.array(full_text_only, dtype=np.int64)
 
-        for hyb_result in combined_results.values():
-            semantic_score = 1 / (rrf_k + hyb_result["semantic_rank"])
-            full_text_score = 1 / (rrf_k + hyb_result["full_text_rank"])
-            hyb_result["rrf_score"] = (
-                semantic_score * semantic_weight
-                + full_text_score * full_text_weight
-            ) / (semantic_weight + full_text_weight)
-
-        sorted_results = sorted(
-            combined_results.values(),
-            key=lambda x: x["rrf_score"],
-            reverse=True,
+        semantic_ranks = np.concatenate(
+            [
+                np.arange(1, num_semantic + 1),
+                np.full(len(full_text_only_indices), semantic_limit),
+            ]
+        )
+        full_text_ranks = np.concatenate(
+            [semantic_full_text_rank, full_text_only_indices + 1]
+        )
+        semantic_scores = 1 / (rrf_k + semantic_ranks)
+        full_text_scores = 1 / (rrf_k + full_text_ranks)
+        rrf_scores = (
+            semantic_scores * semantic_weight
+            + full_text_scores * full_text_weight
+        ) / (semantic_weight + full_text_weight)
+
+        candidates = np.flatnonzero(
+            (semantic_ranks <= semantic_limit * 2)
+            & (full_text_ranks <= full_text_limit * 2)
         )
-        offset_results = sorted_results[
+        # Stable, so ties keep the semantic-first candidate order.
+        ranked = candidates[np.argsort(-rrf_scores[candidates], kind="stable")]
+        selected = ranked[
             search_settings.offset : search_settings.offset
             + search_settings.limit
         ]
 
-        return [
-            ChunkSearchResult(
-                id=result["data"].id,
-                document_id=result["data"].document_id,
-                owner_id=result["data"].owner_id,
-                collection_ids=result["data"].collection_ids,
-                text=result["data"].text,
-                score=result["rrf_score"],
-                metadata={
-                    **result["data"].metadata,
-                    "semantic_rank": result["semantic_rank"],
-                    "full_text_rank": result["full_text_rank"],
-                },
+        results = []
+        for candidate in selected:
+            if candidate < num_semantic:
+                rows, index = semantic_rows, candidate
+            else:
+                rows = full_text_rows
+                index = full_text_only_indices[candidate - num_semantic]
+            results.append(
+                rows.to_result(
+                    int(index),
+                    score=float(rrf_scores[candidate]),
+                    extra_metadata={
+                        "semantic_rank": int(semantic_ranks[candidate]),
+                        "full_text_rank": int(full_text_ranks[candidate]),
+                    },
+                )
             )
-            for result in offset_results
-        ]
+        return results
 
     async def delete(
         self, filters: dict[str, Any]
     ) -> dict[str, dict[str, str]]:
         params: list[str | int | bytes] = []
         where_clause, params = apply_filters(
-            filters, params, mode="condition_only"
+            filters,
+            params,
+            mode="condition_only",
+            promoted_columns=self.promoted_columns,
         )
 
         query = f"""
@@ -665,6 +944,41 @@ class PostgresChunksHandler(Handler):
             for result in results
         }
 
+    async def count_owner_chunks(self, owner_id: UUID) -> int:
+        if self.owner_counts_enabled:
+            query = f"""
+            SELECT chunk_count AS count
+            FROM {self._get_table_name(PostgresChunksHandler.OWNER_COUNTS_TABLE_NAME)}
+            WHERE owner_id = $1;
+            """
+        else:
+            query = f"""
+            SELECT COUNT(*) FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+            WHERE owner_id = $1;
+            """
+        result = await self.connection_manager.fetchrow_query(
+            query, [owner_id], prepared=True
+        )
+        return result["count"] if result else 0
+
+    async def update_chunk_metadata(
+        self, chunk_metadata: list[tuple[UUID, dict]]
+    ) -> None:
+        """Merges new metadata keys (e.g. `chunk_order`, `version`) into
+        existing chunks without touching their text or vectors."""
+        query = f"""
+        UPDATE {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+        SET metadata = metadata || $2::jsonb
+        WHERE id = $1;
+        """
+        await self.connection_manager.execute_many(
+            query,
+            [
+                (chunk_id, json.dumps(metadata))
+                for chunk_id, metadata in chunk_metadata
+            ],
+        )
+
     async def assign_document_chunks_to_collection(
         self, document_id: UUID, collection_id: UUID
     ) -> None:
@@ -711,27 +1025,30 @@ class PostgresChunksHandler(Handler):
         offset: int,
         limit: int,
         include_vectors: bool = False,
+        cursor: Optional[str] = None,
+        total_entries: TotalEntriesMode = "exact",
     ) -> dict[str, Any]:
         vector_select = ", vec" if include_vectors else ""
-        limit_clause = f"LIMIT {limit}" if limit > -1 else ""
-
-        query = f"""
-        SELECT id, document_id, owner_id, collection_ids, text, metadata{vector_select}, COUNT(*) OVER() AS total
-        FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-        WHERE document_id = $1
-        ORDER BY (metadata->>'chunk_order')::integer
-        OFFSET $2
-        {limit_clause};
-        """
-
-        params = [document_id, offset]
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
 
-        results = await self.connection_manager.fetch_query(query, params)
+        results, total, next_cursor = await fetch_page(
+            self.connection_manager,
+            f"SELECT id, document_id, owner_id, collection_ids, text, metadata{vector_select}",
+            f"FROM {table_name}",
+            ["document_id = $1"],
+            [document_id],
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            total_entries=total_entries,
+            sort_column=CHUNK_ORDER_SQL,
+            sort_type="integer",
+            descending=False,
+            table=table_name,
+        )
 
         chunks = []
-        total = 0
         if results:
-            total = results[0].get("total", 0)
             chunks = [
                 {
                     "id": result["id"],
@@ -747,7 +1064,72 @@ class PostgresChunksHandler(Handler):
                 for result in results
             ]
 
-        return {"results": chunks, "total_entries": total}
+        return {
+            "results": chunks,
+            "total_entries": total,
+            "next_cursor": next_cursor,
+        }
+
+    async def list_chunks_for_documents(
+        self,
+        document_ids: list[UUID],
+        limit_per_document: int = -1,
+        include_vectors: bool = False,
+    ) -> dict[UUID, list[dict[str, Any]]]:
+        """Fetch the chunks of many documents with a single query.
+
+        Returns up to `limit_per_document` chunks per document (all of them
+        for -1) in ascending chunk order, keyed by document id, in the same
+        shape as `list_document_chunks` results. A window function ranks the
+        chunks within each document, so the cost is one round trip however
+        many documents are requested.
+        """
+        if not document_ids:
+            return {}
+
+        vector_select = ", vec" if include_vectors else ""
+        rank_filter = (
+            "WHERE chunk_rank <= $2" if limit_per_document >= 0 else ""
+        )
+        params: list[Any] = [document_ids]
+        if limit_per_document >= 0:
+            params.append(limit_per_document)
+
+        query = f"""
+        SELECT id, document_id, owner_id, collection_ids, text, metadata{vector_select}
+        FROM (
+            SELECT id, document_id, owner_id, collection_ids, text, metadata{vector_select},
+                ROW_NUMBER() OVER (
+                    PARTITION BY document_id
+                    ORDER BY {CHUNK_ORDER_SQL}, id
+                ) AS chunk_rank
+            FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+            WHERE document_id = ANY($1::uuid[])
+        ) ranked
+        {rank_filter}
+        ORDER BY document_id, chunk_rank
+        """
+
+        results = await self.connection_manager.fetch_query(query, params)
+
+        chunks_by_document: dict[UUID, list[dict[str, Any]]] = {
+            document_id: [] for document_id in document_ids
+        }
+        for result in results:
+            chunks_by_document.setdefault(result["document_id"], []).append(
+                {
+                    "id": result["id"],
+                    "document_id": result["document_id"],
+                    "owner_id": result["owner_id"],
+                    "collection_ids": result["collection_ids"],
+                    "text": result["text"],
+                    "metadata": json.loads(result["metadata"]),
+                    "vector": (
+                        json.loads(result["vec"]) if include_vectors else None
+                    ),
+                }
+            )
+        return chunks_by_document
 
     async def get_chunk(self, id: UUID) -> dict:
         query = f"""
@@ -1084,6 +1466,8 @@ class PostgresChunksHandler(Handler):
         limit: int,
         filters: Optional[dict[str, Any]] = None,
         include_vectors: bool = False,
+        cursor: Optional[str] = None,
+        total_entries: TotalEntriesMode = "exact",
     ) -> dict[str, Any]:
         """List chunks with pagination support.
 
@@ -1092,43 +1476,49 @@ class PostgresChunksHandler(Handler):
             limit (int, optional): Maximum number of records to return. Defaults to 10.
             filters (dict, optional): Dictionary of filters to apply. Defaults to None.
             include_vectors (bool, optional): Whether to include vector data. Defaults to False.
+            cursor (str, optional): Keyset cursor from a previous page; overrides `offset`.
+            total_entries (str, optional): How to count matches: "exact", "estimated" or "none".
 
         Returns:
             dict: Dictionary containing:
                 - results: List of chunk records
                 - total_entries: Total number of chunks matching the filters
+                - next_cursor: Cursor of the next page, if any
         """
         vector_select = ", vec" if include_vectors else ""
-        select_clause = f"""
-            id, document_id, owner_id, collection_ids,
-            text, metadata{vector_select}, COUNT(*) OVER() AS total_entries
-        """
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
 
         params: list[str | int | bytes] = []
-        where_clause = ""
+        conditions = []
         if filters:
-            where_clause, params = apply_filters(
-                filters, params, mode="where_clause"
+            condition, params = apply_filters(
+                filters,
+                params,
+                mode="condition_only",
+                promoted_columns=self.promoted_columns,
             )
-
-        query = f"""
-        SELECT {select_clause}
-        FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-        {where_clause}
-        LIMIT ${len(params) + 1}
-        OFFSET ${len(params) + 2}
-        """
-
-        params.extend([limit, offset])
-
-        # Execute the query
-        results = await self.connection_manager.fetch_query(query, params)
+            if condition:
+                conditions.append(condition)
+
+        # Chunks have no creation time, so they are paged in id order
+        results, total, next_cursor = await fetch_page(
+            self.connection_manager,
+            f"SELECT id, document_id, owner_id, collection_ids, text, metadata{vector_select}",
+            f"FROM {table_name}",
+            conditions,
+            params,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            total_entries=total_entries,
+            sort_column=None,
+            descending=False,
+            table=table_name,
+        )
 
         # Process results
         chunks = []
-        total_entries = 0
         if results:
-            total_entries = results[0].get("total_entries", 0)
             chunks = [
                 {
                     "id": str(result["id"]),
@@ -1144,7 +1534,11 @@ class PostgresChunksHandler(Handler):
                 for result in results
             ]
 
-        return {"results": chunks, "total_entries": total_entries}
+        return {
+            "results": chunks,
+            "total_entries": total,
+            "next_cursor": next_cursor,
+        }
 
     async def search_documents(
         self,
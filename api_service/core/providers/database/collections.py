@@ -21,8 +21,10 @@ from core.base.abstractions import (
     IngestionStatus,
 )
 from core.base.api.models import CollectionResponse
+from core.utils.shared_cache import invalidate_principals
 
 from .base import PostgresConnectionManager
+from .utils import TotalEntriesMode, fetch_page
 
 logger = logging.getLogger()
 
@@ -254,10 +256,12 @@ class PostgresCollectionsHandler(Handler):
             UPDATE {self._get_table_name("users")}
             SET collection_ids = array_remove(collection_ids, $1)
             WHERE $1 = ANY(collection_ids)
+            RETURNING id
         """
-        await self.connection_manager.execute_query(
+        updated_users = await self.connection_manager.fetch_query(
             user_update_query, [collection_id]
         )
+        await invalidate_principals(*(row["id"] for row in updated_users))
 
         # Remove collection_id from documents
         document_update_query = f"""
@@ -287,37 +291,45 @@ class PostgresCollectionsHandler(Handler):
             raise R2RException(status_code=404, message="Collection not found")
 
     async def documents_in_collection(
-        self, collection_id: UUID, offset: int, limit: int
-    ) -> dict[str, list[DocumentResponse] | int]:
+        self,
+        collection_id: UUID,
+        offset: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        total_entries: TotalEntriesMode = "exact",
+    ) -> dict[str, Any]:
         """Get all documents in a specific collection with pagination.
 
         Args:
             collection_id (UUID): The ID of the collection to get documents from.
             offset (int): The number of documents to skip.
             limit (int): The maximum number of documents to return.
+            cursor (Optional[str]): Keyset cursor from a previous page; overrides `offset`.
+            total_entries (str): How to count matches: "exact", "estimated" or "none".
         Returns:
-            List[DocumentResponse]: A list of DocumentResponse objects representing the documents in the collection.
+            dict: The DocumentResponse objects in `results`, with `total_entries` and `next_cursor`.
         Raises:
             R2RException: If the collection doesn't exist.
         """
         if not await self.collection_exists(collection_id):
             raise R2RException(status_code=404, message="Collection not found")
-        query = f"""
+        results, total, next_cursor = await fetch_page(
+            self.connection_manager,
+            """
             SELECT d.id, d.owner_id, d.type, d.metadata, d.title, d.version,
-                d.size_in_bytes, d.ingestion_status, d.extraction_status, d.created_at, d.updated_at, d.summary,
-                COUNT(*) OVER() AS total_entries
-            FROM {self._get_table_name("documents")} d
-            WHERE $1 = ANY(d.collection_ids)
-            ORDER BY d.created_at DESC
-            OFFSET $2
-        """
-
-        conditions = [collection_id, offset]
-        if limit != -1:
-            query += " LIMIT $3"
-            conditions.append(limit)
-
-        results = await self.connection_manager.fetch_query(query, conditions)
+                d.size_in_bytes, d.ingestion_status, d.extraction_status, d.created_at, d.updated_at, d.summary
+            """,
+            f"FROM {self._get_table_name('documents')} d",
+            ["$1 = ANY(d.collection_ids)"],
+            [collection_id],
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            total_entries=total_entries,
+            sort_column="d.created_at",
+            id_column="d.id",
+            table=self._get_table_name("documents"),
+        )
         documents = [
             DocumentResponse(
                 id=row["id"],
@@ -338,9 +350,11 @@ class PostgresCollectionsHandler(Handler):
             )
             for row in results
         ]
-        total_entries = results[0]["total_entries"] if results else 0
-
-        return {"results": documents, "total_entries": total_entries}
+        return {
+            "results": documents,
+            "total_entries": total,
+            "next_cursor": next_cursor,
+        }
 
     async def get_collections_overview(
         self,
@@ -350,7 +364,9 @@ class PostgresCollectionsHandler(Handler):
         filter_document_ids: Optional[list[UUID]] = None,
         filter_collection_ids: Optional[list[UUID]] = None,
         owner_only: bool = False,
-    ) -> dict[str, list[CollectionResponse] | int]:
+        cursor: Optional[str] = None,
+        total_entries: TotalEntriesMode = "exact",
+    ) -> dict[str, Any]:
         conditions = []
         params: list[Any] = []
         param_index = 1
@@ -385,37 +401,31 @@ class PostgresCollectionsHandler(Handler):
             params.append(filter_collection_ids)
             param_index += 1
 
-        where_clause = (
-            f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        )
-
-        query = f"""
-            SELECT
-                c.*,
-                COUNT(*) OVER() as total_entries
-            FROM {self.project_name}.collections c
-            {where_clause}
-            ORDER BY created_at DESC
-            OFFSET ${param_index}
-        """
-        params.append(offset)
-        param_index += 1
-
-        if limit != -1:
-            query += f" LIMIT ${param_index}"
-            params.append(limit)
-
         try:
-            results = await self.connection_manager.fetch_query(query, params)
-
-            if not results:
-                return {"results": [], "total_entries": 0}
-
-            total_entries = results[0]["total_entries"] if results else 0
+            results, total, next_cursor = await fetch_page(
+                self.connection_manager,
+                "SELECT c.*",
+                f"FROM {self.project_name}.collections c",
+                conditions,
+                params,
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
+                total_entries=total_entries,
+                sort_column="c.created_at",
+                id_column="c.id",
+                table=f"{self.project_name}.collections",
+            )
 
             collections = [CollectionResponse(**row) for row in results]
 
-            return {"results": collections, "total_entries": total_entries}
+            return {
+                "results": collections,
+                "total_entries": total,
+                "next_cursor": next_cursor,
+            }
+        except R2RException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -2,6 +2,7 @@ import csv
 import json
 import logging
 import tempfile
+from collections import OrderedDict
 from datetime import datetime
 from typing import IO, Any, Optional
 from uuid import UUID, uuid4
@@ -9,12 +10,14 @@ from uuid import UUID, uuid4
 from fastapi import HTTPException
 
 from core.base import Handler, Message, R2RException
+from core.utils import num_tokens
 from shared.api.models.management.responses import (
     ConversationResponse,
     MessageResponse,
 )
 
 from .base import PostgresConnectionManager
+from .utils import TotalEntriesMode, fetch_page
 
 logger = logging.getLogger(__name__)
 
@@ -71,12 +74,33 @@ def safe_dumps(obj: Any) -> str:
     return json.dumps(obj, default=_json_default)
 
 
+def message_token_count(message: Message) -> int:
+    """Approximate the prompt tokens a stored message will take up."""
+    text = (
+        message.content
+        if isinstance(message.content, str)
+        else safe_dumps(message.content or "")
+    )
+    if message.tool_calls:
+        text += safe_dumps(message.tool_calls)
+    elif message.function_call:
+        text += safe_dumps(message.function_call)
+    try:
+        return num_tokens(text) + 3
+    except Exception:
+        return len(text) // 4 + 3
+
+
 class PostgresConversationsHandler(Handler):
     def __init__(
         self, project_name: str, connection_manager: PostgresConnectionManager
     ):
         self.project_name = project_name
         self.connection_manager = connection_manager
+        # Recent message windows of active conversations, most recently used
+        # last. See `get_conversation_window`.
+        self._window_cache: OrderedDict[UUID, dict[str, Any]] = OrderedDict()
+        self.window_cache_size = 256
 
     async def create_tables(self):
         create_conversations_query = f"""
@@ -84,8 +108,13 @@ class PostgresConversationsHandler(Handler):
             id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
             user_id UUID,
             created_at TIMESTAMPTZ DEFAULT NOW(),
-            name TEXT
+            name TEXT,
+            summary TEXT,
+            summary_until TIMESTAMPTZ
         );
+        ALTER TABLE {self._get_table_name("conversations")}
+        ADD COLUMN IF NOT EXISTS summary TEXT,
+        ADD COLUMN IF NOT EXISTS summary_until TIMESTAMPTZ;
         """
 
         create_messages_query = f"""
@@ -95,10 +124,15 @@ class PostgresConversationsHandler(Handler):
             parent_id UUID,
             content JSONB,
             metadata JSONB,
+            token_count INT,
             created_at TIMESTAMPTZ DEFAULT NOW(),
             FOREIGN KEY (conversation_id) REFERENCES {self._get_table_name("conversations")}(id),
             FOREIGN KEY (parent_id) REFERENCES {self._get_table_name("messages")}(id)
         );
+        ALTER TABLE {self._get_table_name("messages")}
+        ADD COLUMN IF NOT EXISTS token_count INT;
+        CREATE INDEX IF NOT EXISTS idx_{self.project_name}_messages_conversation_created_at
+        ON {self._get_table_name("messages")} (conversation_id, created_at DESC);
         """
         await self.connection_manager.execute_query(create_conversations_query)
         await self.connection_manager.execute_query(create_messages_query)
@@ -136,6 +170,8 @@ class PostgresConversationsHandler(Handler):
         limit: int,
         filter_user_ids: Optional[list[UUID]] = None,
         conversation_ids: Optional[list[UUID]] = None,
+        cursor: Optional[str] = None,
+        total_entries: TotalEntriesMode = "exact",
     ) -> dict[str, Any]:
         conditions = []
         params: list = []
@@ -157,41 +193,26 @@ class PostgresConversationsHandler(Handler):
             params.append(conversation_ids)
             param_index += 1
 
-        where_clause = (
-            "WHERE " + " AND ".join(conditions) if conditions else ""
+        results, total, next_cursor = await fetch_page(
+            self.connection_manager,
+            """
+            SELECT c.id,
+                extract(epoch from c.created_at) as created_at_epoch,
+                c.user_id,
+                c.name
+            """,
+            f"FROM {self._get_table_name('conversations')} c",
+            conditions,
+            params,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            total_entries=total_entries,
+            sort_column="c.created_at",
+            id_column="c.id",
+            table=self._get_table_name("conversations"),
         )
 
-        query = f"""
-            WITH conversation_overview AS (
-                SELECT c.id,
-                    extract(epoch from c.created_at) as created_at_epoch,
-                    c.user_id,
-                    c.name
-                FROM {self._get_table_name("conversations")} c
-                {where_clause}
-            ),
-            counted_overview AS (
-                SELECT *,
-                    COUNT(*) OVER() AS total_entries
-                FROM conversation_overview
-            )
-            SELECT * FROM counted_overview
-            ORDER BY created_at_epoch DESC
-            OFFSET ${param_index}
-        """
-        params.append(offset)
-        param_index += 1
-
-        if limit != -1:
-            query += f" LIMIT ${param_index}"
-            params.append(limit)
-
-        results = await self.connection_manager.fetch_query(query, params)
-
-        if not results:
-            return {"results": [], "total_entries": 0}
-
-        total_entries = results[0]["total_entries"]
         conversations = [
             {
                 "id": str(row["id"]),
@@ -202,7 +223,11 @@ class PostgresConversationsHandler(Handler):
             for row in results
         ]
 
-        return {"results": conversations, "total_entries": total_entries}
+        return {
+            "results": conversations,
+            "total_entries": total,
+            "next_cursor": next_cursor,
+        }
 
     async def add_message(
         self,
@@ -270,11 +295,12 @@ class PostgresConversationsHandler(Handler):
         metadata_str = safe_dumps(metadata)
 
         # 4) Insert the message (existing code)
+        token_count = message_token_count(content)
         query = f"""
             INSERT INTO {self._get_table_name("messages")}
-            (id, conversation_id, parent_id, content, created_at, metadata)
-            VALUES ($1, $2, $3, $4::jsonb, NOW(), $5::jsonb)
-            RETURNING id
+            (id, conversation_id, parent_id, content, created_at, metadata, token_count)
+            VALUES ($1, $2, $3, $4::jsonb, NOW(), $5::jsonb, $6)
+            RETURNING id, created_at
         """
         inserted = await self.connection_manager.fetchrow_query(
             query,
@@ -284,6 +310,7 @@ class PostgresConversationsHandler(Handler):
                 parent_id,
                 content_str,
                 metadata_str,
+                token_count,
             ],
         )
         if not inserted:
@@ -291,7 +318,17 @@ class PostgresConversationsHandler(Handler):
                 status_code=500, message="Failed to insert message."
             )
 
-        return MessageResponse(id=message_id, message=content)
+        response = MessageResponse(
+            id=message_id, message=content, metadata=metadata
+        )
+        if window := self._window_cache.get(conversation_id):
+            window["entries"].append(
+                (response, token_count, inserted["created_at"])
+            )
+            window["last_message_id"] = message_id
+            self._trim_window(window, window["max_tokens"])
+
+        return response
 
     async def edit_message(
         self,
@@ -348,7 +385,8 @@ class PostgresConversationsHandler(Handler):
             UPDATE {self._get_table_name("messages")}
             SET content = $1::jsonb,
                 metadata = $2::jsonb,
-                created_at = $3
+                created_at = $3,
+                token_count = $5
             WHERE id = $4
             RETURNING id
         """
@@ -359,12 +397,14 @@ class PostgresConversationsHandler(Handler):
                 json.dumps(new_metadata),
                 row["created_at"],
                 message_id,
+                message_token_count(Message(**content_to_save)),
             ],
         )
         if not updated:
             raise R2RException(
                 status_code=500, message="Failed to update message."
             )
+        self._window_cache.pop(row["conversation_id"], None)
 
         return {
             "id": str(message_id),
@@ -381,7 +421,7 @@ class PostgresConversationsHandler(Handler):
     ) -> None:
         # Fetch current metadata
         query = f"""
-            SELECT metadata FROM {self._get_table_name("messages")}
+            SELECT conversation_id, metadata FROM {self._get_table_name("messages")}
             WHERE id = $1
         """
         row = await self.connection_manager.fetchrow_query(query, [message_id])
@@ -389,6 +429,7 @@ class PostgresConversationsHandler(Handler):
             raise R2RException(
                 status_code=404, message=f"Message {message_id} not found."
             )
+        self._window_cache.pop(row["conversation_id"], None)
 
         current_metadata = json.loads(row["metadata"]) or {}
         updated_metadata = {**current_metadata, **metadata}
@@ -446,45 +487,195 @@ class PostgresConversationsHandler(Handler):
             msg_query, [conversation_id]
         )
 
-        response_messages = []
-        for row in results:
-            try:
-                # Parse the message content
-                content_json = json.loads(row["content"])
-                # Create a Message object with the parsed content
-                message = Message(**content_json)
-                # Create a MessageResponse
-                response_messages.append(
-                    MessageResponse(
-                        id=row["id"],
-                        message=message,
-                        metadata=json.loads(row["metadata"]),
-                    )
-                )
-            except Exception as e:
-                # If there's an error parsing the message (e.g., due to version mismatch),
-                # log it and create a fallback message
-                logger.warning(f"Error parsing message {row['id']}: {str(e)}")
-                fallback_content = content_json.get(
-                    "content", "Message could not be loaded"
-                )
-                fallback_role = content_json.get("role", "assistant")
+        return [self._row_to_message_response(row) for row in results]
 
-                # Create a basic fallback message
-                fallback_message = Message(
-                    role=fallback_role,
-                    content=f"[Message format incompatible: {fallback_content}]",
+    @staticmethod
+    def _row_to_message_response(row: Any) -> MessageResponse:
+        try:
+            # Parse the message content
+            content_json = json.loads(row["content"])
+            # Create a Message object with the parsed content
+            message = Message(**content_json)
+        except Exception as e:
+            # If there's an error parsing the message (e.g., due to version mismatch),
+            # log it and create a fallback message
+            logger.warning(f"Error parsing message {row['id']}: {str(e)}")
+            fallback_content = content_json.get(
+                "content", "Message could not be loaded"
+            )
+            fallback_role = content_json.get("role", "assistant")
+
+            # Create a basic fallback message
+            message = Message(
+                role=fallback_role,
+                content=f"[Message format incompatible: {fallback_content}]",
+            )
+
+        return MessageResponse(
+            id=row["id"],
+            message=message,
+            metadata=json.loads(row["metadata"]),
+        )
+
+    @staticmethod
+    def _trim_window(window: dict[str, Any], max_tokens: int) -> None:
+        """Drop the oldest messages until the window fits `max_tokens`.
+
+        The newest message is always kept, and the window never starts on a
+        reply, so that it opens with a user turn.
+        """
+        entries = window["entries"]
+        total = sum(token_count for _, token_count, _ in entries)
+        while len(entries) > 1 and (
+            total > max_tokens or entries[0][0].message.role != "user"
+        ):
+            total -= entries.pop(0)[1]
+        window["max_tokens"] = max_tokens
+
+    async def get_conversation_window(
+        self,
+        conversation_id: UUID,
+        max_tokens: int,
+        max_messages: int = 200,
+        filter_user_ids: Optional[list[UUID]] = None,
+    ) -> dict[str, Any]:
+        """Load the most recent messages of a conversation that fit within
+        `max_tokens`, along with the running summary of older turns.
+
+        Only the newest `max_messages` rows are read, so the cost does not
+        grow with the conversation. Windows are cached between turns and
+        revalidated against the conversation's latest message id.
+
+        Returns a dict with `messages` (oldest first), `summary`,
+        `summary_until` (the created_at of the last summarized message) and
+        `window_start` (the created_at of the oldest message in the window).
+        """
+        conditions = ["c.id = $1"]
+        params: list = [conversation_id]
+
+        if filter_user_ids:
+            conditions.append(f"""
+                c.user_id IN (
+                    SELECT id
+                    FROM {self.project_name}.users
+                    WHERE id = ANY($2)
                 )
+            """)
+            params.append(filter_user_ids)
+
+        query = f"""
+            SELECT c.id, c.summary, c.summary_until, (
+                SELECT m.id FROM {self._get_table_name("messages")} m
+                WHERE m.conversation_id = c.id
+                ORDER BY m.created_at DESC
+                LIMIT 1
+            ) AS last_message_id
+            FROM {self._get_table_name("conversations")} c
+            WHERE {" AND ".join(conditions)}
+        """
+        conv_row = await self.connection_manager.fetchrow_query(
+            query, params, prepared=True
+        )
+        if not conv_row:
+            raise R2RException(
+                status_code=404,
+                message=f"Conversation {conversation_id} not found.",
+            )
 
-                response_messages.append(
-                    MessageResponse(
-                        id=row["id"],
-                        message=fallback_message,
-                        metadata=json.loads(row["metadata"]),
+        window = self._window_cache.get(conversation_id)
+        if (
+            window is None
+            or window["last_message_id"] != conv_row["last_message_id"]
+            or window["max_tokens"] < max_tokens
+        ):
+            msg_query = f"""
+                SELECT id, content, metadata, created_at, token_count
+                FROM (
+                    SELECT *, SUM(token_count) OVER (
+                        ORDER BY created_at DESC
+                        ROWS UNBOUNDED PRECEDING
+                    ) AS running_tokens
+                    FROM (
+                        SELECT id, content, metadata, created_at,
+                            COALESCE(token_count, length(content::text) / 4)
+                                AS token_count
+                        FROM {self._get_table_name("messages")}
+                        WHERE conversation_id = $1
+                        ORDER BY created_at DESC
+                        LIMIT $3
+                    ) recent
+                ) windowed
+                -- The newest message is always kept
+                WHERE running_tokens <= $2 OR running_tokens = token_count
+                ORDER BY created_at ASC
+            """
+            results = await self.connection_manager.fetch_query(
+                msg_query,
+                [conversation_id, max_tokens, max_messages],
+                prepared=True,
+            )
+            window = {
+                "entries": [
+                    (
+                        self._row_to_message_response(row),
+                        row["token_count"],
+                        row["created_at"],
                     )
-                )
+                    for row in results
+                ],
+                "last_message_id": conv_row["last_message_id"],
+            }
+            self._window_cache[conversation_id] = window
+            if len(self._window_cache) > self.window_cache_size:
+                self._window_cache.popitem(last=False)
+        self._window_cache.move_to_end(conversation_id)
+        self._trim_window(window, max_tokens)
 
-        return response_messages
+        entries = window["entries"]
+        return {
+            "messages": [response for response, _, _ in entries],
+            "summary": conv_row["summary"],
+            "summary_until": conv_row["summary_until"],
+            "window_start": entries[0][2] if entries else None,
+        }
+
+    async def get_messages_between(
+        self,
+        conversation_id: UUID,
+        after: Optional[datetime],
+        before: datetime,
+        limit: int = 100,
+    ) -> list[tuple[MessageResponse, datetime]]:
+        """Fetch messages created after `after` (if given) and before
+        `before`, oldest first, along with their created_at."""
+        query = f"""
+            SELECT id, content, metadata, created_at
+            FROM {self._get_table_name("messages")}
+            WHERE conversation_id = $1
+            AND created_at < $2
+            AND ($3::timestamptz IS NULL OR created_at > $3)
+            ORDER BY created_at ASC
+            LIMIT $4
+        """
+        results = await self.connection_manager.fetch_query(
+            query, [conversation_id, before, after, limit]
+        )
+        return [
+            (self._row_to_message_response(row), row["created_at"])
+            for row in results
+        ]
+
+    async def update_conversation_summary(
+        self, conversation_id: UUID, summary: str, summary_until: datetime
+    ) -> None:
+        query = f"""
+            UPDATE {self._get_table_name("conversations")}
+            SET summary = $2, summary_until = $3
+            WHERE id = $1
+        """
+        await self.connection_manager.execute_query(
+            query, [conversation_id, summary, summary_until]
+        )
 
     async def update_conversation(
         self, conversation_id: UUID, name: str
@@ -554,6 +745,8 @@ class PostgresConversationsHandler(Handler):
                 message=f"Conversation {conversation_id} not found.",
             )
 
+        self._window_cache.pop(conversation_id, None)
+
         # Delete all messages
         del_messages_query = f"DELETE FROM {self._get_table_name('messages')} WHERE conversation_id = $1"
         await self.connection_manager.execute_query(
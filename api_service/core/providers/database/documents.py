@@ -24,6 +24,7 @@ from core.base import (
 
 from .base import PostgresConnectionManager
 from .filters import apply_filters
+from .utils import TotalEntriesMode, fetch_page
 
 logger = logging.getLogger()
 
@@ -77,6 +78,10 @@ class PostgresDocumentsHandler(Handler):
         dimension: int | float,
     ):
         self.dimension = dimension
+        # Bumped on every document write made through this handler, so that
+        # data derived from the documents table (e.g. the agent's document
+        # context block) can be invalidated without re-querying it.
+        self.generation = 0
         super().__init__(project_name, connection_manager)
 
     async def create_tables(self):
@@ -326,6 +331,7 @@ class PostgresDocumentsHandler(Handler):
                     else:
                         wait_time = 0.1 * (2**retries)  # Exponential backoff
                         await asyncio.sleep(wait_time)
+            self.generation += 1
 
     async def delete(
         self, document_id: UUID, version: Optional[str] = None
@@ -342,6 +348,7 @@ class PostgresDocumentsHandler(Handler):
             params.append(version)
 
         await self.connection_manager.execute_query(query=query, params=params)
+        self.generation += 1
 
     async def _get_status_from_table(
         self,
@@ -415,6 +422,8 @@ class PostgresDocumentsHandler(Handler):
             WHERE {column_name} = Any($2)
         """
         await self.connection_manager.execute_query(query, [status, ids])
+        if table_name == PostgresDocumentsHandler.TABLE_NAME:
+            self.generation += 1
 
     def _get_status_model(self, status_type: str):
         """Get the status model for a given status type.
@@ -515,8 +524,11 @@ class PostgresDocumentsHandler(Handler):
         filters: Optional[dict[str, Any]] = None,
         sort_order: str = "DESC",
         owner_only: bool = False,
+        cursor: Optional[str] = None,
+        total_entries: TotalEntriesMode = "exact",
     ) -> dict[str, Any]:
-        """Fetch overviews of documents with optional offset/limit pagination.
+        """Fetch overviews of documents with optional offset/limit or keyset
+        (`cursor`) pagination. See `fetch_page`.
 
         You can use either:
           - Traditional filters: `filter_user_ids`, `filter_document_ids`, `filter_collection_ids`
@@ -607,14 +619,7 @@ class PostgresDocumentsHandler(Handler):
         # -------------------------
         # Build the full query
         # -------------------------
-        base_query = (
-            f"FROM {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}"
-        )
-        if conditions:
-            # Combine everything with AND
-            base_query += " WHERE " + " AND ".join(conditions)
-
-        # Construct SELECT fields (including total_entries via window function)
+        table_name = self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)
         select_fields = """
             SELECT
                 id,
@@ -631,27 +636,24 @@ class PostgresDocumentsHandler(Handler):
                 updated_at,
                 summary,
                 summary_embedding,
-                total_tokens,
-                COUNT(*) OVER() AS total_entries
-        """
-
-        query = f"""
-            {select_fields}
-            {base_query}
-            ORDER BY created_at {sort_order}
-            OFFSET ${param_index}
+                total_tokens
         """
-        params.append(offset)
-        param_index += 1
-
-        if limit != -1:
-            query += f" LIMIT ${param_index}"
-            params.append(limit)
-            param_index += 1
 
         try:
-            results = await self.connection_manager.fetch_query(query, params)
-            total_entries = results[0]["total_entries"] if results else 0
+            results, total, next_cursor = await fetch_page(
+                self.connection_manager,
+                select_fields,
+                f"FROM {table_name}",
+                conditions,
+                params,
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
+                total_entries=total_entries,
+                descending=sort_order.upper() != "ASC",
+                table=table_name,
+                prepared=True,
+            )
 
             documents = []
             for row in results:
@@ -702,7 +704,13 @@ class PostgresDocumentsHandler(Handler):
                         total_tokens=row["total_tokens"],
                     )
                 )
-            return {"results": documents, "total_entries": total_entries}
+            return {
+                "results": documents,
+                "total_entries": total,
+                "next_cursor": next_cursor,
+            }
+        except R2RException:
+            raise
         except Exception as e:
             logger.error(f"Error in get_documents_overview: {str(e)}")
             raise HTTPException(
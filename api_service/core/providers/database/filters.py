@@ -1,6 +1,12 @@
 import json
 import uuid
-from typing import Any, Optional, Set, Tuple
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from core.base.providers.database import PromotedMetadataKey
+
+PromotedColumns = dict[str, "PromotedMetadataKey"]
 
 
 class FilterOperator:
@@ -89,6 +95,7 @@ def _process_filter_dict(
     param_helper: ParamHelper,
     top_level_columns: Set[str],
     json_column: str,
+    promoted_columns: Optional[PromotedColumns] = None,
 ) -> str:
     """Recursively processes a filter dictionary node."""
     if not filter_dict:
@@ -110,7 +117,11 @@ def _process_filter_dict(
             # FIX: Remove extra parentheses around recursive call result
             sub_conditions = [
                 _process_filter_dict(
-                    item, param_helper, top_level_columns, json_column
+                    item,
+                    param_helper,
+                    top_level_columns,
+                    json_column,
+                    promoted_columns,
                 )
                 for item in value
                 if isinstance(item, dict)
@@ -135,7 +146,11 @@ def _process_filter_dict(
             # FIX: Remove extra parentheses around recursive call result
             sub_conditions = [
                 _process_filter_dict(
-                    item, param_helper, top_level_columns, json_column
+                    item,
+                    param_helper,
+                    top_level_columns,
+                    json_column,
+                    promoted_columns,
                 )
                 for item in value
                 if isinstance(item, dict)
@@ -158,6 +173,7 @@ def _process_filter_dict(
                 param_helper,
                 top_level_columns,
                 json_column,
+                promoted_columns,
             )
             # Avoid adding trivial TRUE conditions directly
             if sql_condition != "TRUE":
@@ -186,6 +202,7 @@ def _process_field_condition(
     param_helper: ParamHelper,
     top_level_columns: Set[str],
     json_column: str,
+    promoted_columns: Optional[PromotedColumns] = None,
 ) -> str:
     """Processes a condition for a specific field."""
 
@@ -284,7 +301,11 @@ def _process_field_condition(
             # Field was like "metadata.key" - relative_path is "key"
             # Pass the relative path and the original condition_spec
             return _build_metadata_condition(
-                relative_path, condition_spec, param_helper, json_column
+                relative_path,
+                condition_spec,
+                param_helper,
+                json_column,
+                promoted_columns,
             )
         else:
             # Field was just "metadata" - condition_spec must define paths/ops
@@ -299,7 +320,11 @@ def _process_field_condition(
             for meta_path, meta_condition_spec in condition_spec.items():
                 # Recursively call _build_metadata_condition for each path
                 condition_sql = _build_metadata_condition(
-                    meta_path, meta_condition_spec, param_helper, json_column
+                    meta_path,
+                    meta_condition_spec,
+                    param_helper,
+                    json_column,
+                    promoted_columns,
                 )
                 if condition_sql != "TRUE":
                     metadata_conditions.append(condition_sql)
@@ -531,6 +556,7 @@ def _build_metadata_condition(
     condition_spec: Any,
     param_helper: ParamHelper,
     json_column: str,
+    promoted_columns: Optional[PromotedColumns] = None,
 ) -> str:
     """
     Builds SQL condition for a potentially nested field within a JSONB column.
@@ -545,6 +571,8 @@ def _build_metadata_condition(
                               {"nested": "val"}, {"path.to.key": {"$in": [...]}}).
         param_helper (ParamHelper): The parameter helper instance.
         json_column (str): The name of the JSONB column (e.g., 'metadata').
+        promoted_columns (Optional[PromotedColumns]): Metadata keys materialized
+                              as generated columns, keyed by metadata key.
 
     Returns:
         str: The generated SQL condition string.
@@ -568,7 +596,12 @@ def _build_metadata_condition(
                     f"Operator '{key}' cannot be applied directly to the root of '{json_column}'. Specify a path."
                 )
             return _build_metadata_operator_condition(
-                relative_path, key, value, param_helper, json_column
+                relative_path,
+                key,
+                value,
+                param_helper,
+                json_column,
+                promoted_columns,
             )
 
         # Case 2: The key is NOT an operator - assume it's a nested path segment
@@ -581,7 +614,11 @@ def _build_metadata_condition(
             )
             # Recursively call _build_metadata_condition with the combined path and the inner value
             return _build_metadata_condition(
-                new_relative_path, value, param_helper, json_column
+                new_relative_path,
+                value,
+                param_helper,
+                json_column,
+                promoted_columns,
             )
 
     # Handle condition_spec being a direct value (shorthand for EQ)
@@ -599,6 +636,7 @@ def _build_metadata_condition(
             condition_spec,  # The value itself
             param_helper,
             json_column,
+            promoted_columns,
         )
 
     # Handle condition_spec being a dictionary but with multiple keys or zero keys (invalid structure at this level)
@@ -620,15 +658,97 @@ def _build_metadata_condition(
         )
 
 
+def _build_promoted_column_condition(
+    promoted: "PromotedMetadataKey",
+    op: str,
+    value: Any,
+    param_helper: ParamHelper,
+) -> Optional[str]:
+    """Builds SQL for an operator on a promoted metadata column.
+
+    Mirrors the JSONB semantics of `_build_metadata_operator_condition` for
+    string values. Returns None for anything without an exact column
+    equivalent, in which case the caller falls back to the JSONB path.
+    """
+    column = promoted.column
+
+    if promoted.type == "text[]":
+        if op in (
+            FilterOperator.IN,
+            FilterOperator.NIN,
+            FilterOperator.OVERLAP,
+            FilterOperator.ARRAY_CONTAINS,
+        ):
+            if not isinstance(value, list) or not all(
+                isinstance(item, str) for item in value
+            ):
+                return None
+            if not value:
+                return "FALSE" if op == FilterOperator.IN else "TRUE"
+            placeholder = param_helper.add(value)
+            if op == FilterOperator.ARRAY_CONTAINS:
+                return f"{column} @> {placeholder}::text[]"
+            if op == FilterOperator.NIN:
+                return f"NOT ({column} && {placeholder}::text[])"
+            return f"{column} && {placeholder}::text[]"
+        return None
+
+    if value is None:
+        if op == FilterOperator.EQ:
+            return f"{column} IS NULL"
+        if op == FilterOperator.NE:
+            return f"{column} IS NOT NULL"
+        return None
+
+    if op in (FilterOperator.IN, FilterOperator.NIN):
+        if not isinstance(value, list):
+            return None
+        if not value:
+            return "FALSE" if op == FilterOperator.IN else "TRUE"
+        placeholder = param_helper.add([str(item) for item in value])
+        condition = f"{column} = ANY({placeholder}::text[])"
+        return condition if op == FilterOperator.IN else f"NOT ({condition})"
+
+    sql_op_map = {
+        FilterOperator.EQ: "=",
+        FilterOperator.NE: "!=",
+        FilterOperator.LT: "<",
+        FilterOperator.LTE: "<=",
+        FilterOperator.GT: ">",
+        FilterOperator.GTE: ">=",
+        FilterOperator.LIKE: "LIKE",
+        FilterOperator.ILIKE: "ILIKE",
+    }
+    if op not in sql_op_map or not isinstance(value, str):
+        return None
+
+    if op == FilterOperator.EQ and value in promoted.partial_vector_indexes:
+        # Inline configured values so that prepared (generic) plans can
+        # still match the partial vector index built for them.
+        literal = value.replace("'", "''")
+        return f"{column} = '{literal}'"
+
+    placeholder = param_helper.add(value)
+    return f"{column} {sql_op_map[op]} {placeholder}"
+
+
 def _build_metadata_operator_condition(
     relative_path: str,
     op: str,
     value: Any,
     param_helper: ParamHelper,
     json_column: str,
+    promoted_columns: Optional[PromotedColumns] = None,
 ) -> str:
     """Builds the specific SQL for an operator on a JSONB path."""
 
+    if promoted_columns and relative_path in promoted_columns:
+        promoted_condition = _build_promoted_column_condition(
+            promoted_columns[relative_path], op, value, param_helper
+        )
+        if promoted_condition is not None:
+            return promoted_condition
+
     path_parts = relative_path.split(".")
 
     # Determine accessors WITH and WITHOUT text extraction
@@ -805,51 +925,230 @@ def _build_metadata_operator_condition(
         )
 
 
-# --- Public API Function ---
+# --- Compiled Filter Plans ---
+
+# Filters sent by the search endpoints come in a handful of shapes whose
+# values change from call to call (owner, collections, document type...).
+# The SQL text only depends on the shape, so it is compiled once per shape
+# and later calls just bind the new values into the cached template. This
+# also keeps the statement text stable for the server-side statement cache.
+FILTER_PLAN_CACHE_SIZE = 1024
+
+_filter_plans: "OrderedDict[tuple, Optional[tuple[str, list[tuple]]]]" = (
+    OrderedDict()
+)
+_UNPLANNED = object()
+
+# Probe values stand in for the filter values while working out which
+# parameter comes from which value. String probes are upper-case UUIDs so
+# that UUID columns accept them and their canonical (lower-case) form can be
+# told apart from the raw value.
+_UUID_PROBE_BASE = 0xF1 << 120
+_NUMERIC_PROBE_BASE = 987_654_321_000
+_PROBED_TYPES = (str, int, float, uuid.UUID)
+
+
+def _canonical_uuid(value: Any) -> str:
+    try:
+        return str(uuid.UUID(str(value)))
+    except (ValueError, TypeError) as e:
+        raise FilterError(f"Invalid UUID format in filter value: {e}") from e
+
+
+def _make_probe(
+    kind: type, index: int, probe_map: dict[Any, tuple[int, Any]]
+) -> Any:
+    """Creates the probe for the value at `index` and registers the forms
+    the builders may turn it into."""
+    if kind is str:
+        probe = str(uuid.UUID(int=_UUID_PROBE_BASE + index)).upper()
+        probe_map[probe] = (index, None)
+        probe_map[probe.lower()] = (index, _canonical_uuid)
+    elif kind is uuid.UUID:
+        probe = uuid.UUID(int=_UUID_PROBE_BASE + index)
+        probe_map[probe] = (index, None)
+        probe_map[str(probe)] = (index, str)
+    else:
+        probe = _NUMERIC_PROBE_BASE + index
+        if kind is float:
+            probe += 0.5
+        probe_map[probe] = (index, None)
+        probe_map[str(probe)] = (index, str)
+    return probe
+
+
+def _filter_shape(
+    node: Any, inline_values: frozenset[str], values: list[Any]
+) -> Any:
+    """Computes the shape signature of a filter node.
+
+    The signature keeps the structure, keys and operators, and replaces each
+    bindable value by its type, collecting the values themselves into
+    `values` in walk order. Booleans, None and strings that may be inlined
+    as literals (partial index values) change the generated SQL, so they
+    stay in the signature as they are.
+    """
+    if isinstance(node, dict):
+        return (
+            "dict",
+            tuple(_shape_items(node.items(), inline_values, values)),
+        )
+    if isinstance(node, list):
+        return (
+            "list",
+            tuple(_shape_items(enumerate(node), inline_values, values)),
+        )
+    kind = type(node)
+    if kind in _PROBED_TYPES and (
+        kind is not str or node not in inline_values
+    ):
+        values.append(node)
+        return kind
+    return ("literal", kind, repr(node))
+
+
+def _shape_items(
+    items: Iterable[tuple[Any, Any]],
+    inline_values: frozenset[str],
+    values: list[Any],
+) -> list[tuple[Any, Any]]:
+    # Plain values are handled in the loop; this runs for every filter on
+    # every search, and most nodes are leaves.
+    shape = []
+    for key, item in items:
+        kind = type(item)
+        if kind in _PROBED_TYPES and (
+            kind is not str or item not in inline_values
+        ):
+            values.append(item)
+            shape.append((key, kind))
+        else:
+            shape.append((key, _filter_shape(item, inline_values, values)))
+    return shape
+
+
+def _probe_filter(
+    node: Any,
+    inline_values: frozenset[str],
+    probe_map: dict[Any, tuple[int, Any]],
+    values: list[Any],
+) -> Any:
+    """Copies a filter node with every bindable value (the ones
+    `_filter_shape` collects, in the same order) replaced by a probe."""
+    if isinstance(node, dict):
+        return {
+            key: _probe_filter(value, inline_values, probe_map, values)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [
+            _probe_filter(item, inline_values, probe_map, values)
+            for item in node
+        ]
+    kind = type(node)
+    if kind in _PROBED_TYPES and (
+        kind is not str or node not in inline_values
+    ):
+        values.append(node)
+        return _make_probe(kind, len(values) - 1, probe_map)
+    return node
+
+
+def _probe_ref(
+    probe_map: dict[Any, tuple[int, Any]], value: Any
+) -> Optional[tuple[int, Any]]:
+    try:
+        return probe_map.get(value)
+    except TypeError:  # unhashable parameter
+        return None
+
+
+def _param_binder(
+    probe_param: Any, param: Any, probe_map: dict[Any, tuple[int, Any]]
+) -> Optional[tuple]:
+    """Works out how a parameter is derived from the filter values."""
+    if isinstance(probe_param, list):
+        refs = [_probe_ref(probe_map, item) for item in probe_param]
+        if refs and all(ref is not None for ref in refs):
+            return ("list", refs)
+    else:
+        ref = _probe_ref(probe_map, probe_param)
+        if ref is not None:
+            return ("value", *ref)
+    if type(probe_param) is type(param) and probe_param == param:
+        # Does not depend on any probed value (e.g. a JSON-encoded boolean).
+        return ("const", param)
+    return None
+
+
+def _bind_params(binders: list[tuple], values: list[Any]) -> list[Any]:
+    params = []
+    for binder in binders:
+        if binder[0] == "value":
+            _, index, convert = binder
+            value = values[index]
+            params.append(convert(value) if convert else value)
+        elif binder[0] == "list":
+            params.append(
+                [
+                    convert(values[index]) if convert else values[index]
+                    for index, convert in binder[1]
+                ]
+            )
+        else:
+            params.append(binder[1])
+    return params
 
 
-def apply_filters(
+def _plan_filters(
     filters: dict[str, Any],
-    param_list: Optional[list[Any]] = None,  # Pass list to accumulate params
-    top_level_columns: Optional[Set[str] | list[str]] = None,
-    json_column: str = "metadata",
-    mode: str = "where_clause",  # Controls output format
-) -> Tuple[str, list[Any]]:
+    sql: str,
+    params: list[Any],
+    prefix_length: int,
+    inline_values: frozenset[str],
+    compile_args: tuple,
+) -> Optional[tuple[str, list[tuple]]]:
+    """Builds the cached plan for the shape of `filters`.
+
+    Compiles the filter a second time with probe values to find out which
+    filter value every parameter comes from. Returns None when the shape
+    cannot be bound safely (the generated SQL depends on the values, or a
+    parameter is derived from a value in some other way), in which case the
+    shape is always compiled from scratch.
     """
-    Applies a dictionary of filters to generate SQL conditions and parameters.
-
-    Args:
-        filters: Dictionary representing the filter query (MongoDB-like syntax).
-        param_list: An optional existing list to append parameters to.
-                    If None, a new list is created.
-        top_level_columns: Optional set or list of column names considered top-level
-                           (not part of the json_column). Defaults are used if None.
-        json_column: The name of the column storing JSONB data (default: 'metadata').
-        mode: 'where_clause' returns "WHERE condition", 'condition_only' returns "condition".
-
-    Returns:
-        Tuple containing:
-            - The generated SQL condition string (potentially prefixed with 'WHERE ').
-            - The list of parameters collected.
+    probe_map: dict[Any, tuple[int, Any]] = {}
+    probe_filters = _probe_filter(filters, inline_values, probe_map, [])
+    try:
+        probe_sql, probe_params = _compile_filters(
+            probe_filters, [None] * prefix_length, *compile_args
+        )
+    except FilterError:
+        return None
+    if probe_sql != sql or len(probe_params) != len(params):
+        return None
+
+    binders = []
+    for probe_param, param in zip(
+        probe_params[prefix_length:], params[prefix_length:], strict=True
+    ):
+        binder = _param_binder(probe_param, param, probe_map)
+        if binder is None:
+            return None
+        binders.append(binder)
+    return sql, binders
 
-    Raises:
-        FilterError: If the filter structure or operators are invalid.
-    """
-    if param_list is None:
-        param_list = []
 
+def _compile_filters(
+    filters: dict[str, Any],
+    param_list: list[Any],
+    processed_top_level_columns: Set[str],
+    json_column: str,
+    mode: str,
+    promoted_columns: Optional[PromotedColumns],
+) -> Tuple[str, list[Any]]:
+    """Walks the filter and generates the SQL condition and parameters."""
     param_helper = ParamHelper(initial_params=param_list)
 
-    # Initialize top_level_columns with defaults if not provided
-    if top_level_columns is None:
-        processed_top_level_columns = DEFAULT_TOP_LEVEL_COLUMNS.copy()
-    elif isinstance(top_level_columns, list):
-        processed_top_level_columns = set(top_level_columns)
-    elif isinstance(top_level_columns, set):
-        processed_top_level_columns = top_level_columns.copy()
-    else:
-        raise TypeError("top_level_columns must be a Set, list, or None.")
-
     # Ensure json_column itself IS treated as a potential top-level key
     # but its processing is handled differently (expecting nested structure)
     # processed_top_level_columns.discard(json_column)
@@ -860,7 +1159,11 @@ def apply_filters(
     else:
         try:
             condition = _process_filter_dict(
-                filters, param_helper, processed_top_level_columns, json_column
+                filters,
+                param_helper,
+                processed_top_level_columns,
+                json_column,
+                promoted_columns,
             )
             # If processing resulted in an empty condition string, default to TRUE
             if not condition:
@@ -890,3 +1193,101 @@ def apply_filters(
         raise FilterError(
             f"Unsupported filter mode: {mode}. Choose 'where_clause' or 'condition_only'."
         )
+
+
+# --- Public API Function ---
+
+
+def apply_filters(
+    filters: dict[str, Any],
+    param_list: Optional[list[Any]] = None,  # Pass list to accumulate params
+    top_level_columns: Optional[Set[str] | list[str]] = None,
+    json_column: str = "metadata",
+    mode: str = "where_clause",  # Controls output format
+    promoted_columns: Optional[PromotedColumns] = None,
+) -> Tuple[str, list[Any]]:
+    """
+    Applies a dictionary of filters to generate SQL conditions and parameters.
+
+    Args:
+        filters: Dictionary representing the filter query (MongoDB-like syntax).
+        param_list: An optional existing list to append parameters to.
+                    If None, a new list is created.
+        top_level_columns: Optional set or list of column names considered top-level
+                           (not part of the json_column). Defaults are used if None.
+        json_column: The name of the column storing JSONB data (default: 'metadata').
+        mode: 'where_clause' returns "WHERE condition", 'condition_only' returns "condition".
+        promoted_columns: Optional metadata keys materialized as generated columns
+                          on the target table, keyed by metadata key. Conditions on
+                          those keys are compiled against the indexed column.
+
+    Returns:
+        Tuple containing:
+            - The generated SQL condition string (potentially prefixed with 'WHERE ').
+            - The list of parameters collected.
+
+    Raises:
+        FilterError: If the filter structure or operators are invalid.
+    """
+    if param_list is None:
+        param_list = []
+
+    if top_level_columns is not None and not isinstance(
+        top_level_columns, (list, set)
+    ):
+        raise TypeError("top_level_columns must be a Set, list, or None.")
+
+    promoted_key: tuple = ()
+    inline_values: frozenset[str] = frozenset()
+    if promoted_columns:
+        promoted_key = tuple(
+            (name, key.type, tuple(key.partial_vector_indexes))
+            for name, key in promoted_columns.items()
+        )
+        inline_values = frozenset(
+            value
+            for key in promoted_columns.values()
+            for value in key.partial_vector_indexes
+        )
+
+    values: list[Any] = []
+    cache_key = (
+        _filter_shape(filters, inline_values, values),
+        len(param_list),
+        None if top_level_columns is None else frozenset(top_level_columns),
+        json_column,
+        mode,
+        promoted_key,
+    )
+
+    plan = _filter_plans.get(cache_key, _UNPLANNED)
+    if plan is not _UNPLANNED:
+        _filter_plans.move_to_end(cache_key)
+    if plan is not None and plan is not _UNPLANNED:
+        sql, binders = plan
+        param_helper = ParamHelper(initial_params=param_list)
+        param_helper.params.extend(_bind_params(binders, values))
+        return sql, param_helper.params
+
+    # Initialize top_level_columns with defaults if not provided
+    processed_top_level_columns = set(
+        DEFAULT_TOP_LEVEL_COLUMNS
+        if top_level_columns is None
+        else top_level_columns
+    )
+    compile_args = (
+        processed_top_level_columns,
+        json_column,
+        mode,
+        promoted_columns,
+    )
+    prefix_length = len(param_list)
+    sql, params = _compile_filters(filters, param_list, *compile_args)
+
+    if plan is _UNPLANNED:
+        _filter_plans[cache_key] = _plan_filters(
+            filters, sql, params, prefix_length, inline_values, compile_args
+        )
+        if len(_filter_plans) > FILTER_PLAN_CACHE_SIZE:
+            _filter_plans.popitem(last=False)
+    return sql, params
@@ -8,7 +8,7 @@ import os
 import tempfile
 import time
 from typing import IO, Any, AsyncGenerator, Optional, Tuple
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import asyncpg
 import httpx
@@ -163,6 +163,49 @@ class PostgresEntitiesHandler(Handler):
             metadata=result["metadata"],
         )
 
+    async def create_many(
+        self,
+        entities: list[Entity],
+        store_type: StoreType,
+    ) -> list[Entity]:
+        """Insert many entities into the specified store in one batch.
+
+        Ids are assigned client-side (unless already set) and written back
+        onto `entities`, so callers can link relationships to the new rows
+        without reading them back. The batch goes through one `executemany`.
+        """
+        if not entities:
+            return []
+
+        table_name = self._get_entity_table_for_store(store_type)
+        query = f"""
+            INSERT INTO {self._get_table_name(table_name)}
+            (id, name, category, description, parent_id, description_embedding, chunk_ids, metadata)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+        """
+
+        params: list[tuple] = []
+        for entity in entities:
+            entity.id = entity.id or uuid4()
+            embedding = entity.description_embedding
+            params.append(
+                (
+                    entity.id,
+                    entity.name,
+                    entity.category,
+                    entity.description,
+                    entity.parent_id,
+                    str(embedding)
+                    if isinstance(embedding, list)
+                    else embedding,
+                    entity.chunk_ids,
+                    json.dumps(entity.metadata) if entity.metadata else None,
+                )
+            )
+
+        await self.connection_manager.execute_many(query, params)
+        return entities
+
     async def get(
         self,
         parent_id: UUID,
@@ -825,6 +868,54 @@ class PostgresRelationshipsHandler(Handler):
             metadata=result["metadata"],
         )
 
+    async def create_many(
+        self,
+        relationships: list[Relationship],
+        store_type: StoreType,
+    ) -> list[Relationship]:
+        """Insert many relationships into the specified store in one batch.
+
+        Like `PostgresEntitiesHandler.create_many`, ids are assigned
+        client-side and the batch is sent through a single `executemany`.
+        """
+        if not relationships:
+            return []
+
+        table_name = self._get_relationship_table_for_store(store_type)
+        query = f"""
+            INSERT INTO {self._get_table_name(table_name)}
+            (id, subject, predicate, object, description, subject_id, object_id,
+             weight, chunk_ids, parent_id, description_embedding, metadata)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+        """
+
+        params: list[tuple] = []
+        for relationship in relationships:
+            relationship.id = relationship.id or uuid4()
+            embedding = relationship.description_embedding
+            metadata = relationship.metadata
+            params.append(
+                (
+                    relationship.id,
+                    relationship.subject,
+                    relationship.predicate,
+                    relationship.object,
+                    relationship.description,
+                    relationship.subject_id,
+                    relationship.object_id,
+                    relationship.weight,
+                    relationship.chunk_ids,
+                    relationship.parent_id,
+                    str(embedding)
+                    if isinstance(embedding, list)
+                    else embedding,
+                    json.dumps(metadata) if metadata else None,
+                )
+            )
+
+        await self.connection_manager.execute_many(query, params)
+        return relationships
+
     async def get(
         self,
         parent_id: UUID,
@@ -2581,9 +2672,11 @@ class PostgresGraphsHandler(Handler):
         table_name = f"graphs_{search_type}"
         property_names_str = ", ".join(property_names)
 
-        # Build the WHERE clause from filters
-        params: list[str | int | bytes] = [
-            json.dumps(query_embedding),
+        # Build the WHERE clause from filters. The embedding goes over the
+        # wire as a binary float4[] and is cast to vector server-side, rather
+        # than being serialized to (and parsed back from) a JSON string.
+        params: list[Any] = [
+            [float(x) for x in query_embedding],
             limit,
         ]
         conditions_clause = self._build_filters(filters, params, search_type)
@@ -2597,10 +2690,10 @@ class PostgresGraphsHandler(Handler):
         QUERY = f"""
             SELECT
                 {property_names_str},
-                ({embedding_type} <=> $1) as similarity_score
+                ({embedding_type} <=> $1::real[]::vector) as similarity_score
             FROM {self._get_table_name(table_name)}
             {where_clause}
-            ORDER BY {embedding_type} <=> $1
+            ORDER BY {embedding_type} <=> $1::real[]::vector
             LIMIT $2;
         """
 
@@ -0,0 +1,241 @@
+import json
+import logging
+from typing import Any, Optional
+from uuid import UUID
+
+from core.base import Handler
+
+from .base import PostgresConnectionManager
+from .documents import PostgresDocumentsHandler
+
+logger = logging.getLogger()
+
+
+class PostgresJobsHandler(Handler):
+    """Durable job queue used by the `postgres` orchestration provider.
+
+    Jobs are claimed with `FOR UPDATE SKIP LOCKED`, so any number of workers
+    (in one or many processes) can poll the table without blocking each
+    other. A claimed job holds a lease that its worker keeps extending; if
+    the worker dies, the lease expires and the job becomes claimable again.
+    """
+
+    TABLE_NAME = "jobs"
+
+    def __init__(
+        self, project_name: str, connection_manager: PostgresConnectionManager
+    ):
+        super().__init__(project_name, connection_manager)
+
+    async def create_tables(self):
+        query = f"""
+        CREATE TABLE IF NOT EXISTS {self._get_table_name(PostgresJobsHandler.TABLE_NAME)} (
+            id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+            workflow_name TEXT NOT NULL,
+            parameters JSONB NOT NULL,
+            document_id UUID,
+            status TEXT NOT NULL DEFAULT 'queued',
+            attempts INT NOT NULL DEFAULT 0,
+            max_attempts INT NOT NULL DEFAULT 3,
+            run_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            worker_id TEXT,
+            lease_expires_at TIMESTAMPTZ,
+            last_error TEXT,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            updated_at TIMESTAMPTZ DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_{self.project_name}_{PostgresJobsHandler.TABLE_NAME}_claimable
+        ON {self._get_table_name(PostgresJobsHandler.TABLE_NAME)} (workflow_name, run_at)
+        WHERE status IN ('queued', 'running');
+        CREATE INDEX IF NOT EXISTS idx_{self.project_name}_{PostgresJobsHandler.TABLE_NAME}_document_id
+        ON {self._get_table_name(PostgresJobsHandler.TABLE_NAME)} (document_id);
+        """
+        await self.connection_manager.execute_query(query)
+
+    async def enqueue_job(
+        self,
+        workflow_name: str,
+        parameters: dict,
+        document_id: Optional[UUID] = None,
+        max_attempts: int = 3,
+    ) -> UUID:
+        query = f"""
+        INSERT INTO {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+            (workflow_name, parameters, document_id, max_attempts)
+        VALUES ($1, $2, $3, $4)
+        RETURNING id
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query,
+            [
+                workflow_name,
+                json.dumps(parameters, default=str),
+                document_id,
+                max_attempts,
+            ],
+        )
+        return result["id"]
+
+    async def claim_job(
+        self,
+        worker_id: str,
+        concurrency_limits: dict[str, int],
+        lease_seconds: int,
+    ) -> Optional[dict[str, Any]]:
+        """Claim the next runnable job, or return `None` if there is none.
+
+        A job is runnable when it is queued and due, or when a previous
+        worker's lease on it has expired. Only workflows in
+        `concurrency_limits` are considered, and a workflow is skipped while
+        it already has that many live jobs. The limit is checked without a
+        global lock, so concurrent claims may briefly overshoot it.
+        """
+        table = self._get_table_name(PostgresJobsHandler.TABLE_NAME)
+        query = f"""
+        WITH limits AS (
+            SELECT * FROM unnest($1::text[], $2::int[])
+                AS l(workflow_name, max_running)
+        ),
+        candidate AS (
+            SELECT j.id
+            FROM {table} j
+            JOIN limits l ON l.workflow_name = j.workflow_name
+            WHERE j.run_at <= NOW()
+            AND j.attempts < j.max_attempts
+            AND (
+                j.status = 'queued'
+                OR (j.status = 'running' AND j.lease_expires_at < NOW())
+            )
+            AND (
+                SELECT COUNT(*) FROM {table} r
+                WHERE r.workflow_name = j.workflow_name
+                AND r.status = 'running'
+                AND r.lease_expires_at >= NOW()
+            ) < l.max_running
+            ORDER BY j.run_at
+            LIMIT 1
+            FOR UPDATE OF j SKIP LOCKED
+        )
+        UPDATE {table} AS jobs
+        SET status = 'running',
+            attempts = jobs.attempts + 1,
+            worker_id = $3,
+            lease_expires_at = NOW() + make_interval(secs => $4),
+            updated_at = NOW()
+        FROM candidate
+        WHERE jobs.id = candidate.id
+        RETURNING jobs.id, jobs.workflow_name, jobs.parameters,
+            jobs.document_id, jobs.attempts, jobs.max_attempts
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query,
+            [
+                list(concurrency_limits.keys()),
+                list(concurrency_limits.values()),
+                worker_id,
+                float(lease_seconds),
+            ],
+        )
+        if result is None:
+            return None
+        job = dict(result)
+        job["parameters"] = json.loads(job["parameters"])
+        return job
+
+    async def extend_lease(
+        self, job_id: UUID, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """Extend a running job's lease.
+
+        Returns `False` if the job is no longer held by `worker_id`.
+        """
+        query = f"""
+        UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        SET lease_expires_at = NOW() + make_interval(secs => $3),
+            updated_at = NOW()
+        WHERE id = $1 AND worker_id = $2 AND status = 'running'
+        RETURNING id
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query, [job_id, worker_id, float(lease_seconds)]
+        )
+        return result is not None
+
+    async def complete_job(self, job_id: UUID, worker_id: str) -> None:
+        query = f"""
+        UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        SET status = 'completed', lease_expires_at = NULL, updated_at = NOW()
+        WHERE id = $1 AND worker_id = $2
+        """
+        await self.connection_manager.execute_query(query, [job_id, worker_id])
+
+    async def fail_job(
+        self,
+        job_id: UUID,
+        worker_id: str,
+        error: str,
+        retry_in_seconds: Optional[float] = None,
+    ) -> None:
+        """Record a failed attempt.
+
+        The job is re-queued to run after `retry_in_seconds`, or marked
+        `failed` for good when that is `None`.
+        """
+        query = f"""
+        UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        SET status = CASE WHEN $4::float8 IS NULL THEN 'failed' ELSE 'queued' END,
+            run_at = NOW() + make_interval(secs => COALESCE($4::float8, 0)),
+            last_error = $3,
+            lease_expires_at = NULL,
+            updated_at = NOW()
+        WHERE id = $1 AND worker_id = $2
+        """
+        await self.connection_manager.execute_query(
+            query, [job_id, worker_id, error, retry_in_seconds]
+        )
+
+    async def fail_expired_jobs(
+        self, ingestion_workflows: list[str]
+    ) -> list[UUID]:
+        """Fail jobs whose lease expired after their last allowed attempt.
+
+        The documents of failed ingestion jobs are marked as failed too, as
+        the crashed worker never got to record it. Returns the failed job
+        ids.
+        """
+        query = f"""
+        WITH expired AS (
+            UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+            SET status = 'failed',
+                last_error = 'Lease expired after the final attempt.',
+                updated_at = NOW()
+            WHERE status = 'running'
+            AND lease_expires_at < NOW()
+            AND attempts >= max_attempts
+            RETURNING id, workflow_name, document_id
+        ),
+        documents AS (
+            UPDATE {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}
+            SET ingestion_status = 'failed'
+            WHERE id IN (
+                SELECT document_id FROM expired
+                WHERE workflow_name = ANY($1::text[])
+            )
+        )
+        SELECT id FROM expired
+        """
+        rows = await self.connection_manager.fetch_query(
+            query, [ingestion_workflows]
+        )
+        return [row["id"] for row in rows]
+
+    async def get_job(self, job_id: UUID) -> Optional[dict[str, Any]]:
+        query = f"""
+        SELECT id, workflow_name, document_id, status, attempts,
+            max_attempts, run_at, worker_id, last_error, created_at,
+            updated_at
+        FROM {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        WHERE id = $1
+        """
+        result = await self.connection_manager.fetchrow_query(query, [job_id])
+        return dict(result) if result else None
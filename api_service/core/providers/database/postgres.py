@@ -21,6 +21,7 @@ from .graphs import (
     PostgresGraphsHandler,
     PostgresRelationshipsHandler,
 )
+from .jobs import PostgresJobsHandler
 from .limits import PostgresLimitsHandler
 from .maintenance import PostgresMaintenanceHandler
 from .prompts_handler import PostgresPromptsHandler
@@ -70,6 +71,7 @@ class PostgresDatabaseProvider(DatabaseProvider):
     conversations_handler: PostgresConversationsHandler
     limits_handler: PostgresLimitsHandler
     maintenance_handler: PostgresMaintenanceHandler
+    jobs_handler: PostgresJobsHandler
 
     def __init__(
         self,
@@ -155,6 +157,7 @@ class PostgresDatabaseProvider(DatabaseProvider):
             connection_manager=self.connection_manager,
             dimension=self.dimension,
             quantization_type=(self.quantization_type),
+            promoted_metadata_keys=self.config.promoted_metadata_keys,
         )
         self.conversations_handler = PostgresConversationsHandler(
             self.project_name, self.connection_manager
@@ -202,6 +205,9 @@ class PostgresDatabaseProvider(DatabaseProvider):
             connection_manager=self.connection_manager,
             config=self.config,
         )
+        self.jobs_handler = PostgresJobsHandler(
+            self.project_name, self.connection_manager
+        )
 
     async def initialize(self):
         logger.info("Initializing `PostgresDatabaseProvider`.")
@@ -241,6 +247,7 @@ class PostgresDatabaseProvider(DatabaseProvider):
         await self.conversations_handler.create_tables()
         await self.limits_handler.create_tables()
         await self.maintenance_handler.create_tables()
+        await self.jobs_handler.create_tables()
 
     def _get_postgres_configuration_settings(
         self, config: DatabaseConfig
@@ -263,6 +270,8 @@ class PostgresDatabaseProvider(DatabaseProvider):
             "max_worker_processes": "R2R_POSTGRES_MAX_WORKER_PROCESSES",
             "random_page_cost": "R2R_POSTGRES_RANDOM_PAGE_COST",
             "statement_cache_size": "R2R_POSTGRES_STATEMENT_CACHE_SIZE",
+            "prepared_statement_mode": "R2R_POSTGRES_PREPARED_STATEMENT_MODE",
+            "hot_statement_cache_size": "R2R_POSTGRES_HOT_STATEMENT_CACHE_SIZE",
             "shared_buffers": "R2R_POSTGRES_SHARED_BUFFERS",
             "wal_buffers": "R2R_POSTGRES_WAL_BUFFERS",
             "work_mem": "R2R_POSTGRES_WORK_MEM",
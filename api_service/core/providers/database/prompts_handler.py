@@ -4,12 +4,14 @@ import os
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generic, Optional, TypeVar
 
 import yaml
 
 from core.base import Handler, generate_default_prompt_id
+from core.utils.shared_cache import get_shared_cache
 
 from .base import PostgresConnectionManager
 
@@ -17,6 +19,26 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+DEFAULT_PROMPT_DIRECTORY = Path(os.path.dirname(__file__)) / "prompts"
+
+
+@lru_cache(maxsize=None)
+def load_prompt_files(directory: Path) -> tuple[tuple[Path, Any], ...]:
+    """Parse the prompt YAML files in `directory` once per process.
+
+    The result is shared by every handler, so parsing it before the API
+    workers fork (see `core.main.warmup`) spares each worker the work.
+    Unreadable files map to the exception raised while parsing them.
+    """
+    parsed: list[tuple[Path, Any]] = []
+    for yaml_file in sorted(directory.glob("*.yaml")):
+        try:
+            with open(yaml_file, "r", encoding="utf-8") as file:
+                parsed.append((yaml_file, yaml.safe_load(file)))
+        except Exception as e:
+            parsed.append((yaml_file, e))
+    return tuple(parsed)
+
 
 @dataclass
 class CacheEntry(Generic[T]):
@@ -123,6 +145,34 @@ class CacheablePromptHandler(Handler):
         self._template_cache = Cache[dict](
             ttl=cache_ttl, max_size=max_cache_size
         )
+        self._shared_generation: Optional[str] = None
+
+    @property
+    def _generation_key(self) -> str:
+        return f"prompts:{self.project_name}:generation"
+
+    async def _load_shared_generation(self) -> None:
+        """Record the shared prompt generation the local caches reflect."""
+        if shared_cache := get_shared_cache():
+            self._shared_generation = await shared_cache.get(
+                self._generation_key
+            )
+
+    async def _sync_shared_generation(self) -> None:
+        """Drop the local caches if a prompt changed in another worker."""
+        if shared_cache := get_shared_cache():
+            generation = await shared_cache.get(self._generation_key)
+            if generation != self._shared_generation:
+                self._prompt_cache.clear()
+                self._template_cache.clear()
+                self._shared_generation = generation
+
+    async def _publish_prompt_change(self) -> None:
+        """Tell the other workers to drop their cached prompts."""
+        if shared_cache := get_shared_cache():
+            generation = await shared_cache.incr(self._generation_key)
+            if generation is not None:
+                self._shared_generation = str(generation)
 
     def _cache_key(
         self, prompt_name: str, inputs: Optional[dict] = None
@@ -151,6 +201,7 @@ class CacheablePromptHandler(Handler):
             return prompt_override
 
         cache_key = self._cache_key(prompt_name, inputs)
+        await self._sync_shared_generation()
 
         # If not bypassing, try returning from the prompt-level cache
         if not bypass_cache:
@@ -233,6 +284,7 @@ class CacheablePromptHandler(Handler):
 
         # Perform the update
         await self._update_prompt_impl(name, template, input_types)
+        await self._publish_prompt_change()
 
         # Force refresh template cache
         template_info = await self._get_template_info(name)
@@ -276,15 +328,15 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         **cache_options,
     ):
         super().__init__(**cache_options)
-        self.prompt_directory = (
-            prompt_directory or Path(os.path.dirname(__file__)) / "prompts"
-        )
+        self.prompt_directory = prompt_directory or DEFAULT_PROMPT_DIRECTORY
         self.connection_manager = connection_manager
         self.project_name = project_name
         self.prompts: dict[str, dict[str, str | dict[str, str]]] = {}
 
     async def _load_prompts(self) -> None:
         """Load prompts from both database and YAML files."""
+        await self._load_shared_generation()
+
         # First load from database
         await self._load_prompts_from_database()
 
@@ -343,51 +395,60 @@ class PostgresPromptsHandler(CacheablePromptHandler):
             return
 
         logger.info(f"Loading prompts from {self.prompt_directory}")
-        for yaml_file in self.prompt_directory.glob("*.yaml"):
+        for yaml_file, data in load_prompt_files(self.prompt_directory):
             logger.debug(f"Processing {yaml_file}")
             try:
-                with open(yaml_file, "r", encoding="utf-8") as file:
-                    data = yaml.safe_load(file)
-                    if not isinstance(data, dict):
-                        raise ValueError(
-                            f"Invalid format in YAML file {yaml_file}"
-                        )
-
-                    for name, prompt_data in data.items():
-                        # Attempt to parse the relevant prompt fields
-                        template = prompt_data.get("template")
-                        input_types = prompt_data.get("input_types", {})
+                if isinstance(data, Exception):
+                    raise data
+                if not isinstance(data, dict):
+                    raise ValueError(
+                        f"Invalid format in YAML file {yaml_file}"
+                    )
 
-                        # Decide on per-prompt overwrite behavior (or fallback)
-                        overwrite_on_diff = prompt_data.get(
-                            "overwrite_on_diff", default_overwrite_on_diff
-                        )
-                        # Some logic to determine if we *should* modify
-                        # For instance, preserve only if it has never been updated
-                        # (i.e., created_at == updated_at).
-                        should_modify = True
-                        if name in self.prompts:
-                            existing = self.prompts[name]
-                            should_modify = (
-                                existing["created_at"]
-                                == existing["updated_at"]
-                            )
-
-                        # If should_modify is True, the default logic is
-                        #   preserve_existing = False,
-                        # so we can pass that in. Otherwise, preserve_existing=True
-                        # effectively means we skip the update.
-                        logger.info(
-                            f"Loading default prompt: {name} from {yaml_file}."
+                for name, prompt_data in data.items():
+                    # Attempt to parse the relevant prompt fields
+                    template = prompt_data.get("template")
+                    input_types = prompt_data.get("input_types", {})
+
+                    # Unchanged prompts need no upsert; skipping them keeps
+                    # every worker start from rewriting the prompts table.
+                    existing = self.prompts.get(name)
+                    if (
+                        existing
+                        and existing["template"] == template
+                        and existing["input_types"] == input_types
+                    ):
+                        continue
+
+                    # Decide on per-prompt overwrite behavior (or fallback)
+                    overwrite_on_diff = prompt_data.get(
+                        "overwrite_on_diff", default_overwrite_on_diff
+                    )
+                    # Some logic to determine if we *should* modify
+                    # For instance, preserve only if it has never been updated
+                    # (i.e., created_at == updated_at).
+                    should_modify = True
+                    if name in self.prompts:
+                        existing = self.prompts[name]
+                        should_modify = (
+                            existing["created_at"] == existing["updated_at"]
                         )
 
-                        await self.add_prompt(
-                            name=name,
-                            template=template,
-                            input_types=input_types,
-                            preserve_existing=False,
-                            overwrite_on_diff=overwrite_on_diff,
-                        )
+                    # If should_modify is True, the default logic is
+                    #   preserve_existing = False,
+                    # so we can pass that in. Otherwise, preserve_existing=True
+                    # effectively means we skip the update.
+                    logger.info(
+                        f"Loading default prompt: {name} from {yaml_file}."
+                    )
+
+                    await self.add_prompt(
+                        name=name,
+                        template=template,
+                        input_types=input_types,
+                        preserve_existing=False,
+                        overwrite_on_diff=overwrite_on_diff,
+                    )
             except Exception as e:
                 logger.error(f"Error loading {yaml_file}: {e}")
                 continue
@@ -657,11 +718,12 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         for key in list(self._prompt_cache._cache.keys()):
             if key.startswith(f"{name}:"):
                 self._prompt_cache.invalidate(key)
+        await self._publish_prompt_change()
 
     async def get_all_prompts(self) -> dict[str, Any]:
         """Retrieve all stored prompts."""
         query = f"""
-        SELECT id, name, template, input_types, created_at, updated_at, COUNT(*) OVER() AS total_entries
+        SELECT id, name, template, input_types, created_at, updated_at
         FROM {self._get_table_name("prompts")};
         """
         results = await self.connection_manager.fetch_query(query)
@@ -669,7 +731,8 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         if not results:
             return {"results": [], "total_entries": 0}
 
-        total_entries = results[0]["total_entries"] if results else 0
+        # Prompts are never paged, so the count is just the row count
+        total_entries = len(results)
 
         prompts = [
             {
@@ -704,6 +767,7 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         for key in list(self._prompt_cache._cache.keys()):
             if key.startswith(f"{name}:"):
                 self._prompt_cache.invalidate(key)
+        await self._publish_prompt_change()
 
     async def get_message_payload(
         self,
@@ -2,7 +2,7 @@ import csv
 import json
 import tempfile
 from datetime import datetime
-from typing import IO, Optional
+from typing import IO, Any, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -10,10 +10,12 @@ from fastapi import HTTPException
 from core.base import CryptoProvider, Handler
 from core.base.abstractions import R2RException
 from core.utils import generate_user_id
+from core.utils.shared_cache import invalidate_principals
 from shared.abstractions import User
 
 from .base import PostgresConnectionManager, QueryBuilder
 from .collections import PostgresCollectionsHandler
+from .utils import TotalEntriesMode, fetch_page
 
 
 def _merge_metadata(
@@ -167,7 +169,9 @@ class PostgresUserHandler(Handler):
             .where("id = $1")
             .build()
         )
-        result = await self.connection_manager.fetchrow_query(query, [id])
+        result = await self.connection_manager.fetchrow_query(
+            query, [id], prepared=True
+        )
 
         if not result:
             raise R2RException(status_code=404, message="User not found")
@@ -219,7 +223,9 @@ class PostgresUserHandler(Handler):
             .where("email = $1")
             .build()
         )
-        result = await self.connection_manager.fetchrow_query(query, [email])
+        result = await self.connection_manager.fetchrow_query(
+            query, [email], prepared=True
+        )
         if not result:
             raise R2RException(status_code=404, message="User not found")
 
@@ -472,6 +478,7 @@ class PostgresUserHandler(Handler):
                 user.id,
             ],
         )
+        await invalidate_principals(user.id)
 
         if not result:
             raise HTTPException(
@@ -546,6 +553,7 @@ class PostgresUserHandler(Handler):
 
         if not result:
             raise R2RException(status_code=404, message="User not found")
+        await invalidate_principals(id)
 
     async def update_user_password(self, id: UUID, new_hashed_password: str):
         query = f"""
@@ -556,6 +564,7 @@ class PostgresUserHandler(Handler):
         await self.connection_manager.execute_query(
             query, [new_hashed_password, id]
         )
+        await invalidate_principals(id)
 
     async def get_all_users(self) -> list[User]:
         """Get all users with minimal information."""
@@ -638,6 +647,7 @@ class PostgresUserHandler(Handler):
             raise R2RException(
                 status_code=400, message="Invalid or expired verification code"
             )
+        await invalidate_principals(result["id"])
 
     async def remove_verification_code(self, verification_code: str):
         query = f"""
@@ -694,6 +704,7 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        await invalidate_principals(id)
 
     async def add_user_to_collection(
         self, id: UUID, collection_id: UUID
@@ -719,6 +730,7 @@ class PostgresUserHandler(Handler):
             raise R2RException(
                 status_code=400, message="User already in collection"
             )
+        await invalidate_principals(id)
 
         update_collection_query = f"""
             UPDATE {self._get_table_name("collections")}
@@ -752,6 +764,7 @@ class PostgresUserHandler(Handler):
                 status_code=400,
                 message="User is not a member of the specified collection",
             )
+        await invalidate_principals(id)
         return True
 
     async def get_users_in_collection(
@@ -832,6 +845,7 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        await invalidate_principals(id)
 
     async def get_user_id_by_verification_code(
         self, verification_code: str
@@ -860,64 +874,64 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        await invalidate_principals(id)
 
     async def get_users_overview(
         self,
         offset: int,
         limit: int,
         user_ids: Optional[list[UUID]] = None,
-    ) -> dict[str, list[User] | int]:
-        """Return users with document usage and total entries."""
-        query = f"""
-            WITH user_document_ids AS (
-                SELECT
-                    u.id as user_id,
-                    ARRAY_AGG(d.id) FILTER (WHERE d.id IS NOT NULL) AS doc_ids
-                FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
-                LEFT JOIN {self._get_table_name("documents")} d ON u.id = d.owner_id
-                GROUP BY u.id
-            ),
-            user_docs AS (
+        cursor: Optional[str] = None,
+        total_entries: TotalEntriesMode = "exact",
+    ) -> dict[str, Any]:
+        """Return users with document usage and total entries.
+
+        Users are paged by email first, and document usage is only
+        aggregated for the users on the page.
+        """
+        table_name = self._get_table_name(PostgresUserHandler.TABLE_NAME)
+        results, total, next_cursor = await fetch_page(
+            self.connection_manager,
+            """
+            SELECT
+                u.id,
+                u.email,
+                u.is_superuser,
+                u.is_active,
+                u.is_verified,
+                u.name,
+                u.bio,
+                u.profile_picture,
+                u.collection_ids,
+                u.created_at,
+                u.updated_at,
+                ud.num_files,
+                ud.total_size_in_bytes,
+                ud.document_ids
+            """,
+            f"FROM {table_name} u",
+            ["u.id = ANY($1::uuid[])"] if user_ids else [],
+            [user_ids] if user_ids else [],
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            total_entries=total_entries,
+            sort_column="u.email",
+            sort_type="text",
+            id_column="u.id",
+            descending=False,
+            table=table_name,
+            joins=f"""
+            LEFT JOIN LATERAL (
                 SELECT
-                    u.id,
-                    u.email,
-                    u.is_superuser,
-                    u.is_active,
-                    u.is_verified,
-                    u.name,
-                    u.bio,
-                    u.profile_picture,
-                    u.collection_ids,
-                    u.created_at,
-                    u.updated_at,
                     COUNT(d.id) AS num_files,
                     COALESCE(SUM(d.size_in_bytes), 0) AS total_size_in_bytes,
-                    ud.doc_ids as document_ids
-                FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
-                LEFT JOIN {self._get_table_name("documents")} d ON u.id = d.owner_id
-                LEFT JOIN user_document_ids ud ON u.id = ud.user_id
-                {" WHERE u.id = ANY($3::uuid[])" if user_ids else ""}
-                GROUP BY u.id, u.email, u.is_superuser, u.is_active, u.is_verified,
-                         u.created_at, u.updated_at, u.collection_ids, ud.doc_ids
-            )
-            SELECT
-                user_docs.*,
-                COUNT(*) OVER() AS total_entries
-            FROM user_docs
-            ORDER BY email
-            OFFSET $1
-        """
-
-        params: list = [offset]
-
-        if limit != -1:
-            query += " LIMIT $2"
-            params.append(limit)
-
-        if user_ids:
-            params.append(user_ids)
-
-        results = await self.connection_manager.fetch_query(query, params)
+                    ARRAY_AGG(d.id) FILTER (WHERE d.id IS NOT NULL) AS document_ids
+                FROM {self._get_table_name("documents")} d
+                WHERE d.owner_id = u.id
+            ) ud ON TRUE
+            """,
+        )
         if not results:
             raise R2RException(status_code=404, message="No users found")
 
@@ -946,8 +960,11 @@ class PostgresUserHandler(Handler):
                 )
             )
 
-        total_entries = results[0]["total_entries"]
-        return {"results": users_list, "total_entries": total_entries}
+        return {
+            "results": users_list,
+            "total_entries": total,
+            "next_cursor": next_cursor,
+        }
 
     async def _collection_exists(self, collection_id: UUID) -> bool:
         """Check if a collection exists."""
@@ -1078,6 +1095,8 @@ class PostgresUserHandler(Handler):
         if result is None:
             raise R2RException(status_code=404, message="API key not found")
 
+        # Principals cached for the revoked key must not outlive it.
+        await invalidate_principals(user_id)
         return True
 
     async def update_api_key_name(
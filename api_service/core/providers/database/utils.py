@@ -2,6 +2,14 @@
 Database utility functions for PostgreSQL operations.
 """
 
+import base64
+import json
+from datetime import datetime
+from typing import Any, Literal, Optional
+from uuid import UUID
+
+from core.base import R2RException
+
 
 def psql_quote_literal(value: str) -> str:
     """Safely quote a string literal for PostgreSQL to prevent SQL injection.
@@ -10,3 +18,162 @@ def psql_quote_literal(value: str) -> str:
     or your database driver's quoting functions.
     """
     return "'" + value.replace("'", "''") + "'"
+
+
+TotalEntriesMode = Literal["exact", "estimated", "none"]
+
+
+def encode_cursor(sort_value: Any, id: UUID | str) -> str:
+    """Encode the sort key and id of the last row of a page as an opaque
+    keyset pagination cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, str(id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    try:
+        sort_value, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, str(UUID(id))
+    except Exception as e:
+        raise R2RException(
+            status_code=400, message="Invalid pagination cursor."
+        ) from e
+
+
+async def count_entries(
+    connection_manager: Any,
+    from_clause: str,
+    conditions: list[str],
+    params: list,
+    mode: TotalEntriesMode = "exact",
+    table: Optional[str] = None,
+) -> Optional[int]:
+    """Count the rows matching `conditions`.
+
+    `estimated` avoids scanning: unfiltered counts come from
+    `pg_class.reltuples` of `table`, filtered ones from the planner's row
+    estimate. `none` skips counting altogether.
+    """
+    if mode == "none":
+        return None
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    if mode == "estimated":
+        if not conditions and table:
+            row = await connection_manager.fetchrow_query(
+                "SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = $1::regclass",
+                [table],
+            )
+            # reltuples is -1 for tables that were never vacuumed or analyzed
+            if row and row["estimate"] >= 0:
+                return row["estimate"]
+        row = await connection_manager.fetchrow_query(
+            f"EXPLAIN (FORMAT JSON) SELECT 1 {from_clause} {where_clause}",
+            params,
+        )
+        plan = row[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    row = await connection_manager.fetchrow_query(
+        f"SELECT COUNT(*) AS total_entries {from_clause} {where_clause}",
+        params,
+    )
+    return row["total_entries"]
+
+
+async def fetch_page(
+    connection_manager: Any,
+    select_clause: str,
+    from_clause: str,
+    conditions: list[str],
+    params: list,
+    offset: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    total_entries: TotalEntriesMode = "exact",
+    sort_column: Optional[str] = "created_at",
+    sort_type: str = "timestamptz",
+    id_column: str = "id",
+    descending: bool = True,
+    table: Optional[str] = None,
+    joins: str = "",
+    prepared: bool = False,
+) -> tuple[list, Optional[int], Optional[str]]:
+    """Fetch one page of a list query, ordered by `(sort_column, id_column)`.
+
+    With a `cursor` from a previous page the page starts right after that
+    row (keyset pagination) and `offset` is ignored, so deep pages cost the
+    same as the first one. `sort_column=None` orders by id alone. `joins` are
+    only applied to the page query, not to the count.
+
+    `select_clause` must select the row id as `id`. Returns the rows, the
+    total (see `count_entries`) and the cursor of the next page, which is
+    `None` on the last page.
+    """
+    direction = "DESC" if descending else "ASC"
+    comparison = "<" if descending else ">"
+    page_conditions = list(conditions)
+    page_params = list(params)
+
+    if sort_column:
+        order_by = f"{sort_column} {direction}, {id_column} {direction}"
+        cursor_select = f", {sort_column} AS cursor_sort_value"
+    else:
+        order_by = f"{id_column} {direction}"
+        cursor_select = ""
+
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        if sort_column:
+            page_conditions.append(
+                f"({sort_column}, {id_column}) {comparison} "
+                f"(${len(page_params) + 1}::text::{sort_type}, ${len(page_params) + 2}::text::uuid)"
+            )
+            page_params.extend([str(sort_value), last_id])
+        else:
+            page_conditions.append(
+                f"{id_column} {comparison} ${len(page_params) + 1}::text::uuid"
+            )
+            page_params.append(last_id)
+
+    where_clause = (
+        f"WHERE {' AND '.join(page_conditions)}" if page_conditions else ""
+    )
+    query = f"""
+        {select_clause}{cursor_select}
+        {from_clause}
+        {joins}
+        {where_clause}
+        ORDER BY {order_by}
+    """
+    if offset and not cursor:
+        query += f" OFFSET ${len(page_params) + 1}"
+        page_params.append(offset)
+    if limit != -1:
+        query += f" LIMIT ${len(page_params) + 1}"
+        page_params.append(limit)
+
+    rows = await connection_manager.fetch_query(
+        query, page_params, prepared=prepared
+    )
+
+    next_cursor = None
+    if limit != -1 and rows and len(rows) == limit:
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            last["cursor_sort_value"] if sort_column else None, last["id"]
+        )
+
+    total = await count_entries(
+        connection_manager,
+        from_clause,
+        conditions,
+        params,
+        mode=total_entries,
+        table=table,
+    )
+    return rows, total, next_cursor
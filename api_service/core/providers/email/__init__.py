@@ -1,7 +1,12 @@
-from .console_mock import ConsoleMockEmailProvider
-from .mailersend import MailerSendEmailProvider
-from .sendgrid import SendGridEmailProvider
-from .smtp import AsyncSMTPEmailProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .console_mock import ConsoleMockEmailProvider
+    from .mailersend import MailerSendEmailProvider
+    from .sendgrid import SendGridEmailProvider
+    from .smtp import AsyncSMTPEmailProvider
 
 __all__ = [
     "ConsoleMockEmailProvider",
@@ -9,3 +14,13 @@ __all__ = [
     "SendGridEmailProvider",
     "MailerSendEmailProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ConsoleMockEmailProvider": ".console_mock",
+        "MailerSendEmailProvider": ".mailersend",
+        "SendGridEmailProvider": ".sendgrid",
+        "AsyncSMTPEmailProvider": ".smtp",
+    },
+)
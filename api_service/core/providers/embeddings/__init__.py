@@ -1,9 +1,26 @@
-from .litellm import LiteLLMEmbeddingProvider
-from .ollama import OllamaEmbeddingProvider
-from .openai import OpenAIEmbeddingProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .cross_encoder import CrossEncoderReranker
+    from .litellm import LiteLLMEmbeddingProvider
+    from .ollama import OllamaEmbeddingProvider
+    from .openai import OpenAIEmbeddingProvider
 
 __all__ = [
+    "CrossEncoderReranker",
     "LiteLLMEmbeddingProvider",
     "OpenAIEmbeddingProvider",
     "OllamaEmbeddingProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CrossEncoderReranker": ".cross_encoder",
+        "LiteLLMEmbeddingProvider": ".litellm",
+        "OllamaEmbeddingProvider": ".ollama",
+        "OpenAIEmbeddingProvider": ".openai",
+    },
+)
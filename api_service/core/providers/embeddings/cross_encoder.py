@@ -0,0 +1,296 @@
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from copy import copy
+from typing import Any, Optional
+
+import numpy as np
+
+from core.base import ChunkSearchResult, EmbeddingConfig, R2RException
+
+logger = logging.getLogger()
+
+LOCAL_RERANK_PREFIX = "local/"
+
+
+def is_local_rerank_model(rerank_model: Optional[str]) -> bool:
+    """Whether `rerank_model` selects the in-process cross-encoder."""
+    return bool(rerank_model) and rerank_model.startswith(LOCAL_RERANK_PREFIX)  # type: ignore
+
+
+class CrossEncoderReranker:
+    """CPU cross-encoder reranker backed by ONNX Runtime.
+
+    Concurrent `arerank` calls are micro-batched: pairs are collected for up
+    to `batch_wait_ms` (or until `batch_size` pairs are queued), scored in a
+    single inference run off the event loop, and fanned back out to the
+    awaiting callers. Scores are cached per `(query, chunk_id)`.
+
+    The model directory must contain a `model.onnx` exported for sequence
+    classification and the matching `tokenizer.json`.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        max_candidates: int = 64,
+        batch_size: int = 32,
+        batch_wait_ms: float = 2.0,
+        max_length: int = 512,
+        cache_size: int = 10_000,
+    ):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_candidates = max_candidates
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait_ms / 1000
+        self.max_length = max_length
+        self.cache_size = cache_size
+
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        self.input_names = {i.name for i in session.get_inputs()}
+
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_pretrained(
+        cls, model_path: str, **kwargs
+    ) -> "CrossEncoderReranker":
+        try:
+            import onnxruntime
+            from tokenizers import Tokenizer
+        except ImportError:
+            raise ImportError(
+                "Local reranking requires onnxruntime and tokenizers. Please install them using `pip install onnxruntime tokenizers`."
+            ) from None
+
+        model_dir = cls._resolve_model_dir(model_path)
+        onnx_path = os.path.join(model_dir, "model.onnx")
+        if not os.path.exists(onnx_path):
+            onnx_path = os.path.join(model_dir, "onnx", "model.onnx")
+        tokenizer_path = os.path.join(model_dir, "tokenizer.json")
+        if not os.path.exists(onnx_path) or not os.path.exists(tokenizer_path):
+            raise R2RException(
+                f"Reranker model at {model_dir} must contain `model.onnx` and `tokenizer.json`.",
+                500,
+            )
+
+        options = onnxruntime.SessionOptions()
+        if threads := os.getenv("R2R_RERANK_INTRA_OP_THREADS"):
+            options.intra_op_num_threads = int(threads)
+        session = onnxruntime.InferenceSession(
+            onnx_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        tokenizer = Tokenizer.from_file(tokenizer_path)
+        logger.info(f"Loaded local cross-encoder reranker from {model_dir}")
+        return cls(session, tokenizer, **kwargs)
+
+    @classmethod
+    def from_config(cls, config: EmbeddingConfig) -> "CrossEncoderReranker":
+        if not is_local_rerank_model(config.rerank_model):
+            raise ValueError(
+                f"Local reranking requires a `rerank_model` starting with `{LOCAL_RERANK_PREFIX}`."
+            )
+        return cls.from_pretrained(
+            config.rerank_model[len(LOCAL_RERANK_PREFIX) :],  # type: ignore
+            max_candidates=config.rerank_max_candidates,
+            batch_size=config.rerank_batch_size,
+            batch_wait_ms=config.rerank_batch_wait_ms,
+            max_length=config.rerank_max_length,
+            cache_size=config.rerank_cache_size,
+        )
+
+    @staticmethod
+    def _resolve_model_dir(model_path: str) -> str:
+        if os.path.isdir(model_path):
+            return model_path
+        try:
+            from huggingface_hub import snapshot_download
+        except ImportError:
+            raise R2RException(
+                f"Reranker model directory {model_path} not found, and huggingface_hub is not installed to download it.",
+                500,
+            ) from None
+        return snapshot_download(
+            model_path,
+            allow_patterns=["*.onnx", "onnx/*.onnx", "tokenizer.json"],
+        )
+
+    def score_pairs(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Synchronously score `(query, text)` pairs. Blocks on inference."""
+        scores: list[float] = []
+        for i in range(0, len(pairs), self.batch_size):
+            encodings = self.tokenizer.encode_batch(
+                pairs[i : i + self.batch_size]
+            )
+            inputs = {
+                "input_ids": np.array(
+                    [e.ids for e in encodings], dtype=np.int64
+                ),
+                "attention_mask": np.array(
+                    [e.attention_mask for e in encodings], dtype=np.int64
+                ),
+                "token_type_ids": np.array(
+                    [e.type_ids for e in encodings], dtype=np.int64
+                ),
+            }
+            logits = self.session.run(
+                None,
+                {k: v for k, v in inputs.items() if k in self.input_names},
+            )[0]
+            scores.extend(self._logits_to_scores(logits).tolist())
+        return scores
+
+    @staticmethod
+    def _logits_to_scores(logits: np.ndarray) -> np.ndarray:
+        logits = logits.astype(np.float32)
+        if logits.ndim == 1 or logits.shape[-1] == 1:
+            return 1.0 / (1.0 + np.exp(-logits.reshape(-1)))
+        # Two-way classification heads score the "relevant" class.
+        shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+        return (shifted / shifted.sum(axis=-1, keepdims=True))[:, -1]
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if (
+            self._queue is None
+            or self._loop is not loop
+            or self._worker is None
+            or self._worker.done()
+        ):
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._batch_loop(self._queue))
+        return self._queue
+
+    async def _batch_loop(self, queue: asyncio.Queue) -> None:
+        # Exits once the queue drains; `_ensure_worker` restarts it on demand.
+        loop = asyncio.get_running_loop()
+        while not queue.empty():
+            batch = [await queue.get()]
+            num_pairs = len(batch[0][0])
+            deadline = loop.time() + self.batch_wait
+            while num_pairs < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                num_pairs += len(item[0])
+
+            pairs = [pair for item_pairs, _ in batch for pair in item_pairs]
+            try:
+                scores = await asyncio.to_thread(self.score_pairs, pairs)
+            except Exception as e:
+                logger.error(f"Error during local reranking: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for item_pairs, future in batch:
+                if not future.done():
+                    future.set_result(
+                        scores[offset : offset + len(item_pairs)]
+                    )
+                offset += len(item_pairs)
+
+    async def ascore_pairs(self, pairs: list[tuple[str, str]]) -> list[float]:
+        if not pairs:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_worker().put_nowait((pairs, future))
+        return await future
+
+    def _cache_get(self, key: tuple[str, str]) -> Optional[float]:
+        score = self._cache.get(key)
+        if score is not None:
+            self._cache.move_to_end(key)
+        return score
+
+    def _cache_put(self, key: tuple[str, str], score: float) -> None:
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _split_cached(
+        self, query: str, candidates: list[ChunkSearchResult]
+    ) -> tuple[list[Optional[float]], list[int]]:
+        scores: list[Optional[float]] = []
+        missing: list[int] = []
+        for idx, result in enumerate(candidates):
+            score = self._cache_get((query, str(result.id)))
+            scores.append(score)
+            if score is None:
+                missing.append(idx)
+        return scores, missing
+
+    def _merge(
+        self,
+        results: list[ChunkSearchResult],
+        scores: list[Optional[float]],
+        limit: int,
+    ) -> list[ChunkSearchResult]:
+        sort_keys = np.fromiter(
+            (score or 0.0 for score in scores),
+            dtype=np.float64,
+            count=len(scores),
+        )
+        # Rank on indices and only copy the results that are returned.
+        order = np.argsort(-sort_keys, kind="stable")[:limit]
+        scored_results = []
+        for index in order:
+            copied_result = copy(results[index])
+            copied_result.score = scores[index]
+            scored_results.append(copied_result)
+        # Candidates beyond the cap keep their original retrieval order.
+        remaining = limit - len(scored_results)
+        scored_results.extend(results[len(scores) : len(scores) + remaining])
+        return scored_results
+
+    def rerank(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        limit: int = 10,
+    ) -> list[ChunkSearchResult]:
+        candidates = results[: self.max_candidates]
+        scores, missing = self._split_cached(query, candidates)
+        if missing:
+            new_scores = self.score_pairs(
+                [(query, candidates[idx].text) for idx in missing]
+            )
+            for idx, score in zip(missing, new_scores, strict=False):
+                scores[idx] = score
+                self._cache_put((query, str(candidates[idx].id)), score)
+        return self._merge(results, scores, limit)
+
+    async def arerank(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        limit: int = 10,
+    ) -> list[ChunkSearchResult]:
+        candidates = results[: self.max_candidates]
+        scores, missing = self._split_cached(query, candidates)
+        if missing:
+            new_scores = await self.ascore_pairs(
+                [(query, candidates[idx].text) for idx in missing]
+            )
+            for idx, score in zip(missing, new_scores, strict=False):
+                scores[idx] = score
+                self._cache_put((query, str(candidates[idx].id)), score)
+        return self._merge(results, scores, limit)
@@ -17,6 +17,7 @@ from core.base import (
     R2RException,
 )
 
+from .cross_encoder import CrossEncoderReranker, is_local_rerank_model
 from .utils import truncate_texts_to_token_limit
 
 logger = logging.getLogger()
@@ -45,7 +46,10 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
             )
 
         self.rerank_url = None
-        if config.rerank_model:
+        self.local_reranker: CrossEncoderReranker | None = None
+        if is_local_rerank_model(config.rerank_model):
+            self.local_reranker = CrossEncoderReranker.from_config(config)
+        elif config.rerank_model:
             if "huggingface" not in config.rerank_model:
                 raise ValueError(
                     "LiteLLMEmbeddingProvider only supports re-ranking via the HuggingFace text-embeddings-inference API"
@@ -146,7 +150,7 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
             "stage": stage,
             "kwargs": kwargs,
         }
-        return (await self._execute_with_backoff_async(task))[0]
+        return await self._execute_coalesced_async(task)
 
     def get_embedding(
         self,
@@ -209,6 +213,8 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
         stage: EmbeddingProvider.Step = EmbeddingProvider.Step.RERANK,
         limit: int = 10,
     ):
+        if self.local_reranker:
+            return self.local_reranker.rerank(query, results, limit=limit)
         if self.config.rerank_model is not None:
             if not self.rerank_url:
                 raise ValueError(
@@ -269,6 +275,10 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
         Returns:
             List of reranked ChunkSearchResult objects, limited to specified count
         """
+        if self.local_reranker:
+            return await self.local_reranker.arerank(
+                query, results, limit=limit
+            )
         if self.config.rerank_model is not None:
             if not self.rerank_url:
                 raise ValueError(
@@ -11,6 +11,8 @@ from core.base import (
     R2RException,
 )
 
+from .cross_encoder import CrossEncoderReranker, is_local_rerank_model
+
 logger = logging.getLogger()
 
 
@@ -26,9 +28,12 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
             raise ValueError(
                 "OllamaEmbeddingProvider must be initialized with provider `ollama`."
             )
-        if config.rerank_model:
+        self.local_reranker: CrossEncoderReranker | None = None
+        if is_local_rerank_model(config.rerank_model):
+            self.local_reranker = CrossEncoderReranker.from_config(config)
+        elif config.rerank_model:
             raise ValueError(
-                "OllamaEmbeddingProvider does not support separate reranking."
+                "OllamaEmbeddingProvider only supports local cross-encoder reranking."
             )
 
         self.base_model = config.base_model
@@ -97,8 +102,7 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
             "stage": stage,
             "kwargs": kwargs,
         }
-        result = await self._execute_with_backoff_async(task)
-        return result[0]
+        return await self._execute_coalesced_async(task)
 
     def get_embedding(
         self,
@@ -162,6 +166,8 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         stage: EmbeddingProvider.Step = EmbeddingProvider.Step.RERANK,
         limit: int = 10,
     ) -> list[ChunkSearchResult]:
+        if self.local_reranker:
+            return self.local_reranker.rerank(query, results, limit=limit)
         return results[:limit]
 
     async def arerank(
@@ -171,4 +177,8 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         stage: EmbeddingProvider.Step = EmbeddingProvider.Step.RERANK,
         limit: int = 10,
     ):
+        if self.local_reranker:
+            return await self.local_reranker.arerank(
+                query, results, limit=limit
+            )
         return results[:limit]
@@ -13,6 +13,7 @@ from core.base import (
     EmbeddingProvider,
 )
 
+from .cross_encoder import CrossEncoderReranker, is_local_rerank_model
 from .utils import truncate_texts_to_token_limit
 
 logger = logging.getLogger()
@@ -48,9 +49,12 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         self.client = OpenAI()
         self.async_client = AsyncOpenAI()
 
-        if config.rerank_model:
+        self.local_reranker: CrossEncoderReranker | None = None
+        if is_local_rerank_model(config.rerank_model):
+            self.local_reranker = CrossEncoderReranker.from_config(config)
+        elif config.rerank_model:
             raise ValueError(
-                "OpenAIEmbeddingProvider does not support separate reranking."
+                "OpenAIEmbeddingProvider only supports local cross-encoder reranking."
             )
 
         if config.base_model and "openai/" in config.base_model:
@@ -166,8 +170,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "stage": stage,
             "kwargs": kwargs,
         }
-        result = await self._execute_with_backoff_async(task)
-        return result[0]
+        return await self._execute_coalesced_async(task)
 
     def get_embedding(
         self,
@@ -231,6 +234,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         stage: EmbeddingProvider.Step = EmbeddingProvider.Step.RERANK,
         limit: int = 10,
     ):
+        if self.local_reranker:
+            return self.local_reranker.rerank(query, results, limit=limit)
         return results[:limit]
 
     async def arerank(
@@ -240,6 +245,10 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         stage: EmbeddingProvider.Step = EmbeddingProvider.Step.RERANK,
         limit: int = 10,
     ):
+        if self.local_reranker:
+            return await self.local_reranker.arerank(
+                query, results, limit=limit
+            )
         return results[:limit]
 
     def tokenize_string(self, text: str, model: str) -> list[int]:
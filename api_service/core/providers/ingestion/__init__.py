@@ -1,9 +1,14 @@
 # type: ignore
-from .r2r.base import R2RIngestionConfig, R2RIngestionProvider
-from .unstructured.base import (
-    UnstructuredIngestionConfig,
-    UnstructuredIngestionProvider,
-)
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .r2r.base import R2RIngestionConfig, R2RIngestionProvider
+    from .unstructured.base import (
+        UnstructuredIngestionConfig,
+        UnstructuredIngestionProvider,
+    )
 
 __all__ = [
     "R2RIngestionConfig",
@@ -11,3 +16,13 @@ __all__ = [
     "UnstructuredIngestionProvider",
     "UnstructuredIngestionConfig",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "R2RIngestionConfig": ".r2r.base",
+        "R2RIngestionProvider": ".r2r.base",
+        "UnstructuredIngestionConfig": ".unstructured.base",
+        "UnstructuredIngestionProvider": ".unstructured.base",
+    },
+)
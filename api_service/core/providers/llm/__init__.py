@@ -1,7 +1,12 @@
-from .anthropic import AnthropicCompletionProvider
-from .litellm import LiteLLMCompletionProvider
-from .openai import OpenAICompletionProvider
-from .r2r_llm import R2RCompletionProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicCompletionProvider
+    from .litellm import LiteLLMCompletionProvider
+    from .openai import OpenAICompletionProvider
+    from .r2r_llm import R2RCompletionProvider
 
 __all__ = [
     "AnthropicCompletionProvider",
@@ -9,3 +14,13 @@ __all__ = [
     "OpenAICompletionProvider",
     "R2RCompletionProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AnthropicCompletionProvider": ".anthropic",
+        "LiteLLMCompletionProvider": ".litellm",
+        "OpenAICompletionProvider": ".openai",
+        "R2RCompletionProvider": ".r2r_llm",
+    },
+)
@@ -1,5 +1,17 @@
-from .mistral import MistralOCRProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .mistral import MistralOCRProvider
 
 __all__ = [
     "MistralOCRProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MistralOCRProvider": ".mistral",
+    },
+)
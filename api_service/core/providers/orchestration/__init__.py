@@ -1,4 +1,23 @@
-from .hatchet import HatchetOrchestrationProvider
-from .simple import SimpleOrchestrationProvider
+from typing import TYPE_CHECKING
 
-__all__ = ["HatchetOrchestrationProvider", "SimpleOrchestrationProvider"]
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .hatchet import HatchetOrchestrationProvider
+    from .postgres import PostgresOrchestrationProvider
+    from .simple import SimpleOrchestrationProvider
+
+__all__ = [
+    "HatchetOrchestrationProvider",
+    "PostgresOrchestrationProvider",
+    "SimpleOrchestrationProvider",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "HatchetOrchestrationProvider": ".hatchet",
+        "PostgresOrchestrationProvider": ".postgres",
+        "SimpleOrchestrationProvider": ".simple",
+    },
+)
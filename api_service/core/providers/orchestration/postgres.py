@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+
+from core.base import OrchestrationConfig, R2RException, Workflow
+
+from .simple import SimpleOrchestrationProvider
+
+logger = logging.getLogger()
+
+
+class PostgresOrchestrationProvider(SimpleOrchestrationProvider):
+    """Runs the `simple` workflows from a durable job queue in Postgres.
+
+    `run_workflow` only enqueues a job and returns its id. `start_worker`
+    launches `job_workers` in-process async workers that claim jobs, run
+    them and retry failures with exponential backoff. Workflow progress is
+    reported through the document's ingestion status, as in the simple
+    workflows; the job row keeps the attempt count and last error.
+    """
+
+    def __init__(self, config: OrchestrationConfig, database_provider: Any):
+        super().__init__(config)
+        self.jobs_handler = database_provider.jobs_handler
+        self.worker_id = (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self.workers: list[asyncio.Task] = []
+        self.job_available = asyncio.Event()
+        self.concurrency_limits: dict[str, int] = {}
+
+    async def start_worker(self):
+        if self.workers:
+            return
+        for _ in range(self.config.job_workers):
+            self.workers.append(asyncio.create_task(self._worker_loop()))
+        self.workers.append(asyncio.create_task(self._reaper_loop()))
+        logger.info(
+            f"Started {self.config.job_workers} job workers as {self.worker_id}."
+        )
+
+    async def stop_worker(self):
+        for task in self.workers:
+            task.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    def register_workflows(
+        self, workflow: Workflow, service: Any, messages: dict
+    ) -> None:
+        super().register_workflows(workflow, service, messages)
+        if workflow == Workflow.INGESTION:
+            self.concurrency_limits.update(
+                dict.fromkeys(
+                    self.ingestion_workflows,
+                    self.config.ingestion_concurrency_limit,
+                )
+            )
+        elif workflow == Workflow.GRAPH:
+            self.concurrency_limits.update(
+                dict.fromkeys(
+                    self.graph_search_results_workflows,
+                    self.config.graph_search_results_concurrency_limit,
+                )
+            )
+
+    async def run_workflow(
+        self,
+        workflow_name: str,
+        parameters: dict,
+        options: dict,
+        *args,
+        **kwargs,
+    ) -> dict[str, str]:
+        if workflow_name not in self.concurrency_limits:
+            raise ValueError(f"Workflow '{workflow_name}' not found.")
+
+        document_id = (
+            (options or {}).get("additional_metadata", {}).get("document_id")
+        )
+        job_id = await self.jobs_handler.enqueue_job(
+            workflow_name,
+            parameters,
+            document_id=UUID(str(document_id)) if document_id else None,
+            max_attempts=self.config.job_max_attempts,
+        )
+        self.job_available.set()
+        return {
+            "task_id": str(job_id),
+            "message": self.messages.get(
+                workflow_name, "Workflow queued successfully."
+            ),
+        }
+
+    def _get_workflow(self, workflow_name: str) -> Callable:
+        if workflow_name in self.ingestion_workflows:
+            return self.ingestion_workflows[workflow_name]
+        return self.graph_search_results_workflows[workflow_name]
+
+    def _retry_delay(self, job: dict) -> float:
+        return self.config.job_retry_backoff_seconds * 2 ** (
+            job["attempts"] - 1
+        )
+
+    async def _worker_loop(self):
+        while True:
+            try:
+                job = await self.jobs_handler.claim_job(
+                    self.worker_id,
+                    self.concurrency_limits,
+                    self.config.job_lease_seconds,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error claiming job: {e}")
+                job = None
+
+            if job is None:
+                # Sleep until the next poll, or until a job is enqueued locally
+                try:
+                    await asyncio.wait_for(
+                        self.job_available.wait(),
+                        timeout=self.config.job_poll_interval,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self.job_available.clear()
+                continue
+
+            await self._run_job(job)
+
+    async def _run_job(self, job: dict):
+        job_id = job["id"]
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            await self._get_workflow(job["workflow_name"])(
+                job["parameters"].get("request")
+            )
+        except asyncio.CancelledError:
+            # Leave the lease to expire so another worker picks the job up.
+            raise
+        except Exception as e:
+            status_code = getattr(e, "status_code", 500)
+            retryable = not (
+                isinstance(e, (R2RException, HTTPException))
+                and 400 <= status_code < 500
+            )
+            retry_in = (
+                self._retry_delay(job)
+                if retryable and job["attempts"] < job["max_attempts"]
+                else None
+            )
+            logger.error(
+                f"Job {job_id} ({job['workflow_name']}) failed on attempt "
+                f"{job['attempts']}/{job['max_attempts']}: {e}"
+                + (f"; retrying in {retry_in:.0f}s." if retry_in else ".")
+            )
+            await self.jobs_handler.fail_job(
+                job_id, self.worker_id, str(e), retry_in_seconds=retry_in
+            )
+        else:
+            await self.jobs_handler.complete_job(job_id, self.worker_id)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job_id: UUID):
+        interval = self.config.job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                held = await self.jobs_handler.extend_lease(
+                    job_id, self.worker_id, self.config.job_lease_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Could not extend lease on job {job_id}: {e}")
+                continue
+            if not held:
+                logger.warning(f"Lost the lease on job {job_id}.")
+                return
+
+    async def _reaper_loop(self):
+        while True:
+            await asyncio.sleep(self.config.job_lease_seconds)
+            try:
+                failed = await self.jobs_handler.fail_expired_jobs(
+                    list(self.ingestion_workflows)
+                )
+            except Exception as e:
+                logger.error(f"Error failing expired jobs: {e}")
+                continue
+            if failed:
+                logger.warning(
+                    f"Failed {len(failed)} jobs whose final attempt never finished."
+                )
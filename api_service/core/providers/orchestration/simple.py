@@ -8,6 +8,8 @@ class SimpleOrchestrationProvider(OrchestrationProvider):
         super().__init__(config)
         self.config = config
         self.messages: dict[str, str] = {}
+        self.ingestion_workflows: dict[str, Any] = {}
+        self.graph_search_results_workflows: dict[str, Any] = {}
 
     async def start_worker(self):
         pass
@@ -1,3 +1,15 @@
-from .apscheduler import APSchedulerProvider
+from typing import TYPE_CHECKING
+
+from core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .apscheduler import APSchedulerProvider
 
 __all__ = ["APSchedulerProvider"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "APSchedulerProvider": ".apscheduler",
+    },
+)
@@ -3,7 +3,9 @@ from typing import Set, Tuple
 
 from shared.utils.base_utils import (
     SearchResultsCollector,
+    SSEDelta,
     SSEFormatter,
+    coalesce_sse_events,
     convert_nonserializable_objects,
     decrement_version,
     deep_update,
@@ -228,6 +230,8 @@ __all__ = [
     "num_tokens",
     "num_tokens_from_messages",
     "SSEFormatter",
+    "SSEDelta",
+    "coalesce_sse_events",
     "SearchResultsCollector",
     "update_settings_from_dict",
     "deep_update",
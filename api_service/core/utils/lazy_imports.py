@@ -0,0 +1,43 @@
+"""Lazy package exports.
+
+Provider and parser packages re-export many classes whose modules pull in
+heavy SDKs (litellm, anthropic, hatchet, pypdf, openpyxl, ...). Importing
+them eagerly from the package `__init__` made `import core` load every
+one of them whatever the config selected. A package instead declares
+where each exported name lives and gets a module-level `__getattr__`
+(PEP 562) that imports the defining module on first access:
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__, {"OpenAIEmbeddingProvider": ".openai"}
+    )
+
+`from package import Name` and `package.Name` keep working. Keep the
+eager imports under `if TYPE_CHECKING:` so type checkers still see them.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """`__getattr__` and `__dir__` for `package`, resolving each name in
+    `exports` from its (relative) module on first access."""
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip `__getattr__`.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
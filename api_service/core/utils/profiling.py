@@ -0,0 +1,228 @@
+"""Per-stage latency timings for the retrieval hot path.
+
+`stage_timer` records how long a stage (embedding, chunk search, rerank,
+prompt fetch, LLM call, ...) took. Every observation feeds a process-wide
+Prometheus-style histogram, and when a request has opted in through
+`collect_timings`, the elapsed milliseconds are also accumulated into that
+request's timings dict so they can be returned with the response.
+
+`sampled_profile` optionally wraps a request in cProfile and dumps the
+stats for slow requests. It is controlled by the environment:
+
+- `R2R_PROFILE_SAMPLE_RATE`: fraction of requests to profile (default 0).
+- `R2R_PROFILE_THRESHOLD_MS`: only dump profiles slower than this
+  (default 1000).
+- `R2R_PROFILE_DIR`: where `.prof` files are written (default
+  `/tmp/r2r-profiles`).
+"""
+
+import cProfile
+import logging
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger()
+
+T = TypeVar("T")
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+_request_timings: ContextVar[Optional[dict[str, float]]] = ContextVar(
+    "r2r_request_timings", default=None
+)
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram rendered in the Prometheus text format."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(
+            self.buckets, self.counts, strict=False
+        ):
+            cumulative += bucket_count
+            lines.append(
+                f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+            )
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class StageMetrics:
+    """Process-wide registry of per-stage latency histograms."""
+
+    metric_name = "r2r_stage_duration_seconds"
+
+    def __init__(self):
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.metric_name} Time spent in each retrieval stage.",
+            f"# TYPE {self.metric_name} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self._histograms.items()):
+                lines.extend(
+                    histogram.render(self.metric_name, f'stage="{stage}"')
+                )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+stage_metrics = StageMetrics()
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Time the enclosed block as `stage`.
+
+    Repeated stages within one request (e.g. one embedding per sub-query)
+    are summed in the request's timings.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stage_metrics.observe(stage, elapsed)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[stage] = round(timings.get(stage, 0.0) + elapsed * 1000, 3)
+
+
+def timed_stage(
+    stage: str,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator form of `stage_timer` for coroutine functions."""
+
+    def decorator(
+        func: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with stage_timer(stage):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def collect_timings(enabled: bool = True) -> Iterator[Optional[dict]]:
+    """Collect the stage timings (in ms) of the enclosed request.
+
+    Yields the timings dict, or `None` when disabled. Tasks spawned inside
+    the block share the same dict, so concurrent stages are recorded too.
+    Nested calls reuse the outer request's dict.
+    """
+    if not enabled:
+        yield None
+        return
+    existing = _request_timings.get()
+    if existing is not None:
+        yield existing
+        return
+    timings: dict[str, float] = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+_profile_lock = threading.Lock()
+
+
+@contextmanager
+def sampled_profile(name: str) -> Iterator[None]:
+    """Profile a sampled fraction of requests, dumping slow ones to disk.
+
+    cProfile is per-thread, so the profile covers everything the event loop
+    ran while the request was in flight. Only one request is profiled at a
+    time.
+    """
+    sample_rate = float(os.getenv("R2R_PROFILE_SAMPLE_RATE", "0"))
+    if sample_rate <= 0 or random.random() >= sample_rate:
+        yield
+        return
+    if not _profile_lock.acquire(blocking=False):
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler (e.g. sentry) is already active.
+        _profile_lock.release()
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _profile_lock.release()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        threshold_ms = float(os.getenv("R2R_PROFILE_THRESHOLD_MS", "1000"))
+        if elapsed_ms >= threshold_ms:
+            profile_dir = os.getenv("R2R_PROFILE_DIR", "/tmp/r2r-profiles")
+            try:
+                os.makedirs(profile_dir, exist_ok=True)
+                path = os.path.join(
+                    profile_dir, f"{name}-{int(time.time() * 1000)}.prof"
+                )
+                profiler.dump_stats(path)
+                logger.info(
+                    f"Request {name} took {elapsed_ms:.0f}ms, profile written to {path}"
+                )
+            except OSError as e:
+                logger.warning(f"Could not write profile for {name}: {e}")
@@ -0,0 +1,253 @@
+"""Optional cache tier shared by every API worker process.
+
+With several workers per node, each process would otherwise keep its own
+copy of cached prompts, authenticated principals and query embeddings,
+and a change made through one worker (e.g. a prompt update) would stay
+invisible to the others until their local caches expire. The shared tier
+is a Redis-compatible key/value store that all workers read through.
+
+It is controlled by the environment:
+
+- `R2R_SHARED_CACHE_URL`: `redis://...` or `rediss://...` for a
+  Redis-compatible server, or `memory://` for an in-process stand-in
+  (tests, single-worker deployments). Unset disables the tier.
+- `R2R_SHARED_CACHE_PREFIX`: prefix for every key (default `r2r:`).
+- `R2R_SHARED_CACHE_PRINCIPAL_TTL`: seconds an authenticated user is
+  reused for the same token (default 10, 0 disables). Token expiry can
+  take this long to apply; logging out and any write to the user row
+  (`invalidate_principals`) are immediate. Password hashes are never
+  cached.
+- `R2R_SHARED_CACHE_EMBEDDING_TTL`: seconds a query embedding is kept
+  (default 86400).
+
+Cache failures are logged and treated as misses, so an unreachable server
+degrades to the uncached behavior instead of failing requests.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+logger = logging.getLogger()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}; using {default}")
+        return default
+
+
+def hash_key(value: str) -> str:
+    """Digest for values that must not be stored in keys verbatim (tokens,
+    query texts)."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class SharedCache(ABC):
+    """Minimal async key/value interface over string values."""
+
+    def __init__(self, prefix: str = "r2r:"):
+        self.prefix = prefix
+        self.principal_ttl = _env_int("R2R_SHARED_CACHE_PRINCIPAL_TTL", 10)
+        self.embedding_ttl = _env_int("R2R_SHARED_CACHE_EMBEDDING_TTL", 86400)
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: str, ttl: Optional[float] = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def ping(self) -> bool:
+        pass
+
+    async def get_json(self, key: str) -> Any:
+        value = await self.get(key)
+        return None if value is None else json.loads(value)
+
+    async def set_json(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        await self.set(key, json.dumps(value), ttl=ttl)
+
+
+class InMemorySharedCache(SharedCache):
+    """Process-local stand-in with the same semantics as the Redis tier."""
+
+    def __init__(self, prefix: str = "r2r:"):
+        super().__init__(prefix)
+        self._data: dict[str, tuple[str, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(self.prefix + key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[self.prefix + key]
+            return None
+        return value
+
+    async def set(
+        self, key: str, value: str, ttl: Optional[float] = None
+    ) -> None:
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._data[self.prefix + key] = (value, expires_at)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(self.prefix + key, None)
+
+    async def incr(self, key: str) -> Optional[int]:
+        value = int(await self.get(key) or 0) + 1
+        # Like Redis INCR, keep the remaining TTL of an existing key.
+        entry = self._data.get(self.prefix + key)
+        self._data[self.prefix + key] = (str(value), entry and entry[1])
+        return value
+
+    async def ping(self) -> bool:
+        return True
+
+
+class RedisSharedCache(SharedCache):
+    """Shared tier backed by a Redis-compatible server.
+
+    The client is created on first use in each process, so a cache built
+    before the workers fork never shares sockets across them.
+    """
+
+    def __init__(self, url: str, prefix: str = "r2r:"):
+        super().__init__(prefix)
+        try:
+            import redis.asyncio  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "The shared cache requires the redis package. Please install it using `pip install redis`."
+            ) from None
+        self.url = url
+        self._client: Any = None
+        self._client_pid: Optional[int] = None
+
+    def _redis(self):
+        if self._client is None or self._client_pid != os.getpid():
+            import redis.asyncio
+
+            self._client = redis.asyncio.from_url(
+                self.url, decode_responses=True
+            )
+            self._client_pid = os.getpid()
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self._redis().get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Shared cache get failed for {key}: {e}")
+            return None
+
+    async def set(
+        self, key: str, value: str, ttl: Optional[float] = None
+    ) -> None:
+        try:
+            await self._redis().set(
+                self.prefix + key,
+                value,
+                px=None if ttl is None else max(1, int(ttl * 1000)),
+            )
+        except Exception as e:
+            logger.warning(f"Shared cache set failed for {key}: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self._redis().delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            logger.warning(f"Shared cache delete failed for {keys}: {e}")
+
+    async def incr(self, key: str) -> Optional[int]:
+        try:
+            return await self._redis().incr(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Shared cache incr failed for {key}: {e}")
+            return None
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self._redis().ping())
+        except Exception as e:
+            logger.warning(f"Shared cache ping failed: {e}")
+            return False
+
+
+def create_shared_cache(
+    url: Optional[str], prefix: str = "r2r:"
+) -> Optional[SharedCache]:
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return InMemorySharedCache(prefix)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisSharedCache(url, prefix)
+    raise ValueError(f"Unsupported shared cache URL: {url}")
+
+
+_UNSET: Any = object()
+_shared_cache: Optional[SharedCache] = _UNSET
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """The process-wide shared cache, or None when the tier is disabled."""
+    global _shared_cache
+    if _shared_cache is _UNSET:
+        _shared_cache = create_shared_cache(
+            os.getenv("R2R_SHARED_CACHE_URL"),
+            os.getenv("R2R_SHARED_CACHE_PREFIX", "r2r:"),
+        )
+    return _shared_cache
+
+
+def set_shared_cache(cache: Optional[SharedCache]) -> None:
+    """Replace the process-wide shared cache (None disables it)."""
+    global _shared_cache
+    _shared_cache = cache
+
+
+# User fields that must never leave the database through the cache.
+PRINCIPAL_EXCLUDE = {"hashed_password"}
+
+
+def principal_key(token: str) -> str:
+    return f"principal:{hash_key(token)}"
+
+
+def principal_version_key(user_id: Any) -> str:
+    return f"principal_version:{user_id}"
+
+
+async def invalidate_principals(*user_ids: Any) -> None:
+    """Invalidate every cached principal of these users, whatever token it
+    was cached under, by bumping their version counters."""
+    shared_cache = get_shared_cache()
+    if shared_cache is None:
+        return
+    for user_id in user_ids:
+        await shared_cache.incr(principal_version_key(user_id))
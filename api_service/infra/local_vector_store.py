@@ -0,0 +1,550 @@
+"""
+Local, zero-network vector store for offline retrieval.
+
+Serves the same `search()` contract as `R2RClientWrapper.search` (a dict with
+`success`, `results` and `error`) from a FAISS index on disk, so `rag_api.py`
+can answer searches without R2R in local development, CI and edge deployments.
+
+On-disk layout (one directory, `vector_store/` by default):
+
+    manifest.json         dimension, index type, row count, bitmap keys
+    index.faiss           HNSW or IVF-PQ index; FAISS ids are row positions
+    vectors.npy           normalized float32 vectors, used to rebuild the index
+    ids.npy, document_ids.npy
+    text_offsets.npy + texts.bin, metadata_offsets.npy + metadata.bin
+    bitmaps.npy           packed row bitmaps, one per (field, value) pair of
+                          the bitmap fields (role, access_level by default)
+    deleted.npy           packed tombstones for deleted rows
+    delta.npy + delta.json rows added since the last compaction
+
+Everything except the delta is memory-mapped at load. Filters on bitmap fields
+are applied inside the FAISS search through an `IDSelectorBitmap`, so filtered
+searches still return `limit` results; other filters are checked against the
+row metadata after the search.
+
+Additions go to a small in-memory delta that is searched exhaustively and
+merged with the base results; deletions set tombstones. `compact()` folds both
+into a freshly built base index.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - optional dependency
+    faiss = None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+DEFAULT_BITMAP_FIELDS = ("role", "access_level")
+DEFAULT_HNSW_M = 32
+DEFAULT_EF_SEARCH = 64
+DEFAULT_NPROBE = 16
+# IVF-PQ needs enough vectors to train its coarse quantizer and codebooks;
+# smaller stores fall back to HNSW.
+MIN_VECTORS_PER_IVF_LIST = 39
+DEFAULT_COMPACT_THRESHOLD = 5000
+
+EmbedFn = Callable[[List[str]], List[List[float]]]
+
+
+def _require_faiss():
+    if faiss is None:
+        raise ImportError(
+            "The local vector store requires FAISS. Install it with `pip install faiss-cpu`."
+        )
+
+
+def _normalize(vectors: Any) -> np.ndarray:
+    array = np.ascontiguousarray(np.asarray(vectors, dtype="float32"))
+    if array.ndim == 1:
+        array = array.reshape(1, -1)
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return array / norms
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    return np.packbits(mask.astype(bool), bitorder="little")
+
+
+def _unpack(bits: np.ndarray, count: int) -> np.ndarray:
+    return np.unpackbits(bits, count=count, bitorder="little").astype(bool)
+
+
+def _encode_blob(values: Sequence[str]) -> Tuple[np.ndarray, bytes]:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype="int64")
+    if encoded:
+        offsets[1:] = np.cumsum([len(item) for item in encoded])
+    return offsets, b"".join(encoded)
+
+
+def _default_embed_fn() -> EmbedFn:
+    # Same model settings as scripts/generate_embeddings.py
+    from langchain_openai import OpenAIEmbeddings
+
+    embeddings = OpenAIEmbeddings(
+        model=os.getenv("EMBEDDINGS_MODEL", "text-embedding-3-small"),
+        dimensions=int(os.getenv("EMBEDDINGS_DIMENSIONS", "1536")),
+    )
+    return embeddings.embed_documents
+
+
+def build_ann_index(vectors: np.ndarray, index_type: str = "hnsw", hnsw_m: int = DEFAULT_HNSW_M):
+    """Builds an inner-product ANN index over normalized `vectors`.
+
+    `index_type` is `hnsw` or `ivfpq`. IVF-PQ falls back to HNSW when there
+    are too few vectors to train it.
+    """
+    _require_faiss()
+    count, dimension = vectors.shape
+    if index_type == "ivfpq":
+        nlist = max(1, int(4 * np.sqrt(count)))
+        # PQ sub-quantizers must divide the dimension
+        m = next(m for m in (64, 48, 32, 24, 16, 12, 8, 4, 2, 1) if dimension % m == 0)
+        if count >= max(nlist, 256) * MIN_VECTORS_PER_IVF_LIST:
+            index = faiss.index_factory(dimension, f"IVF{nlist},PQ{m}", faiss.METRIC_INNER_PRODUCT)
+            index.train(vectors)
+            index.add(vectors)
+            return index
+        logger.info(f"Only {count} vectors, too few to train IVF{nlist},PQ{m}. Using HNSW instead.")
+    elif index_type != "hnsw":
+        raise ValueError(f"Unknown index type '{index_type}'. Use 'hnsw' or 'ivfpq'.")
+
+    index = faiss.IndexHNSWFlat(dimension, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+    index.hnsw.efConstruction = max(40, 2 * hnsw_m)
+    if count:
+        index.add(vectors)
+    return index
+
+
+class LocalVectorStore:
+    """
+    A memory-mapped FAISS vector store with the `R2RClientWrapper.search` interface.
+
+    Attributes:
+        path (str): Directory holding the store files.
+        dimension (int): Embedding dimension.
+        index_type (str): `hnsw` or `ivfpq`.
+        bitmap_fields (tuple[str, ...]): Metadata fields with pre-built bitmaps.
+    """
+
+    def __init__(self, path: str, embed_fn: Optional[EmbedFn] = None, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        """Loads the store at `path`, memory-mapping the index and columns.
+
+        Args:
+            path (str): Directory written by `LocalVectorStore.build`.
+            embed_fn (Optional[EmbedFn]): Turns texts into embeddings. Defaults
+                to OpenAI embeddings configured like `scripts/generate_embeddings.py`,
+                created on first use.
+            compact_threshold (int): Delta size at which `add` compacts the store.
+        """
+        _require_faiss()
+        self.path = path
+        self._embed_fn = embed_fn
+        self.compact_threshold = compact_threshold
+
+        with open(os.path.join(path, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported vector store format in {path}: {manifest.get('format')}")
+        self.dimension = manifest["dimension"]
+        self.index_type = manifest["index_type"]
+        self.count = manifest["count"]
+        self.bitmap_fields = tuple(manifest["bitmap_fields"])
+        self._bitmap_keys = {(field, value): i for i, (field, value) in enumerate(manifest["bitmap_keys"])}
+
+        if self.count:
+            self.index = faiss.read_index(
+                os.path.join(path, "index.faiss"), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        else:
+            self.index = None
+        load = lambda name: np.load(os.path.join(path, name), mmap_mode="r")  # noqa: E731
+        self._vectors = load("vectors.npy")
+        self._ids = load("ids.npy")
+        self._document_ids = load("document_ids.npy")
+        self._text_offsets = load("text_offsets.npy")
+        self._texts = np.memmap(os.path.join(path, "texts.bin"), dtype="uint8", mode="r") if self._text_offsets[-1] else b""
+        self._metadata_offsets = load("metadata_offsets.npy")
+        self._metadata = np.memmap(os.path.join(path, "metadata.bin"), dtype="uint8", mode="r") if self._metadata_offsets[-1] else b""
+        self._bitmaps = load("bitmaps.npy")
+
+        deleted_path = os.path.join(path, "deleted.npy")
+        self._alive = ~_unpack(np.load(deleted_path), self.count) if os.path.exists(deleted_path) else np.ones(self.count, dtype=bool)
+        self._row_by_id = {str(chunk_id): row for row, chunk_id in enumerate(self._ids)}
+
+        self._delta_vectors = np.zeros((0, self.dimension), dtype="float32")
+        self._delta_rows: List[Dict[str, Any]] = []
+        delta_path = os.path.join(path, "delta.json")
+        if os.path.exists(delta_path):
+            with open(delta_path, "r", encoding="utf-8") as f:
+                self._delta_rows = json.load(f)
+            self._delta_vectors = np.load(os.path.join(path, "delta.npy"))
+
+        logger.info(f"Loaded local vector store from {path}: {self.count} base rows ({self.index_type}), {len(self._delta_rows)} pending additions.")
+
+    @classmethod
+    def from_env(cls, embed_fn: Optional[EmbedFn] = None) -> "LocalVectorStore":
+        """Loads the store at `LOCAL_VECTOR_STORE_PATH` (default `vector_store`)."""
+        return cls(os.getenv("LOCAL_VECTOR_STORE_PATH", "vector_store"), embed_fn=embed_fn)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        chunks: Iterable[Dict[str, Any]],
+        vectors: Optional[Any] = None,
+        embed_fn: Optional[EmbedFn] = None,
+        index_type: str = "hnsw",
+        bitmap_fields: Sequence[str] = DEFAULT_BITMAP_FIELDS,
+        dimension: Optional[int] = None,
+    ) -> "LocalVectorStore":
+        """Writes a new store to `path` and loads it.
+
+        Args:
+            path (str): Output directory. Existing store files are replaced.
+            chunks (Iterable[Dict[str, Any]]): Dicts with `text` and optional
+                `id`, `document_id` and `metadata` (ids default to the row number).
+            vectors (Optional[Any]): One embedding per chunk. Computed with
+                `embed_fn` when omitted.
+            embed_fn (Optional[EmbedFn]): Embedding function, kept for queries.
+            index_type (str): `hnsw` or `ivfpq`.
+            bitmap_fields (Sequence[str]): Metadata fields to pre-build bitmaps for.
+            dimension (Optional[int]): Needed only to build an empty store.
+        """
+        chunks = list(chunks)
+        if vectors is None:
+            embed_fn = embed_fn or _default_embed_fn()
+            vectors = embed_fn([chunk["text"] for chunk in chunks]) if chunks else []
+        vectors = _normalize(vectors) if len(chunks) else np.zeros((0, dimension or 0), dtype="float32")
+        if len(vectors) != len(chunks):
+            raise ValueError(f"Got {len(vectors)} vectors for {len(chunks)} chunks.")
+        cls._write(path, chunks, vectors, index_type, tuple(bitmap_fields))
+        return cls(path, embed_fn=embed_fn)
+
+    @classmethod
+    def from_legacy(cls, legacy_path: str, output_path: str, embed_fn: Optional[EmbedFn] = None, index_type: str = "hnsw") -> "LocalVectorStore":
+        """Converts the `index.faiss` + `metadata.json` pair written by older
+        versions of `scripts/generate_embeddings.py` (a flat L2 index)."""
+        _require_faiss()
+        with open(os.path.join(legacy_path, "metadata.json"), "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+        flat = faiss.read_index(os.path.join(legacy_path, "index.faiss"))
+        vectors = flat.reconstruct_n(0, flat.ntotal)
+        chunks = [{"text": text, "metadata": metadata} for text, metadata in zip(legacy["texts"], legacy["metadata"], strict=True)]
+        return cls.build(output_path, chunks, vectors=vectors, embed_fn=embed_fn, index_type=index_type)
+
+    @staticmethod
+    def _write(path: str, chunks: List[Dict[str, Any]], vectors: np.ndarray, index_type: str, bitmap_fields: Tuple[str, ...]) -> None:
+        _require_faiss()
+        os.makedirs(path, exist_ok=True)
+        count = len(chunks)
+        metadatas = [chunk.get("metadata") or {} for chunk in chunks]
+
+        bitmap_keys = sorted(
+            {(field, str(metadata[field])) for metadata in metadatas for field in bitmap_fields if metadata.get(field) is not None}
+        )
+        bitmaps = np.zeros((len(bitmap_keys), (count + 7) // 8), dtype="uint8")
+        for i, (field, value) in enumerate(bitmap_keys):
+            bitmaps[i] = _pack(np.array([str(metadata.get(field)) == value for metadata in metadatas], dtype=bool))
+
+        text_offsets, texts = _encode_blob([chunk.get("text") or "" for chunk in chunks])
+        metadata_offsets, metadata_blob = _encode_blob([json.dumps(metadata, ensure_ascii=False, default=str) for metadata in metadatas])
+
+        # Write into a temporary directory, then swap the files in, so a crash
+        # mid-build never leaves a half-written store behind.
+        with tempfile.TemporaryDirectory(dir=path) as tmp:
+            if count:
+                faiss.write_index(build_ann_index(vectors, index_type), os.path.join(tmp, "index.faiss"))
+            np.save(os.path.join(tmp, "vectors.npy"), vectors)
+            np.save(os.path.join(tmp, "ids.npy"), np.array([str(chunk.get("id", row)) for row, chunk in enumerate(chunks)], dtype="U"))
+            np.save(os.path.join(tmp, "document_ids.npy"), np.array([str(chunk.get("document_id", "")) for chunk in chunks], dtype="U"))
+            np.save(os.path.join(tmp, "text_offsets.npy"), text_offsets)
+            np.save(os.path.join(tmp, "metadata_offsets.npy"), metadata_offsets)
+            np.save(os.path.join(tmp, "bitmaps.npy"), bitmaps)
+            with open(os.path.join(tmp, "texts.bin"), "wb") as f:
+                f.write(texts)
+            with open(os.path.join(tmp, "metadata.bin"), "wb") as f:
+                f.write(metadata_blob)
+            with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "format": FORMAT_VERSION,
+                        "dimension": int(vectors.shape[1]),
+                        "index_type": index_type,
+                        "count": count,
+                        "bitmap_fields": list(bitmap_fields),
+                        "bitmap_keys": [list(key) for key in bitmap_keys],
+                    },
+                    f,
+                )
+            for name in ("deleted.npy", "delta.npy", "delta.json", "index.faiss"):
+                if os.path.exists(os.path.join(path, name)):
+                    os.remove(os.path.join(path, name))
+            # The manifest goes last: it is what makes the new files a store.
+            for name in sorted(os.listdir(tmp), key=lambda name: name == "manifest.json"):
+                os.replace(os.path.join(tmp, name), os.path.join(path, name))
+
+    # ------------------------------------------------------------------
+    # Row access
+    # ------------------------------------------------------------------
+
+    def _text(self, row: int) -> str:
+        return bytes(self._texts[self._text_offsets[row]:self._text_offsets[row + 1]]).decode("utf-8")
+
+    def _row_metadata(self, row: int) -> Dict[str, Any]:
+        return json.loads(bytes(self._metadata[self._metadata_offsets[row]:self._metadata_offsets[row + 1]]).decode("utf-8"))
+
+    def _base_result(self, row: int, score: float) -> Dict[str, Any]:
+        return {
+            "id": str(self._ids[row]),
+            "document_id": str(self._document_ids[row]),
+            "text": self._text(row),
+            "metadata": self._row_metadata(row),
+            "score": score,
+        }
+
+    # ------------------------------------------------------------------
+    # Filtering
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _condition_values(condition: Any) -> Optional[List[str]]:
+        """Values accepted by an equality-style filter, or None for other operators."""
+        if isinstance(condition, dict):
+            if set(condition) == {"$eq"}:
+                return [str(condition["$eq"])]
+            if set(condition) == {"$in"}:
+                return [str(value) for value in condition["$in"]]
+            return None
+        if isinstance(condition, (list, tuple)):
+            return [str(value) for value in condition]
+        return [str(condition)]
+
+    @classmethod
+    def _matches(cls, metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        for field, condition in filters.items():
+            value = metadata.get(field)
+            values = cls._condition_values(condition)
+            if values is not None:
+                if isinstance(value, list):
+                    if not {str(v) for v in value} & set(values):
+                        return False
+                elif str(value) not in values:
+                    return False
+            elif "$ne" in condition:
+                if value == condition["$ne"]:
+                    return False
+            elif "$nin" in condition:
+                if value in condition["$nin"]:
+                    return False
+            else:
+                raise ValueError(f"Unsupported filter for '{field}': {condition}")
+        return True
+
+    def _split_filters(self, filters: Optional[Dict[str, Any]]) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Turns `filters` into a row mask for the base index plus the filters
+        that still have to be checked per result."""
+        mask = self._alive.copy()
+        residual: Dict[str, Any] = {}
+        for field, condition in (filters or {}).items():
+            values = self._condition_values(condition)
+            if field in self.bitmap_fields and values is not None:
+                field_mask = np.zeros(self.count, dtype=bool)
+                for value in values:
+                    key = self._bitmap_keys.get((field, value))
+                    if key is not None:
+                        field_mask |= _unpack(self._bitmaps[key], self.count)
+                mask &= field_mask
+            else:
+                residual[field] = condition
+        return mask, residual
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        if self._embed_fn is None:
+            self._embed_fn = _default_embed_fn()
+        return _normalize(self._embed_fn(texts))
+
+    def _search_params(self, selector):
+        if isinstance(self.index, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=DEFAULT_EF_SEARCH)
+        return faiss.SearchParametersIVF(sel=selector, nprobe=DEFAULT_NPROBE)
+
+    def search_vector(self, vector: Any, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Returns the `limit` most similar chunks to `vector` that match `filters`."""
+        query = _normalize(vector)
+        mask, residual = self._split_filters(filters)
+        results: List[Dict[str, Any]] = []
+
+        if self.index is not None and mask.any():
+            bitmap = _pack(mask)
+            selector = faiss.IDSelectorBitmap(self.count, faiss.swig_ptr(bitmap))
+            # Residual filters are checked after the search, so fetch extra candidates.
+            k = min(self.count, limit * 4 if residual else limit)
+            scores, rows = self.index.search(query, k, params=self._search_params(selector))
+            for score, row in zip(scores[0], rows[0], strict=True):
+                if row < 0:
+                    continue
+                result = self._base_result(int(row), float(score))
+                if not residual or self._matches(result["metadata"], residual):
+                    results.append(result)
+
+        if self._delta_rows:
+            scores = self._delta_vectors @ query[0]
+            for row in np.argsort(-scores)[: limit * 4]:
+                # Copy the metadata too: callers may modify the result, and the
+                # delta rows are persisted by `save()`.
+                delta_row = self._delta_rows[row]
+                result = dict(delta_row, metadata=dict(delta_row["metadata"]), score=float(scores[row]))
+                if self._matches(result["metadata"], filters or {}):
+                    results.append(result)
+
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return results[:limit]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        search_settings: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Performs a similarity search, with the same contract as `R2RClientWrapper.search`.
+
+        Args:
+            query (str): The user's search query string.
+            limit (int): The maximum number of results to return. Defaults to 5.
+            filters (Optional[Dict[str, Any]]): Metadata filters, either `{field: value}`
+                or `{field: {"$eq" | "$in" | "$ne" | "$nin": ...}}`.
+            search_settings (Optional[Dict[str, Any]]): `limit` and `filters` here
+                override the arguments, as in the R2R search settings.
+
+        Returns:
+            Dict[str, Any]: `success`, `results` (dicts with `id`, `document_id`,
+            `text`, `metadata`, `score` and `similarity`) and `error`.
+        """
+        settings = search_settings or {}
+        limit = settings.get("limit", limit)
+        filters = settings.get("filters", filters)
+        try:
+            results = self.search_vector(self._embed([query])[0], limit=limit, filters=filters)
+        except Exception as e:
+            logger.exception(f"Local vector search failed: {e}")
+            return {"error": f"Local search error: {str(e)}", "success": False, "results": []}
+        for result in results:
+            result["similarity"] = result["score"]
+            result["metadata"].setdefault("document_id", result["document_id"])
+            result["metadata"].setdefault("chunk_id", result["id"])
+        return {"results": results, "success": True}
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def add(self, chunks: Iterable[Dict[str, Any]], vectors: Optional[Any] = None) -> int:
+        """Adds chunks (same shape as in `build`), replacing any with the same id.
+
+        Returns the number of chunks added. Compacts the store once the
+        pending additions reach `compact_threshold`.
+        """
+        chunks = list(chunks)
+        if not chunks:
+            return 0
+        vectors = _normalize(vectors) if vectors is not None else self._embed([chunk["text"] for chunk in chunks])
+        self.delete(chunk_ids=[str(chunk["id"]) for chunk in chunks if "id" in chunk], save=False)
+        start = self.count + len(self._delta_rows)
+        self._delta_rows.extend(
+            {
+                "id": str(chunk.get("id", start + i)),
+                "document_id": str(chunk.get("document_id", "")),
+                "text": chunk.get("text") or "",
+                "metadata": chunk.get("metadata") or {},
+            }
+            for i, chunk in enumerate(chunks)
+        )
+        self._delta_vectors = np.vstack([self._delta_vectors, vectors])
+        if len(self._delta_rows) >= self.compact_threshold:
+            self.compact()
+        else:
+            self.save()
+        return len(chunks)
+
+    def delete(self, chunk_ids: Optional[Iterable[str]] = None, document_id: Optional[str] = None, save: bool = True) -> int:
+        """Deletes chunks by id and/or all chunks of `document_id`. Returns the number deleted."""
+        chunk_ids = {str(chunk_id) for chunk_id in chunk_ids or []}
+        deleted = 0
+        rows = [self._row_by_id[chunk_id] for chunk_id in chunk_ids if chunk_id in self._row_by_id]
+        if document_id is not None and self.count:
+            rows.extend(np.flatnonzero(self._document_ids == str(document_id)).tolist())
+        for row in rows:
+            if self._alive[row]:
+                self._alive[row] = False
+                deleted += 1
+
+        keep = [
+            i for i, row in enumerate(self._delta_rows)
+            if row["id"] not in chunk_ids and (document_id is None or row["document_id"] != str(document_id))
+        ]
+        if len(keep) != len(self._delta_rows):
+            deleted += len(self._delta_rows) - len(keep)
+            self._delta_rows = [self._delta_rows[i] for i in keep]
+            self._delta_vectors = self._delta_vectors[keep]
+        if deleted and save:
+            self.save()
+        return deleted
+
+    def save(self) -> None:
+        """Persists tombstones and pending additions."""
+        np.save(os.path.join(self.path, "deleted.npy"), _pack(~self._alive))
+        if self._delta_rows:
+            np.save(os.path.join(self.path, "delta.npy"), self._delta_vectors)
+            with open(os.path.join(self.path, "delta.json"), "w", encoding="utf-8") as f:
+                json.dump(self._delta_rows, f, ensure_ascii=False, default=str)
+        else:
+            for name in ("delta.npy", "delta.json"):
+                if os.path.exists(os.path.join(self.path, name)):
+                    os.remove(os.path.join(self.path, name))
+
+    def compact(self) -> None:
+        """Rebuilds the base index from the live rows and pending additions."""
+        rows = np.flatnonzero(self._alive)
+        chunks = [
+            {
+                "id": str(self._ids[row]),
+                "document_id": str(self._document_ids[row]),
+                "text": self._text(row),
+                "metadata": self._row_metadata(row),
+            }
+            for row in rows
+        ] + self._delta_rows
+        vectors = np.vstack([np.asarray(self._vectors[rows]), self._delta_vectors])
+        logger.info(f"Compacting local vector store at {self.path} into {len(chunks)} rows.")
+        self._write(self.path, chunks, vectors, self.index_type, self.bitmap_fields)
+        self.__init__(self.path, embed_fn=self._embed_fn, compact_threshold=self.compact_threshold)
@@ -0,0 +1,128 @@
+"""Add per-owner chunk counts maintained by triggers.
+
+Revision ID: 5b8d2e9f1c47
+Revises: 3efc7b3b1b3d
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+import logging
+import os
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8d2e9f1c47"
+down_revision: Union[str, None] = "3efc7b3b1b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+project_name = os.getenv("R2R_PROJECT_NAME", "r2r_default")
+
+
+def check_if_upgrade_needed() -> bool:
+    """Check if the upgrade has already been applied."""
+    inspector = inspect(op.get_bind())
+
+    if not inspector.has_table("chunks", schema=project_name):
+        logger.info(
+            f"Migration not needed: '{project_name}.chunks' table doesn't exist"
+        )
+        return False
+
+    if inspector.has_table("owner_chunk_counts", schema=project_name):
+        logger.info(
+            "Migration not needed: owner_chunk_counts table already exists"
+        )
+        return False
+
+    logger.info("Migration needed: chunks need an owner_chunk_counts table")
+    return True
+
+
+def upgrade() -> None:
+    if not check_if_upgrade_needed():
+        return
+
+    counts = f"{project_name}.owner_chunk_counts"
+    function = f"{project_name}.adjust_owner_chunk_counts"
+    chunks = f"{project_name}.chunks"
+
+    op.execute(f"""
+        CREATE TABLE {counts} (
+            owner_id UUID PRIMARY KEY,
+            chunk_count BIGINT NOT NULL DEFAULT 0
+        );
+
+        CREATE OR REPLACE FUNCTION {function}()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF TG_LEVEL = 'ROW' THEN
+                UPDATE {counts} SET chunk_count = chunk_count - 1
+                WHERE owner_id = OLD.owner_id;
+                IF NEW.owner_id IS NOT NULL THEN
+                    INSERT INTO {counts} (owner_id, chunk_count)
+                    VALUES (NEW.owner_id, 1)
+                    ON CONFLICT (owner_id) DO UPDATE
+                    SET chunk_count = {counts}.chunk_count + 1;
+                END IF;
+            ELSIF TG_OP = 'INSERT' THEN
+                INSERT INTO {counts} (owner_id, chunk_count)
+                SELECT owner_id, COUNT(*) FROM new_chunks
+                WHERE owner_id IS NOT NULL
+                GROUP BY owner_id
+                ON CONFLICT (owner_id) DO UPDATE
+                SET chunk_count = {counts}.chunk_count + EXCLUDED.chunk_count;
+            ELSE
+                UPDATE {counts} c SET chunk_count = c.chunk_count - d.removed
+                FROM (
+                    SELECT owner_id, COUNT(*) AS removed FROM old_chunks
+                    WHERE owner_id IS NOT NULL
+                    GROUP BY owner_id
+                ) d
+                WHERE c.owner_id = d.owner_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$;
+    """)
+
+    # Block writes to chunks while the triggers are installed and the counts
+    # are backfilled, so that no insert or delete is missed or counted twice.
+    op.execute(f"LOCK TABLE {chunks} IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(f"""
+        CREATE TRIGGER owner_chunk_counts_insert
+            AFTER INSERT ON {chunks}
+            REFERENCING NEW TABLE AS new_chunks
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        CREATE TRIGGER owner_chunk_counts_delete
+            AFTER DELETE ON {chunks}
+            REFERENCING OLD TABLE AS old_chunks
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        CREATE TRIGGER owner_chunk_counts_update
+            AFTER UPDATE OF owner_id ON {chunks}
+            FOR EACH ROW
+            WHEN (OLD.owner_id IS DISTINCT FROM NEW.owner_id)
+            EXECUTE FUNCTION {function}();
+
+        INSERT INTO {counts} (owner_id, chunk_count)
+        SELECT owner_id, COUNT(*) FROM {chunks}
+        WHERE owner_id IS NOT NULL
+        GROUP BY owner_id;
+    """)
+
+
+def downgrade() -> None:
+    chunks = f"{project_name}.chunks"
+    op.execute(f"""
+        DROP TRIGGER IF EXISTS owner_chunk_counts_insert ON {chunks};
+        DROP TRIGGER IF EXISTS owner_chunk_counts_delete ON {chunks};
+        DROP TRIGGER IF EXISTS owner_chunk_counts_update ON {chunks};
+        DROP FUNCTION IF EXISTS {project_name}.adjust_owner_chunk_counts();
+        DROP TABLE IF EXISTS {project_name}.owner_chunk_counts;
+    """)
@@ -36,6 +36,7 @@ import time
 
 # Importar R2RClientWrapper (ajustar caminho se necessário ao executar)
 from infra.r2r_client import R2RClientWrapper 
+from infra.local_vector_store import LocalVectorStore
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(name)s] - %(message)s')
@@ -74,6 +75,17 @@ except Exception as e:
     logging.error(f"Unexpected error initializing R2R Client Wrapper: {e}. R2R features disabled.", exc_info=True)
     r2r_client = None
 
+# Backend da busca simples: "r2r" (padrão) ou "local" (índice FAISS em disco,
+# sem rede, gerado por scripts/generate_embeddings.py). O RAG continua no R2R.
+VECTOR_STORE_BACKEND = os.getenv("VECTOR_STORE_BACKEND", "r2r").lower()
+search_client = r2r_client
+if VECTOR_STORE_BACKEND == "local":
+    try:
+        search_client = LocalVectorStore.from_env()
+        logging.info("Local vector store loaded for RAG API search.")
+    except Exception as e:
+        logging.error(f"Failed to load local vector store: {e}. Falling back to R2R search.", exc_info=True)
+
 # Configurações
 # EMBEDDINGS_MODEL = "text-embedding-3-small"
 # EMBEDDINGS_DIMENSIONS = 1536
@@ -293,7 +305,7 @@ async def query_documents(
     Raises:
         HTTPException: Em caso de erro (autenticação, serviço indisponível, erro interno).
     """
-    if not r2r_client:
+    if not (r2r_client if request.use_rag else search_client):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="R2R service client is not available.",
@@ -372,10 +384,11 @@ async def query_documents(
 
         else:
             # --- Lógica Busca Simples --- 
-            logging.info(f"Sending search query to R2R: '{request.query}' with k={request.top_k}")
-            r2r_search_data = r2r_client.search(
+            logging.info(f"Sending search query to {VECTOR_STORE_BACKEND}: '{request.query}' with k={request.top_k}, Filters: {final_filters}")
+            r2r_search_data = search_client.search(
                 query=request.query,
-                limit=request.top_k
+                limit=request.top_k,
+                filters=final_filters
             )
             
             if not r2r_search_data.get("success"):
@@ -560,7 +573,8 @@ async def health_check():
         "timestamp": datetime.now(UTC).isoformat(),
         "dependencies": {
             "database": "healthy" if supabase_client else "unavailable",
-            "r2r_client": True if r2r_client else "unavailable"
+            "r2r_client": True if r2r_client else "unavailable",
+            "search_backend": "local" if isinstance(search_client, LocalVectorStore) else "r2r"
         }
     }
     
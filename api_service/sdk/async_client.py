@@ -18,20 +18,43 @@ from .asnyc_methods import (
     SystemSDK,
     UsersSDK,
 )
-from .base.base_client import BaseClient
+from .base.base_client import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    BaseClient,
+)
 
 
 class R2RAsyncClient(BaseClient):
-    """Asynchronous client for interacting with the R2R API."""
+    """Asynchronous client for interacting with the R2R API.
+
+    Regular and streaming calls share one pooled httpx client (HTTP/2 when
+    `h2` is installed), so connections are reused across calls. Pass
+    `timeout=` to a call to override the client timeout for it. Close the
+    client with `aclose()` or use it as an async context manager.
+    """
 
     def __init__(
         self,
         base_url: str | None = None,
         timeout: float = 300.0,
         custom_client=None,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
     ):
         super().__init__(base_url, timeout)
-        self.client = custom_client or httpx.AsyncClient(timeout=timeout)
+        self.client = custom_client or httpx.AsyncClient(
+            **self._client_kwargs(
+                timeout,
+                http2=http2,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+        )
         self.chunks = ChunksSDK(self)
         self.collections = CollectionsSDK(self)
         self.conversations = ConversationsSDK(self)
@@ -81,15 +104,16 @@ class R2RAsyncClient(BaseClient):
         url = self._get_full_url(endpoint, version)
         request_args = self._prepare_request_args(endpoint, **kwargs)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream(method, url, **request_args) as response:
-                await self._handle_response(response)
-                async for line in response.aiter_lines():
-                    if line.strip():  # Ignore empty lines
-                        try:
-                            yield json.loads(line)
-                        except Exception:
-                            yield line
+        async with self.client.stream(method, url, **request_args) as response:
+            if response.status_code >= 400:
+                await response.aread()
+            await self._handle_response(response)
+            async for line in response.aiter_lines():
+                if line.strip():  # Ignore empty lines
+                    try:
+                        yield json.loads(line)
+                    except Exception:
+                        yield line
 
     async def _handle_response(self, response):
         if response.status_code >= 400:
@@ -114,14 +138,17 @@ class R2RAsyncClient(BaseClient):
                 status_code=response.status_code, message=message
             )
 
-    async def close(self):
+    async def aclose(self):
         await self.client.aclose()
 
+    async def close(self):
+        await self.aclose()
+
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.close()
+        await self.aclose()
 
     def set_api_key(self, api_key: str) -> None:
         if self.access_token:
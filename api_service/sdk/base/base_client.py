@@ -1,8 +1,15 @@
+import importlib.util
 import os
-from typing import Optional
+from typing import Any, Optional
+
+import httpx
 
 from shared.abstractions import R2RException
 
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
 
 class BaseClient:
     def __init__(
@@ -19,6 +26,29 @@ class BaseClient:
         self._user_id: Optional[str] = None
         self.api_key: Optional[str] = os.getenv("R2R_API_KEY", None)
 
+    @staticmethod
+    def _client_kwargs(
+        timeout: float,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    ) -> dict[str, Any]:
+        """Settings for the pooled httpx client shared by every call.
+
+        HTTP/2 is only enabled when the optional `h2` package is installed;
+        otherwise the pool falls back to keep-alive HTTP/1.1 connections.
+        """
+        return {
+            "timeout": timeout,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            "http2": http2 and importlib.util.find_spec("h2") is not None,
+        }
+
     def _get_auth_header(self) -> dict[str, str]:
         if self.access_token and self.api_key:
             raise R2RException(
@@ -6,7 +6,12 @@ from httpx import Client, RequestError, Response
 
 from shared.abstractions import R2RException
 
-from .base.base_client import BaseClient
+from .base.base_client import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    BaseClient,
+)
 from .sync_methods import (
     ChunksSDK,
     CollectionsSDK,
@@ -22,14 +27,33 @@ from .sync_methods import (
 
 
 class R2RClient(BaseClient):
+    """Synchronous client for interacting with the R2R API.
+
+    Regular and streaming calls share one pooled httpx client (HTTP/2 when
+    `h2` is installed). Close it with `close()` or use it as a context
+    manager.
+    """
+
     def __init__(
         self,
         base_url: str | None = None,
         timeout: float = 300.0,
         custom_client=None,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
     ):
         super().__init__(base_url, timeout)
-        self.client = custom_client or Client(timeout=timeout)
+        self.client = custom_client or Client(
+            **self._client_kwargs(
+                timeout,
+                http2=http2,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+        )
         self.chunks = ChunksSDK(self)
         self.collections = CollectionsSDK(self)
         self.conversations = ConversationsSDK(self)
@@ -87,48 +111,47 @@ class R2RClient(BaseClient):
         url = self._get_full_url(endpoint, version)
         request_args = self._prepare_request_args(endpoint, **kwargs)
 
-        with Client(timeout=self.timeout) as client:
-            with client.stream(method, url, **request_args) as response:
-                self._handle_response(response)
-
-                sse_event_block: dict[str, Any] = {"event": None, "data": []}
-
-                for line in response.iter_lines():
-                    if isinstance(line, bytes):
-                        line = line.decode("utf-8", "replace")
-
-                    # Blank line -> end of this SSE event
-                    if line == "":
-                        # If there's any accumulated data, yield this event
-                        if sse_event_block["data"]:
-                            data_str = "".join(sse_event_block["data"])
-                            yield {
-                                "event": sse_event_block["event"] or "unknown",
-                                "data": data_str,
-                            }
-                        # Reset the block
-                        sse_event_block = {"event": None, "data": []}
-                        continue
-
-                    # Otherwise, parse the line
-                    if line.startswith("event:"):
-                        sse_event_block["event"] = line[
-                            len("event:") :
-                        ].lstrip()
-                    elif line.startswith("data:"):
-                        # Accumulate the exact substring after "data:"
-                        # Notice we do *not* strip() the entire line
-                        chunk = line[len("data:") :]
-                        sse_event_block["data"].append(chunk)
-                    # Optionally handle id:, retry:, etc. if needed
-
-                # If something remains in the buffer at the end
-                if sse_event_block["data"]:
-                    data_str = "".join(sse_event_block["data"])
-                    yield {
-                        "event": sse_event_block["event"] or "unknown",
-                        "data": data_str,
-                    }
+        with self.client.stream(method, url, **request_args) as response:
+            if response.status_code >= 400:
+                response.read()
+            self._handle_response(response)
+
+            sse_event_block: dict[str, Any] = {"event": None, "data": []}
+
+            for line in response.iter_lines():
+                if isinstance(line, bytes):
+                    line = line.decode("utf-8", "replace")
+
+                # Blank line -> end of this SSE event
+                if line == "":
+                    # If there's any accumulated data, yield this event
+                    if sse_event_block["data"]:
+                        data_str = "".join(sse_event_block["data"])
+                        yield {
+                            "event": sse_event_block["event"] or "unknown",
+                            "data": data_str,
+                        }
+                    # Reset the block
+                    sse_event_block = {"event": None, "data": []}
+                    continue
+
+                # Otherwise, parse the line
+                if line.startswith("event:"):
+                    sse_event_block["event"] = line[len("event:") :].lstrip()
+                elif line.startswith("data:"):
+                    # Accumulate the exact substring after "data:"
+                    # Notice we do *not* strip() the entire line
+                    chunk = line[len("data:") :]
+                    sse_event_block["data"].append(chunk)
+                # Optionally handle id:, retry:, etc. if needed
+
+            # If something remains in the buffer at the end
+            if sse_event_block["data"]:
+                data_str = "".join(sse_event_block["data"])
+                yield {
+                    "event": sse_event_block["event"] or "unknown",
+                    "data": data_str,
+                }
 
     def _handle_response(self, response: Response) -> None:
         if response.status_code >= 400:
@@ -153,6 +176,15 @@ class R2RClient(BaseClient):
                 status_code=response.status_code, message=message
             )
 
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def set_api_key(self, api_key: str) -> None:
         if self.access_token:
             raise ValueError("Cannot have both access token and api key.")
@@ -259,6 +259,7 @@ class AggregateSearchResult(R2RSerializable):
     graph_search_results: Optional[list[GraphSearchResult]] = None
     web_search_results: Optional[list[WebPageSearchResult]] = None
     document_search_results: Optional[list[DocumentResponse]] = None
+    timings: Optional[dict[str, float]] = None
 
     def __str__(self) -> str:
         return f"AggregateSearchResult(chunk_search_results={self.chunk_search_results}, graph_search_results={self.graph_search_results}, web_search_results={self.web_search_results}, document_search_results={str(self.document_search_results)})"
@@ -389,6 +390,16 @@ class ChunkSearchSettings(R2RSerializable):
         default=True,
         description="Whether to enable chunk search",
     )
+    rerank_candidates: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=1_000,
+        description="Number of candidates to retrieve and pass to the reranker before keeping the top `limit`. Defaults to `limit`; ignored when no rerank model is configured.",
+    )
+    rerank_score_threshold: Optional[float] = Field(
+        default=None,
+        description="Candidates whose retrieval score is below this value are not reranked and keep their retrieval order after the reranked ones. Reranking is skipped when at most one candidate clears it. Requires `include_scores`.",
+    )
 
 
 class GraphSearchSettings(R2RSerializable):
@@ -456,6 +467,11 @@ class SearchSettings(R2RSerializable):
         description="""Whether to include search score values in the
         search results""",
     )
+    include_timings: bool = Field(
+        default=False,
+        description="""Whether to return per-stage latency timings (in
+        milliseconds) with the results""",
+    )
 
     # Search strategy and settings
     search_strategy: str = Field(
@@ -509,6 +525,7 @@ class SearchSettings(R2RSerializable):
                     "include_metadata": True,
                     "probes": 10,
                     "ef_search": 40,
+                    "rerank_candidates": 50,
                 },
                 "graph_settings": {
                     "enabled": True,
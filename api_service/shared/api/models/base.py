@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -11,7 +11,8 @@ class R2RResults(BaseModel, Generic[T]):
 
 class PaginatedR2RResult(BaseModel, Generic[T]):
     results: T
-    total_entries: int
+    total_entries: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class GenericBooleanResponse(BaseModel):
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import math
@@ -5,7 +6,15 @@ import uuid
 from abc import ABCMeta
 from copy import deepcopy
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Optional, Tuple, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from uuid import NAMESPACE_DNS, UUID, uuid4, uuid5
 
 import tiktoken
@@ -629,28 +638,192 @@ class CombinedMeta(AsyncSyncMeta, ABCMeta):
     pass
 
 
+def format_sse_event(event_name: str, payload: Any) -> str:
+    """A complete SSE event (`event:` line, `data:` line and the blank line
+    that ends it) as a single string."""
+    return f"event: {event_name}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
 async def yield_sse_event(event_name: str, payload: dict, chunk_size=1024):
     """
-    Helper that yields a single SSE event in properly chunked lines.
+    Helper that yields a single SSE event:
 
-    e.g. event: event_name
-         data: (partial JSON 1)
-         data: (partial JSON 2)
-         ...
+         event: event_name
+         data: (JSON payload)
          [blank line to end event]
+
+    The event is yielded as one string, so that each event costs one
+    write instead of one per line.
+    """
+    yield format_sse_event(event_name, payload)
+
+
+def _delta_envelope(object_name: str) -> tuple[str, str, str]:
+    """Split the serialized `message` / `thinking` delta payload around its
+    two variable fields (id, text), so that emitting a delta only has to
+    encode those two strings."""
+    id_marker, text_marker = json.dumps("\0id"), json.dumps("\0text")
+    template = json.dumps(
+        {
+            "id": "\0id",
+            "object": object_name,
+            "delta": {
+                "content": [
+                    {
+                        "type": "text",
+                        "payload": {"value": "\0text", "annotations": []},
+                    }
+                ]
+            },
+        }
+    )
+    head, rest = template.split(id_marker)
+    middle, tail = rest.split(text_marker)
+    return head, middle, tail
+
+
+class SSEDelta(str):
+    """A pre-serialized `message` or `thinking` delta event.
+
+    It is an ordinary SSE event string, so it can be yielded anywhere an
+    event line is expected, but it also keeps the event name, id and text,
+    which lets `coalesce_sse_events` merge consecutive deltas into a
+    single event and re-encode them in the compact wire format.
     """
 
-    # SSE: first the "event: ..."
-    yield f"event: {event_name}\n"
+    ENVELOPES = {
+        "message": _delta_envelope("agent.message.delta"),
+        "thinking": _delta_envelope("agent.thinking.delta"),
+    }
+
+    event: str
+    id: str
+    text: str
+
+    def __new__(cls, event: str, id: str, text: str) -> "SSEDelta":
+        head, middle, tail = cls.ENVELOPES[event]
+        value = super().__new__(
+            cls,
+            f"event: {event}\ndata: {head}{json.dumps(id)}{middle}"
+            f"{json.dumps(text)}{tail}\n\n",
+        )
+        value.event, value.id, value.text = event, id, text
+        return value
+
+    def compact(self) -> str:
+        """The event in the compact wire format: `{"id": ..., "v": text}`."""
+        return (
+            f'event: {self.event}\ndata: {{"id":{json.dumps(self.id)},'
+            f'"v":{json.dumps(self.text)}}}\n\n'
+        )
 
-    # Convert payload to JSON
-    content_str = json.dumps(payload, default=str)
 
-    # data
-    yield f"data: {content_str}\n"
+async def coalesce_sse_events(
+    events: AsyncIterable[str],
+    flush_interval: float = 0.03,
+    max_frame_bytes: int = 16_384,
+    compact: bool = False,
+) -> AsyncGenerator[str, None]:
+    """Group a stream of SSE events into frames for the response body.
+
+    Events are read ahead of the client by a background task. A frame is
+    sent `flush_interval` seconds after its first event, or as soon as it
+    holds `max_frame_bytes`; consecutive `SSEDelta`s of the same kind are
+    merged into one event (keeping the first id). While the client is
+    slow to read, deltas keep merging into the next frame, and once that
+    frame is full reading pauses, so a slow client holds back the LLM
+    stream instead of buffering it without bound.
+
+    With `compact`, deltas are sent in the `SSEDelta.compact` format; all
+    other events are passed through unchanged.
+    """
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Condition()
+    # Plain events, or [first delta, texts] for a run of merged deltas.
+    pending: list[Any] = []
+    pending_bytes = 0
+    first_pending_at = 0.0
+    finished = False
+    error: Optional[BaseException] = None
+
+    def frame_has_room() -> bool:
+        return pending_bytes < max_frame_bytes
+
+    async def read_events():
+        nonlocal pending_bytes, first_pending_at, finished, error
+        try:
+            async for event in events:
+                async with changed:
+                    await changed.wait_for(frame_has_room)
+                    if not pending:
+                        first_pending_at = loop.time()
+                    last = pending[-1] if pending else None
+                    if (
+                        isinstance(event, SSEDelta)
+                        and isinstance(last, list)
+                        and last[0].event == event.event
+                    ):
+                        last[1].append(event.text)
+                        pending_bytes += len(event.text)
+                    elif isinstance(event, SSEDelta):
+                        pending.append([event, [event.text]])
+                        pending_bytes += len(event)
+                    else:
+                        pending.append(event)
+                        pending_bytes += len(event)
+                    changed.notify_all()
+        except Exception as e:
+            error = e
+        finally:
+            async with changed:
+                finished = True
+                changed.notify_all()
+
+    def render(entry: Any) -> str:
+        if not isinstance(entry, list):
+            return entry
+        first, texts = entry
+        delta = (
+            first
+            if len(texts) == 1
+            else SSEDelta(first.event, first.id, "".join(texts))
+        )
+        return delta.compact() if compact else delta
 
-    # blank line signals end of SSE event
-    yield "\n"
+    reader = asyncio.create_task(read_events())
+    try:
+        while True:
+            async with changed:
+                await changed.wait_for(lambda: pending or finished)
+                deadline = first_pending_at + flush_interval
+                while not finished and frame_has_room():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(changed.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                frame = "".join(render(entry) for entry in pending)
+                pending.clear()
+                pending_bytes = 0
+                done = finished
+                changed.notify_all()
+            if frame:
+                yield frame
+            if done:
+                break
+        if error is not None:
+            raise error
+    finally:
+        reader.cancel()
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+        aclose = getattr(events, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 class SSEFormatter:
@@ -693,48 +866,28 @@ class SSEFormatter:
         async for line in yield_sse_event("final_answer", final_data):
             yield line
 
+    @staticmethod
+    def message_event(text_segment, msg_id=None) -> SSEDelta:
+        return SSEDelta(
+            "message", msg_id or f"msg_{uuid.uuid4().hex[:8]}", text_segment
+        )
+
+    @staticmethod
+    def thinking_event(text_segment, thinking_id=None) -> SSEDelta:
+        return SSEDelta(
+            "thinking",
+            thinking_id or f"think_{uuid.uuid4().hex[:8]}",
+            text_segment,
+        )
+
     # Include other existing SSEFormatter methods for compatibility
     @staticmethod
     async def yield_message_event(text_segment, msg_id=None):
-        msg_id = msg_id or f"msg_{uuid.uuid4().hex[:8]}"
-        msg_payload = {
-            "id": msg_id,
-            "object": "agent.message.delta",
-            "delta": {
-                "content": [
-                    {
-                        "type": "text",
-                        "payload": {
-                            "value": text_segment,
-                            "annotations": [],
-                        },
-                    }
-                ]
-            },
-        }
-        async for line in yield_sse_event("message", msg_payload):
-            yield line
+        yield SSEFormatter.message_event(text_segment, msg_id)
 
     @staticmethod
     async def yield_thinking_event(text_segment, thinking_id=None):
-        thinking_id = thinking_id or f"think_{uuid.uuid4().hex[:8]}"
-        thinking_data = {
-            "id": thinking_id,
-            "object": "agent.thinking.delta",
-            "delta": {
-                "content": [
-                    {
-                        "type": "text",
-                        "payload": {
-                            "value": text_segment,
-                            "annotations": [],
-                        },
-                    }
-                ]
-            },
-        }
-        async for line in yield_sse_event("thinking", thinking_data):
-            yield line
+        yield SSEFormatter.thinking_event(text_segment, thinking_id)
 
     @staticmethod
     def yield_done_event():
@@ -0,0 +1,121 @@
+"""Import-time benchmark for `core`.
+
+Runs `python -X importtime -c "import core"` in fresh interpreters and
+summarizes the output: the total import time and the modules with the
+largest cumulative time. Provider and parser packages export their classes
+lazily (`core.utils.lazy_imports`), so none of the SDKs or parser
+libraries in `HEAVY_MODULES` should show up here; the app imports the
+providers its config selects when it builds them.
+`tests/unit/app/test_import_time.py` checks that list.
+
+Run from `api_service/`:
+
+    python tests/scaling/importTimeBenchmark.py ["import core.main"]
+"""
+
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Configuration
+STATEMENT = "import core"
+RUNS = 5
+TOP = 20
+
+API_SERVICE_DIR = Path(__file__).resolve().parents[2]
+
+# Top-level packages that only selected providers or parsers may import.
+HEAVY_MODULES = (
+    "anthropic",
+    "apscheduler",
+    "asyncpg",
+    "bs4",
+    "cryptography",
+    "docutils",
+    "docx",
+    "hatchet_sdk",
+    "litellm",
+    "mistralai",
+    "networkx",
+    "olefile",
+    "openpyxl",
+    "pdf2image",
+    "PIL",
+    "pillow_heif",
+    "pptx",
+    "pypdf",
+    "unstructured_client",
+    "xlrd",
+)
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the `-X importtime` lines of `output` (the stderr of a run)."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        records.append(
+            ImportRecord(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    return records
+
+
+def measure_imports(statement: str = STATEMENT) -> list[ImportRecord]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=API_SERVICE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def total_ms(records: list[ImportRecord]) -> float:
+    return sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+
+
+def heavy_modules(records: list[ImportRecord]) -> list[str]:
+    loaded = {r.module.partition(".")[0] for r in records}
+    return [module for module in HEAVY_MODULES if module in loaded]
+
+
+def main():
+    statement = sys.argv[1] if len(sys.argv) > 1 else STATEMENT
+    runs = [measure_imports(statement) for _ in range(RUNS)]
+    totals = sorted(total_ms(records) for records in runs)
+    records = runs[-1]
+
+    print(
+        f"{statement!r}: {len(records)} modules, median "
+        f"{statistics.median(totals):.1f} ms, min {totals[0]:.1f} ms, "
+        f"max {totals[-1]:.1f} ms over {RUNS} runs\n"
+        f"{'cumulative ms':>14} {'self ms':>9}  module"
+    )
+    for record in sorted(records, key=lambda r: -r.cumulative_us)[:TOP]:
+        print(
+            f"{record.cumulative_us / 1000:>14.1f} "
+            f"{record.self_us / 1000:>9.1f}  {record.module}"
+        )
+    print(f"heavy modules loaded: {', '.join(heavy_modules(records)) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Offline benchmark of chunk search latency against recall@k for the rerank
+settings (`rerank_candidates`, `rerank_score_threshold`, no rerank model).
+
+Runs `RetrievalService._vector_search_logic` over a synthetic corpus, with
+no database or model. Chunks are clustered around random topics; each has
+a "true" embedding, which the simulated reranker scores with, and a noisy
+copy that the first-stage vector search uses, so reranking a wider
+candidate set recovers recall that the first stage loses. Search and
+rerank latencies are simulated from the per-call and per-row costs below;
+tune them to match production profiles before comparing settings.
+
+Run from `api_service/`:
+
+    python tests/scaling/rerankBenchmark.py
+"""
+
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from uuid import UUID
+
+import numpy as np
+
+from core.base import ChunkSearchResult, SearchSettings
+from core.main.services.retrieval_service import RetrievalService
+
+# Configuration
+CORPUS_SIZE = 20_000
+DIMENSION = 64
+NUM_QUERIES = 100
+K = 10
+NUM_TOPICS = 200
+# Per-dimension standard deviations of the Gaussian noise added (before
+# renormalizing) to the topic for chunk embeddings, to the true chunk
+# embedding for the first-stage copy, and to a chunk for each query.
+TOPIC_SPREAD = 0.075
+RETRIEVAL_NOISE = 0.045
+QUERY_NOISE = 0.04
+SEED = 7
+
+SEARCH_LATENCY_MS = 4.0
+SEARCH_LATENCY_PER_ROW_MS = 0.02
+RERANK_LATENCY_MS = 2.0
+RERANK_LATENCY_PER_PAIR_MS = 0.3
+
+# (label, rerank model configured, chunk_settings overrides)
+SETTINGS = [
+    ("no rerank model", False, {}),
+    ("rerank top k", True, {}),
+    ("rerank 30 candidates", True, {"rerank_candidates": 30}),
+    ("rerank 50 candidates", True, {"rerank_candidates": 50}),
+    ("rerank 100 candidates", True, {"rerank_candidates": 100}),
+    (
+        "rerank 100, threshold 0.6",
+        True,
+        {"rerank_candidates": 100, "rerank_score_threshold": 0.6},
+    ),
+    (
+        "rerank 100, threshold 0.7",
+        True,
+        {"rerank_candidates": 100, "rerank_score_threshold": 0.7},
+    ),
+]
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+class SyntheticCorpus:
+    def __init__(self, rng: np.random.Generator):
+        def noise(rows: int) -> np.ndarray:
+            return rng.standard_normal((rows, DIMENSION))
+
+        topics = normalize(noise(NUM_TOPICS))
+        self.true_vectors = normalize(
+            topics[rng.integers(0, NUM_TOPICS, CORPUS_SIZE)]
+            + TOPIC_SPREAD * noise(CORPUS_SIZE)
+        )
+        self.search_vectors = normalize(
+            self.true_vectors + RETRIEVAL_NOISE * noise(CORPUS_SIZE)
+        )
+        sources = rng.choice(CORPUS_SIZE, NUM_QUERIES, replace=False)
+        self.queries = normalize(
+            self.true_vectors[sources] + QUERY_NOISE * noise(NUM_QUERIES)
+        )
+        self.relevant = [
+            set(np.argsort(-(self.true_vectors @ query))[:K].tolist())
+            for query in self.queries
+        ]
+
+
+class SyntheticChunksHandler:
+    def __init__(self, corpus: SyntheticCorpus):
+        self.corpus = corpus
+
+    async def semantic_search(
+        self, query_vector: list[float], search_settings: SearchSettings
+    ) -> list[ChunkSearchResult]:
+        limit = search_settings.limit
+        scores = self.corpus.search_vectors @ np.asarray(query_vector)
+        top = np.argpartition(-scores, limit)[:limit]
+        top = top[np.argsort(-scores[top])]
+        await asyncio.sleep(
+            (SEARCH_LATENCY_MS + SEARCH_LATENCY_PER_ROW_MS * limit) / 1000
+        )
+        return [
+            ChunkSearchResult(
+                id=UUID(int=int(idx)),
+                document_id=UUID(int=0),
+                owner_id=None,
+                collection_ids=[],
+                score=float(scores[idx]),
+                text=f"chunk {idx}",
+                metadata={},
+            )
+            for idx in top
+        ]
+
+
+@dataclass
+class SyntheticReranker:
+    corpus: SyntheticCorpus
+    has_reranker: bool
+    pairs: list[int] = field(default_factory=list)
+
+    async def arerank(
+        self, query: str, results: list[ChunkSearchResult], limit: int
+    ) -> list[ChunkSearchResult]:
+        self.pairs.append(len(results))
+        await asyncio.sleep(
+            (RERANK_LATENCY_MS + RERANK_LATENCY_PER_PAIR_MS * len(results))
+            / 1000
+        )
+        query_vector = self.corpus.queries[int(query)]
+        for result in results:
+            result.score = float(
+                self.corpus.true_vectors[result.id.int] @ query_vector
+            )
+        return sorted(results, key=lambda r: r.score, reverse=True)[:limit]
+
+
+@dataclass
+class Report:
+    label: str
+    latencies_ms: list[float]
+    recalls: list[float]
+    pairs: list[int]
+
+    def row(self) -> str:
+        latencies = sorted(self.latencies_ms)
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        pairs = statistics.mean(self.pairs) if self.pairs else 0
+        return (
+            f"{self.label:<28} {statistics.mean(latencies):>8.2f} "
+            f"{p95:>8.2f} {statistics.mean(self.recalls):>10.3f} "
+            f"{pairs:>8.1f}"
+        )
+
+
+async def run_settings(
+    corpus: SyntheticCorpus,
+    label: str,
+    rerank: bool,
+    chunk_settings: dict,
+) -> Report:
+    reranker = SyntheticReranker(corpus, has_reranker=rerank)
+    service = RetrievalService.__new__(RetrievalService)
+    service.providers = SimpleNamespace(  # type: ignore[assignment]
+        database=SimpleNamespace(
+            chunks_handler=SyntheticChunksHandler(corpus)
+        ),
+        completion_embedding=reranker,
+    )
+
+    latencies, recalls = [], []
+    for query_idx, query_vector in enumerate(corpus.queries):
+        settings = SearchSettings(limit=K, use_fulltext_search=False)
+        for key, value in chunk_settings.items():
+            setattr(settings.chunk_settings, key, value)
+
+        start = time.perf_counter()
+        results = await service._vector_search_logic(
+            str(query_idx), settings, precomputed_vector=query_vector.tolist()
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        returned = {result.id.int for result in results}
+        recalls.append(len(returned & corpus.relevant[query_idx]) / K)
+    return Report(label, latencies, recalls, reranker.pairs)
+
+
+async def main():
+    corpus = SyntheticCorpus(np.random.default_rng(SEED))
+    print(
+        f"{CORPUS_SIZE} chunks, {NUM_QUERIES} queries, recall@{K}\n"
+        f"{'settings':<28} {'mean ms':>8} {'p95 ms':>8} "
+        f"{'recall@k':>10} {'pairs':>8}"
+    )
+    for label, rerank, chunk_settings in SETTINGS:
+        report = await run_settings(corpus, label, rerank, chunk_settings)
+        print(report.row())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
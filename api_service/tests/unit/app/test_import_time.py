@@ -0,0 +1,50 @@
+"""
+Unit tests for the lazy provider and parser imports: `import core` must not
+load provider SDKs or parser libraries, checked with the `-X importtime`
+benchmark in tests/scaling.
+"""
+
+from tests.scaling.importTimeBenchmark import (
+    heavy_modules,
+    measure_imports,
+    parse_importtime,
+    total_ms,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        300 |     shared.utils
+import time:       400 |        700 |   shared
+import time:      1000 |       1900 | core
+import time:        50 |         50 | json
+"""
+
+
+def test_parse_importtime():
+    records = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [(r.module, r.depth) for r in records] == [
+        ("_io", 1),
+        ("shared.utils", 2),
+        ("shared", 1),
+        ("core", 0),
+        ("json", 0),
+    ]
+    assert records[3].self_us == 1000
+    assert total_ms(records) == 1.95
+
+
+def test_import_core_skips_heavy_modules():
+    records = measure_imports("import core")
+
+    assert "core" in {r.module for r in records}
+    assert heavy_modules(records) == []
+
+
+def test_selected_provider_is_imported_on_access():
+    records = measure_imports(
+        "import core; core.providers.APSchedulerProvider"
+    )
+
+    assert heavy_modules(records) == ["apscheduler"]
@@ -0,0 +1,105 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import OrchestrationConfig, R2RException
+from core.providers.orchestration import PostgresOrchestrationProvider
+
+
+@pytest.fixture
+def jobs_handler():
+    handler = MagicMock()
+    handler.enqueue_job = AsyncMock(return_value=uuid.uuid4())
+    handler.complete_job = AsyncMock()
+    handler.fail_job = AsyncMock()
+    handler.extend_lease = AsyncMock(return_value=True)
+    return handler
+
+
+@pytest.fixture
+def provider(jobs_handler):
+    database_provider = MagicMock()
+    database_provider.jobs_handler = jobs_handler
+    provider = PostgresOrchestrationProvider(
+        OrchestrationConfig(
+            provider="postgres",
+            job_max_attempts=3,
+            job_retry_backoff_seconds=10,
+        ),
+        database_provider,
+    )
+    provider.ingestion_workflows = {"ingest-files": AsyncMock()}
+    provider.concurrency_limits["ingest-files"] = 2
+    return provider
+
+
+def make_job(attempts=1):
+    return {
+        "id": uuid.uuid4(),
+        "workflow_name": "ingest-files",
+        "parameters": {"request": {"document_id": "abc"}},
+        "attempts": attempts,
+        "max_attempts": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_enqueues_job(provider, jobs_handler):
+    document_id = uuid.uuid4()
+
+    result = await provider.run_workflow(
+        "ingest-files",
+        {"request": {}},
+        options={"additional_metadata": {"document_id": str(document_id)}},
+    )
+
+    assert result["task_id"] == str(jobs_handler.enqueue_job.return_value)
+    assert jobs_handler.enqueue_job.await_args.kwargs == {
+        "document_id": document_id,
+        "max_attempts": 3,
+    }
+    provider.ingestion_workflows["ingest-files"].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_successful_job_is_completed(provider, jobs_handler):
+    job = make_job()
+
+    await provider._run_job(job)
+
+    provider.ingestion_workflows["ingest-files"].assert_awaited_once_with(
+        {"document_id": "abc"}
+    )
+    jobs_handler.complete_job.assert_awaited_once_with(
+        job["id"], provider.worker_id
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff(provider, jobs_handler):
+    provider.ingestion_workflows["ingest-files"].side_effect = RuntimeError(
+        "timeout"
+    )
+
+    await provider._run_job(make_job(attempts=2))
+
+    assert jobs_handler.fail_job.await_args.kwargs == {"retry_in_seconds": 20}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "attempts, error",
+    [
+        (3, RuntimeError("timeout")),
+        (1, R2RException(message="Bad file", status_code=400)),
+    ],
+)
+async def test_job_fails_for_good(provider, jobs_handler, attempts, error):
+    provider.ingestion_workflows["ingest-files"].side_effect = error
+
+    await provider._run_job(make_job(attempts=attempts))
+
+    assert jobs_handler.fail_job.await_args.kwargs == {
+        "retry_in_seconds": None
+    }
@@ -0,0 +1,98 @@
+"""
+Unit tests for the SDK clients' pooled httpx client: one instance serves
+every regular and streaming call, the context managers close it, and the
+pool settings reach httpx.
+"""
+
+import httpx
+import pytest
+
+import sdk.async_client as async_client
+import sdk.sync_client as sync_client
+from sdk import R2RAsyncClient, R2RClient
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/stream"):
+        return httpx.Response(200, text='event: message\ndata: {"v":"hi"}\n\n')
+    return httpx.Response(200, json={"results": {"message": "ok"}})
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Records the httpx clients built by the SDK, serving them locally."""
+    clients: list[tuple[httpx.Client | httpx.AsyncClient, dict]] = []
+
+    def recording(cls, transport):
+        def build(**kwargs):
+            client = cls(transport=transport, **kwargs)
+            clients.append((client, kwargs))
+            return client
+
+        return build
+
+    monkeypatch.setattr(
+        async_client.httpx,
+        "AsyncClient",
+        recording(httpx.AsyncClient, httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(
+        sync_client,
+        "Client",
+        recording(httpx.Client, httpx.MockTransport(handler)),
+    )
+    return clients
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_and_closes_one_http_client(created):
+    async with R2RAsyncClient("http://localhost:7272") as client:
+        await client.system.health()
+        await client.system.health()
+        lines = [
+            line
+            async for line in client._make_streaming_request("POST", "stream")
+        ]
+
+    assert lines == ["event: message", 'data: {"v":"hi"}']
+    assert len(created) == 1
+    assert created[0][0] is client.client
+    assert client.client.is_closed
+
+
+def test_sync_client_reuses_and_closes_one_http_client(created):
+    with R2RClient("http://localhost:7272") as client:
+        client.system.health()
+        client.system.health()
+        events = list(client._make_streaming_request("POST", "stream"))
+
+    assert events == [{"event": "message", "data": ' {"v":"hi"}'}]
+    assert len(created) == 1
+    assert created[0][0] is client.client
+    assert client.client.is_closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_cls", [R2RClient, R2RAsyncClient])
+async def test_pool_settings_pass_through(created, client_cls):
+    client = client_cls(
+        "http://localhost:7272",
+        timeout=12.0,
+        http2=False,
+        max_connections=7,
+        max_keepalive_connections=3,
+        keepalive_expiry=5.0,
+    )
+
+    (_, kwargs) = created[0]
+    assert kwargs["limits"] == httpx.Limits(
+        max_connections=7, max_keepalive_connections=3, keepalive_expiry=5.0
+    )
+    assert kwargs["timeout"] == 12.0
+    assert kwargs["http2"] is False
+    assert client.client.timeout == httpx.Timeout(12.0)
+
+    if isinstance(client, R2RAsyncClient):
+        await client.aclose()
+    else:
+        client.close()
@@ -0,0 +1,200 @@
+"""
+Unit tests for the shared cache tier used by pre-forked API workers:
+prompt invalidation across workers, principal and embedding caching, and
+the readiness flag.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.utils import shared_cache
+from core.utils.shared_cache import InMemorySharedCache, create_shared_cache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = InMemorySharedCache()
+    monkeypatch.setattr(shared_cache, "_shared_cache", cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_expires_and_counts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(shared_cache.time, "monotonic", lambda: now[0])
+    cache = InMemorySharedCache()
+
+    await cache.set("a", "1", ttl=5)
+    await cache.set_json("b", [0.5, 1.5])
+    assert await cache.incr("n") == 1
+    assert await cache.incr("n") == 2
+    now[0] += 10
+
+    assert await cache.get("a") is None
+    assert await cache.get_json("b") == [0.5, 1.5]
+    assert await cache.get("n") == "2"
+    await cache.delete("b", "missing")
+    assert await cache.get("b") is None
+
+
+def test_create_shared_cache_from_url():
+    assert create_shared_cache(None) is None
+    assert isinstance(create_shared_cache("memory://"), InMemorySharedCache)
+    with pytest.raises(ValueError):
+        create_shared_cache("memcached://localhost")
+
+
+def make_prompts_handler(templates):
+    from core.providers.database.prompts_handler import (
+        PostgresPromptsHandler,
+    )
+
+    async def fetchrow_query(query, params):
+        return {
+            "id": uuid4(),
+            "template": templates[params[0]],
+            "input_types": {},
+        }
+
+    connection_manager = MagicMock()
+    connection_manager.fetchrow_query = AsyncMock(side_effect=fetchrow_query)
+    return PostgresPromptsHandler("test", connection_manager)
+
+
+@pytest.mark.asyncio
+async def test_prompt_update_invalidates_other_workers(cache):
+    templates = {"greeting": "hello"}
+    worker_a = make_prompts_handler(templates)
+    worker_b = make_prompts_handler(templates)
+    for worker in (worker_a, worker_b):
+        await worker._load_shared_generation()
+        assert await worker.get_cached_prompt("greeting") == "hello"
+
+    templates["greeting"] = "hi"
+    await worker_b.update_prompt("greeting", template="hi")
+
+    assert await worker_a.get_cached_prompt("greeting") == "hi"
+    assert await worker_b.get_cached_prompt("greeting") == "hi"
+
+
+@pytest.mark.asyncio
+async def test_prompt_cache_is_local_without_shared_tier(monkeypatch):
+    monkeypatch.setattr(shared_cache, "_shared_cache", None)
+    templates = {"greeting": "hello"}
+    handler = make_prompts_handler(templates)
+
+    await handler.get_cached_prompt("greeting")
+    await handler.get_cached_prompt("greeting")
+
+    assert handler.connection_manager.fetchrow_query.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_principal_is_shared_until_logout(cache):
+    from core.base.api.models import User
+    from core.providers.auth import R2RAuthProvider
+
+    user = User(id=uuid4(), email="a@example.com")
+    worker_a = R2RAuthProvider.__new__(R2RAuthProvider)
+    worker_b = R2RAuthProvider.__new__(R2RAuthProvider)
+    for worker in (worker_a, worker_b):
+        worker._authenticate = AsyncMock(return_value=user)
+        worker.database_provider = MagicMock()
+        worker.database_provider.token_handler.blacklist_token = AsyncMock()
+
+    assert (await worker_a.user("token")).id == user.id
+    assert (await worker_b.user("token")).email == user.email
+    worker_b._authenticate.assert_not_awaited()
+
+    await worker_a.logout("token")
+    await worker_b.user("token")
+    worker_b._authenticate.assert_awaited_once_with("token")
+
+
+@pytest.mark.asyncio
+async def test_cached_principal_drops_password_and_follows_user_writes(cache):
+    from core.base.api.models import User
+    from core.providers.auth import R2RAuthProvider
+    from core.utils.shared_cache import invalidate_principals
+
+    user = User(id=uuid4(), email="a@example.com", hashed_password="hash")
+    worker = R2RAuthProvider.__new__(R2RAuthProvider)
+    worker._authenticate = AsyncMock(return_value=user)
+
+    await worker.user("token")
+    assert "hash" not in str(cache._data)
+    assert (await worker.user("token")).hashed_password is None
+    assert worker._authenticate.await_count == 1
+
+    await invalidate_principals(user.id)
+    assert (await worker.user("token")).hashed_password == "hash"
+    assert worker._authenticate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_deleted_api_key_stops_authenticating_at_once(cache):
+    from core.base.abstractions import R2RException
+    from core.base.api.models import User
+    from core.providers.auth import R2RAuthProvider
+    from core.providers.database.users import PostgresUserHandler
+
+    user = User(id=uuid4(), email="a@example.com")
+    key_id = uuid4()
+    worker = R2RAuthProvider.__new__(R2RAuthProvider)
+    worker._authenticate = AsyncMock(return_value=user)
+
+    connection_manager = MagicMock()
+    connection_manager.fetchrow_query = AsyncMock(return_value={"id": key_id})
+    users_handler = PostgresUserHandler.__new__(PostgresUserHandler)
+    users_handler.project_name = "test"
+    users_handler.connection_manager = connection_manager
+
+    await worker.user("pk.secret")
+    await users_handler.delete_api_key(user.id, key_id)
+    worker._authenticate.side_effect = R2RException(
+        status_code=401, message="Invalid API key"
+    )
+
+    with pytest.raises(R2RException):
+        await worker.user("pk.secret")
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_is_shared(cache):
+    from core.main.services.retrieval_service import RetrievalService
+
+    def make_service():
+        providers = MagicMock()
+        providers.completion_embedding.config = SimpleNamespace(
+            base_model="openai/text-embedding-3-small", base_dimension=2
+        )
+        providers.completion_embedding.async_get_embedding = AsyncMock(
+            return_value=[0.1, 0.2]
+        )
+        service = RetrievalService.__new__(RetrievalService)
+        service.providers = providers
+        return service
+
+    worker_a, worker_b = make_service(), make_service()
+
+    assert await worker_a._embed_query("query") == [0.1, 0.2]
+    assert await worker_b._embed_query("query") == [0.1, 0.2]
+    embed_b = worker_b.providers.completion_embedding.async_get_embedding
+    embed_b.assert_not_awaited()
+
+
+def test_ready_only_after_warm_up(monkeypatch):
+    from core.main import warmup
+
+    monkeypatch.setattr(warmup, "_ready", False)
+    monkeypatch.setattr(warmup, "_warm_seconds", None)
+
+    warmup.mark_ready()
+    assert not warmup.is_ready()
+    monkeypatch.setattr(warmup, "_warm_seconds", 0.5)
+    assert warmup.is_ready()
+    warmup.mark_not_ready()
+    assert not warmup.is_ready()
@@ -0,0 +1,45 @@
+import pytest
+
+from core.providers.database.base import is_read_only_statement
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("SELECT 1", True),
+        ("\n  -- overview\n  select * from docs where id = $1;", True),
+        ("WITH ranked AS (SELECT 1) SELECT * FROM ranked", True),
+        ("SELECT updated_at FROM users WHERE id = $1", True),
+        ("SELECT * FROM jobs FOR UPDATE SKIP LOCKED", False),
+        ("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d", False),
+        ("INSERT INTO t (a) VALUES ($1) RETURNING id", False),
+        ("SELECT 1; SELECT 2", False),
+    ],
+)
+def test_is_read_only_statement(query, expected):
+    assert is_read_only_statement(query) is expected
+
+
+@pytest.mark.asyncio
+async def test_prepared_fetch_reuses_pinned_statement(db_provider):
+    manager = db_provider.connection_manager
+    query = "SELECT $1::int + 1 AS value"
+    assert db_provider.pool.hot_statements_enabled
+
+    plain = await manager.fetch_query(query, [1])
+    prepared = await manager.fetchrow_query(query, [41], prepared=True)
+    assert plain[0]["value"] == 2
+    assert prepared["value"] == 42
+
+    # The pool may hand each call a different connection, so check the
+    # pinning on one connection held for both executions.
+    async with db_provider.pool.get_connection() as conn:
+        first = await manager._run(conn, "fetch", query, [1], prepared=True)
+        statement = conn._hot_statements[query]
+        second = await manager._run(
+            conn, "fetchrow", query, [41], prepared=True
+        )
+
+        assert first[0]["value"] == 2
+        assert second["value"] == 42
+        assert conn._hot_statements[query] is statement
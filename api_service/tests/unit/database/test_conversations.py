@@ -110,6 +110,50 @@ async def test_get_conversation(conversations_handler):
     assert messages[1].message.content == "Msg2"
 
 
+@pytest.mark.asyncio
+async def test_get_conversation_window(conversations_handler):
+    conv = await conversations_handler.create_conversation()
+    conv_id = conv.id
+
+    for i in range(6):
+        role = "user" if i % 2 == 0 else "assistant"
+        await conversations_handler.add_message(
+            conv_id, Message(role=role, content=f"Message {i} " + "word " * 50)
+        )
+
+    # Each message is ~60 tokens, so only the last turn fits.
+    window = await conversations_handler.get_conversation_window(
+        conv_id, max_tokens=150
+    )
+    assert [m.message.content.split()[1] for m in window["messages"]] == [
+        "4",
+        "5",
+    ]
+    assert window["summary"] is None
+    assert window["window_start"] is not None
+
+    # Messages added afterwards extend the cached window.
+    await conversations_handler.add_message(
+        conv_id, Message(role="user", content="Follow-up")
+    )
+    window = await conversations_handler.get_conversation_window(
+        conv_id, max_tokens=150
+    )
+    assert window["messages"][-1].message.content == "Follow-up"
+
+    older = await conversations_handler.get_messages_between(
+        conv_id, after=None, before=window["window_start"]
+    )
+    await conversations_handler.update_conversation_summary(
+        conv_id, summary="Earlier turns", summary_until=older[-1][1]
+    )
+    window = await conversations_handler.get_conversation_window(
+        conv_id, max_tokens=150
+    )
+    assert window["summary"] == "Earlier turns"
+    assert window["summary_until"] < window["window_start"]
+
+
 @pytest.mark.asyncio
 async def test_delete_conversation(conversations_handler):
     conv = await conversations_handler.create_conversation()
@@ -3,6 +3,7 @@ from enum import Enum
 
 import pytest
 
+from core.base import Entity, Relationship
 from core.base.api.models import GraphResponse
 
 
@@ -304,6 +305,50 @@ async def test_bulk_entities(graphs_handler):
         assert ent["name"] in fetched_names
 
 
+@pytest.mark.asyncio
+async def test_create_many_entities_and_relationships(graphs_handler):
+    coll_id = uuid.uuid4()
+    graph_resp = await graphs_handler.create(collection_id=coll_id,
+                                             name="CreateMany")
+    graph_id = graph_resp.id
+
+    entities = await graphs_handler.entities.create_many(
+        [
+            Entity(name="EntityA", category="Person", parent_id=graph_id),
+            Entity(name="EntityB", category="Place", parent_id=graph_id),
+        ],
+        store_type=StoreType.GRAPHS,
+    )
+    assert all(e.id is not None for e in entities)
+    ids = {e.name: e.id for e in entities}
+
+    await graphs_handler.relationships.create_many(
+        [
+            Relationship(
+                subject="EntityA",
+                subject_id=ids["EntityA"],
+                predicate="lives_in",
+                object="EntityB",
+                object_id=ids["EntityB"],
+                parent_id=graph_id,
+            )
+        ],
+        store_type=StoreType.GRAPHS,
+    )
+
+    ents, total_ents = await graphs_handler.get_entities(parent_id=graph_id,
+                                                         offset=0,
+                                                         limit=10)
+    assert total_ents == 2
+    assert {e.id for e in ents} == set(ids.values())
+
+    rels, total_rels = await graphs_handler.get_relationships(
+        parent_id=graph_id, offset=0, limit=10)
+    assert total_rels == 1
+    assert rels[0].subject_id == ids["EntityA"]
+    assert rels[0].object_id == ids["EntityB"]
+
+
 @pytest.mark.asyncio
 async def test_relationship_filtering(graphs_handler):
     coll_id = uuid.uuid4()
@@ -0,0 +1,110 @@
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import R2RException
+from core.providers.database.utils import (
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+)
+
+
+def test_cursor_round_trip():
+    row_id = uuid.uuid4()
+    created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    sort_value, decoded_id = decode_cursor(encode_cursor(created_at, row_id))
+
+    assert sort_value == created_at.isoformat()
+    assert decoded_id == str(row_id)
+
+
+def test_invalid_cursor_is_a_client_error():
+    with pytest.raises(R2RException) as exc_info:
+        decode_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_continues_after_cursor():
+    last_id = uuid.uuid4()
+    rows = [
+        {"id": uuid.uuid4(), "cursor_sort_value": "2025-01-02T00:00:00"},
+        {"id": last_id, "cursor_sort_value": "2025-01-01T00:00:00"},
+    ]
+    connection_manager = MagicMock()
+    connection_manager.fetch_query = AsyncMock(return_value=rows)
+    connection_manager.fetchrow_query = AsyncMock()
+    cursor = encode_cursor("2025-01-03T00:00:00", uuid.uuid4())
+
+    results, total, next_cursor = await fetch_page(
+        connection_manager,
+        "SELECT id",
+        "FROM documents",
+        ["owner_id = $1"],
+        [uuid.uuid4()],
+        offset=500,
+        limit=2,
+        cursor=cursor,
+        total_entries="none",
+    )
+
+    query, params = connection_manager.fetch_query.await_args.args
+    assert (
+        "(created_at, id) < ($2::text::timestamptz, $3::text::uuid)" in query
+    )
+    assert "OFFSET" not in query
+    assert params[-1] == 2
+    assert results == rows
+    assert total is None
+    connection_manager.fetchrow_query.assert_not_awaited()
+    assert decode_cursor(next_cursor) == (
+        "2025-01-01T00:00:00",
+        str(last_id),
+    )
+
+
+@pytest.mark.asyncio
+async def test_document_chunks_without_chunk_order_page_by_id():
+    from core.providers.database.chunks import PostgresChunksHandler
+
+    document_id, last_id = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        {
+            "id": chunk_id,
+            "document_id": document_id,
+            "owner_id": None,
+            "collection_ids": [],
+            "text": "chunk",
+            "metadata": "{}",
+            # What COALESCE returns for chunks stored without chunk_order.
+            "cursor_sort_value": -1,
+        }
+        for chunk_id in (uuid.uuid4(), last_id)
+    ]
+    handler = PostgresChunksHandler.__new__(PostgresChunksHandler)
+    handler.project_name = "test"
+    handler.connection_manager = MagicMock()
+    handler.connection_manager.fetch_query = AsyncMock(return_value=rows)
+
+    first = await handler.list_document_chunks(
+        document_id, offset=0, limit=2, total_entries="none"
+    )
+    await handler.list_document_chunks(
+        document_id,
+        offset=0,
+        limit=2,
+        cursor=first["next_cursor"],
+        total_entries="none",
+    )
+
+    query, params = handler.connection_manager.fetch_query.await_args.args
+    assert decode_cursor(first["next_cursor"]) == (-1, str(last_id))
+    assert (
+        "(COALESCE((metadata->>'chunk_order')::integer, -1), id) > "
+        "($2::text::integer, $3::text::uuid)"
+    ) in query
+    assert params[1:3] == ["-1", str(last_id)]
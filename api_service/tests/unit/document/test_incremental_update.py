@@ -0,0 +1,187 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.main.services.ingestion_service import IngestionService
+from shared.utils import generate_extraction_id
+
+
+def stored_chunk(text, order):
+    return {
+        "id": uuid.uuid4(),
+        "text": text,
+        "metadata": {"chunk_order": order},
+    }
+
+
+def new_chunk(text, order):
+    return {
+        "id": uuid.uuid4(),
+        "data": text,
+        "metadata": {"chunk_order": order},
+    }
+
+
+def chunker_output(document_id, texts):
+    """Chunks as the ingestion provider yields them, ids from position."""
+    return [
+        {
+            "id": generate_extraction_id(document_id, order),
+            "data": text,
+            "metadata": {"chunk_order": order},
+        }
+        for order, text in enumerate(texts)
+    ]
+
+
+def as_stored(chunks):
+    return [
+        {"id": c["id"], "text": c["data"], "metadata": c["metadata"]}
+        for c in chunks
+    ]
+
+
+@pytest.fixture
+def chunks_handler():
+    handler = MagicMock()
+    handler.list_document_chunks = AsyncMock()
+    handler.update_chunk_metadata = AsyncMock()
+    handler.delete = AsyncMock()
+    return handler
+
+
+@pytest.fixture
+def ingestion_service(chunks_handler):
+    providers = MagicMock()
+    providers.database.chunks_handler = chunks_handler
+    return IngestionService(config=MagicMock(), providers=providers)
+
+
+@pytest.mark.asyncio
+async def test_diff_embeds_only_changed_chunks(
+    ingestion_service, chunks_handler
+):
+    intro, body, outro = (
+        stored_chunk("Intro", 0),
+        stored_chunk("Old body", 1),
+        stored_chunk("Outro", 2),
+    )
+    chunks_handler.list_document_chunks.return_value = {
+        "results": [intro, body, outro]
+    }
+    parsed = [
+        new_chunk("Intro", 0),
+        new_chunk("New paragraph", 1),
+        new_chunk("New body", 2),
+        new_chunk("Outro", 3),
+    ]
+
+    to_embed, removed = await ingestion_service.diff_document_chunks(
+        uuid.uuid4(), parsed
+    )
+
+    assert [c["data"] for c in to_embed] == ["New paragraph", "New body"]
+    assert removed == [body["id"]]
+    # Unchanged text that shifted position is moved, not re-embedded.
+    chunks_handler.update_chunk_metadata.assert_awaited_once_with(
+        [(outro["id"], {"chunk_order": 3})]
+    )
+
+
+@pytest.mark.asyncio
+async def test_diff_without_stored_chunks_embeds_everything(
+    ingestion_service, chunks_handler
+):
+    chunks_handler.list_document_chunks.return_value = {"results": []}
+    parsed = [new_chunk("Only", 0)]
+
+    to_embed, removed = await ingestion_service.diff_document_chunks(
+        uuid.uuid4(), parsed
+    )
+
+    assert to_embed == parsed
+    assert removed == []
+    chunks_handler.update_chunk_metadata.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_diff_refreshes_metadata_of_kept_chunks(
+    ingestion_service, chunks_handler
+):
+    kept = stored_chunk("Same text", 0)
+    kept["metadata"].update(version="v0", title="Old title", tags=["a"])
+    chunks_handler.list_document_chunks.return_value = {"results": [kept]}
+    parsed = new_chunk("Same text", 0)
+    parsed["metadata"].update(version="v1", title="New title", tags=["a"])
+
+    to_embed, removed = await ingestion_service.diff_document_chunks(
+        uuid.uuid4(), [parsed]
+    )
+
+    assert to_embed == []
+    assert removed == []
+    chunks_handler.update_chunk_metadata.assert_awaited_once_with(
+        [
+            (
+                kept["id"],
+                {
+                    "chunk_order": 0,
+                    "version": "v1",
+                    "title": "New title",
+                    "tags": ["a"],
+                },
+            )
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_diff_edit_in_place_gets_a_new_id(
+    ingestion_service, chunks_handler
+):
+    document_id = uuid.uuid4()
+    stored = as_stored(chunker_output(document_id, ["Intro", "Old body"]))
+    chunks_handler.list_document_chunks.return_value = {"results": stored}
+
+    to_embed, removed = await ingestion_service.diff_document_chunks(
+        document_id, chunker_output(document_id, ["Intro", "New body"])
+    )
+
+    assert [c["data"] for c in to_embed] == ["New body"]
+    # Deleting the old body must not delete the upserted new one.
+    assert removed == [stored[1]["id"]]
+    assert to_embed[0]["id"] not in {c["id"] for c in stored}
+
+
+@pytest.mark.asyncio
+async def test_diff_inserted_paragraph_keeps_later_chunks(
+    ingestion_service, chunks_handler
+):
+    document_id = uuid.uuid4()
+    stored = as_stored(chunker_output(document_id, ["Intro", "Body", "Outro"]))
+    chunks_handler.list_document_chunks.return_value = {"results": stored}
+    parsed = chunker_output(
+        document_id,
+        ["Intro", "New paragraph", "Other paragraph", "Body", "Outro"],
+    )
+
+    to_embed, removed = await ingestion_service.diff_document_chunks(
+        document_id, parsed
+    )
+
+    assert [c["data"] for c in to_embed] == [
+        "New paragraph",
+        "Other paragraph",
+    ]
+    assert removed == []
+    new_ids = [c["id"] for c in to_embed]
+    # Upserting the new chunks must not overwrite the kept, shifted ones.
+    assert not set(new_ids) & {c["id"] for c in stored}
+    assert len(set(new_ids)) == len(new_ids)
+    chunks_handler.update_chunk_metadata.assert_awaited_once_with(
+        [
+            (stored[1]["id"], {"chunk_order": 3}),
+            (stored[2]["id"], {"chunk_order": 4}),
+        ]
+    )
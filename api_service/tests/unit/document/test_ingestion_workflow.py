@@ -0,0 +1,216 @@
+"""
+Unit tests for the streaming `ingest_files` pipeline of the simple
+orchestration: the `prefetch` queue, the summary started mid-stream, the
+incremental path, and cleanup when a step fails or the consumer stops early.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from core.base import DocumentChunk, IngestionStatus
+from core.main import IngestionServiceAdapter
+from core.main.orchestration.simple.ingestion_workflow import (
+    prefetch,
+    simple_ingestion_factory,
+)
+from core.main.services.ingestion_service import IngestionService
+
+
+class Source:
+    """Async generator wrapper that records how far it was consumed."""
+
+    def __init__(self, items, fail_at=None):
+        self.items = items
+        self.fail_at = fail_at
+        self.produced = 0
+        self.closed = False
+
+    async def __call__(self, *args, **kwargs):
+        try:
+            for index, item in enumerate(self.items):
+                if index == self.fail_at:
+                    raise RuntimeError("parser failed")
+                self.produced += 1
+                yield item
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_prefetch_yields_in_order_and_propagates_errors():
+    assert [item async for item in prefetch(Source([1, 2, 3])(), 2)] == [
+        1,
+        2,
+        3,
+    ]
+
+    source = Source([1, 2, 3], fail_at=2)
+    received = []
+    with pytest.raises(RuntimeError, match="parser failed"):
+        async for item in prefetch(source(), 2):
+            received.append(item)
+    assert received == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_early_exit_closes_source():
+    source = Source(list(range(100)))
+    stream = prefetch(source(), 2)
+
+    assert await stream.__anext__() == 0
+    await stream.aclose()
+
+    assert source.closed
+    # Bounded read-ahead: the producer stopped at the queue limit.
+    assert source.produced <= 4
+
+
+def make_chunks(count):
+    document_id, owner_id = uuid.uuid4(), uuid.uuid4()
+    return [
+        DocumentChunk(
+            id=uuid.uuid4(),
+            document_id=document_id,
+            owner_id=owner_id,
+            collection_ids=[],
+            data=f"chunk {i}",
+            metadata={"chunk_order": i},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(
+        IngestionServiceAdapter,
+        "parse_ingest_file_input",
+        staticmethod(
+            lambda data: {
+                "document_id": uuid.uuid4(),
+                "user": MagicMock(),
+                "file_data": {"filename": "doc.txt"},
+                "metadata": {},
+                "version": "v0",
+                "size_in_bytes": 10,
+                "ingestion_config": data["ingestion_config"],
+                "collection_ids": [],
+            }
+        ),
+    )
+    providers = MagicMock()
+    providers.database = AsyncMock()
+    providers.ingestion.config = SimpleNamespace(automatic_extraction=False)
+    config = MagicMock()
+    config.ingestion.chunks_for_document_summary = 2
+    service = IngestionService(config=config, providers=providers)
+
+    service.create_document_info_from_file = MagicMock(
+        return_value=SimpleNamespace(
+            id=uuid.uuid4(), owner_id=uuid.uuid4(), total_tokens=0
+        )
+    )
+    service.update_document_status = AsyncMock()
+    service.augment_document_info = AsyncMock()
+    service.finalize_ingestion = AsyncMock()
+    service.delete_chunks = AsyncMock()
+    service.stored = []
+
+    async def store_embeddings(entries):
+        async for entry in entries:
+            service.stored.append(entry)
+        yield "stored"
+
+    service.store_embeddings = store_embeddings
+    return service
+
+
+def statuses(service):
+    return [
+        call.kwargs.get("status")
+        for call in service.update_document_status.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ingest_files_streams_chunks_and_summarizes(service):
+    chunks = make_chunks(5)
+    service.parse_file = Source(chunks)
+
+    async def get_embeddings(texts):
+        return [[0.0] for _ in texts]
+
+    service.providers.embedding.async_get_embeddings = get_embeddings
+
+    await simple_ingestion_factory(service)["ingest-files"](
+        {"ingestion_config": {}}
+    )
+
+    assert sorted(entry.id for entry in service.stored) == sorted(
+        chunk.id for chunk in chunks
+    )
+    summary_chunks = service.augment_document_info.await_args.args[1]
+    assert summary_chunks == [{"data": "chunk 0"}, {"data": "chunk 1"}]
+    assert statuses(service)[-1] == IngestionStatus.SUCCESS
+    service.delete_chunks.assert_awaited_once_with([])
+
+
+@pytest.mark.asyncio
+async def test_incremental_ingest_embeds_only_the_diff(service):
+    chunks = make_chunks(3)
+    service.parse_file = Source(chunks)
+    removed = [uuid.uuid4()]
+    service.diff_document_chunks = AsyncMock(
+        return_value=(chunks[1:], removed)
+    )
+
+    async def get_embeddings(texts):
+        return [[0.0] for _ in texts]
+
+    service.providers.embedding.async_get_embeddings = get_embeddings
+
+    await simple_ingestion_factory(service)["ingest-files"](
+        {"ingestion_config": {"incremental_update": True}}
+    )
+
+    assert [entry.id for entry in service.stored] == [
+        chunk.id for chunk in chunks[1:]
+    ]
+    service.delete_chunks.assert_awaited_once_with(removed)
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_stops_the_pipeline(service):
+    source = Source(make_chunks(200))
+    service.parse_file = source
+    started = []
+
+    async def get_embeddings(texts):
+        started.append(texts)
+        if len(started) == 2:
+            raise RuntimeError("embedding provider down")
+        await asyncio.sleep(10)
+
+    service.providers.embedding.async_get_embeddings = get_embeddings
+
+    with pytest.raises(HTTPException):
+        await simple_ingestion_factory(service)["ingest-files"](
+            {"ingestion_config": {}}
+        )
+
+    assert source.closed
+    assert source.produced < 200
+    await asyncio.sleep(0)
+    pending = [
+        task
+        for task in asyncio.all_tasks()
+        if task is not asyncio.current_task()
+    ]
+    assert pending == []
+    assert statuses(service)[-1] == IngestionStatus.FAILED
+    service.finalize_ingestion.assert_not_awaited()
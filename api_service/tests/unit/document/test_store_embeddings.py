@@ -0,0 +1,110 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.base import Vector, VectorEntry, VectorType
+from core.main.services.ingestion_service import IngestionService
+
+
+def make_entries(owner_id, count):
+    document_id = uuid.uuid4()
+    return [
+        VectorEntry(
+            id=uuid.uuid4(),
+            document_id=document_id,
+            owner_id=owner_id,
+            collection_ids=[],
+            vector=Vector(data=[0.1, 0.2], type=VectorType.FIXED),
+            text=f"chunk {i}",
+            metadata={},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def database():
+    database = MagicMock()
+    database.config.app.default_max_chunks_per_user = 5
+    database.users_handler.get_user_by_id = AsyncMock(
+        return_value=MagicMock(limits_overrides=None)
+    )
+    database.chunks_handler.count_owner_chunks = AsyncMock(return_value=1)
+    database.chunks_handler.upsert_entries = AsyncMock()
+    return database
+
+
+@pytest.fixture
+def ingestion_service(database):
+    providers = MagicMock()
+    providers.database = database
+    return IngestionService(config=MagicMock(), providers=providers)
+
+
+@pytest.mark.asyncio
+async def test_quota_is_resolved_once_per_owner(ingestion_service, database):
+    owner_id = uuid.uuid4()
+    entries = make_entries(owner_id, 6)
+
+    async def stream():
+        for entry in entries:
+            yield entry
+
+    messages = [
+        msg
+        async for msg in ingestion_service.store_embeddings(
+            stream(), storage_batch_size=2
+        )
+    ]
+
+    database.users_handler.get_user_by_id.assert_awaited_once_with(owner_id)
+    database.chunks_handler.count_owner_chunks.assert_awaited_once_with(
+        owner_id
+    )
+    # One chunk is already stored, so only four of the six fit the limit.
+    stored = [
+        entry
+        for call in database.chunks_handler.upsert_entries.await_args_list
+        for entry in call.args[0]
+    ]
+    assert stored == entries[:4]
+    assert [
+        len(c.args[0])
+        for c in database.chunks_handler.upsert_entries.await_args_list
+    ] == [2, 2]
+    assert sum("exceeded" in msg for msg in messages) == 2
+
+
+@pytest.mark.asyncio
+async def test_accepts_sequences_of_dicts(ingestion_service, database):
+    entries = make_entries(uuid.uuid4(), 3)
+
+    messages = [
+        msg
+        async for msg in ingestion_service.store_embeddings(
+            [entry.to_dict() for entry in entries]
+        )
+    ]
+
+    database.chunks_handler.upsert_entries.assert_awaited_once()
+    assert messages[-1].endswith("with vector count: 3")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("counts_enabled", [True, False])
+async def test_owner_chunk_count_source(counts_enabled):
+    from core.providers.database.chunks import PostgresChunksHandler
+
+    handler = PostgresChunksHandler.__new__(PostgresChunksHandler)
+    handler.project_name = "test"
+    handler.owner_counts_enabled = counts_enabled
+    handler.connection_manager = MagicMock()
+    handler.connection_manager.fetchrow_query = AsyncMock(
+        return_value={"count": 7}
+    )
+
+    assert await handler.count_owner_chunks(uuid.uuid4()) == 7
+    query = handler.connection_manager.fetchrow_query.await_args.args[0]
+    assert ("test.owner_chunk_counts" in query) is counts_enabled
+    assert ("COUNT(*)" in query) is not counts_enabled
@@ -0,0 +1,55 @@
+import asyncio
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.base import DocumentChunk
+from core.main.services.ingestion_service import IngestionService
+
+
+def make_chunk(text):
+    return DocumentChunk(
+        id=uuid.uuid4(),
+        document_id=uuid.uuid4(),
+        owner_id=uuid.uuid4(),
+        collection_ids=[],
+        data=text,
+        metadata={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_embed_document_bounds_pending_batches():
+    in_flight = 0
+    peak = 0
+
+    async def get_embeddings(texts):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[float(len(text))] for text in texts]
+
+    providers = MagicMock()
+    providers.embedding.async_get_embeddings = get_embeddings
+    service = IngestionService(config=MagicMock(), providers=providers)
+
+    chunks = [make_chunk(f"chunk {i}") for i in range(20)]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    entries = [
+        entry
+        async for entry in service.embed_document(
+            stream(), embedding_batch_size=2, max_pending_batches=2
+        )
+    ]
+
+    assert sorted(entry.id for entry in entries) == sorted(
+        chunk.id for chunk in chunks
+    )
+    assert peak <= 2
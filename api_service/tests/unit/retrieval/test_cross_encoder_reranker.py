@@ -0,0 +1,175 @@
+"""
+Unit tests for the local ONNX cross-encoder reranker.
+
+The model is a tiny randomly-initialized graph (embedding lookup, mean pool,
+linear head) built on the fly, so these tests exercise batching, caching and
+candidate capping without downloading real weights.
+"""
+
+import asyncio
+import uuid
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+onnxruntime = pytest.importorskip("onnxruntime")
+tokenizers = pytest.importorskip("tokenizers")
+
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from core.base import ChunkSearchResult  # noqa: E402
+from core.providers.embeddings.cross_encoder import (  # noqa: E402
+    CrossEncoderReranker,
+    is_local_rerank_model,
+)
+
+VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]"] + [
+    "aristotle",
+    "ethics",
+    "virtue",
+    "plato",
+    "cats",
+    "dogs",
+    "weather",
+    "rain",
+]
+
+
+@pytest.fixture(scope="module")
+def tiny_model_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tiny_cross_encoder")
+    rng = np.random.default_rng(0)
+    hidden = 8
+
+    embeddings = numpy_helper.from_array(
+        rng.normal(size=(len(VOCAB), hidden)).astype(np.float32), "emb"
+    )
+    head = numpy_helper.from_array(
+        rng.normal(size=(hidden, 1)).astype(np.float32), "head"
+    )
+    graph = helper.make_graph(
+        [
+            helper.make_node("Gather", ["emb", "input_ids"], ["tokens"]),
+            helper.make_node(
+                "ReduceMean", ["tokens"], ["pooled"], axes=[1], keepdims=0
+            ),
+            helper.make_node("MatMul", ["pooled", "head"], ["logits"]),
+        ],
+        "tiny_cross_encoder",
+        [
+            helper.make_tensor_value_info(
+                "input_ids", TensorProto.INT64, ["batch", "seq"]
+            ),
+            helper.make_tensor_value_info(
+                "attention_mask", TensorProto.INT64, ["batch", "seq"]
+            ),
+        ],
+        [helper.make_tensor_value_info("logits", TensorProto.FLOAT, None)],
+        initializer=[embeddings, head],
+    )
+    model = helper.make_model(
+        graph, opset_imports=[helper.make_opsetid("", 13)]
+    )
+    model.ir_version = 8
+    onnx.save(model, str(path / "model.onnx"))
+
+    tokenizer = tokenizers.Tokenizer(
+        tokenizers.models.WordLevel(
+            {token: idx for idx, token in enumerate(VOCAB)}, unk_token="[UNK]"
+        )
+    )
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer.post_processor = tokenizers.processors.TemplateProcessing(
+        single="[CLS] $A [SEP]",
+        pair="[CLS] $A [SEP] $B:1 [SEP]:1",
+        special_tokens=[("[CLS]", 2), ("[SEP]", 3)],
+    )
+    tokenizer.save(str(path / "tokenizer.json"))
+    return path
+
+
+@pytest.fixture
+def reranker(tiny_model_dir):
+    return CrossEncoderReranker.from_pretrained(
+        str(tiny_model_dir), max_candidates=4, batch_size=16
+    )
+
+
+def make_results(texts):
+    return [
+        ChunkSearchResult(
+            id=uuid.uuid4(),
+            document_id=uuid.uuid4(),
+            owner_id=None,
+            collection_ids=[],
+            score=0.0,
+            text=text,
+            metadata={},
+        )
+        for text in texts
+    ]
+
+
+def test_local_rerank_model_prefix():
+    assert is_local_rerank_model("local/models/ms-marco")
+    assert not is_local_rerank_model("huggingface/BAAI/bge-reranker")
+    assert not is_local_rerank_model(None)
+
+
+def test_rerank_orders_by_score_and_caps_candidates(reranker):
+    results = make_results(
+        ["aristotle ethics", "cats dogs", "virtue", "rain", "plato", "weather"]
+    )
+
+    reranked = reranker.rerank("aristotle virtue", results, limit=6)
+
+    scored = reranked[:4]
+    assert [r.score for r in scored] == sorted(
+        [r.score for r in scored], reverse=True
+    )
+    assert all(0.0 <= r.score <= 1.0 for r in scored)
+    # Results past `max_candidates` are not scored and keep their order.
+    assert [r.id for r in reranked[4:]] == [results[4].id, results[5].id]
+    # The inputs are not mutated.
+    assert all(r.score == 0.0 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_micro_batched(reranker, monkeypatch):
+    calls = []
+    score_pairs = reranker.score_pairs
+
+    def counting_score_pairs(pairs):
+        calls.append(len(pairs))
+        return score_pairs(pairs)
+
+    monkeypatch.setattr(reranker, "score_pairs", counting_score_pairs)
+    reranker.batch_wait = 0.05
+
+    queries = ["aristotle", "cats", "rain"]
+    outputs = await asyncio.gather(
+        *[
+            reranker.arerank(q, make_results(["ethics", "dogs"]), limit=2)
+            for q in queries
+        ]
+    )
+
+    assert calls == [6]
+    assert all(len(out) == 2 for out in outputs)
+
+
+@pytest.mark.asyncio
+async def test_scores_are_cached_by_query_and_chunk(reranker, monkeypatch):
+    results = make_results(["aristotle ethics", "cats dogs"])
+    first = await reranker.arerank("virtue", results, limit=2)
+
+    def fail(pairs):
+        raise AssertionError("cached scores should skip inference")
+
+    monkeypatch.setattr(reranker, "score_pairs", fail)
+    second = await reranker.arerank("virtue", results, limit=2)
+
+    assert [(r.id, r.score) for r in first] == [
+        (r.id, r.score) for r in second
+    ]
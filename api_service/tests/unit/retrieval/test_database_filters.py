@@ -21,7 +21,10 @@ from core.providers.database.filters import (
     _build_collection_ids_condition,
     _build_metadata_condition,
     _build_metadata_operator_condition,
+    _compile_filters,
+    _filter_plans,
 )
+from core.base.providers.database import PromotedMetadataKey
 
 # Define test constants
 UUID1 = str(uuid.uuid4())
@@ -600,3 +603,133 @@ class TestApplyFiltersApi:
          accessor = f"{self.json_column}->>'priority'"; priority_condition = self._expected_safe_compare_sql(accessor, '>=', '$3', 'numeric')
          expected_sql = ( f"(status!=$1) AND ({tags_condition}) AND (({priority_condition}) OR (owner_id = $4))" )
          assert sql.replace(" ", "") == expected_sql.replace(" ", ""); assert params == ["archived", json.dumps(["urgent"]), 5, UUID1]
+
+
+class TestPromotedColumns:
+    promoted = {
+        "access_level": PromotedMetadataKey(key="access_level", partial_vector_indexes=["student"]),
+        "annotation_tags": PromotedMetadataKey(key="annotation_tags", type="text[]"),
+    }
+
+    def _apply(self, filters):
+        return apply_filters(filters, [], mode="condition_only", promoted_columns=self.promoted)
+
+    def test_eq_uses_column(self):
+        sql, params = self._apply({"access_level": "admin"})
+        assert sql == "meta_access_level = $1"
+        assert params == ["admin"]
+    def test_eq_partial_index_value_is_inlined(self):
+        sql, params = self._apply({"metadata.access_level": {FilterOperator.EQ: "student"}})
+        assert sql == "meta_access_level = 'student'"
+        assert params == []
+    def test_in_and_nin_on_text_column(self):
+        sql, params = self._apply({"access_level": {FilterOperator.IN: ["a", "b"]}})
+        assert sql == "meta_access_level = ANY($1::text[])"
+        assert params == [["a", "b"]]
+        sql, params = self._apply({"access_level": {FilterOperator.NIN: ["a"]}})
+        assert sql == "NOT (meta_access_level = ANY($1::text[]))"
+        assert params == [["a"]]
+    def test_null_on_text_column(self):
+        sql, params = self._apply({"access_level": None})
+        assert sql == "meta_access_level IS NULL"
+        assert params == []
+    def test_array_column_operators(self):
+        sql, params = self._apply({"annotation_tags": {FilterOperator.IN: ["x"]}})
+        assert sql == "meta_annotation_tags && $1::text[]"
+        assert params == [["x"]]
+        sql, params = self._apply({"annotation_tags": {FilterOperator.ARRAY_CONTAINS: ["x", "y"]}})
+        assert sql == "meta_annotation_tags @> $1::text[]"
+        assert params == [["x", "y"]]
+    def test_unsupported_operator_falls_back_to_jsonb(self):
+        sql, params = self._apply({"access_level": {FilterOperator.GT: 3}})
+        assert "metadata->>'access_level'" in sql.replace(" ", "")
+        assert params == [3]
+        sql, params = self._apply({"annotation_tags": {FilterOperator.JSON_CONTAINS: ["x"]}})
+        assert sql.replace(" ", "") == "metadata->'annotation_tags'@>$1::jsonb"
+    def test_nested_path_is_not_promoted(self):
+        sql, params = self._apply({"metadata.access_level.sub": "x"})
+        assert "meta_access_level" not in sql
+    def test_mixed_with_standard_columns(self):
+        sql, params = self._apply({"access_level": "student", "document_id": UUID1})
+        assert sql == "(meta_access_level = 'student') AND (document_id = $1)"
+        assert params == [UUID1]
+
+
+class TestPromotedColumnsHandler:
+    def _handler(self, existing_columns):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from core.providers.database.chunks import PostgresChunksHandler
+
+        handler = PostgresChunksHandler.__new__(PostgresChunksHandler)
+        handler.project_name = "test"
+        handler.configured_promoted_columns = TestPromotedColumns.promoted
+        handler.promoted_columns = {}
+        handler.connection_manager = MagicMock()
+        handler.connection_manager.execute_query = AsyncMock()
+        handler.connection_manager.fetch_query = AsyncMock(side_effect=lambda query, params: (
+            [{"relname": "idx_vectors_meta_access_level"}] if "pg_index" in query
+            else [{"column_name": column} for column in existing_columns]))
+        conn = MagicMock(execute=AsyncMock())
+        handler.connection_manager.pool.get_connection.return_value.__aenter__ = AsyncMock(return_value=conn)
+        handler.connection_manager.pool.get_connection.return_value.__aexit__ = AsyncMock(return_value=False)
+        return handler, conn
+
+    @pytest.mark.asyncio
+    async def test_load_only_enables_existing_columns(self):
+        handler, _ = self._handler(["id", "meta_access_level"])
+        await handler.load_promoted_columns()
+        assert list(handler.promoted_columns) == ["access_level"]
+        handler.connection_manager.execute_query.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_create_builds_indexes_concurrently(self):
+        handler, conn = self._handler(["meta_access_level", "meta_annotation_tags"])
+        await handler.create_promoted_columns()
+        ddl = " ".join(c.args[0] for c in handler.connection_manager.execute_query.await_args_list)
+        assert "ADD COLUMN IF NOT EXISTS meta_annotation_tags TEXT[]" in ddl and "CREATE INDEX" not in ddl
+        index_sql = [c.args[0] for c in conn.execute.await_args_list]
+        assert index_sql[0] == "DROP INDEX CONCURRENTLY IF EXISTS test.idx_vectors_meta_access_level"
+        assert len(index_sql) == 4 and all("CREATE INDEX CONCURRENTLY IF NOT EXISTS" in sql for sql in index_sql[1:])
+        assert any("USING hnsw" in sql and "WHERE meta_access_level = 'student'" in sql for sql in index_sql)
+        assert set(handler.promoted_columns) == {"access_level", "annotation_tags"}
+
+
+class TestFilterPlanCache:
+    def setup_method(self):
+        _filter_plans.clear()
+
+    def _compile(self, filters, params=None):
+        return _compile_filters(filters, list(params or []), TEST_TOP_LEVEL_COLS, JSON_COLUMN, "where_clause", None)
+
+    def test_same_shape_reuses_plan_with_new_values(self):
+        def shape(owner, ids, n):
+            return {"owner_id": owner, "collection_ids": {FilterOperator.OVERLAP: ids}, "metadata.n": {FilterOperator.GT: n}}
+
+        first = apply_filters(shape(UUID1, [UUID2], 1), [])
+        second = apply_filters(shape(UUID3, [UUID1.upper()], 7), [])
+        assert len(_filter_plans) == 1
+        assert first[0] == second[0]
+        assert second == self._compile(shape(UUID3, [UUID1.upper()], 7))
+        assert second[1] == [UUID3, UUID1, 7]
+    def test_value_dependent_sql_gets_its_own_plan(self):
+        assert apply_filters({"metadata.flag": True}, [])[1] == [True]
+        assert apply_filters({"metadata.flag": False}, [])[1] == [False]
+        assert apply_filters({"collection_ids": [UUID1, UUID2]}, [])[1] == [UUID1, UUID2]
+        assert apply_filters({"collection_ids": []}, []) == ("WHERE FALSE", [])
+        assert len(_filter_plans) == 4
+    def test_existing_params_are_kept(self):
+        for value in ("a", "b"):
+            sql, params = apply_filters({"status": value}, ["vector"])
+            assert sql == "WHERE status = $2"
+            assert params == ["vector", value]
+    def test_invalid_uuid_still_rejected_on_cached_plan(self):
+        apply_filters({"collection_ids": [UUID1]}, [])
+        with pytest.raises(FilterError):
+            apply_filters({"collection_ids": ["not-a-uuid"]}, [])
+    def test_inlined_partial_index_value_is_part_of_shape(self):
+        promoted = TestPromotedColumns.promoted
+        student = apply_filters({"access_level": "student"}, [], promoted_columns=promoted)
+        admin = apply_filters({"access_level": "admin"}, [], promoted_columns=promoted)
+        assert student == ("WHERE meta_access_level = 'student'", [])
+        assert admin == ("WHERE meta_access_level = $1", ["admin"])
@@ -0,0 +1,104 @@
+"""
+Unit tests for RetrievalService.get_context and the cached document-context
+block of the agent system prompt.
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.base import IngestionStatus
+from core.main.services.retrieval_service import RetrievalService
+
+
+def make_document(**kwargs):
+    document = MagicMock()
+    document.id = kwargs.get("id", uuid4())
+    document.title = kwargs.get("title", "Doc")
+    document.summary = kwargs.get("summary", "A summary")
+    document.ingestion_status = IngestionStatus.SUCCESS
+    document.total_tokens = 10
+    document.model_dump = lambda: {
+        "id": document.id,
+        "chunks": document.chunks,
+    }
+    return document
+
+
+@pytest.fixture
+def service():
+    documents = [make_document(), make_document()]
+    providers = MagicMock()
+    documents_handler = providers.database.documents_handler
+    documents_handler.generation = 0
+    documents_handler.get_documents_overview = AsyncMock(
+        return_value={"results": documents}
+    )
+    providers.database.chunks_handler.list_chunks_for_documents = AsyncMock(
+        return_value={documents[0].id: [{"text": "a"}, {"text": "b"}]}
+    )
+
+    service = RetrievalService.__new__(RetrievalService)
+    service.providers = providers
+    service.config = SimpleNamespace(
+        agent=SimpleNamespace(
+            document_context_cache_ttl=60, document_context_cache_size=2
+        )
+    )
+    service._documents_context_cache = OrderedDict()
+    service.documents = documents
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_context_fetches_chunks_in_one_query(service):
+    results = await service.get_context(
+        filters={}, options={"chunks_per_document": 2}
+    )
+
+    chunks_handler = service.providers.database.chunks_handler
+    chunks_handler.list_chunks_for_documents.assert_awaited_once_with(
+        document_ids=[doc.id for doc in service.documents],
+        limit_per_document=2,
+        include_vectors=False,
+    )
+    assert [len(r["chunks"]) for r in results] == [2, 0]
+
+
+@pytest.mark.asyncio
+async def test_documents_context_is_cached_per_user(service):
+    user_id = uuid4()
+    overview = (
+        service.providers.database.documents_handler.get_documents_overview
+    )
+
+    first = await service._build_documents_context(filter_user_id=user_id)
+    second = await service._build_documents_context(filter_user_id=user_id)
+    await service._build_documents_context(filter_user_id=uuid4())
+
+    assert first == second
+    assert "Title: Doc" in first
+    assert overview.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_documents_context_is_invalidated_by_document_writes(service):
+    user_id = uuid4()
+    documents_handler = service.providers.database.documents_handler
+
+    await service._build_documents_context(filter_user_id=user_id)
+    documents_handler.generation += 1
+    await service._build_documents_context(filter_user_id=user_id)
+
+    assert documents_handler.get_documents_overview.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_documents_context_cache_is_bounded(service):
+    for _ in range(3):
+        await service._build_documents_context(filter_user_id=uuid4())
+
+    assert len(service._documents_context_cache) == 2
@@ -0,0 +1,134 @@
+"""
+Unit tests for coalescing concurrent single-text embedding requests.
+"""
+
+import asyncio
+
+import pytest
+
+from core.base.providers.embedding import (
+    EmbeddingProvider,
+    EmbeddingRequestCoalescer,
+)
+
+STAGE = EmbeddingProvider.Step.BASE
+
+
+def make_task(text, **kwargs):
+    return {"texts": [text], "stage": STAGE, "kwargs": kwargs}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    calls = []
+
+    async def execute(task):
+        calls.append(task["texts"])
+        return [[float(len(text))] for text in task["texts"]]
+
+    coalescer = EmbeddingRequestCoalescer(execute, max_batch_size=8)
+    texts = ["a", "bb", "ccc", "bb"]
+    results = await asyncio.gather(
+        *[coalescer.submit(make_task(text)) for text in texts]
+    )
+
+    assert results == [[1.0], [2.0], [3.0], [2.0]]
+    # Duplicate texts within a batch are only embedded once.
+    assert calls == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_and_split_by_kwargs():
+    calls = []
+
+    async def execute(task):
+        calls.append((task["kwargs"].get("model"), len(task["texts"])))
+        return [[0.0] for _ in task["texts"]]
+
+    coalescer = EmbeddingRequestCoalescer(execute, max_batch_size=2)
+    await asyncio.gather(
+        *[coalescer.submit(make_task(str(i))) for i in range(3)],
+        coalescer.submit(make_task("x", model="other")),
+    )
+
+    assert sorted(calls, key=str) == sorted(
+        [(None, 2), (None, 1), ("other", 1)], key=str
+    )
+
+
+@pytest.mark.asyncio
+async def test_failures_propagate_to_every_caller():
+    async def execute(task):
+        raise RuntimeError("provider down")
+
+    coalescer = EmbeddingRequestCoalescer(execute)
+    results = await asyncio.gather(
+        coalescer.submit(make_task("a")),
+        coalescer.submit(make_task("b")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_short_provider_response_fails_every_caller():
+    async def execute(task):
+        return [[0.0]]
+
+    coalescer = EmbeddingRequestCoalescer(execute)
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            coalescer.submit(make_task("a")),
+            coalescer.submit(make_task("b")),
+            return_exceptions=True,
+        ),
+        1,
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_slow_batch_does_not_delay_the_next_one():
+    release = asyncio.Event()
+
+    async def execute(task):
+        if task["texts"] == ["slow"]:
+            await release.wait()
+            raise RuntimeError("provider timed out")
+        return [[1.0] for _ in task["texts"]]
+
+    coalescer = EmbeddingRequestCoalescer(execute, max_batch_size=1)
+    slow = asyncio.ensure_future(coalescer.submit(make_task("slow")))
+    await asyncio.sleep(0.01)
+
+    assert await asyncio.wait_for(coalescer.submit(make_task("fast")), 1) == [
+        1.0
+    ]
+    assert not slow.done()
+    release.set()
+    with pytest.raises(RuntimeError):
+        await slow
+
+
+@pytest.mark.asyncio
+async def test_in_flight_batches_are_bounded():
+    in_flight = peak = 0
+
+    async def execute(task):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[0.0] for _ in task["texts"]]
+
+    coalescer = EmbeddingRequestCoalescer(
+        execute, max_batch_size=1, max_concurrent_batches=2
+    )
+    await asyncio.gather(
+        *[coalescer.submit(make_task(str(i))) for i in range(6)]
+    )
+
+    assert peak == 2
@@ -0,0 +1,116 @@
+"""
+Unit tests for the row-based hybrid search fusion in PostgresChunksHandler
+and the rag-fusion RRF in RetrievalService.
+"""
+
+import json
+import math
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.base import (
+    ChunkSearchResult,
+    SearchSettings,
+    VectorQuantizationType,
+)
+from core.providers.database.chunks import PostgresChunksHandler
+
+A, B, C, D = (uuid4() for _ in range(4))
+
+
+def make_row(chunk_id, **kwargs):
+    return {
+        "id": chunk_id,
+        "document_id": uuid4(),
+        "owner_id": uuid4(),
+        "collection_ids": [],
+        "text": f"text {chunk_id}",
+        "metadata": json.dumps({"name": str(chunk_id)}),
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def handler():
+    connection_manager = MagicMock()
+    connection_manager.fetch_query = AsyncMock(
+        side_effect=[
+            # Semantic search, then full-text search.
+            [
+                make_row(A, distance=0.1),
+                make_row(B, distance=0.2),
+                make_row(C, distance=0.3),
+            ],
+            [make_row(C, rank=0.9), make_row(D, rank=0.5)],
+        ]
+    )
+    return PostgresChunksHandler(
+        project_name="test",
+        connection_manager=connection_manager,
+        dimension=2,
+        quantization_type=VectorQuantizationType.FP32,
+    )
+
+
+def rrf(semantic_rank, full_text_rank, k=50, semantic_weight=5.0):
+    return (
+        semantic_weight / (k + semantic_rank) + 1.0 / (k + full_text_rank)
+    ) / (semantic_weight + 1.0)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_rows_by_rank(handler):
+    settings = SearchSettings(limit=4, include_scores=True)
+    settings.hybrid_settings.full_text_limit = 4
+
+    results = await handler.hybrid_search("query", [0.1, 0.2], settings)
+
+    assert all(isinstance(r, ChunkSearchResult) for r in results)
+    assert [r.id for r in results] == [A, B, C, D]
+    ranks = [
+        (r.metadata["semantic_rank"], r.metadata["full_text_rank"])
+        for r in results
+    ]
+    assert ranks == [(1, 4), (2, 4), (3, 1), (4, 2)]
+    for result, (semantic_rank, full_text_rank) in zip(
+        results, ranks, strict=True
+    ):
+        assert math.isclose(result.score, rrf(semantic_rank, full_text_rank))
+    assert results[3].metadata["name"] == str(D)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_applies_offset_after_fusion(handler):
+    settings = SearchSettings(limit=2, offset=1)
+    settings.hybrid_settings.full_text_limit = 4
+
+    results = await handler.hybrid_search("query", [0.1, 0.2], settings)
+
+    # Full-text-only rows get `limit` as their semantic rank, so with a
+    # limit of 2 D (2, 2) outranks B (2, 4): fused order is A, D, B, C.
+    assert [r.id for r in results] == [D, B]
+
+
+def test_rag_fusion_rrf_sums_ranks_across_sub_queries():
+    from core.main.services.retrieval_service import RetrievalService
+
+    def chunk(chunk_id):
+        return ChunkSearchResult(
+            id=chunk_id,
+            document_id=uuid4(),
+            owner_id=None,
+            collection_ids=[],
+            text="",
+            metadata={},
+        )
+
+    service = RetrievalService.__new__(RetrievalService)
+    fused = service._reciprocal_rank_fusion_chunks(
+        [[chunk(A), chunk(B)], [chunk(B), chunk(C)], []], k=60.0
+    )
+
+    assert [c.id for c in fused] == [B, A, C]
+    assert math.isclose(fused[0].score, 1 / 61 + 1 / 62)
+    assert service._reciprocal_rank_fusion_chunks([[], []]) == []
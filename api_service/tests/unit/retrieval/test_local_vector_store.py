@@ -0,0 +1,196 @@
+"""
+Unit tests for the memory-mapped local FAISS vector store used for
+offline search: R2R-shaped results, bitmap and residual filters, the delta
+segment and compaction.
+"""
+
+import json
+import zlib
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from infra.local_vector_store import LocalVectorStore  # noqa: E402
+
+DIMENSION = 8
+
+
+def fake_embed(texts):
+    """Deterministic embeddings: each text maps to a random vector seeded by it."""
+    return [
+        np.random.default_rng(zlib.crc32(text.encode()))
+        .normal(size=DIMENSION)
+        .tolist()
+        for text in texts
+    ]
+
+
+def make_chunks(count, offset=0):
+    return [
+        {
+            "id": f"c{i}",
+            "document_id": f"doc{i % 3}",
+            "text": f"chunk {i}",
+            "metadata": {
+                "role": "professor" if i % 4 == 0 else "aluno",
+                "access_level": "student" if i % 2 else "admin",
+                "source": "gdrive" if i % 5 else "youtube",
+            },
+        }
+        for i in range(offset, offset + count)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalVectorStore.build(
+        str(tmp_path / "store"), make_chunks(40), embed_fn=fake_embed
+    )
+
+
+def test_search_returns_r2r_shaped_results(store):
+    response = store.search("chunk 7", limit=3)
+
+    assert response["success"] is True
+    assert len(response["results"]) == 3
+    top = response["results"][0]
+    assert top["text"] == "chunk 7"
+    assert top["metadata"]["chunk_id"] == "c7"
+    assert top["metadata"]["document_id"] == "doc1"
+    assert top["similarity"] == pytest.approx(1.0, abs=1e-4)
+
+
+def test_bitmap_filters_still_fill_the_limit(store):
+    results = store.search(
+        "chunk 0", limit=10, filters={"access_level": "student"}
+    )["results"]
+
+    # Filtering inside the index still returns a full page of results.
+    assert len(results) == 10
+    assert all(r["metadata"]["access_level"] == "student" for r in results)
+
+
+def test_combined_bitmap_and_residual_filters(store):
+    filters = {"role": {"$in": ["aluno"]}, "source": {"$ne": "youtube"}}
+    results = store.search("chunk 3", limit=40, filters=filters)["results"]
+
+    expected = {
+        c["id"]
+        for c in make_chunks(40)
+        if c["metadata"]["role"] == "aluno"
+        and c["metadata"]["source"] != "youtube"
+    }
+    assert {r["id"] for r in results} == expected
+
+
+def test_unknown_bitmap_value_returns_nothing(store):
+    assert (
+        store.search("chunk 1", filters={"role": "diretor"})["results"] == []
+    )
+
+
+def test_add_and_delete_survive_reload(store):
+    store.add(
+        make_chunks(2, offset=99),
+        vectors=fake_embed(["chunk 99", "chunk 100"]),
+    )
+    store.delete(chunk_ids=["c7"])
+    store.delete(document_id="doc2")
+
+    reloaded = LocalVectorStore(store.path, embed_fn=fake_embed)
+    ids = {r["id"] for r in reloaded.search("chunk 100", limit=50)["results"]}
+
+    assert {"c99", "c100"} <= ids
+    assert "c7" not in ids
+    assert not any(int(i[1:]) % 3 == 2 for i in ids)
+
+
+def test_add_replaces_existing_chunk(store):
+    store.add(
+        [
+            {
+                "id": "c5",
+                "document_id": "doc2",
+                "text": "novo texto",
+                "metadata": {"role": "aluno"},
+            }
+        ]
+    )
+
+    results = store.search("novo texto", limit=40)["results"]
+    assert [r["text"] for r in results if r["id"] == "c5"] == ["novo texto"]
+
+
+def test_search_does_not_modify_delta_metadata(store):
+    store.add(
+        [
+            {
+                "id": "c77",
+                "document_id": "doc7",
+                "text": "chunk 77",
+                "metadata": {"role": "aluno"},
+            }
+        ]
+    )
+
+    top = store.search("chunk 77", limit=1)["results"][0]
+    top["metadata"]["role"] = "alterado"
+
+    # Response fields stay on the result, not on the row persisted by save().
+    assert top["metadata"]["chunk_id"] == "c77"
+    assert store._delta_rows[-1]["metadata"] == {"role": "aluno"}
+    store.save()
+    reloaded = LocalVectorStore(store.path, embed_fn=fake_embed)
+    assert reloaded._delta_rows[-1]["metadata"] == {"role": "aluno"}
+
+
+def test_compact_folds_delta_and_tombstones(store):
+    store.add(make_chunks(3, offset=200))
+    store.delete(chunk_ids=["c1", "c2"])
+    store.compact()
+
+    assert store.count == 41
+    assert store._delta_rows == []
+    assert store._alive.all()
+    assert store.search("chunk 201", limit=1)["results"][0]["id"] == "c201"
+    assert store.search("chunk 1", limit=41, filters={"role": "professor"})[
+        "results"
+    ]
+
+
+def test_from_legacy_converts_flat_index(tmp_path):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    texts = [f"chunk {i}" for i in range(5)]
+    index = faiss.IndexFlatL2(DIMENSION)
+    index.add(np.array(fake_embed(texts), dtype="float32"))
+    faiss.write_index(index, str(legacy / "index.faiss"))
+    (legacy / "metadata.json").write_text(
+        json.dumps({"texts": texts, "metadata": [{"role": "aluno"}] * 5})
+    )
+
+    store = LocalVectorStore.from_legacy(
+        str(legacy), str(tmp_path / "store"), embed_fn=fake_embed
+    )
+
+    assert store.count == 5
+    assert (
+        store.search("chunk 3", limit=1, filters={"role": "aluno"})["results"][
+            0
+        ]["text"]
+        == "chunk 3"
+    )
+
+
+def test_ivfpq_falls_back_to_hnsw_for_small_stores(tmp_path):
+    store = LocalVectorStore.build(
+        str(tmp_path / "store"),
+        make_chunks(10),
+        embed_fn=fake_embed,
+        index_type="ivfpq",
+    )
+
+    assert isinstance(store.index, faiss.IndexHNSW)
+    assert store.search("chunk 4", limit=1)["results"][0]["id"] == "c4"
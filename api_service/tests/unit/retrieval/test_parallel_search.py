@@ -0,0 +1,106 @@
+"""
+Unit tests for the concurrent chunk/graph fan-out in RetrievalService.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.base import GraphSearchResultType, SearchSettings
+from core.main.services.retrieval_service import RetrievalService
+
+ENTITY_ID, RELATIONSHIP_ID, COMMUNITY_ID = uuid4(), uuid4(), uuid4()
+
+ROWS = {
+    "entities": [{"id": ENTITY_ID, "name": "Alice", "description": "person"}],
+    "relationships": [
+        {
+            "id": RELATIONSHIP_ID,
+            "subject": "Alice",
+            "predicate": "knows",
+            "object": "Bob",
+            "metadata": '{"source": "doc"}',
+        }
+    ],
+    "communities": [{"id": COMMUNITY_ID, "name": "Friends", "summary": "s"}],
+}
+
+
+class ConcurrencyProbe:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def run(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+@pytest.fixture
+def service():
+    probe = ConcurrencyProbe()
+
+    async def graph_search(query, **kwargs):
+        await probe.run()
+        for row in ROWS[kwargs["search_type"]]:
+            yield {**row, "similarity_score": 0.9}
+
+    async def semantic_search(*args, **kwargs):
+        await probe.run()
+        return []
+
+    providers = MagicMock()
+    providers.database.graphs_handler.graph_search = graph_search
+    providers.database.chunks_handler.semantic_search = semantic_search
+    providers.completion_embedding.async_get_embedding = AsyncMock(
+        return_value=[0.1, 0.2]
+    )
+    providers.completion_embedding.arerank = AsyncMock(return_value=[])
+
+    service = RetrievalService.__new__(RetrievalService)
+    service.providers = providers
+    service.probe = probe
+    return service
+
+
+@pytest.mark.asyncio
+async def test_graph_sub_searches_run_concurrently(service):
+    settings = SearchSettings(include_scores=True)
+
+    results = await service._graph_search_logic(
+        "who is alice", settings, precomputed_vector=[0.1, 0.2]
+    )
+
+    assert service.probe.peak == 3
+    assert [r.result_type for r in results] == [
+        GraphSearchResultType.ENTITY,
+        GraphSearchResultType.RELATIONSHIP,
+        GraphSearchResultType.COMMUNITY,
+    ]
+    assert [r.id for r in results] == [
+        ENTITY_ID,
+        RELATIONSHIP_ID,
+        COMMUNITY_ID,
+    ]
+    assert results[1].metadata == {
+        "source": "doc",
+        "associated_query": "who is alice",
+    }
+
+
+@pytest.mark.asyncio
+async def test_chunk_and_graph_legs_run_concurrently(service):
+    settings = SearchSettings(use_fulltext_search=False)
+
+    chunk_results, graph_results = await service._chunk_and_graph_search(
+        "who is alice", settings, precomputed_vector=[0.1, 0.2]
+    )
+
+    assert chunk_results == []
+    assert len(graph_results) == 3
+    # One chunk search plus three graph sub-searches in flight at once.
+    assert service.probe.peak == 4
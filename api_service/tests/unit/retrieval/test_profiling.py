@@ -0,0 +1,105 @@
+"""
+Unit tests for per-stage retrieval timings and the metrics exposition.
+"""
+
+import asyncio
+
+import pytest
+
+from core.utils.profiling import (
+    collect_timings,
+    stage_metrics,
+    stage_timer,
+    timed_stage,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    stage_metrics.reset()
+    yield
+    stage_metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_timings_are_collected_across_tasks():
+    @timed_stage("embedding")
+    async def embed():
+        await asyncio.sleep(0.01)
+
+    with collect_timings() as timings:
+        with stage_timer("search"):
+            await asyncio.gather(embed(), embed())
+
+    assert set(timings) == {"search", "embedding"}
+    # Concurrent stages are summed, so they may exceed the wall clock.
+    assert timings["embedding"] >= 20
+    assert timings["search"] >= 10
+
+
+def test_timings_are_not_collected_when_disabled():
+    with collect_timings(enabled=False) as timings:
+        with stage_timer("rerank"):
+            pass
+
+    assert timings is None
+    assert 'stage="rerank"' in stage_metrics.render()
+
+
+def test_render_prometheus_histogram():
+    stage_metrics.observe("llm", 0.2)
+    stage_metrics.observe("llm", 3.0)
+
+    rendered = stage_metrics.render()
+
+    assert "# TYPE r2r_stage_duration_seconds histogram" in rendered
+    assert (
+        'r2r_stage_duration_seconds_bucket{stage="llm",le="0.25"} 1'
+        in rendered
+    )
+    assert (
+        'r2r_stage_duration_seconds_bucket{stage="llm",le="+Inf"} 2'
+        in rendered
+    )
+    assert 'r2r_stage_duration_seconds_count{stage="llm"} 2' in rendered
+
+
+@pytest.mark.asyncio
+async def test_streaming_rag_is_timed_until_the_stream_ends():
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock
+
+    from core.base import AggregateSearchResult, GenerationConfig
+    from core.main.services.retrieval_service import RetrievalService
+
+    async def completion_stream(**kwargs):
+        for content, finish_reason in (("Hello", None), ("", "stop")):
+            yield SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        delta=SimpleNamespace(content=content),
+                        finish_reason=finish_reason,
+                    )
+                ]
+            )
+
+    service = RetrievalService.__new__(RetrievalService)
+    service.providers = MagicMock()
+    service.providers.database.prompts_handler.get_message_payload = AsyncMock(
+        return_value=[]
+    )
+    service.providers.llm.aget_completion_stream = completion_stream
+    service.search = AsyncMock(return_value=AggregateSearchResult())
+
+    stream = await service.rag(
+        "query", rag_generation_config=GenerationConfig(stream=True)
+    )
+    assert 'stage="rag"' not in stage_metrics.render()
+
+    lines = [line async for line in stream]
+
+    assert "search_results" in lines[0]
+    assert any("Hello" in line for line in lines)
+    assert 'r2r_stage_duration_seconds_count{stage="rag"} 1' in (
+        stage_metrics.render()
+    )
@@ -0,0 +1,108 @@
+"""
+Unit tests for the rerank candidate budget, the rerank skip for providers
+without a rerank model and the rerank score threshold in RetrievalService.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.base import ChunkSearchResult, SearchSettings
+from core.main.services.retrieval_service import RetrievalService
+
+
+def make_results(scores):
+    return [
+        ChunkSearchResult(
+            id=uuid4(),
+            document_id=uuid4(),
+            owner_id=None,
+            collection_ids=[],
+            score=score,
+            text=f"chunk {idx}",
+            metadata={},
+        )
+        for idx, score in enumerate(scores)
+    ]
+
+
+@pytest.fixture
+def service():
+    results = make_results([0.9, 0.8, 0.7, 0.3, 0.2, 0.1])
+
+    async def semantic_search(query_vector, search_settings):
+        return results[: search_settings.limit]
+
+    async def arerank(query, results, limit):
+        return list(reversed(results))[:limit]
+
+    providers = MagicMock()
+    providers.database.chunks_handler.semantic_search = AsyncMock(
+        side_effect=semantic_search
+    )
+    providers.completion_embedding.has_reranker = True
+    providers.completion_embedding.arerank = AsyncMock(side_effect=arerank)
+
+    service = RetrievalService.__new__(RetrievalService)
+    service.providers = providers
+    service.results = results
+    return service
+
+
+async def search(service, **chunk_settings):
+    settings = SearchSettings(limit=2, use_fulltext_search=False)
+    for key, value in chunk_settings.items():
+        setattr(settings.chunk_settings, key, value)
+    return await service._vector_search_logic(
+        "query", settings, precomputed_vector=[0.1]
+    )
+
+
+@pytest.mark.asyncio
+async def test_rerank_candidates_widen_retrieval_only(service):
+    results = await search(service, rerank_candidates=5)
+
+    semantic_search = service.providers.database.chunks_handler.semantic_search
+    assert semantic_search.await_args.kwargs["search_settings"].limit == 5
+    rerank_kwargs = service.providers.completion_embedding.arerank.await_args
+    assert len(rerank_kwargs.kwargs["results"]) == 5
+    assert rerank_kwargs.kwargs["limit"] == 2
+    assert [r.text for r in results] == ["chunk 4", "chunk 3"]
+
+
+@pytest.mark.asyncio
+async def test_rerank_is_skipped_without_rerank_model(service):
+    service.providers.completion_embedding.has_reranker = False
+
+    results = await search(service, rerank_candidates=5)
+
+    semantic_search = service.providers.database.chunks_handler.semantic_search
+    assert semantic_search.await_args.kwargs["search_settings"].limit == 2
+    service.providers.completion_embedding.arerank.assert_not_awaited()
+    assert [r.text for r in results] == ["chunk 0", "chunk 1"]
+
+
+@pytest.mark.asyncio
+async def test_score_threshold_limits_reranked_candidates(service):
+    results = await search(
+        service, rerank_candidates=6, rerank_score_threshold=0.5
+    )
+
+    rerank_kwargs = service.providers.completion_embedding.arerank.await_args
+    assert [r.score for r in rerank_kwargs.kwargs["results"]] == [
+        0.9,
+        0.8,
+        0.7,
+    ]
+    assert [r.text for r in results] == ["chunk 2", "chunk 1"]
+
+
+@pytest.mark.asyncio
+async def test_score_threshold_exits_early(service):
+    results = await search(
+        service, rerank_candidates=6, rerank_score_threshold=0.85
+    )
+
+    service.providers.completion_embedding.arerank.assert_not_awaited()
+    assert [r.text for r in results] == ["chunk 0", "chunk 1"]
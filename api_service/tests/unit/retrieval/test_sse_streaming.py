@@ -0,0 +1,176 @@
+"""
+Unit tests for streamed SSE output: pre-serialized delta events and the
+coalescing of events into frames (merging, compact format, frame size,
+backpressure, errors and closing the source stream).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from shared.utils.base_utils import (
+    SSEDelta,
+    SSEFormatter,
+    coalesce_sse_events,
+    format_sse_event,
+)
+
+
+def parse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.split("\n\n"):
+        if block:
+            event_line, data_line = block.split("\n")
+            events.append(
+                (
+                    event_line.removeprefix("event: "),
+                    json.loads(data_line.removeprefix("data: ")),
+                )
+            )
+    return events
+
+
+async def collect(frames) -> list[str]:
+    return [frame async for frame in frames]
+
+
+async def from_list(events):
+    for event in events:
+        yield event
+
+
+def test_delta_matches_full_envelope():
+    text = 'Aristotle said "hi"\n é'
+    payload = {
+        "id": "msg_1",
+        "object": "agent.message.delta",
+        "delta": {
+            "content": [
+                {
+                    "type": "text",
+                    "payload": {"value": text, "annotations": []},
+                }
+            ]
+        },
+    }
+
+    assert SSEFormatter.message_event(text, "msg_1") == format_sse_event(
+        "message", payload
+    )
+    thinking = SSEFormatter.thinking_event("hmm", "think_1")
+    assert parse_events(thinking)[0][1]["object"] == "agent.thinking.delta"
+    assert thinking.compact() == (
+        'event: thinking\ndata: {"id":"think_1","v":"hmm"}\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_consecutive_deltas_are_merged():
+    events = [
+        SSEFormatter.message_event("Hel", "msg_1"),
+        SSEFormatter.message_event("lo", "msg_2"),
+        SSEFormatter.thinking_event("...", "think_1"),
+        format_sse_event("citation", {"id": "cit_1"}),
+        SSEFormatter.message_event("!", "msg_3"),
+    ]
+
+    frames = await collect(coalesce_sse_events(from_list(events)))
+
+    assert parse_events("".join(frames)) == [
+        ("message", parse_events(SSEDelta("message", "msg_1", "Hello"))[0][1]),
+        ("thinking", parse_events(events[2])[0][1]),
+        ("citation", {"id": "cit_1"}),
+        ("message", parse_events(events[4])[0][1]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_compact_format_only_changes_deltas():
+    events = [
+        SSEFormatter.message_event("a", "msg_1"),
+        SSEFormatter.message_event("b", "msg_2"),
+        format_sse_event("done", "[DONE]"),
+    ]
+
+    frames = await collect(
+        coalesce_sse_events(from_list(events), compact=True)
+    )
+
+    assert "".join(frames) == (
+        'event: message\ndata: {"id":"msg_1","v":"ab"}\n\n'
+        'event: done\ndata: "[DONE]"\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_frame_is_sent_before_the_interval():
+    async def tokens():
+        for i in range(8):
+            yield SSEFormatter.message_event("x" * 100, f"msg_{i}")
+        await asyncio.sleep(60)
+
+    frames = coalesce_sse_events(
+        tokens(), flush_interval=60, max_frame_bytes=500
+    )
+    first = await asyncio.wait_for(frames.__anext__(), 1)
+    await frames.aclose()
+
+    assert len(parse_events(first)) == 1
+    assert len(first) >= 500
+
+
+@pytest.mark.asyncio
+async def test_slow_client_bounds_read_ahead():
+    produced = 0
+
+    async def tokens():
+        nonlocal produced
+        for i in range(1000):
+            produced += 1
+            yield format_sse_event("citation", {"id": i})
+
+    frames = coalesce_sse_events(
+        tokens(), flush_interval=0, max_frame_bytes=200
+    )
+    first = await frames.__anext__()
+    await asyncio.sleep(0.05)
+
+    assert produced < 20
+    rest = await collect(frames)
+    assert len(parse_events("".join([first, *rest]))) == 1000
+
+
+@pytest.mark.asyncio
+async def test_source_error_is_raised_after_pending_events():
+    async def failing():
+        yield SSEFormatter.message_event("partial", "msg_1")
+        raise RuntimeError("LLM stream failed")
+
+    frames = coalesce_sse_events(failing())
+    received = []
+
+    with pytest.raises(RuntimeError, match="LLM stream failed"):
+        async for frame in frames:
+            received.append(frame)
+
+    assert parse_events("".join(received))[0][0] == "message"
+
+
+@pytest.mark.asyncio
+async def test_closing_the_response_closes_the_source():
+    closed = asyncio.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield SSEFormatter.message_event("x")
+                await asyncio.sleep(0)
+        finally:
+            closed.set()
+
+    frames = coalesce_sse_events(endless(), flush_interval=0.01)
+    await frames.__anext__()
+    await frames.aclose()
+
+    assert closed.is_set()
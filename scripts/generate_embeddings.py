@@ -1,10 +1,10 @@
 from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
 from dotenv import load_dotenv
 import os
-import numpy as np
-import json
-import faiss
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api_service"))
+from infra.local_vector_store import LocalVectorStore
 
 # Carregar variáveis de ambiente
 load_dotenv()
@@ -12,6 +12,9 @@ load_dotenv()
 # Configurações
 EMBEDDINGS_MODEL = os.getenv("EMBEDDINGS_MODEL", "text-embedding-3-small")
 EMBEDDINGS_DIMENSIONS = int(os.getenv("EMBEDDINGS_DIMENSIONS", "1536"))
+VECTOR_STORE_PATH = os.getenv("LOCAL_VECTOR_STORE_PATH", "vector_store")
+# "hnsw" ou "ivfpq" (IVF-PQ só é usado com vetores suficientes para o treino)
+VECTOR_STORE_INDEX_TYPE = os.getenv("LOCAL_VECTOR_STORE_INDEX_TYPE", "hnsw")
 
 def main():
     # ---- DEBUG: Print loaded environment variables ----
@@ -44,35 +47,21 @@ def main():
     ]
 
     try:
-        # Extrair textos e metadados
-        texts = [doc["content"] for doc in documents]
-        metadatas = [doc["metadata"] for doc in documents]
-
-        # Criar diretório vector_store se não existir
-        os.makedirs("vector_store", exist_ok=True)
-
-        # Gerar embeddings usando LangChain
-        print("Gerando embeddings usando LangChain...")
-        embeddings_list = embeddings.embed_documents(texts)
-
-        # Converter lista de embeddings para numpy array
-        embeddings_array = np.array(embeddings_list).astype('float32')
-
-        # Criar índice FAISS
-        print("Criando índice FAISS...")
-        index = faiss.IndexFlatL2(EMBEDDINGS_DIMENSIONS)
-        index.add(embeddings_array)
-
-        # Salvar índice e metadados
-        print("Salvando índice e metadados...")
-        faiss.write_index(index, "vector_store/index.faiss")
+        chunks = [
+            {"id": str(i), "text": doc["content"], "metadata": doc["metadata"]}
+            for i, doc in enumerate(documents)
+        ]
 
-        # Salvar metadados
-        with open("vector_store/metadata.json", "w") as f:
-            json.dump({
-                "texts": texts,
-                "metadata": metadatas
-            }, f, ensure_ascii=False, indent=2)
+        # Gerar embeddings e gravar o índice (memory-mapped na leitura) com
+        # os metadados em colunas e os bitmaps de role/access_level
+        print("Gerando embeddings e criando o índice local...")
+        store = LocalVectorStore.build(
+            VECTOR_STORE_PATH,
+            chunks,
+            embed_fn=embeddings.embed_documents,
+            index_type=VECTOR_STORE_INDEX_TYPE,
+        )
+        print(f"Índice {store.index_type} com {store.count} chunks salvo em {VECTOR_STORE_PATH}.")
 
         print("Embeddings gerados e salvos com sucesso usando LangChain!")
 
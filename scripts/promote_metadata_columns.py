@@ -0,0 +1,65 @@
+"""
+Cria as colunas promovidas (`database.promoted_metadata_keys` do r2r.toml)
+na tabela de chunks do R2R, com seus índices B-tree/GIN e HNSW parciais.
+
+É uma etapa de manutenção, executada fora do startup da API: adicionar uma
+coluna gerada reescreve a tabela de chunks com lock exclusivo, então rode em
+uma janela de baixa escrita. Os índices são criados com `CONCURRENTLY`.
+Depois de rodar, reinicie a API para que os filtros passem a usar as colunas.
+
+Uso:
+    python scripts/promote_metadata_columns.py [--config r2r.toml]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..'))
+api_service_dir = os.path.join(project_root, 'api_service')
+if api_service_dir not in sys.path:
+    sys.path.insert(0, api_service_dir)
+
+from dotenv import load_dotenv  # noqa: E402
+
+from core.main.config import R2RConfig  # noqa: E402
+from core.providers import PostgresDatabaseProvider  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+async def main(config_path: str) -> None:
+    config = R2RConfig.load(config_path=config_path)
+    if not config.database.promoted_metadata_keys:
+        logger.info("Nenhuma chave promovida em database.promoted_metadata_keys.")
+        return
+
+    # O crypto provider só é usado pelos handlers de usuários, não aqui.
+    database = PostgresDatabaseProvider(
+        config.database,
+        config.embedding.base_dimension,
+        crypto_provider=None,
+        quantization_type=config.embedding.quantization_settings.quantization_type,
+    )
+    async with database:
+        await database.chunks_handler.create_promoted_columns()
+        logger.info(
+            "Colunas promovidas disponíveis: %s",
+            sorted(database.chunks_handler.promoted_columns),
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument(
+        '--config',
+        default=os.getenv('R2R_CONFIG_PATH', os.path.join(project_root, 'r2r.toml')),
+        help='Caminho do r2r.toml (padrão: R2R_CONFIG_PATH ou r2r.toml na raiz).',
+    )
+    asyncio.run(main(parser.parse_args().config))
@@ -6,6 +6,7 @@ import argparse
 from supabase import create_client, Client
 # from ingestion.gdrive_ingest import authenticate_gdrive
 import uuid
+import hashlib
 from dotenv import load_dotenv
 from googleapiclient.errors import HttpError
 from datetime import datetime, timezone
@@ -193,6 +194,43 @@ def delete_old_chunk(document_id, dry_run=True):
         return False
     return True
 
+def content_hash(text):
+    """Hash estável do conteúdo de um chunk, usado para o diff incremental."""
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+def get_existing_rechunked(original_document_id):
+    """Busca chunks já gerados a partir de um chunk original (runs anteriores)."""
+    response = supabase.table('documents').select('document_id, content, metadata') \
+                       .eq('original_document_id', original_document_id).execute()
+    return response.data or []
+
+def sync_rechunked_chunks(original_document_id, new_chunks, dry_run=True):
+    """Diff incremental: mantém chunks existentes cujo hash e posição batem,
+    deleta os removidos e insere (para re-embedding) apenas os novos/alterados."""
+    existing = {}
+    for row in get_existing_rechunked(original_document_id):
+        row_metadata = row.get('metadata') or {}
+        key = (row_metadata.get('chunk_index'), content_hash(row.get('content')))
+        existing[key] = row['document_id']
+
+    to_insert = []
+    kept = set()
+    for novo in new_chunks:
+        novo['metadata']['content_hash'] = content_hash(novo['content'])
+        key = (novo['metadata'].get('chunk_index'), novo['metadata']['content_hash'])
+        if key in existing:
+            kept.add(existing[key])
+        else:
+            to_insert.append(novo)
+
+    stale = [doc_id for doc_id in existing.values() if doc_id not in kept]
+    logger.info(f"[DIFF] original_document_id={original_document_id}: mantidos={len(kept)}, novos={len(to_insert)}, removidos={len(stale)}")
+    if to_insert and not insert_new_chunks(to_insert, dry_run=dry_run):
+        return False
+    for doc_id in stale:
+        delete_old_chunk(doc_id, dry_run=dry_run)
+    return True
+
 def rechunk_all(dry_run=True, min_chunk_tokens=300, use_ai=False):
     rodada = 1
     while True:
@@ -222,7 +260,8 @@ def rechunk_all(dry_run=True, min_chunk_tokens=300, use_ai=False):
                 if 'chunk_index' in novo:
                     del novo['chunk_index']  # chunk_index deve existir apenas em metadata
                 logger.info(f"Novo chunk {idx}: {count_tokens(novo['content'])} tokens | split_type={novo['metadata'].get('section_split') and 'section' or novo['metadata'].get('sentence_split') and 'sentence' or novo['metadata'].get('token_split') and 'token' or 'paragraph'}")
-            insert_new_chunks(novos_chunks, dry_run=dry_run)
+            if not sync_rechunked_chunks(chunk['document_id'], novos_chunks, dry_run=dry_run):
+                continue
             delete_old_chunk(chunk['document_id'], dry_run=dry_run)
             total_rechunked += 1
             algum_rechunkado = True
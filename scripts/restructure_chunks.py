@@ -14,6 +14,15 @@ import litellm
 
 # Importar a função de pós-processamento do novo local
 from scripts.utils.processing_logic import _post_process_sections
+from scripts.utils.restructure_runner import (
+    DEFAULT_LLM_CONCURRENCY,
+    DEFAULT_MAX_WORKERS,
+    Checkpoint,
+    LLMRateLimiter,
+    insert_in_batches,
+    mark_obsolete_in_batches,
+    run_parallel,
+)
 
 # Tentar importar o agente
 try:
@@ -69,6 +78,7 @@ DEFAULT_SOURCE_TYPE = 'email'
 CHUNK_FETCH_BATCH_SIZE = 500 # Para buscar chunks de um doc original
 DB_INSERT_BATCH_SIZE = 100 # Para inserir novos chunks (ajustar conforme limites da API)
 DB_UPDATE_BATCH_SIZE = 100 # Para marcar chunks antigos (ajustar conforme limites da API)
+CHECKPOINT_DIR = 'scripts/checkpoints' # gdrive_ids concluídos, um arquivo por source_type
 MIN_SECTION_LENGTH = 600 # Limite mínimo de caracteres para não fundir (ajustado para chunks maiores)
 ESSENTIAL_SHORT_TYPES = { # Tipos que podem ser curtos e não devem ser fundidos automaticamente
     'email_assunto', 'email_ps', 'email_saudacao', 'email_assinatura'
@@ -159,34 +169,22 @@ def extract_regex_section_end(pattern: re.Pattern, text: str) -> Tuple[Optional[
 
 def get_distinct_gdrive_ids(supabase_client: Client, source_type: str, limit: Optional[int] = None) -> List[str]:
     """
-    Busca gdrive_ids distintos da tabela 'documents' para um determinado source_type,
-    considerando apenas chunks ativos e não obsoletos.
-    Aplica um limite se fornecido AO RESULTADO FINAL de IDs distintos.
-    A query inicial ao Supabase busca um lote fixo para ter mais chance de encontrar IDs distintos.
+    Busca os gdrive_ids distintos dos chunks ativos (keep = True) de um source_type,
+    em ordem alfabética. A deduplicação é feita no servidor pela RPC
+    `get_distinct_gdrive_ids` (supabase/migrations/0003_get_distinct_gdrive_ids.sql).
     """
     logger.info(f"Buscando gdrive_ids distintos para source_type='{source_type}'...")
 
     try:
-        # A query busca um lote de CHUNK_FETCH_BATCH_SIZE para ter uma boa amostra
-        # O argumento 'limit' da função será aplicado depois, à lista de IDs distintos.
-        response = supabase_client.table('documents') \
-                         .select('metadata->>gdrive_id') \
-                         .eq('metadata->>source_type', source_type) \
-                         .eq('keep', True) \
-                         .neq('metadata->>gdrive_id', 'null') \
-                         .range(0, CHUNK_FETCH_BATCH_SIZE - 1) \
-                         .execute()
-        
+        params = {'p_source_type': source_type}
+        if limit and limit > 0:
+            params['p_limit'] = limit
+        response = supabase_client.rpc('get_distinct_gdrive_ids', params).execute()
+
         if hasattr(response, 'data') and response.data:
-            # Coleta todos os gdrive_ids distintos do lote buscado
-            distinct_ids_from_batch = sorted(list({item['gdrive_id'] for item in response.data if item.get('gdrive_id')}))
-            logger.debug(f"Busca gdrive_id: {len(response.data)} chunks no lote, {len(distinct_ids_from_batch)} IDs distintos encontrados no lote.")
-            
-            if limit and limit > 0: # Aplicar o limite se for especificado e válido
-                logger.info(f"Aplicando limite de {limit} aos {len(distinct_ids_from_batch)} gdrive_ids distintos encontrados.")
-                return distinct_ids_from_batch[:limit]
-            else: # Se não houver limite, ou limite for 0 ou None, retorna todos os distintos encontrados no lote
-                return distinct_ids_from_batch
+            distinct_ids = [item['gdrive_id'] for item in response.data if item.get('gdrive_id')]
+            logger.debug(f"Busca gdrive_id: {len(distinct_ids)} IDs distintos encontrados.")
+            return distinct_ids
         else:
             if hasattr(response, 'error') and response.error:
                logger.error(f"Erro Supabase ao buscar gdrive_ids: {response.error}")
@@ -207,8 +205,9 @@ def reconstruct_document_content(supabase_client: Client, gdrive_id: str) -> Tup
         try:
             query = supabase_client.table('documents') \
                              .select('document_id, content, metadata') \
-                             .eq('metadata->>gdrive_id', gdrive_id) \
-                             .eq('keep', True)
+                             .eq('gdrive_id', gdrive_id) \
+                             .eq('keep', True) \
+                             .order('id')
             
             # Adicionando condições para excluir status obsoletos
             query = query.neq('indexing_status', 'obsolete_restructured')
@@ -361,15 +360,20 @@ def mark_old_chunks_as_obsolete(
     logger.info(f"Marcando chunks para {log_message_identifier} com status: {new_status}")
 
     try:
+        if specific_chunk_ids:
+            # Se estamos atualizando IDs específicos, não precisamos da lógica de .neq("indexing_status", "obsolete_restructured")
+            # pois esta chamada é para definir explicitamente o status desses IDs (geralmente para 'obsolete_restructured').
+            # Atualiza em lotes, para não estourar o tamanho da URL do filtro `in`.
+            if not mark_obsolete_in_batches(supabase_client, specific_chunk_ids, new_status, DB_UPDATE_BATCH_SIZE):
+                return False
+            logger.info(f"Chunks para {log_message_identifier} foram marcados com status '{new_status}'.")
+            return True
+
         update_query = supabase_client.table("documents")\
             .update({"keep": False, "indexing_status": new_status})
 
-        if specific_chunk_ids:
-            # Se estamos atualizando IDs específicos, não precisamos da lógica de .neq("indexing_status", "obsolete_restructured")
-            # pois esta chamada é para definir explicitamente o status desses IDs (geralmente para 'obsolete_restructured')
-            update_query = update_query.in_("document_id", specific_chunk_ids)
-        elif gdrive_id and source_type_to_match: 
-            update_query = update_query.match({"metadata->>gdrive_id": gdrive_id, "metadata->>source_type": source_type_to_match})
+        if gdrive_id and source_type_to_match: 
+            update_query = update_query.match({"gdrive_id": gdrive_id, "source_type": source_type_to_match})
             # A lógica de não sobrescrever 'obsolete_restructured' SÓ se aplica se estamos no modo gdrive_id/source_type
             # E o novo status é 'obsolete_forced_reprocess'.
             if new_status == "obsolete_forced_reprocess":
@@ -391,175 +395,198 @@ def mark_old_chunks_as_obsolete(
         logger.error(f"Exceção ao marcar chunks como obsoletos ({new_status}) para {log_message_identifier}: {e}", exc_info=True)
         return False
 
-def process_documents(supabase_client: Client, agent: StructureAnalyzerAgent, source_type: str, limit: Optional[int] = None, dry_run: bool = True, force_reprocess: bool = False):
-    logger.info(f"Iniciando processamento para source_type: '{source_type}', Dry run: {dry_run}, Force reprocess: {force_reprocess}")
-    gdrive_ids = get_distinct_gdrive_ids(supabase_client, source_type, limit)
+def process_single_document(
+    supabase_client: Client,
+    agent: StructureAnalyzerAgent,
+    gdrive_id: str,
+    source_type: str,
+    dry_run: bool,
+    force_reprocess: bool,
+    llm_limiter: LLMRateLimiter,
+) -> bool:
+    """Reestrutura um gdrive_id. Retorna True se concluído (ou simulado, em dry-run)."""
+    logger.info(f"Processando gdrive_id: {gdrive_id}")
 
-    if not gdrive_ids:
-        logger.info(f"Nenhum gdrive_id encontrado para processar para source_type '{source_type}'.")
-        return
+    # Lógica para buscar e reconstruir conteúdo original
+    original_content, old_chunk_ids, base_metadata = reconstruct_document_content(supabase_client, gdrive_id)
 
-    logger.info(f"Encontrados {len(gdrive_ids)} gdrive_ids para processar: {gdrive_ids}")
-    processed_count = 0
-    successful_count = 0
+    if original_content is None:
+        logger.warning(f"Conteúdo não pôde ser reconstruído para gdrive_id: {gdrive_id}. Pulando.")
+        return False
+    
+    if not base_metadata: # Garante que temos metadados base
+        logger.warning(f"Metadados base não encontrados para gdrive_id: {gdrive_id} após reconstrução. Pulando.")
+        return False
 
-    for gdrive_id in gdrive_ids:
-        processed_count += 1
-        logger.info(f"Processando gdrive_id {processed_count}/{len(gdrive_ids)}: {gdrive_id}")
+    # Garantir que estamos usando o source_type correto dos metadados do documento original,
+    # em vez do parâmetro source_type da função, para o caso de haver alguma inconsistência.
+    # No entanto, a busca inicial de gdrive_ids já filtra por source_type, então deve ser consistente.
+    actual_source_type = base_metadata.get('source_type', source_type)
+    if actual_source_type != source_type:
+        logger.warning(f"Inconsistência de source_type para gdrive_id {gdrive_id}: esperado '{source_type}', encontrado nos metadados '{actual_source_type}'. Usando '{actual_source_type}'.")
+    
+    # Lógica de reprocessamento forçado
+    if force_reprocess and not dry_run:
+        if old_chunk_ids: # Apenas tentar marcar se existirem chunks antigos identificados
+            logger.info(f"Force reprocess habilitado. Tentando marcar chunks antigos como obsoletos para gdrive_id: {gdrive_id}")
+            # Chamada para marcar os chunks do gdrive_id/source_type como 'obsolete_forced_reprocess'
+            if not mark_old_chunks_as_obsolete(
+                supabase_client, 
+                new_status="obsolete_forced_reprocess",
+                gdrive_id=gdrive_id, 
+                source_type_to_match=actual_source_type
+            ):
+                logger.error(f"Falha ao marcar chunks antigos (force_reprocess) para {gdrive_id}. O reprocessamento pode resultar em duplicatas. Continuando com cautela.")
+        else:
+            logger.info(f"Force reprocess habilitado, mas nenhum chunk antigo identificado por reconstruct_document_content para {gdrive_id}. Nada a marcar inicialmente.")
 
-        # Lógica para buscar e reconstruir conteúdo original
-        original_content, old_chunk_ids, base_metadata = reconstruct_document_content(supabase_client, gdrive_id)
+    # Análise de Estrutura com LLM (agente)
+    logger.info(f"Enviando conteúdo (aprox {len(original_content)} chars) para StructureAnalyzerAgent para gdrive_id: {gdrive_id}")
+    try:
+        analyzed_sections = llm_limiter.call(agent.analyze_structure, original_content, actual_source_type)
+    except Exception as e_agent:
+        logger.error(f"Erro ao analisar estrutura com o agente para gdrive_id {gdrive_id}: {e_agent}", exc_info=True)
+        return False
 
-        if original_content is None:
-            logger.warning(f"Conteúdo não pôde ser reconstruído para gdrive_id: {gdrive_id}. Pulando.")
-            continue
-        
-        if not base_metadata: # Garante que temos metadados base
-            logger.warning(f"Metadados base não encontrados para gdrive_id: {gdrive_id} após reconstrução. Pulando.")
-            continue
+    if not analyzed_sections:
+        logger.warning(f"Nenhuma seção analisada retornada pelo agente para gdrive_id: {gdrive_id}. Pulando.")
+        return False
+    
+    logger.info(f"Agente retornou {len(analyzed_sections)} seções analisadas para gdrive_id: {gdrive_id}")
 
-        # Garantir que estamos usando o source_type correto dos metadados do documento original,
-        # em vez do parâmetro source_type da função, para o caso de haver alguma inconsistência.
-        # No entanto, a busca inicial de gdrive_ids já filtra por source_type, então deve ser consistente.
-        actual_source_type = base_metadata.get('source_type', source_type)
-        if actual_source_type != source_type:
-            logger.warning(f"Inconsistência de source_type para gdrive_id {gdrive_id}: esperado '{source_type}', encontrado nos metadados '{actual_source_type}'. Usando '{actual_source_type}'.")
-        
-        # Lógica de reprocessamento forçado
-        if force_reprocess and not dry_run:
-            if old_chunk_ids: # Apenas tentar marcar se existirem chunks antigos identificados
-                logger.info(f"Force reprocess habilitado. Tentando marcar chunks antigos como obsoletos para gdrive_id: {gdrive_id}")
-                # Chamada para marcar os chunks do gdrive_id/source_type como 'obsolete_forced_reprocess'
-                if not mark_old_chunks_as_obsolete(
-                    supabase_client, 
-                    new_status="obsolete_forced_reprocess",
-                    gdrive_id=gdrive_id, 
-                    source_type_to_match=actual_source_type
-                ):
-                    logger.error(f"Falha ao marcar chunks antigos (force_reprocess) para {gdrive_id}. O reprocessamento pode resultar em duplicatas. Continuando com cautela.")
-            else:
-                logger.info(f"Force reprocess habilitado, mas nenhum chunk antigo identificado por reconstruct_document_content para {gdrive_id}. Nada a marcar inicialmente.")
+    # Pós-processamento das seções (fusão, etc.)
+    # Passar o vocabulário específico para ESSENTIAL_SHORT_TYPES
+    current_essential_short_types = ESSENTIAL_SHORT_TYPES # Usar o global por enquanto, pode ser refinado por source_type
+    
+    # Corrigir a chamada para corresponder à assinatura da função importada:
+    # _post_process_sections(sections, min_length, essential_short_types, default_fallback_suffix)
+    # O default_fallback_suffix é pego da constante no módulo utils, não precisa ser passado aqui.
+    # actual_source_type não é um parâmetro de _post_process_sections.
+    final_sections = _post_process_sections(
+        analyzed_sections,
+        MIN_SECTION_LENGTH, 
+        current_essential_short_types
+        # DEFAULT_FALLBACK_SECTION_TYPE_SUFFIX não é mais passado aqui, pois é default na função
+    )
+    logger.info(f"{len(final_sections)} seções finais após pós-processamento para gdrive_id: {gdrive_id}")
 
-        # Análise de Estrutura com LLM (agente)
-        logger.info(f"Enviando conteúdo (aprox {len(original_content)} chars) para StructureAnalyzerAgent para gdrive_id: {gdrive_id}")
-        try:
-            analyzed_sections = agent.analyze_structure(original_content, actual_source_type)
-        except Exception as e_agent:
-            logger.error(f"Erro ao analisar estrutura com o agente para gdrive_id {gdrive_id}: {e_agent}", exc_info=True)
-            continue # Pula para o próximo gdrive_id
+    # Preparar novos chunks para o banco de dados
+    new_chunks_for_db = []
+    current_time_utc = datetime.now(timezone.utc)
 
-        if not analyzed_sections:
-            logger.warning(f"Nenhuma seção analisada retornada pelo agente para gdrive_id: {gdrive_id}. Pulando.")
-            continue
-        
-        logger.info(f"Agente retornou {len(analyzed_sections)} seções analisadas para gdrive_id: {gdrive_id}")
+    for idx, section_data in enumerate(final_sections):
+        new_doc_id = str(uuid.uuid4())
+        section_content = section_data.get('content')
+        section_type_from_agent = section_data.get('section_type')
 
-        # Pós-processamento das seções (fusão, etc.)
-        # Passar o vocabulário específico para ESSENTIAL_SHORT_TYPES
-        current_essential_short_types = ESSENTIAL_SHORT_TYPES # Usar o global por enquanto, pode ser refinado por source_type
-        
-        # Corrigir a chamada para corresponder à assinatura da função importada:
-        # _post_process_sections(sections, min_length, essential_short_types, default_fallback_suffix)
-        # O default_fallback_suffix é pego da constante no módulo utils, não precisa ser passado aqui.
-        # actual_source_type não é um parâmetro de _post_process_sections.
-        final_sections = _post_process_sections(
-            analyzed_sections,
-            MIN_SECTION_LENGTH, 
-            current_essential_short_types
-            # DEFAULT_FALLBACK_SECTION_TYPE_SUFFIX não é mais passado aqui, pois é default na função
-        )
-        logger.info(f"{len(final_sections)} seções finais após pós-processamento para gdrive_id: {gdrive_id}")
-
-        # Preparar novos chunks para o banco de dados
-        new_chunks_for_db = []
-        current_time_utc = datetime.now(timezone.utc)
-
-        for idx, section_data in enumerate(final_sections):
-            new_doc_id = str(uuid.uuid4())
-            section_content = section_data.get('content')
-            section_type_from_agent = section_data.get('section_type')
-
-            # Garantir que section_type_from_agent nunca seja None ou vazio
-            if not section_type_from_agent:
-                logger.warning(f"section_type_from_agent era '{section_type_from_agent}' para gdrive_id {gdrive_id}, seção {idx}. Usando fallback.")
-                section_type_from_agent = f"{actual_source_type}{DEFAULT_FALLBACK_SECTION_TYPE_SUFFIX}"
-
-            if not section_content: # Apenas checar o conteúdo aqui, pois o tipo já foi tratado
-                logger.warning(f"Seção {idx} para gdrive_id {gdrive_id} está sem conteúdo após pós-processamento. Pulando esta seção.")
-                continue
+        # Garantir que section_type_from_agent nunca seja None ou vazio
+        if not section_type_from_agent:
+            logger.warning(f"section_type_from_agent era '{section_type_from_agent}' para gdrive_id {gdrive_id}, seção {idx}. Usando fallback.")
+            section_type_from_agent = f"{actual_source_type}{DEFAULT_FALLBACK_SECTION_TYPE_SUFFIX}"
 
-            # Usar metadados base do documento original e adicionar/sobrescrever específicos do chunk
-            chunk_metadata = base_metadata.copy() # Começa com uma cópia dos metadados do doc original
-            chunk_metadata.update({
-                'chunk_index': idx,
-                'total_chunks_in_doc': len(final_sections),
-                'section_type': section_type_from_agent, # Agora garantido que não é None/vazio
-                'original_document_id': gdrive_id, # ID original do gdrive/documento pai
-                'restructure_approach': 'hybrid_strong',
-                # 'gdrive_id' já está em base_metadata,
-                # 'source_type' já está em base_metadata,
-                # outros metadados originais são mantidos...
-            })
-            # Remover chaves que não queremos duplicar ou que não fazem sentido no nível do chunk se vieram do doc original
-            chunk_metadata.pop('chunk_index_original', None) # Exemplo de limpeza, ajustar conforme necessário
-
-            new_chunk = {
-                'document_id': new_doc_id,
-                'content': section_content,
-                'metadata': chunk_metadata,
-                'embedding': None, # Embedding será gerado por outro processo
-                'keep': True,
-                'indexing_status': 'structured_new',
-                'created_at': current_time_utc.isoformat(),
-                'updated_at': current_time_utc.isoformat()
-            }
-            new_chunks_for_db.append(new_chunk)
-
-        if not new_chunks_for_db:
-            logger.warning(f"Nenhum novo chunk foi preparado para inserção para gdrive_id: {gdrive_id} após processamento completo. Pulando inserção.")
-            continue
+        if not section_content: # Apenas checar o conteúdo aqui, pois o tipo já foi tratado
+            logger.warning(f"Seção {idx} para gdrive_id {gdrive_id} está sem conteúdo após pós-processamento. Pulando esta seção.")
+            return False
 
-        # Inserir novos chunks no banco de dados
-        if not dry_run:
-            logger.info(f"Inserindo {len(new_chunks_for_db)} novos chunks para gdrive_id: {gdrive_id}")
-            all_inserted_successfully = True
-            for i in range(0, len(new_chunks_for_db), DB_INSERT_BATCH_SIZE):
-                batch = new_chunks_for_db[i:i + DB_INSERT_BATCH_SIZE]
-                try:
-                    response = supabase_client.table('documents').insert(batch, returning="minimal").execute()
-                    if hasattr(response, 'error') and response.error:
-                        logger.error(f"Erro Supabase ao inserir lote de chunks para gdrive_id {gdrive_id}: {response.error}")
-                        all_inserted_successfully = False
-                        break # Interrompe a inserção para este gdrive_id se um lote falhar
-                except Exception as e:
-                    logger.error(f"Exceção ao inserir lote de chunks para gdrive_id {gdrive_id}: {e}", exc_info=True)
-                    all_inserted_successfully = False
-                    break
-            
-            if all_inserted_successfully:
-                logger.info(f"Todos os {len(new_chunks_for_db)} chunks para gdrive_id {gdrive_id} inseridos com sucesso.")
-                successful_count += 1
-                
-                if old_chunk_ids: 
-                    logger.info(f"Tentando marcar os {len(old_chunk_ids)} chunks antigos específicos como 'obsolete_restructured' para gdrive_id: {gdrive_id} após inserção bem-sucedida dos novos.")
-                    if not mark_old_chunks_as_obsolete(
-                        supabase_client, 
-                        new_status="obsolete_restructured",
-                        specific_chunk_ids=old_chunk_ids # Passa a lista de IDs dos chunks originais
-                    ):
-                        logger.warning(f"Falha ao marcar os chunks antigos específicos ({len(old_chunk_ids)} IDs) como 'obsolete_restructured' para {gdrive_id} após inserção bem-sucedida. Dados podem estar inconsistentes.")
-                else:
-                    logger.info(f"Nenhum chunk antigo (old_chunk_ids) foi identificado por reconstruct_document_content para {gdrive_id}. Nada a marcar como 'obsolete_restructured'.")
+        # Usar metadados base do documento original e adicionar/sobrescrever específicos do chunk
+        chunk_metadata = base_metadata.copy() # Começa com uma cópia dos metadados do doc original
+        chunk_metadata.update({
+            'chunk_index': idx,
+            'total_chunks_in_doc': len(final_sections),
+            'section_type': section_type_from_agent, # Agora garantido que não é None/vazio
+            'original_document_id': gdrive_id, # ID original do gdrive/documento pai
+            'restructure_approach': 'hybrid_strong',
+            # 'gdrive_id' já está em base_metadata,
+            # 'source_type' já está em base_metadata,
+            # outros metadados originais são mantidos...
+        })
+        # Remover chaves que não queremos duplicar ou que não fazem sentido no nível do chunk se vieram do doc original
+        chunk_metadata.pop('chunk_index_original', None) # Exemplo de limpeza, ajustar conforme necessário
+
+        new_chunk = {
+            'document_id': new_doc_id,
+            'content': section_content,
+            'metadata': chunk_metadata,
+            'embedding': None, # Embedding será gerado por outro processo
+            'keep': True,
+            'indexing_status': 'structured_new',
+            'created_at': current_time_utc.isoformat(),
+            'updated_at': current_time_utc.isoformat()
+        }
+        new_chunks_for_db.append(new_chunk)
+
+    if not new_chunks_for_db:
+        logger.warning(f"Nenhum novo chunk foi preparado para inserção para gdrive_id: {gdrive_id} após processamento completo. Pulando inserção.")
+        return False
+
+    # Inserir novos chunks no banco de dados
+    if not dry_run:
+        logger.info(f"Inserindo {len(new_chunks_for_db)} novos chunks para gdrive_id: {gdrive_id}")
+        all_inserted_successfully = insert_in_batches(supabase_client, new_chunks_for_db, DB_INSERT_BATCH_SIZE, f"gdrive_id {gdrive_id}")
+
+        if all_inserted_successfully:
+            logger.info(f"Todos os {len(new_chunks_for_db)} chunks para gdrive_id {gdrive_id} inseridos com sucesso.")
+
+            if old_chunk_ids: 
+                logger.info(f"Tentando marcar os {len(old_chunk_ids)} chunks antigos específicos como 'obsolete_restructured' para gdrive_id: {gdrive_id} após inserção bem-sucedida dos novos.")
+                if not mark_old_chunks_as_obsolete(
+                    supabase_client, 
+                    new_status="obsolete_restructured",
+                    specific_chunk_ids=old_chunk_ids # Passa a lista de IDs dos chunks originais
+                ):
+                    logger.warning(f"Falha ao marcar os chunks antigos específicos ({len(old_chunk_ids)} IDs) como 'obsolete_restructured' para {gdrive_id} após inserção bem-sucedida. Dados podem estar inconsistentes.")
             else:
-                logger.error(f"Falha ao inserir um ou mais lotes de chunks para gdrive_id {gdrive_id}. Verifique os logs. Alguns chunks podem ter sido inseridos.")
+                logger.info(f"Nenhum chunk antigo (old_chunk_ids) foi identificado por reconstruct_document_content para {gdrive_id}. Nada a marcar como 'obsolete_restructured'.")
+        else:
+            logger.error(f"Falha ao inserir um ou mais lotes de chunks para gdrive_id {gdrive_id}. Verifique os logs. Alguns chunks podem ter sido inseridos.")
+            return False
 
-        else: # dry_run
-            logger.info(f"[DRY RUN] {len(new_chunks_for_db)} chunks seriam preparados para gdrive_id: {gdrive_id}")
-            for chunk_to_insert in new_chunks_for_db:
-                logger.debug(f"[DRY RUN] Chunk a ser inserido: ID={chunk_to_insert['document_id']}, Tipo={chunk_to_insert['metadata'].get('section_type')}, Tamanho={len(chunk_to_insert['content'])}")
-            successful_count +=1 # Em dry_run, contamos como sucesso para fins de relatório de processamento.
+    else: # dry_run
+        logger.info(f"[DRY RUN] {len(new_chunks_for_db)} chunks seriam preparados para gdrive_id: {gdrive_id}")
+        for chunk_to_insert in new_chunks_for_db:
+            logger.debug(f"[DRY RUN] Chunk a ser inserido: ID={chunk_to_insert['document_id']}, Tipo={chunk_to_insert['metadata'].get('section_type')}, Tamanho={len(chunk_to_insert['content'])}")
+        # Em dry_run, contamos como sucesso para fins de relatório de processamento.
+
+    return True
+
+
+def process_documents(
+    supabase_client: Client,
+    agent: StructureAnalyzerAgent,
+    source_type: str,
+    limit: Optional[int] = None,
+    dry_run: bool = True,
+    force_reprocess: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+    checkpoint_file: Optional[str] = None,
+):
+    """
+    Reestrutura os documentos de `source_type` em paralelo (`max_workers` por vez).
+    Com `checkpoint_file`, os gdrive_ids concluídos são gravados e pulados na próxima
+    execução; em dry-run o checkpoint não é usado.
+    """
+    logger.info(f"Iniciando processamento para source_type: '{source_type}', Dry run: {dry_run}, Force reprocess: {force_reprocess}, Workers: {max_workers}")
+    gdrive_ids = get_distinct_gdrive_ids(supabase_client, source_type, limit)
 
-    logger.info(f"Processamento concluído para source_type '{source_type}'. Total de gdrive_ids: {len(gdrive_ids)}, Processados: {processed_count}, Bem-sucedidos (ou seria em dry-run): {successful_count}.")
+    if not gdrive_ids:
+        logger.info(f"Nenhum gdrive_id encontrado para processar para source_type '{source_type}'.")
+        return
+
+    logger.info(f"Encontrados {len(gdrive_ids)} gdrive_ids para processar.")
+    checkpoint = Checkpoint(checkpoint_file) if checkpoint_file and not dry_run else None
+    llm_limiter = LLMRateLimiter(llm_concurrency)
+
+    summary = run_parallel(
+        gdrive_ids,
+        lambda gdrive_id: process_single_document(
+            supabase_client, agent, gdrive_id, source_type, dry_run, force_reprocess, llm_limiter
+        ),
+        checkpoint=checkpoint,
+        max_workers=max_workers,
+    )
+
+    logger.info(f"Processamento concluído para source_type '{source_type}'. Total de gdrive_ids: {summary.total}, Pulados (checkpoint): {summary.skipped}, Bem-sucedidos (ou seria em dry-run): {summary.succeeded}, Falhas: {summary.failed}.")
 
 def main():
     parser = argparse.ArgumentParser(description="Reestrutura documentos do Supabase em chunks semânticos usando LLM.")
@@ -574,6 +601,11 @@ def main():
     # Novo argumento: --force-reprocess
     parser.add_argument("--force-reprocess", action="store_true", help="Força o reprocessamento de documentos mesmo que já tenham sido processados, marcando chunks antigos como obsoletos.")
 
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help=f"Número de documentos processados em paralelo (padrão: {DEFAULT_MAX_WORKERS}).")
+    parser.add_argument("--llm-concurrency", type=int, default=DEFAULT_LLM_CONCURRENCY, help=f"Máximo de chamadas simultâneas ao LLM (padrão: {DEFAULT_LLM_CONCURRENCY}).")
+    parser.add_argument("--checkpoint-file", help=f"Arquivo de checkpoint com os gdrive_ids concluídos (padrão: {CHECKPOINT_DIR}/<source_type>.jsonl).")
+    parser.add_argument("--reset-checkpoint", action="store_true", help="Apaga o checkpoint antes de começar, reprocessando todos os gdrive_ids.")
+
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -609,7 +641,22 @@ def main():
         logger.critical("StructureAnalyzerAgent não pôde ser inicializado devido a falha na importação de dependências (CrewAI/Langchain). O script não pode continuar.")
         return # Ou sys.exit(1)
 
-    process_documents(supabase, agent, args.source_type, args.limit, args.dry_run, args.force_reprocess)
+    checkpoint_file = args.checkpoint_file or os.path.join(CHECKPOINT_DIR, f"{args.source_type}.jsonl")
+    if args.reset_checkpoint:
+        Checkpoint(checkpoint_file).reset()
+        logger.info(f"Checkpoint {checkpoint_file} apagado.")
+
+    process_documents(
+        supabase,
+        agent,
+        args.source_type,
+        args.limit,
+        args.dry_run,
+        args.force_reprocess,
+        max_workers=args.workers,
+        llm_concurrency=args.llm_concurrency,
+        checkpoint_file=checkpoint_file,
+    )
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
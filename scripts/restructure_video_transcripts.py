@@ -9,10 +9,17 @@ from typing import List, Dict, Optional, Any
 
 from supabase import create_client, Client
 from dotenv import load_dotenv
-from postgrest.exceptions import APIError
 
 # Importar a função de pós-processamento real
 from scripts.utils.processing_logic import _post_process_sections
+from scripts.utils.restructure_runner import (
+    DEFAULT_LLM_CONCURRENCY,
+    DEFAULT_MAX_WORKERS,
+    Checkpoint,
+    LLMRateLimiter,
+    insert_in_batches,
+    run_parallel,
+)
 
 # Tentativa de importar StructureAnalyzerAgent e IdentifiedSection
 # Se scripts/restructure_chunks.py estiver no mesmo nível ou no PYTHONPATH
@@ -73,6 +80,7 @@ METADATA_DIR_NAME = "metadata"
 
 DB_INSERT_BATCH_SIZE = 50
 NEW_SOURCE_TYPE = "youtube_video_transcription"
+CHECKPOINT_DIR = "scripts/checkpoints" # Compartilhado com restructure_chunks.py, um arquivo por source_type
 
 # Constantes locais MIN_SECTION_LENGTH e TARGET_CHUNK_SIZE removidas pois não são usadas
 # ou são sobrepostas pela lógica em scripts.utils.processing_logic
@@ -137,7 +145,7 @@ def check_if_already_processed(db_client: Optional[Client], video_id: str) -> bo
         logger.warning("Cliente Supabase não disponível, não é possível verificar processamento anterior. Assumindo não processado.")
         return False
     try:
-        response = db_client.table("documents").select("document_id").eq("metadata->>video_id", video_id).eq("metadata->>source_type", NEW_SOURCE_TYPE).limit(1).execute()
+        response = db_client.table("documents").select("document_id").eq("video_id", video_id).eq("source_type", NEW_SOURCE_TYPE).limit(1).execute()
         if response.data:
             logger.info(f"Chunks para video_id {video_id} (source_type: {NEW_SOURCE_TYPE}) já existem no banco de dados.")
             return True
@@ -151,7 +159,8 @@ def process_single_transcription(
     db_client: Optional[Client],
     structure_analyzer: StructureAnalyzerAgent,
     force_reprocess: bool,
-    dry_run: bool
+    dry_run: bool,
+    llm_limiter: Optional[LLMRateLimiter] = None,
 ):
     """Processa um único arquivo JSON de metadados de transcrição."""
     logger.info(f"Processando arquivo de metadados: {metadata_filepath}")
@@ -221,7 +230,9 @@ def process_single_transcription(
         try:
             # Passar um contexto relevante, se houver. Ex: título do vídeo.
             # context_for_llm = f"Título do Vídeo: {video_title}" # Removido pois não é usado
-            analyzed_sections = structure_analyzer.analyze_structure(
+            llm_limiter = llm_limiter or LLMRateLimiter()
+            analyzed_sections = llm_limiter.call(
+                structure_analyzer.analyze_structure,
                 document_content=full_text_from_transcript, # Nome do parâmetro esperado pela classe real
                 source_type=NEW_SOURCE_TYPE
                 # O parâmetro 'context' não existe no método 'analyze_structure' da classe real.
@@ -307,42 +318,16 @@ def process_single_transcription(
     if force_reprocess: # Implica que se chegou aqui, é para deletar os antigos e inserir novos
         logger.info(f"Modo --force-reprocess: Deletando chunks existentes para video_id {video_id} com source_type {NEW_SOURCE_TYPE}...")
         try:
-            delete_response = db_client.table("documents").delete().eq("metadata->>video_id", video_id).eq("metadata->>source_type", NEW_SOURCE_TYPE).execute()
+            delete_response = db_client.table("documents").delete().eq("video_id", video_id).eq("source_type", NEW_SOURCE_TYPE).execute()
             logger.info(f"Deleção de chunks antigos para {video_id} concluída. Resposta: {delete_response.data if delete_response else 'N/A'}")
         except Exception as e:
             logger.error(f"Erro ao deletar chunks antigos para {video_id}: {e}. Prosseguindo com a inserção de qualquer maneira (pode causar duplicatas).")
 
     if new_chunks_for_db:
-        try:
-            # Inserir em lotes
-            for i in range(0, len(new_chunks_for_db), DB_INSERT_BATCH_SIZE):
-                batch = new_chunks_for_db[i:i + DB_INSERT_BATCH_SIZE]
-                logger.info(f"Inserindo lote de {len(batch)} chunks no Supabase para video_id {video_id}...")
-                try:
-                    # Corrigir: returning="minimal" é um parâmetro de insert(), não um método option()
-                    insert_response = db_client.table("documents").insert(batch, returning="minimal").execute()
-                    # No modo minimal, insert_response.data provavelmente será vazio ou terá um formato diferente.
-                    # Não vamos mais logar insert_response.data diretamente para evitar confusão.
-                    logger.info(f"Inserção do lote para {video_id} no Supabase (aparentemente) bem-sucedida.")
-                except APIError as e:
-                    logger.error(f"Erro API ao inserir chunks no Supabase para video_id {video_id}: {e.message}")
-                    # Logar mais detalhes do erro se disponíveis
-                    if hasattr(e, 'json') and callable(e.json):
-                        logger.error(f"Detalhes do erro JSON: {e.json()}")
-                    return False # Falha na inserção do lote
-                except Exception as e:
-                    logger.error(f"Erro ao inserir chunks no Supabase para video_id {video_id}: {e}")
-                    return False
-            
-            logger.info(f"Todos os {len(new_chunks_for_db)} chunks para {video_id} inseridos no Supabase.")
-            return True
-        except Exception as e: # Este except é para o bloco `if new_chunks_for_db` - parece um pouco deslocado.
-            # Deveria ser `except APIError as e:` ou `except Exception as e:` no nível da tentativa de inserção.
-            # O erro original que ocorria aqui era APIError.
-            # Esta linha `except Exception as e:` provavelmente não será atingida como está, pois os erros de API são capturados acima.
-            # Vou remover este `exc_info=True` redundante e ajustar o log se o erro persistir de forma diferente.
-            logger.error(f"Erro ao inserir chunks no Supabase para video_id {video_id}: {e}")
+        if not insert_in_batches(db_client, new_chunks_for_db, DB_INSERT_BATCH_SIZE, f"video_id {video_id}"):
             return False
+        logger.info(f"Todos os {len(new_chunks_for_db)} chunks para {video_id} inseridos no Supabase.")
+        return True
     else:
         logger.info(f"Nenhum novo chunk para inserir para video_id: {video_id}.")
         return True # Considerado sucesso se não havia nada a fazer.
@@ -359,6 +344,14 @@ def main():
     parser.add_argument("--limit", type=int, help="Limitar o número de transcrições a processar (para teste).")
     parser.add_argument("--dry-run", action="store_true",
                         help="Executar o script em modo de simulação, sem gravar no banco de dados.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Número de transcrições processadas em paralelo (padrão: {DEFAULT_MAX_WORKERS}).")
+    parser.add_argument("--llm-concurrency", type=int, default=DEFAULT_LLM_CONCURRENCY,
+                        help=f"Máximo de chamadas simultâneas ao LLM (padrão: {DEFAULT_LLM_CONCURRENCY}).")
+    parser.add_argument("--checkpoint-file",
+                        help=f"Arquivo de checkpoint com os video_ids concluídos (padrão: {CHECKPOINT_DIR}/{NEW_SOURCE_TYPE}.jsonl).")
+    parser.add_argument("--reset-checkpoint", action="store_true",
+                        help="Apaga o checkpoint antes de começar, reprocessando todas as transcrições.")
 
     args = parser.parse_args()
 
@@ -388,28 +381,32 @@ def main():
         logger.info(f"Nenhum arquivo de metadados encontrado em {actual_metadata_dir}. Encerrando.")
         return
 
-    total_files = len(metadata_files)
-    success_count = 0
-    fail_count = 0
-
-    for i, filepath in enumerate(metadata_files):
-        logger.info(f"--- Processando arquivo {i+1}/{total_files}: {filepath} ---")
-        try:
-            if process_single_transcription(filepath, supabase_client, structure_analyzer, args.force_reprocess, args.dry_run):
-                success_count += 1
-            else:
-                fail_count += 1
-        except Exception as e:
-            logger.error(f"Erro fatal não tratado ao processar {filepath}: {e}", exc_info=True)
-            fail_count +=1
-        logger.info(f"--- Concluído arquivo {i+1}/{total_files} ---")
-
+    checkpoint = None
+    if not args.dry_run:
+        checkpoint_file = args.checkpoint_file or os.path.join(CHECKPOINT_DIR, f"{NEW_SOURCE_TYPE}.jsonl")
+        checkpoint = Checkpoint(checkpoint_file)
+        if args.reset_checkpoint:
+            checkpoint.reset()
+            logger.info(f"Checkpoint {checkpoint_file} apagado.")
+
+    llm_limiter = LLMRateLimiter(args.llm_concurrency)
+    summary = run_parallel(
+        metadata_files,
+        lambda filepath: process_single_transcription(
+            filepath, supabase_client, structure_analyzer, args.force_reprocess, args.dry_run, llm_limiter
+        ),
+        # O arquivo se chama {VIDEO_ID}.json
+        key=lambda filepath: os.path.splitext(os.path.basename(filepath))[0],
+        checkpoint=checkpoint,
+        max_workers=args.workers,
+    )
 
     logger.info("=================================================================")
     logger.info(f"Processamento de reestruturação de transcrições concluído.")
-    logger.info(f"Total de arquivos de metadados encontrados: {total_files}")
-    logger.info(f"Processados com sucesso: {success_count}")
-    logger.info(f"Falhas no processamento: {fail_count}")
+    logger.info(f"Total de arquivos de metadados encontrados: {summary.total}")
+    logger.info(f"Pulados (checkpoint): {summary.skipped}")
+    logger.info(f"Processados com sucesso: {summary.succeeded}")
+    logger.info(f"Falhas no processamento: {summary.failed}")
     logger.info("=================================================================")
 
 
@@ -63,7 +63,7 @@ def revert_changes(supabase_client: Client, gdrive_id_to_revert: str, dry_run: b
             # VAMOS TENTAR A BUSCA E FILTRO NO CLIENTE (menos eficiente):
             response = supabase_client.table('documents') \
                                      .select('document_id, metadata') \
-                                     .eq('metadata->>gdrive_id', gdrive_id_to_revert) \
+                                     .eq('gdrive_id', gdrive_id_to_revert) \
                                      .range(offset, offset + DB_UPDATE_BATCH_SIZE - 1) \
                                      .execute()
 
@@ -117,7 +117,7 @@ def revert_changes(supabase_client: Client, gdrive_id_to_revert: str, dry_run: b
         try:
             response = supabase_client.table('documents') \
                                      .select('document_id') \
-                                     .eq('metadata->>gdrive_id', gdrive_id_to_revert) \
+                                     .eq('gdrive_id', gdrive_id_to_revert) \
                                      .eq('indexing_status', 'obsolete_restructured') \
                                      .range(offset, offset + DB_UPDATE_BATCH_SIZE - 1) \
                                      .execute()
@@ -0,0 +1,241 @@
+"""
+Executor compartilhado pelos scripts de reestruturação de chunks
+(`restructure_chunks.py` e `restructure_video_transcripts.py`).
+
+- `run_parallel`: processa documentos num pool limitado de threads.
+- `Checkpoint`: persiste os IDs já concluídos, para que uma nova execução
+  pule o que já foi feito.
+- `LLMRateLimiter`: limita as chamadas simultâneas ao LLM e recua (para
+  todas as threads) quando o provedor responde com rate limit.
+- `insert_in_batches` / `mark_obsolete_in_batches`: escrita em lotes no
+  Supabase.
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_LLM_CONCURRENCY = 2
+
+
+class Checkpoint:
+    """
+    Conjunto de IDs concluídos, persistido em JSON Lines (um ID por linha).
+    Cada ID é gravado assim que termina, então uma interrupção no meio da
+    execução perde no máximo os documentos que estavam em andamento.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._done: Set[str] = set()
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self._done.add(json.loads(line)["id"])
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        # Última linha truncada por uma interrupção
+                        logger.warning(f"Linha inválida ignorada no checkpoint {path}: {line[:80]}")
+            logger.info(f"Checkpoint {path} carregado com {len(self._done)} IDs concluídos.")
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def mark_done(self, item_id: str) -> None:
+        with self._lock:
+            if item_id in self._done:
+                return
+            self._done.add(item_id)
+            if not self.path:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"id": item_id, "completed_at": time.time()}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._done.clear()
+            if self.path and os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Identifica erros de rate limit (litellm, openai, HTTP 429) sem depender do provedor."""
+    if type(error).__name__ in {"RateLimitError", "TooManyRequests"}:
+        return True
+    status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if status_code == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "rate_limit" in message
+
+
+class LLMRateLimiter:
+    """
+    Limita as chamadas simultâneas ao LLM a `max_concurrency`.
+
+    Quando uma chamada falha por rate limit, todas as threads pausam até o
+    fim do recuo (exponencial, com jitter) antes de novas chamadas, em vez de
+    cada uma insistir por conta própria.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+        max_retries: int = 5,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 60.0,
+    ):
+        self._semaphore = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._lock = threading.Lock()
+        self._cooldown_until = 0.0
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+    def _wait_for_cooldown(self) -> None:
+        while True:
+            with self._lock:
+                remaining = self._cooldown_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def _start_cooldown(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.initial_backoff * 2**attempt)
+        delay += random.uniform(0, delay / 2)
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+        return delay
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            self._wait_for_cooldown()
+            with self._semaphore:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                        raise
+                    delay = self._start_cooldown(attempt)
+            attempt += 1
+            logger.warning(f"Rate limit do LLM (tentativa {attempt}/{self.max_retries}). Pausando chamadas por {delay:.1f}s.")
+
+
+def insert_in_batches(
+    supabase_client: Any,
+    rows: List[Dict],
+    batch_size: int,
+    label: str,
+    table: str = "documents",
+) -> bool:
+    """Insere `rows` em lotes de `batch_size`. Retorna False no primeiro lote com erro."""
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        try:
+            response = supabase_client.table(table).insert(batch, returning="minimal").execute()
+            if hasattr(response, "error") and response.error:
+                logger.error(f"Erro Supabase ao inserir lote de chunks para {label}: {response.error}")
+                return False
+        except Exception as e:
+            logger.error(f"Exceção ao inserir lote de chunks para {label}: {e}", exc_info=True)
+            return False
+    return True
+
+
+def mark_obsolete_in_batches(
+    supabase_client: Any,
+    chunk_ids: List[str],
+    new_status: str,
+    batch_size: int,
+    table: str = "documents",
+) -> bool:
+    """
+    Marca os chunks indicados com `keep = False` e `indexing_status = new_status`,
+    em lotes, para não estourar o tamanho da URL do filtro `in`.
+    """
+    for i in range(0, len(chunk_ids), batch_size):
+        batch = chunk_ids[i:i + batch_size]
+        response = supabase_client.table(table) \
+            .update({"keep": False, "indexing_status": new_status}) \
+            .in_("document_id", batch) \
+            .execute()
+        if hasattr(response, "error") and response.error:
+            logger.error(f"Erro ao marcar lote de {len(batch)} chunks como '{new_status}': {response.error}")
+            return False
+    return True
+
+
+@dataclass
+class RunSummary:
+    total: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+
+def run_parallel(
+    items: Iterable[Any],
+    process_item: Callable[[Any], bool],
+    key: Callable[[Any], str] = str,
+    checkpoint: Optional[Checkpoint] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> RunSummary:
+    """
+    Executa `process_item` para cada item num pool de `max_workers` threads.
+
+    Itens cuja chave já está no checkpoint são pulados; itens processados com
+    sucesso (retorno True) são gravados nele. Uma exceção num item é logada e
+    contada como falha, sem interromper os demais.
+    """
+    summary = RunSummary()
+    pending = []
+    for item in items:
+        summary.total += 1
+        if checkpoint is not None and key(item) in checkpoint:
+            summary.skipped += 1
+        else:
+            pending.append(item)
+
+    if summary.skipped:
+        logger.info(f"{summary.skipped} de {summary.total} itens já concluídos segundo o checkpoint. Pulando.")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(process_item, item): item for item in pending}
+        for done_count, future in enumerate(as_completed(futures), start=1):
+            item_key = key(futures[future])
+            try:
+                ok = future.result()
+            except Exception as e:
+                logger.error(f"Erro não tratado ao processar {item_key}: {e}", exc_info=True)
+                ok = False
+            if ok:
+                summary.succeeded += 1
+                if checkpoint is not None:
+                    checkpoint.mark_done(item_key)
+            else:
+                summary.failed += 1
+            logger.info(f"Progresso: {done_count}/{len(pending)} ({item_key}: {'ok' if ok else 'falha'})")
+
+    return summary
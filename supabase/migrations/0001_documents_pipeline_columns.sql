@@ -0,0 +1,51 @@
+-- supabase/migrations/0001_documents_pipeline_columns.sql
+
+-- Colunas de status usadas pelo worker (etl/annotate_and_index.py) e pelos scripts
+-- de reestruturação. Já existem nos ambientes criados manualmente; IF NOT EXISTS
+-- torna a migração idempotente.
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS keep BOOLEAN;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS status TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS annotation_status TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS annotated_at TIMESTAMPTZ;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS indexing_status TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS indexed_at TIMESTAMPTZ;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS r2r_status TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS r2r_document_id TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS r2r_indexed_at TIMESTAMPTZ;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS r2r_error TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS chunk_index INTEGER;
+
+-- Colunas geradas a partir do JSONB de metadados, para que os filtros usem índices
+-- B-tree comuns em vez de avaliar `metadata->>'...'` linha a linha.
+-- Atenção: adicionar colunas STORED reescreve a tabela (lock exclusivo durante a
+-- migração); rodar fora do horário do ETL.
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS gdrive_id TEXT
+    GENERATED ALWAYS AS (metadata->>'gdrive_id') STORED;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS source_type TEXT
+    GENERATED ALWAYS AS (metadata->>'source_type') STORED;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS video_id TEXT
+    GENERATED ALWAYS AS (metadata->>'video_id') STORED;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS original_document_id TEXT
+    GENERATED ALWAYS AS (metadata->>'original_document_id') STORED;
+
+-- Verdadeiro quando o chunk ainda tem trabalho pendente no pipeline (anotação ou
+-- indexação no R2R, incluindo falhas a reprocessar). Espelha o filtro de
+-- fetch_pending_chunks_from_supabase; mantenha os dois em sincronia.
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS needs_processing BOOLEAN
+    GENERATED ALWAYS AS (
+        COALESCE(
+            status IN ('pending_annotation', 'pending_indexing')
+            OR annotation_status IS NULL
+            OR annotation_status IN ('pending', 'annotation_failed')
+            OR r2r_status IS NULL
+            OR r2r_status = 'pending'
+            OR r2r_status LIKE 'failed%',
+            FALSE
+        )
+    ) STORED;
+
+COMMENT ON COLUMN documents.gdrive_id IS 'Gerada de metadata->>gdrive_id.';
+COMMENT ON COLUMN documents.source_type IS 'Gerada de metadata->>source_type.';
+COMMENT ON COLUMN documents.video_id IS 'Gerada de metadata->>video_id.';
+COMMENT ON COLUMN documents.original_document_id IS 'Gerada de metadata->>original_document_id.';
+COMMENT ON COLUMN documents.needs_processing IS 'Indica se o chunk tem anotação ou indexação pendente (ver fetch_pending_chunks_from_supabase).';
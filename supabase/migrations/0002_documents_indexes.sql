@@ -0,0 +1,37 @@
+-- supabase/migrations/0002_documents_indexes.sql
+
+-- Fila do worker: chunks com trabalho pendente, mais antigos primeiro.
+-- O índice parcial só contém as linhas pendentes, então continua pequeno à medida
+-- que a tabela cresce com chunks já processados.
+CREATE INDEX IF NOT EXISTS idx_documents_pending_updated_at
+    ON documents (updated_at)
+    WHERE needs_processing;
+
+-- Busca de chunks ativos de um documento do Drive (reconstruct_document_content).
+CREATE INDEX IF NOT EXISTS idx_documents_gdrive_id_active
+    ON documents (gdrive_id)
+    WHERE keep IS TRUE;
+
+-- Busca por gdrive_id e status, inclusive de chunks obsoletos (revert_restructuring.py).
+CREATE INDEX IF NOT EXISTS idx_documents_gdrive_id_indexing_status
+    ON documents (gdrive_id, indexing_status);
+
+-- gdrive_ids distintos por source_type (RPC get_distinct_gdrive_ids).
+CREATE INDEX IF NOT EXISTS idx_documents_source_type_gdrive_id_active
+    ON documents (source_type, gdrive_id)
+    WHERE keep IS TRUE AND gdrive_id IS NOT NULL;
+
+-- Transcrições de vídeo já processadas (restructure_video_transcripts.py).
+CREATE INDEX IF NOT EXISTS idx_documents_video_id_source_type
+    ON documents (video_id, source_type)
+    WHERE video_id IS NOT NULL;
+
+-- Chunks gerados a partir de um chunk original (rechunk_supabase_documents.py).
+CREATE INDEX IF NOT EXISTS idx_documents_original_document_id
+    ON documents (original_document_id)
+    WHERE original_document_id IS NOT NULL;
+
+-- Filtros por tag de anotação.
+CREATE INDEX IF NOT EXISTS idx_documents_tags ON documents USING GIN (annotation_tags);
+
+ANALYZE documents;
@@ -0,0 +1,24 @@
+-- supabase/migrations/0003_get_distinct_gdrive_ids.sql
+
+-- gdrive_ids distintos dos chunks ativos de um source_type, calculados no servidor
+-- (antes o cliente buscava um lote de chunks e deduplicava localmente, perdendo
+-- os IDs fora do lote). Usa idx_documents_source_type_gdrive_id_active.
+CREATE OR REPLACE FUNCTION get_distinct_gdrive_ids(
+    p_source_type TEXT,
+    p_limit INTEGER DEFAULT NULL
+)
+RETURNS TABLE (gdrive_id TEXT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT DISTINCT d.gdrive_id
+    FROM documents d
+    WHERE d.source_type = p_source_type
+      AND d.keep IS TRUE
+      AND d.gdrive_id IS NOT NULL
+    ORDER BY d.gdrive_id
+    LIMIT p_limit;
+$$;
+
+REVOKE ALL ON FUNCTION get_distinct_gdrive_ids(TEXT, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION get_distinct_gdrive_ids(TEXT, INTEGER) TO service_role;
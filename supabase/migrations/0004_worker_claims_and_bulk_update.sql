@@ -0,0 +1,87 @@
+-- supabase/migrations/0004_worker_claims_and_bulk_update.sql
+
+-- Reserva (claim) de chunks pendentes pelo worker e atualização em lote, usadas
+-- por worker_service/infra/supabase_dal.py. Com a reserva, várias instâncias do
+-- worker podem buscar chunks em paralelo sem processar o mesmo chunk duas vezes;
+-- a reserva expira sozinha se o worker cair no meio do lote.
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS claimed_by TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMPTZ;
+
+COMMENT ON COLUMN documents.claimed_by IS 'Worker que reservou o chunk para processamento (ver claim_pending_documents).';
+COMMENT ON COLUMN documents.claimed_until IS 'Fim da reserva; depois disso o chunk volta a ser elegível.';
+
+-- Reserva até p_limit chunks com needs_processing, dos mais antigos para os mais
+-- novos. FOR UPDATE SKIP LOCKED faz chamadas concorrentes pularem as linhas que
+-- outra transação está reservando, em vez de esperar por elas.
+CREATE OR REPLACE FUNCTION claim_pending_documents(
+    p_worker_id TEXT,
+    p_limit INTEGER,
+    p_lease_seconds INTEGER DEFAULT 900
+)
+RETURNS SETOF documents
+LANGUAGE sql
+VOLATILE
+AS $$
+    WITH candidates AS (
+        SELECT id
+        FROM documents
+        WHERE needs_processing
+          AND (claimed_until IS NULL OR claimed_until < NOW())
+        ORDER BY updated_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE documents d
+    SET claimed_by = p_worker_id,
+        claimed_until = NOW() + make_interval(secs => p_lease_seconds)
+    FROM candidates
+    WHERE d.id = candidates.id
+    RETURNING d.*;
+$$;
+
+-- Aplica atualizações de status diferentes por chunk numa única chamada.
+-- p_updates é um array JSON de objetos com "id" e as colunas a alterar; colunas
+-- ausentes no objeto mantêm o valor atual. A reserva do chunk é liberada, a não
+-- ser que p_release_claims seja falso (etapas intermediárias do mesmo lote).
+-- Retorna o número de linhas atualizadas.
+CREATE OR REPLACE FUNCTION bulk_update_documents(
+    p_updates JSONB,
+    p_release_claims BOOLEAN DEFAULT TRUE
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+VOLATILE
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE documents d
+    SET annotation_status = CASE WHEN u.value ? 'annotation_status' THEN u.value->>'annotation_status' ELSE d.annotation_status END,
+        annotated_at = CASE WHEN u.value ? 'annotated_at' THEN (u.value->>'annotated_at')::timestamptz ELSE d.annotated_at END,
+        keep = CASE WHEN u.value ? 'keep' THEN (u.value->>'keep')::boolean ELSE d.keep END,
+        annotation_tags = CASE WHEN u.value ? 'annotation_tags'
+            THEN ARRAY(SELECT jsonb_array_elements_text(COALESCE(NULLIF(u.value->'annotation_tags', 'null'::jsonb), '[]'::jsonb)))
+            ELSE d.annotation_tags END,
+        annotation_reason = CASE WHEN u.value ? 'annotation_reason' THEN u.value->>'annotation_reason' ELSE d.annotation_reason END,
+        indexing_status = CASE WHEN u.value ? 'indexing_status' THEN u.value->>'indexing_status' ELSE d.indexing_status END,
+        indexed_at = CASE WHEN u.value ? 'indexed_at' THEN (u.value->>'indexed_at')::timestamptz ELSE d.indexed_at END,
+        status = CASE WHEN u.value ? 'status' THEN u.value->>'status' ELSE d.status END,
+        r2r_status = CASE WHEN u.value ? 'r2r_status' THEN u.value->>'r2r_status' ELSE d.r2r_status END,
+        r2r_document_id = CASE WHEN u.value ? 'r2r_document_id' THEN u.value->>'r2r_document_id' ELSE d.r2r_document_id END,
+        r2r_indexed_at = CASE WHEN u.value ? 'r2r_indexed_at' THEN (u.value->>'r2r_indexed_at')::timestamptz ELSE d.r2r_indexed_at END,
+        r2r_error = CASE WHEN u.value ? 'r2r_error' THEN u.value->>'r2r_error' ELSE d.r2r_error END,
+        claimed_by = CASE WHEN p_release_claims THEN NULL ELSE d.claimed_by END,
+        claimed_until = CASE WHEN p_release_claims THEN NULL ELSE d.claimed_until END
+    FROM jsonb_array_elements(p_updates) AS u(value)
+    -- jsonb_populate_record converte o "id" para o tipo da coluna documents.id
+    WHERE d.id = (jsonb_populate_record(NULL::documents, jsonb_build_object('id', u.value->'id'))).id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION claim_pending_documents(TEXT, INTEGER, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION claim_pending_documents(TEXT, INTEGER, INTEGER) TO service_role;
+REVOKE ALL ON FUNCTION bulk_update_documents(JSONB, BOOLEAN) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION bulk_update_documents(JSONB, BOOLEAN) TO service_role;
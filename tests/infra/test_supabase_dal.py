@@ -0,0 +1,143 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from infra.supabase_dal import (
+    ChunkUpdate,
+    DALError,
+    PostgrestDocumentsDAL,
+    create_documents_dal,
+)
+
+
+def make_dal(handler, **kwargs):
+    """DAL PostgREST com um transporte falso que registra as requisições."""
+    client = httpx.AsyncClient(base_url="https://example.supabase.co/rest/v1", transport=httpx.MockTransport(handler))
+    dal = PostgrestDocumentsDAL("https://example.supabase.co", "service-key", client=client, worker_id="worker-1", **kwargs)
+    # Sem espera entre as retentativas nos testes
+    dal.retry_handler.initial_delay = 0
+    return dal
+
+
+def test_claim_pending_calls_rpc_with_worker_id():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[{"id": 1, "content": "a"}])
+
+    chunks = asyncio.run(make_dal(handler).claim_pending(10, lease_seconds=60))
+
+    assert chunks == [{"id": 1, "content": "a"}]
+    assert requests[0].url.path == "/rest/v1/rpc/claim_pending_documents"
+    assert json.loads(requests[0].content) == {"p_worker_id": "worker-1", "p_limit": 10, "p_lease_seconds": 60}
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, {"needs_processing": "is.true"}),
+        ({"document_id": "doc-1"}, {"document_id": "eq.doc-1"}),
+        ({"include_reannotation": True}, {"or": "(needs_processing.is.true,annotation_status.neq.done,keep.neq.false)"}),
+    ],
+)
+def test_select_pending_filters(kwargs, expected):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    asyncio.run(make_dal(handler).select_pending(5, **kwargs))
+
+    params = dict(requests[0].url.params)
+    assert params["limit"] == "5"
+    assert params["order"] == "updated_at.asc"
+    for key, value in expected.items():
+        assert params[key] == value
+
+
+def test_bulk_update_batches_and_filters_columns():
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(200, json=len(body["p_updates"]))
+
+    updates = [ChunkUpdate(id=i, changes={"r2r_status": "success", "content": "ignorado"}) for i in range(5)]
+    updated = asyncio.run(make_dal(handler, batch_size=2).bulk_update(updates, release_claims=False))
+
+    assert updated == 5
+    assert [len(body["p_updates"]) for body in bodies] == [2, 2, 1]
+    assert bodies[0]["p_updates"][0] == {"id": 0, "r2r_status": "success"}
+    assert all(body["p_release_claims"] is False for body in bodies)
+
+
+def test_transient_errors_are_retried():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) < 3:
+            return httpx.Response(503, text="unavailable")
+        return httpx.Response(200, json=[])
+
+    assert asyncio.run(make_dal(handler).claim_pending(1)) == []
+    assert len(attempts) == 3
+
+
+def test_client_errors_are_not_retried():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(400, json={"message": "bad filter"})
+
+    with pytest.raises(DALError) as exc_info:
+        asyncio.run(make_dal(handler).select_pending(1))
+    assert exc_info.value.status_code == 400
+    assert len(attempts) == 1
+
+
+def test_insert_chunks_rejects_unknown_columns():
+    dal = make_dal(lambda request: httpx.Response(201))
+
+    with pytest.raises(ValueError):
+        asyncio.run(dal.insert_chunks([{"content": "a", "drop_table": "x"}]))
+
+
+def test_insert_chunks_uses_minimal_return_and_column_list():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201)
+
+    rows = [{"content": "a", "metadata": {"x": 1}}, {"content": "b", "document_id": "d"}]
+    assert asyncio.run(make_dal(handler).insert_chunks(rows)) == 2
+
+    assert requests[0].headers["Prefer"] == "return=minimal,missing=default"
+    assert requests[0].url.params["columns"] == "content,document_id,metadata"
+
+
+def test_create_documents_dal_requires_configuration(monkeypatch):
+    for name in ("SUPABASE_DB_DSN", "SUPABASE_URL", "SUPABASE_SERVICE_KEY"):
+        monkeypatch.delenv(name, raising=False)
+
+    with pytest.raises(ValueError):
+        create_documents_dal()
+
+
+def test_transport_errors_become_dal_errors_after_retries():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    with pytest.raises(DALError):
+        asyncio.run(make_dal(handler).bulk_update([ChunkUpdate(id=1, changes={"status": "completed"})]))
+    assert len(attempts) > 1
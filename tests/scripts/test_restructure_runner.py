@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from scripts.utils.restructure_runner import (
+    Checkpoint,
+    LLMRateLimiter,
+    is_rate_limit_error,
+    run_parallel,
+)
+
+
+class RateLimitError(Exception):
+    pass
+
+
+def test_checkpoint_skips_completed_ids(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    processed = []
+
+    def process(item):
+        processed.append(item)
+        return item != "b"
+
+    first = run_parallel(["a", "b", "c"], process, checkpoint=Checkpoint(str(path)), max_workers=2)
+    assert (first.succeeded, first.failed) == (2, 1)
+
+    processed.clear()
+    second = run_parallel(["a", "b", "c"], process, checkpoint=Checkpoint(str(path)))
+    # Só o item que falhou é processado de novo
+    assert processed == ["b"]
+    assert second.skipped == 2
+
+
+def test_checkpoint_ignores_truncated_line(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    path.write_text('{"id": "a"}\n{"id": "b', encoding="utf-8")
+
+    checkpoint = Checkpoint(str(path))
+
+    assert "a" in checkpoint
+    assert "b" not in checkpoint
+
+
+def test_failing_item_does_not_stop_the_others():
+    def process(item):
+        if item == 2:
+            raise ValueError("boom")
+        return True
+
+    summary = run_parallel([1, 2, 3], process, max_workers=3)
+
+    assert (summary.succeeded, summary.failed) == (2, 1)
+
+
+def test_rate_limiter_bounds_concurrency():
+    limiter = LLMRateLimiter(max_concurrency=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def call():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return True
+
+    run_parallel(range(8), lambda _: limiter.call(call), max_workers=8)
+
+    assert peak == 2
+
+
+def test_rate_limiter_backs_off_and_retries():
+    limiter = LLMRateLimiter(max_concurrency=1, initial_backoff=0.01)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RateLimitError("429 Too Many Requests")
+        return "ok"
+
+    assert limiter.call(flaky) == "ok"
+    assert len(attempts) == 3
+
+
+def test_rate_limiter_does_not_retry_other_errors():
+    limiter = LLMRateLimiter(initial_backoff=0.01)
+
+    with pytest.raises(ValueError):
+        limiter.call(lambda: (_ for _ in ()).throw(ValueError("json inválido")))
+    assert not is_rate_limit_error(ValueError("json inválido"))
@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import os
+
+import pytest
+
+# O módulo encerra o processo na importação sem as credenciais do Supabase.
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "service-key")
+
+from etl import annotate_and_index  # noqa: E402
+from infra.supabase_dal import DALError  # noqa: E402
+
+
+class FakeDAL:
+    """DAL em memória: reserva todos os chunks pendentes e registra as atualizações."""
+
+    def __init__(self, chunks):
+        self.chunks = {chunk["id"]: dict(chunk) for chunk in chunks}
+        self.updates = []
+        self.claims = 0
+
+    async def claim_pending(self, limit, lease_seconds=900):
+        self.claims += 1
+        if self.claims > 10:
+            raise AssertionError("o pipeline não terminou")
+        return [dict(chunk) for chunk in self.chunks.values()][:limit]
+
+    async def bulk_update(self, updates, release_claims=True):
+        self.updates.append((list(updates), release_claims))
+        return len(updates)
+
+
+def make_args(**overrides):
+    args = dict(
+        batch_size=10,
+        max_workers=2,
+        skip_annotation=True,
+        skip_r2r_indexing=True,
+        source_doc_id_to_reprocess=None,
+        reprocess_supabase_annotations=False,
+    )
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def test_failed_chunks_are_released_with_error_status(monkeypatch):
+    def process_single_chunk(chunk, annotator, skip_annotation, args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(annotate_and_index, "process_single_chunk", process_single_chunk)
+    dal = FakeDAL([{"id": "c1", "content": "texto"}])
+
+    asyncio.run(annotate_and_index.run_pipeline(dal, None, None, make_args()))
+
+    failure_updates = [(u, release) for updates, release in dal.updates for u in updates if u.changes]
+    assert len(failure_updates) == 1
+    update, released = failure_updates[0]
+    assert released is True
+    assert update.changes["annotation_status"] == "annotation_failed"
+    assert update.changes["status"] == "processing_failed"
+    assert "boom" in update.changes["annotation_reason"]
+    # Na segunda reserva o chunk já falhou nesta execução: só é liberado.
+    assert dal.claims == 2
+
+
+def test_status_write_failures_do_not_stop_the_pipeline(monkeypatch):
+    def process_single_chunk(chunk, annotator, skip_annotation, args):
+        raise RuntimeError("boom")
+
+    async def bulk_update(updates, release_claims=True):
+        raise DALError("Falha de conexão com o Supabase")
+
+    monkeypatch.setattr(annotate_and_index, "process_single_chunk", process_single_chunk)
+    dal = FakeDAL([{"id": "c1", "content": "texto"}])
+    dal.bulk_update = bulk_update
+
+    asyncio.run(annotate_and_index.run_pipeline(dal, None, None, make_args()))
+
+    assert dal.claims == 2
@@ -66,8 +66,8 @@ fi
 # ls -la /app/worker_service/etl/ # Mais específico
 
 # Executa o script principal do pipeline ETL.
-# O monkey-patch para HTTP/1.1 e a correção do RetryHandler estão em annotate_and_index.py
-# e resilience.py, respectivamente.
+# O acesso ao Supabase passa pela DAL assíncrona (infra/supabase_dal.py);
+# SUPABASE_HTTP2=false força HTTP/1.1 se o ambiente tiver problemas com HTTP/2.
 # Usar python -u para saída não bufferizada, o que pode ajudar nos logs do Railway.
 echo "======================================"
 echo "Iniciando script principal do ETL Worker (annotate_and_index.py)..."
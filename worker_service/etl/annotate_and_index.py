@@ -25,31 +25,6 @@ Requer configuração via variáveis de ambiente (ver `.env.sample`).
 
 from __future__ import annotations
 
-# --- INÍCIO DO MONKEY PATCH HTTP/1.1 ---
-import httpx  # Necessário para o patch
-import sys    # Para print flush
-
-print("!!! ATENÇÃO: TENTANDO APLICAR MONKEY PATCH GLOBAL NO HTTpx PARA FORÇAR HTTP/1.1 !!!", flush=True)
-
-_original_httpx_client_init = httpx.Client.__init__
-_original_httpx_async_client_init = httpx.AsyncClient.__init__
-
-def _patched_httpx_client_init(self_client, *args, **kwargs):
-    print(f"MONKEY_PATCH: httpx.Client.__init__ - Forçando http2=False. Kwargs recebidos: {kwargs}", flush=True)
-    kwargs['http2'] = False
-    _original_httpx_client_init(self_client, *args, **kwargs)
-
-def _patched_httpx_async_client_init(self_async_client, *args, **kwargs):
-    print(f"MONKEY_PATCH: httpx.AsyncClient.__init__ - Forçando http2=False. Kwargs recebidos: {kwargs}", flush=True)
-    kwargs['http2'] = False
-    _original_httpx_async_client_init(self_async_client, *args, **kwargs)
-
-httpx.Client.__init__ = _patched_httpx_client_init
-httpx.AsyncClient.__init__ = _patched_httpx_async_client_init
-
-print("!!! MONKEY PATCH HTTpx APLICADO GLOBALMENTE !!!", flush=True)
-# --- FIM DO MONKEY PATCH HTTP/1.1 ---
-
 import argparse
 import logging
 import os
@@ -58,7 +33,7 @@ import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import tempfile
 import json
 import traceback
@@ -69,16 +44,13 @@ from cachetools import TTLCache
 
 import tiktoken
 from dotenv import load_dotenv
-from postgrest.exceptions import APIError as PostgrestAPIError
-from supabase import Client, create_client
-from supabase.lib.client_options import ClientOptions
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
-from httpx import TimeoutException, ConnectError, RemoteProtocolError
+from httpx import RemoteProtocolError
 from r2r import DocumentChunk
 
 # Adiciona o diretório raiz do projeto ao PYTHONPATH
@@ -86,12 +58,13 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-logger_etl_version_check = logging.getLogger("etl_version_check")
-logger_etl_version_check.info("--- ETL_ANNOTATE_AND_INDEX.PY --- VERSION_MAY_16_REFRESH_CHECK_V3 --- ATTEMPTING IMPORT AnnotatorAgent ---")
-from agents.annotator_agent import AnnotatorAgent, ChunkOut
-logger_etl_version_check.info("--- ETL_ANNOTATE_AND_INDEX.PY --- VERSION_MAY_16_REFRESH_CHECK_V3 --- IMPORTED AnnotatorAgent SUCCESSFULLY ---")
-
 from infra.r2r_client import R2RClientWrapper
+from infra.supabase_dal import ChunkUpdate, DALError, DocumentsDAL, create_documents_dal
+
+if TYPE_CHECKING:
+    # CrewAI e langchain levam segundos para importar; só são carregados
+    # quando a anotação roda (ver `_load_annotator_agent`).
+    from agents.annotator_agent import AnnotatorAgent, ChunkOut
 
 # ---------------------------------------------------------------------------
 # Configuração global
@@ -115,48 +88,10 @@ except Exception:
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 
-if not SUPABASE_URL or not SUPABASE_KEY:
+if not os.getenv("SUPABASE_DB_DSN") and (not SUPABASE_URL or not SUPABASE_KEY):
     logger.error("SUPABASE_URL ou SUPABASE_SERVICE_KEY ausentes. Abortando.")
     sys.exit(1)
 
-# Configurar timeouts e headers
-options = ClientOptions(
-    postgrest_client_timeout=300  # Timeout de 5 minutos para operações do PostgREST
-    # Headers de autenticação removidos daqui.
-    # create_client(SUPABASE_URL, SUPABASE_KEY) deve lidar com a service_role_key automaticamente.
-)
-
-# --- REVERTENDO: Voltar para a inicialização padrão --- 
-supabase_client: Client = create_client(SUPABASE_URL, SUPABASE_KEY, options)
-print("--- SUPABASE CLIENT INITIALIZED (using ClientOptions) ---", flush=True)
-
-# DEBUG: Verificar as opções do cliente PostgREST interno
-print("--- BEGINNING SUPABASE CLIENT DEBUG ---", flush=True)
-try:
-    if hasattr(supabase_client, 'postgrest') and supabase_client.postgrest:
-        print("DEBUG: supabase_client.postgrest object exists.", flush=True)
-        
-        if hasattr(supabase_client.postgrest, 'session') and supabase_client.postgrest.session:
-            internal_httpx_client = supabase_client.postgrest.session
-            print(f"DEBUG: Internal httpx client type: {type(internal_httpx_client)}", flush=True)
-            if hasattr(internal_httpx_client, 'timeout'):
-                print(f"DEBUG: Timeout of internal httpx client: {internal_httpx_client.timeout}", flush=True)
-            else:
-                if hasattr(supabase_client.postgrest, 'options') and hasattr(supabase_client.postgrest.options, 'timeout'):
-                     print(f"DEBUG: Timeout from supabase_client.postgrest.options: {supabase_client.postgrest.options.timeout}", flush=True)
-
-            if hasattr(internal_httpx_client, 'headers'):
-                print(f"DEBUG: Headers of internal httpx client: {internal_httpx_client.headers}", flush=True)
-            
-            print(f"DEBUG: HTTP/2 support status is not directly introspectable via simple attribute here.", flush=True)
-        else:
-            print("DEBUG: Could not access supabase_client.postgrest.session for httpx client details.", flush=True)
-    else:
-        print("DEBUG: supabase_client.postgrest object NOT found or not initialized.", flush=True)
-except Exception as e_debug:
-    print(f"DEBUG: Exception during Supabase client introspection: {str(e_debug)}", flush=True)
-print("--- END OF SUPABASE CLIENT DEBUG ---", flush=True)
-
 try:
     r2r_client = R2RClientWrapper()
     logger.info("R2R Client inicializado.")
@@ -168,7 +103,7 @@ except Exception as exc:
 # Funções utilitárias
 # ---------------------------------------------------------------------------
 
-RETRYABLE_EXCEPTIONS = (ConnectionError, TimeoutError, PostgrestAPIError, RemoteProtocolError)
+RETRYABLE_EXCEPTIONS = (ConnectionError, TimeoutError, RemoteProtocolError)
 
 def tenacity_retry():
     return retry(
@@ -201,18 +136,13 @@ def _sanitize_metadata(item_to_sanitize: Any) -> Any:
 # Supabase helpers
 # ---------------------------------------------------------------------------
 
-@tenacity_retry()
-def _update_chunk_status_supabase(doc_id: str, update: Dict[str, Any]):
-    allowed = {
-        "annotation_status", "annotated_at", "keep", "annotation_tags",
-        "indexing_status", "indexed_at", "annotation_reason", "status",
-        "r2r_status", "r2r_document_id", "r2r_indexed_at", "r2r_error",
-    }
-    payload = {k: v for k, v in update.items() if k in allowed}
-    
-    if not payload:
-        logger.debug(f"Nenhum payload válido para atualizar o status do Supabase para doc_id {doc_id}")
-        return
+def _status_update(doc_id: str, update: Dict[str, Any]) -> ChunkUpdate:
+    """
+    Monta a atualização de status de um chunk, derivando a coluna `status` do
+    resultado da anotação ou da indexação quando ela não é informada.
+    As atualizações são acumuladas e gravadas em lote com `DocumentsDAL.bulk_update`.
+    """
+    payload = dict(update)
 
     if "r2r_status" in payload:
         if payload["r2r_status"] == "success": # Alterado de "indexed" para "success" para corresponder à lógica de _upload_document_batch_to_r2r
@@ -231,77 +161,31 @@ def _update_chunk_status_supabase(doc_id: str, update: Dict[str, Any]):
         elif payload["annotation_status"] == "annotation_failed": # Unificado "error" e "annotation_failed"
              payload.setdefault("status", "processing_failed")
 
-    logger.debug(f"Atualizando Supabase para doc_id {doc_id} com payload: {payload}")
-    try:
-        supabase_client.table("documents").update(payload).eq("id", doc_id).execute()
-        logger.info(f"Status do Supabase atualizado com sucesso para chunk id {doc_id}")
-    except Exception as e:
-        logger.error(f"Falha ao atualizar status do Supabase para chunk id {doc_id}: {e}", exc_info=True)
-        raise
-
-# Cache para evitar múltiplas buscas do mesmo chunk no Supabase
-# chunk_cache = TTLCache(maxsize=1000, ttl=300) # Cache para 1000 chunks por 5 minutos # REMOVER CACHE POR AGORA
+    return ChunkUpdate(id=doc_id, changes=payload)
 
-@tenacity_retry() # Adicionando o decorador de retry aqui também
-def ensure_chunk_exists(chunk_id_supabase: str, chunk_data_for_insert: Optional[Dict[str, Any]] = None): # Adicionado argumento para dados de inserção
-    """
-    Garante que o chunk/documento existe na tabela 'documents' do Supabase.
-    Se não existir e chunk_data_for_insert for fornecido, faz insert.
-    O ID do chunk no Supabase é o campo 'id'.
-    Retorna os dados do chunk se existir ou for criado, caso contrário None.
-    """
-    logger.debug(f"[ensure_chunk_exists] Chamado para ID: {chunk_id_supabase}")
-    
-    # Verifica se o chunk existe
-    resp_select = supabase_client.table("documents").select("id").eq("id", chunk_id_supabase).limit(1).execute()
-    
-    if resp_select.data:
-        logger.debug(f"[ensure_chunk_exists] Chunk {chunk_id_supabase} já existe no Supabase.")
-        # Retorna um dict simples indicando existência, os dados completos serão do fetch_pending_chunks...
-        return {"id": chunk_id_supabase, "exists": True}
-    elif chunk_data_for_insert:
-        logger.info(f"[ensure_chunk_exists] Chunk {chunk_id_supabase} não encontrado. Tentando inserir.")
-        insert_data = {
-            "id": chunk_id_supabase,
-            "document_id": chunk_data_for_insert.get("document_id"), # Corrigido: source_document_id -> document_id
-            # "source_file_name": chunk_data_for_insert.get("source_file_name"), # Presumindo que está em metadata
-            # "source_type": chunk_data_for_insert.get("source_type"), # Presumindo que está em metadata
-            # "user_id": chunk_data_for_insert.get("user_id"), # Presumindo que está em metadata ou não é mais usado diretamente
-            "content": chunk_data_for_insert.get("content"), # Corrigido: chunk_content -> content
-            "token_count": chunk_data_for_insert.get("token_count"),
-            "chunk_index": chunk_data_for_insert.get("chunk_index"),
-            "metadata": _sanitize_metadata(chunk_data_for_insert.get("metadata", {})),
-            "status": chunk_data_for_insert.get("status", "pending_annotation"), 
-            "annotation_status": chunk_data_for_insert.get("annotation_status"),
-            "r2r_status": chunk_data_for_insert.get("r2r_status"),
-            "annotation_tags": chunk_data_for_insert.get("annotation_tags"), # Adicionado
-            "keep": chunk_data_for_insert.get("keep") # Adicionado
-        }
-        insert_data_cleaned = {k: v for k, v in insert_data.items() if v is not None}
-        
-        try:
-            resp_insert = supabase_client.table("documents").insert(insert_data_cleaned).execute()
-            logger.info(f"[ensure_chunk_exists] Chunk {chunk_id_supabase} inserido no Supabase.")
-            if resp_insert.data:
-                return resp_insert.data[0] 
-            else:
-                resp_after_insert = supabase_client.table("documents").select("id").eq("id", chunk_id_supabase).limit(1).execute()
-                if resp_after_insert.data:
-                    return {"id": chunk_id_supabase, "exists": True, "inserted_now": True} # Indica que foi inserido
-                else:
-                    logger.error(f"[ensure_chunk_exists] Chunk {chunk_id_supabase} não encontrado mesmo após tentativa de inserção.")
-                    return None 
-        except Exception as e_insert:
-            logger.error(f"[ensure_chunk_exists] Falha ao inserir chunk {chunk_id_supabase}: {e_insert}", exc_info=True)
-            raise
-    else:
-        logger.warning(f"[ensure_chunk_exists] Chunk {chunk_id_supabase} não encontrado e sem dados para inserção.")
-        return None
+async def _write_status_updates(dal: DocumentsDAL, updates: List[ChunkUpdate], release_claims: bool = True) -> None:
+    if not updates:
+        return
+    try:
+        updated = await dal.bulk_update(updates, release_claims=release_claims)
+        logger.info(f"Status do Supabase atualizado em lote para {updated} de {len(updates)} chunks.")
+    except DALError as e:
+        # Sem o status gravado, os chunks continuam pendentes e voltam a ser
+        # reservados quando a reserva expirar; o lote seguinte pode prosseguir.
+        logger.error(f"Falha ao atualizar em lote o status de {len(updates)} chunks no Supabase: {e}", exc_info=True)
 
 # ---------------------------------------------------------------------------
 # Chunk‑level helpers
 # ---------------------------------------------------------------------------
 
+def _load_annotator_agent() -> type[AnnotatorAgent]:
+    """Importa o AnnotatorAgent sob demanda, para que jobs com
+    `--skip_annotation` não paguem a importação do CrewAI/langchain."""
+    from agents.annotator_agent import AnnotatorAgent
+
+    return AnnotatorAgent
+
+
 @tenacity_retry()
 def _run_annotation(annotator: AnnotatorAgent, chunk_input_dict: Dict[str, Any]) -> Optional[ChunkOut]:
     # chunk_input_dict deve conter 'text_content', 'id' (supabase_id), 'metadata'
@@ -334,12 +218,15 @@ async def _upload_document_batch_to_r2r(
     list_of_supabase_chunk_dicts: List[Dict[str, Any]],
     # document_metadata_for_r2r_parent: Dict[str, Any], # Metadados para o Documento R2R PAI
     supabase_chunk_ids_in_batch: List[str] # IDs dos chunks Supabase que compõem este lote R2R
-):
+) -> List[ChunkUpdate]:
+    """Envia os chunks ao R2R e retorna as atualizações de status resultantes, para gravação em lote."""
+    # Indexado por ID: uma atualização posterior do mesmo chunk substitui a anterior
+    status_updates: Dict[str, ChunkUpdate] = {}
     if not r2r_client:
         logger.warning("R2R client não está disponível. Pulando upload para R2R.")
         for supabase_chunk_id in supabase_chunk_ids_in_batch:
-            _update_chunk_status_supabase(supabase_chunk_id, {"r2r_status": "failed_client_unavailable", "status": "processing_failed", "r2r_error": "R2R client not available"})
-        return # Não retorna valor, a atualização de status é o efeito colateral
+            status_updates[supabase_chunk_id] = _status_update(supabase_chunk_id, {"r2r_status": "failed_client_unavailable", "status": "processing_failed", "r2r_error": "R2R client not available"})
+        return list(status_updates.values())
 
     logger.info(f"Preparando para enviar {len(list_of_supabase_chunk_dicts)} chunks para R2R para o documento R2R PAI originado de '{document_id_from_source}'.")
 
@@ -350,7 +237,7 @@ async def _upload_document_batch_to_r2r(
 
         if not chunk_text or chunk_text.isspace():
             logger.warning(f"Chunk Supabase ID {supabase_id} tem texto vazio. NÃO SERÁ ENVIADO para R2R.")
-            _update_chunk_status_supabase(supabase_id, {"r2r_status": "skipped_empty_content", "status": "processing_failed", "r2r_error": "Chunk content is empty"})
+            status_updates[supabase_id] = _status_update(supabase_id, {"r2r_status": "skipped_empty_content", "status": "processing_failed", "r2r_error": "Chunk content is empty"})
             continue
 
         # Montar metadados para o R2R DocumentChunk
@@ -397,8 +284,8 @@ async def _upload_document_batch_to_r2r(
     if not r2r_document_chunks_to_send:
         logger.warning(f"Nenhum chunk válido para enviar ao R2R para o documento fonte ID '{document_id_from_source}' após a filtragem de vazios.")
         for supabase_chunk_id in supabase_chunk_ids_in_batch: # Marcar todos os originais do lote
-            _update_chunk_status_supabase(supabase_chunk_id, {"r2r_status": "skipped_no_valid_chunks_in_batch", "status": "processed_with_r2r_skip", "r2r_error": "No valid chunks in the batch to send to R2R"})
-        return
+            status_updates[supabase_chunk_id] = _status_update(supabase_chunk_id, {"r2r_status": "skipped_no_valid_chunks_in_batch", "status": "processed_with_r2r_skip", "r2r_error": "No valid chunks in the batch to send to R2R"})
+        return list(status_updates.values())
 
     try:
         # O `document_id_original` aqui é o ID do documento R2R "pai".
@@ -421,13 +308,15 @@ async def _upload_document_batch_to_r2r(
             sup_id = str(supabase_chunk_dict_sent.get("id"))
             # Apenas atualiza aqueles que tinham conteúdo (os vazios já foram marcados)
             if supabase_chunk_dict_sent.get("content", "").strip():
-                 _update_chunk_status_supabase(sup_id, {"r2r_status": "success", "status": "completed", "indexed_at": datetime.now(timezone.utc).isoformat(), "r2r_error": None})
+                 status_updates[sup_id] = _status_update(sup_id, {"r2r_status": "success", "status": "completed", "indexed_at": datetime.now(timezone.utc).isoformat(), "r2r_error": None})
 
     except Exception as e:
         logger.error(f"Erro ao enviar lote para R2R (documento fonte ID '{document_id_from_source}'): {e}")
         logger.error(traceback.format_exc())
         for supabase_chunk_id in supabase_chunk_ids_in_batch: # Marcar todos do lote original como falha
-            _update_chunk_status_supabase(supabase_chunk_id, {"r2r_status": "failed_upload", "status": "processing_failed", "r2r_error": str(e)})
+            status_updates[supabase_chunk_id] = _status_update(supabase_chunk_id, {"r2r_status": "failed_upload", "status": "processing_failed", "r2r_error": str(e)})
+
+    return list(status_updates.values())
 
 # ---------------------------------------------------------------------------
 # Processa um único chunk
@@ -453,8 +342,7 @@ def process_single_chunk(
 
     logger.info(f"Iniciando processamento (anotação) do chunk Supabase ID: {chunk_supabase_id}")
 
-    # Não precisamos de ensure_chunk_exists aqui se fetch_pending_chunks_from_supabase já retorna dados completos.
-    # A lógica de ensure_chunk_exists era mais para o pipeline de ingestão.
+    # fetch_pending_chunks_from_supabase já retorna os dados completos do chunk.
     # Aqui, assumimos que chunk_initial_data é o estado atual do Supabase.
 
     current_annotation_status = chunk_initial_data.get("annotation_status")
@@ -540,25 +428,40 @@ def process_single_chunk(
     if annotation_status_val != current_annotation_status : # Se o status da anotação mudou
         chunk_initial_data["annotated_at"] = datetime.now(timezone.utc).isoformat()
 
-    # Atualiza o status no Supabase com os resultados da fase de anotação
-    _update_chunk_status_supabase(chunk_supabase_id, {
-        "annotation_status": chunk_initial_data["annotation_status"],
-        "annotated_at": chunk_initial_data.get("annotated_at"), # Pode ser None se não mudou
-        "keep": chunk_initial_data["keep"],
-        "annotation_tags": chunk_initial_data["annotation_tags"],
-        "annotation_reason": chunk_initial_data["annotation_reason"],
-        # "status" será definido por _update_chunk_status_supabase baseado em annotation_status
-    })
-    
+    # O status no Supabase é gravado em lote por run_pipeline (ver _annotation_status_update)
     logger.info(f"Processamento (fase de anotação) do chunk {chunk_supabase_id} concluído. Keep={chunk_initial_data['keep']}, Status Anotação={chunk_initial_data['annotation_status']}")
     return chunk_initial_data
 
+def _failed_chunk_update(doc_id: str, error: Any) -> ChunkUpdate:
+    """
+    Atualização de um chunk cujo processamento falhou com erro (exceção na thread
+    ou `_processing_error`): marca a anotação como falha e, ao ser gravada, libera
+    a reserva, em vez de deixar o chunk reservado até o fim do lease.
+    """
+    return _status_update(doc_id, {
+        "annotation_status": "annotation_failed",
+        "annotation_reason": f"Erro no processamento: {error}"[:1000],
+    })
+
+def _annotation_status_update(chunk_data: Dict[str, Any]) -> ChunkUpdate:
+    """Atualização de status com os resultados da fase de anotação de um chunk processado."""
+    update = {
+        "annotation_status": chunk_data["annotation_status"],
+        "keep": chunk_data["keep"],
+        "annotation_tags": chunk_data["annotation_tags"],
+        "annotation_reason": chunk_data["annotation_reason"],
+        # "status" será definido por _status_update baseado em annotation_status
+    }
+    if chunk_data.get("annotated_at"): # Só muda se o status da anotação mudou
+        update["annotated_at"] = chunk_data["annotated_at"]
+    return _status_update(str(chunk_data["id"]), update)
+
 # ---------------------------------------------------------------------------
 # Pipeline principal
 # ---------------------------------------------------------------------------
 
 async def run_pipeline(
-    supabase_client: Client,
+    dal: DocumentsDAL,
     r2r_client_wrapper: R2RClientWrapper, # Não usado diretamente, mas o global r2r_client é
     gdrive_service: Any, 
     args: argparse.Namespace
@@ -568,7 +471,7 @@ async def run_pipeline(
     annotator_service = None
     if not args.skip_annotation:
         try:
-            annotator_service = AnnotatorAgent() 
+            annotator_service = _load_annotator_agent()()
             logger.info("AnnotatorAgent instanciado com sucesso.")
         except Exception as e_annotator:
             logger.error(f"Falha ao inicializar AnnotatorAgent: {e_annotator}", exc_info=True)
@@ -589,6 +492,9 @@ async def run_pipeline(
     total_batches_processed: int = 0
     overall_start_time = time.time()
     gdrive_file_id_cache = TTLCache(maxsize=1000, ttl=3600) # Usado por fetch_pending_chunks...
+    # Chunks que falharam nesta execução voltam a ficar pendentes (annotation_failed);
+    # um lote só com eles indica que não há mais trabalho novo.
+    failed_ids_in_run: set = set()
     
     while True:
         batch_start_time = time.time()
@@ -598,7 +504,7 @@ async def run_pipeline(
         # 1. Buscar chunks pendentes do Supabase
         # fetch_pending_chunks_from_supabase já usa os nomes de coluna corretos internamente
         chunks_to_process_this_batch = await fetch_pending_chunks_from_supabase(
-            supabase_client,
+            dal,
             limit=args.batch_size,
             document_id_to_reprocess=args.source_doc_id_to_reprocess, # Passa o nome correto do arg
             gdrive_file_id_cache=gdrive_file_id_cache,
@@ -609,10 +515,18 @@ async def run_pipeline(
             logger.info("Nenhum chunk pendente encontrado para o lote. Finalizando o processamento.")
             break
 
+        batch_ids = {str(chunk.get("id")) for chunk in chunks_to_process_this_batch if isinstance(chunk, dict)}
+        if batch_ids and batch_ids <= failed_ids_in_run:
+            logger.info(f"Lote {total_batches_processed}: restam apenas {len(batch_ids)} chunks que já falharam nesta execução. Finalizando o processamento.")
+            # Atualizações sem colunas só liberam a reserva.
+            await _write_status_updates(dal, [ChunkUpdate(id=chunk["id"]) for chunk in chunks_to_process_this_batch if isinstance(chunk, dict) and "id" in chunk])
+            break
+
         logger.info(f"Lote {total_batches_processed}: Encontrados {len(chunks_to_process_this_batch)} chunks para processar (fase de anotação).")
 
         # 2. Fase de Anotação (paralela)
         annotated_chunks_for_r2r: List[Dict[str, Any]] = []
+        annotation_updates: List[ChunkUpdate] = []
         errors_in_this_batch_annotation = 0
 
         with ThreadPoolExecutor(max_workers=args.max_workers, thread_name_prefix="AnnotWorker") as executor:
@@ -631,6 +545,12 @@ async def run_pipeline(
                     if processed_chunk_dict.get("_processing_error"): # Verifica erro interno de process_single_chunk
                         logger.error(f"Erro explícito de process_single_chunk para {supabase_id_processed}: {processed_chunk_dict['_processing_error']}")
                         errors_in_this_batch_annotation +=1
+                        failed_ids_in_run.add(supabase_id_processed)
+                        annotation_updates.append(_failed_chunk_update(supabase_id_processed, processed_chunk_dict["_processing_error"]))
+                    else:
+                        annotation_updates.append(_annotation_status_update(processed_chunk_dict))
+                        if processed_chunk_dict.get("annotation_status") == "annotation_failed":
+                            failed_ids_in_run.add(supabase_id_processed)
                     
                     # Adiciona à lista para R2R se keep=True e não houve erro explícito
                     if processed_chunk_dict.get("keep") is True and not processed_chunk_dict.get("_processing_error"):
@@ -641,8 +561,17 @@ async def run_pipeline(
                 except Exception as e_thread:
                     logger.error(f"Erro INESPERADO ao processar chunk Supabase ID {supabase_id_processed} na thread de anotação: {e_thread}", exc_info=True)
                     errors_in_this_batch_annotation +=1
+                    failed_ids_in_run.add(supabase_id_processed)
+                    annotation_updates.append(_failed_chunk_update(supabase_id_processed, e_thread))
         
         total_errors_in_annotation_phase_run += errors_in_this_batch_annotation
+
+        # Grava os resultados da anotação numa única chamada. Os chunks que seguem
+        # para o R2R continuam reservados até a gravação do status da indexação.
+        index_in_r2r = not args.skip_r2r_indexing
+        ids_for_r2r = {str(chunk["id"]) for chunk in annotated_chunks_for_r2r} if index_in_r2r else set()
+        await _write_status_updates(dal, [u for u in annotation_updates if u.id not in ids_for_r2r])
+        await _write_status_updates(dal, [u for u in annotation_updates if u.id in ids_for_r2r], release_claims=False)
         logger.info(f"Lote {total_batches_processed} - Fase de Anotação Concluída: {len(chunks_to_process_this_batch)} tentados, {total_chunks_successfully_annotated_in_run} acumulado sucesso, {errors_in_this_batch_annotation} erros neste lote.")
 
         # 3. Fase de Indexação R2R (agrupado por documento original)
@@ -652,6 +581,7 @@ async def run_pipeline(
             # Agrupa chunks pelo document_id (que é o ID do documento fonte no Supabase)
             # Este document_id será usado para gerar/obter o ID do Documento R2R "Pai"
             chunks_grouped_by_source_doc_id: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            r2r_status_updates: List[ChunkUpdate] = []
             for chunk_dict_for_r2r in annotated_chunks_for_r2r:
                 # Usa o 'document_id' do Supabase (que é o ID do documento fonte) para agrupar
                 source_doc_id = str(chunk_dict_for_r2r.get("document_id", "")) # Corrigido
@@ -666,12 +596,17 @@ async def run_pipeline(
                 
                 supabase_ids_for_this_r2r_doc = [str(ch.get("id")) for ch in chunks_for_this_r2r_doc]
 
-                await _upload_document_batch_to_r2r(
+                r2r_status_updates.extend(await _upload_document_batch_to_r2r(
                     document_id_from_source=r2r_parent_doc_source_id, # ID do documento fonte para R2R nomear/agrupar
                     list_of_supabase_chunk_dicts=chunks_for_this_r2r_doc,
                     supabase_chunk_ids_in_batch=supabase_ids_for_this_r2r_doc
-                )
+                ))
                 total_chunks_submitted_to_r2r_in_run += num_chunks_for_this_parent # Contar os que foram para a função de upload
+
+            failed_ids_in_run.update(
+                str(u.id) for u in r2r_status_updates if str(u.changes.get("r2r_status", "")).startswith("failed")
+            )
+            await _write_status_updates(dal, r2r_status_updates)
         elif args.skip_r2r_indexing:
             logger.info(f"Lote {total_batches_processed}: Indexação R2R pulada por flag.")
         else:
@@ -698,70 +633,39 @@ async def run_pipeline(
     logger.info("Pipeline finalizado.")
 
 async def fetch_pending_chunks_from_supabase(
-    client: Client,
+    dal: DocumentsDAL,
     limit: int = 10,
     document_id_to_reprocess: Optional[str] = None, # ID do documento Supabase para reprocessar
     gdrive_file_id_cache: Optional[TTLCache] = None, # Não usado diretamente nesta função, mas pode ser útil em `run_pipeline`
     reprocess_supabase_annotations: bool = False,
 ) -> List[Dict[str, Any]]:
-    logger.info(f"Buscando chunks pendentes: limit={limit}, document_id_to_reprocess={document_id_to_reprocess}, reprocess_supabase_annotations={reprocess_supabase_annotations}")
-    
-    # Colunas a serem selecionadas. Usar nomes corretos.
-    select_columns = (
-        "id, document_id, content, metadata, annotation_tags, keep, " # Corrigido: chunk_content -> content, original_document_id -> document_id, tags -> annotation_tags
-        "annotation_reason, token_count, created_at, updated_at, "
-        "annotation_status, status, " # Removido indexing_status, r2r_indexed_at (usar r2r_status)
-        "r2r_document_id, r2r_status, r2r_error, chunk_index, annotated_at" # Adicionado annotated_at para consistência
-    )
-    query = client.table("documents").select(select_columns, count="exact") # Adicionado count="exact"
-
-    if document_id_to_reprocess:
-        # Filtra pelo document_id do Supabase.
-        # Se document_id_to_reprocess é um GDrive ID, precisaria de um passo anterior para mapeá-lo para document_ids do Supabase.
-        # Assumindo aqui que document_id_to_reprocess é o Supabase document_id.
-        query = query.eq("document_id", document_id_to_reprocess) 
-        logger.info(f"Buscando todos os chunks para reprocessamento do Supabase document_id: {document_id_to_reprocess}")
-        # Não filtra por status "reprocessed_skipped_all" aqui, pois o reprocessamento pode querer pegar tudo.
-        # A lógica de pular ou não o reprocessamento fica em process_single_chunk.
-    else:
-        # Construindo a query OR
-        # Condições para buscar chunks que precisam de atenção (anotação ou indexação)
-        # ou que falharam em etapas anteriores.
-        # CORREÇÃO: Remover vírgulas do final de cada string de filtro individual.
-        filters = (
-            "status.eq.pending_annotation", 
-            "status.eq.pending_indexing",
-            "annotation_status.is.null", 
-            "annotation_status.eq.pending", 
-            "annotation_status.eq.annotation_failed", 
-            "r2r_status.is.null", 
-            "r2r_status.eq.pending", 
-            "r2r_status.like.failed%" 
-        )
-        
-        if reprocess_supabase_annotations:
-            logger.warning(f"REPROCESS_SUPABASE_ANNOTATIONS ativado. Buscando chunks com annotation_status != 'done' e keep != False, ignorando status de R2R.")
-            # Adicionando condições para re-anotação
-            filters += ("annotation_status.ne.done", "keep.ne.False")
-        
-        query = query.or_(",".join(filters)) # A junção com vírgula aqui é a forma correta de passar para o .or_()
+    """
+    Busca o próximo lote de chunks a processar.
 
-    query = query.order("updated_at", desc=False).limit(limit) # Processar os mais antigos primeiro
+    No modo normal, os chunks pendentes (`needs_processing`) são reservados para
+    este worker (`claim_pending`), para que outras instâncias não os peguem ao
+    mesmo tempo. Nos modos de reprocessamento, os chunks são apenas lidos.
+    """
+    logger.info(f"Buscando chunks pendentes: limit={limit}, document_id_to_reprocess={document_id_to_reprocess}, reprocess_supabase_annotations={reprocess_supabase_annotations}")
 
     try:
-        response = await asyncio.to_thread(query.execute) 
-    except PostgrestAPIError as e:
-        logger.error(f"Erro PostgrestAPIError ao buscar chunks pendentes: {e.message} (Code: {e.code}, Details: {e.details}, Hint: {e.hint})")
-        return []
+        if document_id_to_reprocess:
+            # Assumindo aqui que document_id_to_reprocess é o Supabase document_id.
+            # A lógica de pular ou não o reprocessamento fica em process_single_chunk.
+            logger.info(f"Buscando todos os chunks para reprocessamento do Supabase document_id: {document_id_to_reprocess}")
+            chunks = await dal.select_pending(limit, document_id=document_id_to_reprocess)
+        elif reprocess_supabase_annotations:
+            logger.warning(f"REPROCESS_SUPABASE_ANNOTATIONS ativado. Buscando chunks com annotation_status != 'done' e keep != False, ignorando status de R2R.")
+            chunks = await dal.select_pending(limit, include_reannotation=True)
+        else:
+            chunks = await dal.claim_pending(limit)
     except Exception as e:
-        logger.error(f"Erro inesperado ao buscar chunks pendentes: {e}", exc_info=True)
+        logger.error(f"Erro ao buscar chunks pendentes: {e}", exc_info=True)
         return []
 
-    if response.data:
-        logger.info(f"Encontrados {response.count if response.count is not None else len(response.data)} chunks no Supabase que correspondem aos critérios (retornando {len(response.data)}).")
-        # Lógica de gdrive_file_id_cache removida daqui, pois não parece ser o local correto para popular/usar.
-        # Se necessário, deve ser tratado no nível de ingestão ou antes de chamar esta função.
-        return response.data
+    if chunks:
+        logger.info(f"Encontrados {len(chunks)} chunks no Supabase que correspondem aos critérios.")
+        return chunks
     else:
         logger.info("Nenhum chunk pendente encontrado no Supabase com os critérios atuais.")
         return []
@@ -770,6 +674,16 @@ async def fetch_pending_chunks_from_supabase(
 # CLI
 # ---------------------------------------------------------------------------
 
+async def _run_with_dal(args: argparse.Namespace):
+    # Uma única DAL (e um único pool de conexões) para toda a execução
+    async with create_documents_dal() as dal:
+        await run_pipeline(
+            dal=dal,
+            r2r_client_wrapper=r2r_client, # r2r_client é o wrapper global
+            gdrive_service=None, # gdrive_service não é usado diretamente no pipeline de chunks
+            args=args
+        )
+
 def main():
     logger.info("--- SCRIPT VERSION: 2024-05-16 12:00 PM ---") # Adicionando log de versão
     start_time_main = time.time()
@@ -792,12 +706,7 @@ def main():
 
     try:
         logger.info("Executando ETL com argumentos: %s", args)
-        asyncio.run(run_pipeline(
-            supabase_client=supabase_client, 
-            r2r_client_wrapper=r2r_client, # r2r_client é o wrapper global   
-            gdrive_service=None, # gdrive_service não é usado diretamente no pipeline de chunks
-            args=args
-        ))
+        asyncio.run(_run_with_dal(args))
     except KeyboardInterrupt:
         logger.info("Processo interrompido pelo usuário.")
     except Exception as e_main:
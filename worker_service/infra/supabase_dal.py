@@ -0,0 +1,423 @@
+"""
+Camada de acesso assíncrona às tabelas do pipeline (hoje, `documents`).
+
+Substitui o uso do cliente síncrono supabase-py a partir de threads: todas as
+chamadas do worker passam por um único pool de conexões keep-alive, dentro do
+event loop, com operações em lote:
+
+- `select_pending`: chunks pendentes (ou todos de um documento, para reprocessar).
+- `claim_pending`: reserva chunks pendentes para este worker (SKIP LOCKED), de
+  modo que várias instâncias não processem o mesmo chunk.
+- `bulk_update`: atualizações de status diferentes por chunk numa só chamada.
+- `insert_chunks`: inserção em lotes.
+
+Há duas implementações com a mesma interface:
+
+- `PostgrestDocumentsDAL`: fala com o PostgREST do Supabase por um único
+  `httpx.AsyncClient` (HTTP/2 por padrão, com pool limitado).
+- `AsyncpgDocumentsDAL`: fala direto com o Postgres por um pool do asyncpg,
+  usado quando `SUPABASE_DB_DSN` está configurado e o asyncpg está instalado.
+
+Ambas usam as funções `claim_pending_documents` e `bulk_update_documents`
+(ver supabase/migrations/0004_worker_claims_and_bulk_update.sql).
+"""
+
+import json
+import logging
+import os
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import httpx
+
+from .resilience import RetryHandler
+
+try:
+    import asyncpg
+except ImportError:  # asyncpg é opcional; sem ele, só o backend PostgREST
+    asyncpg = None
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTS_TABLE = "documents"
+
+# Colunas lidas pelo pipeline de anotação/indexação
+PIPELINE_COLUMNS = (
+    "id", "document_id", "content", "metadata", "annotation_tags", "keep",
+    "annotation_reason", "token_count", "created_at", "updated_at",
+    "annotation_status", "status", "r2r_document_id", "r2r_status",
+    "r2r_error", "chunk_index", "annotated_at",
+)
+
+# Colunas que bulk_update_documents sabe atualizar
+UPDATABLE_COLUMNS = frozenset({
+    "annotation_status", "annotated_at", "keep", "annotation_tags",
+    "indexing_status", "indexed_at", "annotation_reason", "status",
+    "r2r_status", "r2r_document_id", "r2r_indexed_at", "r2r_error",
+})
+
+# Colunas aceitas em insert_chunks (também evita nomes arbitrários no SQL do asyncpg)
+INSERTABLE_COLUMNS = frozenset({
+    "id", "document_id", "content", "metadata", "token_count", "chunk_index",
+    "status", "keep", "annotation_status", "annotation_tags", "annotation_reason",
+    "indexing_status", "r2r_status",
+})
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_LEASE_SECONDS = 900
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+RETRY_EXCEPTIONS = (httpx.TransportError, ConnectionError, TimeoutError)
+
+
+class DALError(Exception):
+    """
+    Erro retornado pelo banco (ou pelo PostgREST) numa operação da DAL, ou falha
+    de transporte (conexão, timeout) que persistiu depois das retentativas.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RetryableDALError(DALError):
+    """Erro transitório (HTTP 429/5xx); a operação é repetida pelo RetryHandler."""
+
+
+@dataclass(frozen=True)
+class ChunkUpdate:
+    """
+    Alterações de status de um chunk da tabela `documents`.
+
+    Attributes:
+        id (Any): Valor da coluna `id` do chunk.
+        changes (Dict[str, Any]): Colunas a alterar. Só as de `UPDATABLE_COLUMNS`
+            são enviadas; as demais são ignoradas.
+    """
+
+    id: Any
+    changes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_payload(self) -> Dict[str, Any]:
+        payload = {k: v for k, v in self.changes.items() if k in UPDATABLE_COLUMNS}
+        payload["id"] = self.id
+        return payload
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def _batches(items: Sequence[Any], batch_size: int) -> Iterable[Sequence[Any]]:
+    for i in range(0, len(items), batch_size):
+        yield items[i:i + batch_size]
+
+
+def _check_insert_columns(rows: Sequence[Dict[str, Any]]) -> List[str]:
+    columns = sorted({column for row in rows for column in row})
+    unknown = set(columns) - INSERTABLE_COLUMNS
+    if unknown:
+        raise ValueError(f"Colunas não suportadas em insert_chunks: {sorted(unknown)}")
+    return columns
+
+
+class DocumentsDAL(ABC):
+    """Interface comum dos backends. Use como `async with create_documents_dal() as dal:`."""
+
+    def __init__(self, worker_id: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size
+        self.retry_handler = RetryHandler(
+            retries=3, initial_delay=1.0, max_delay=15.0,
+            retry_exceptions=RETRY_EXCEPTIONS + (RetryableDALError,),
+        )
+
+    async def _execute(self, operation: Any, *args: Any, **kwargs: Any) -> Any:
+        """Executa `operation` com retentativas; falhas de transporte que
+        persistem viram `DALError`, como os erros do banco."""
+        try:
+            return await self.retry_handler.execute_async(operation, *args, **kwargs)
+        except RETRY_EXCEPTIONS as e:
+            raise DALError(f"Falha de conexão com o Supabase: {e!r}") from e
+
+    async def __aenter__(self) -> "DocumentsDAL":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @abstractmethod
+    async def select_pending(
+        self,
+        limit: int,
+        document_id: Optional[str] = None,
+        include_reannotation: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca chunks com `needs_processing`, dos mais antigos para os mais novos.
+
+        Args:
+            limit: Número máximo de chunks.
+            document_id: Se informado, retorna todos os chunks desse documento
+                (coluna `document_id`), pendentes ou não.
+            include_reannotation: Inclui também chunks com anotação diferente de
+                'done' ou `keep` diferente de False.
+        """
+
+    @abstractmethod
+    async def claim_pending(self, limit: int, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> List[Dict[str, Any]]:
+        """
+        Reserva até `limit` chunks pendentes para este worker e os retorna.
+
+        A reserva dura `lease_seconds`; `bulk_update` a libera. Chunks reservados
+        por outro worker (com reserva vigente) não são retornados.
+        """
+
+    @abstractmethod
+    async def _bulk_update_batch(self, payloads: List[Dict[str, Any]], release_claims: bool) -> int:
+        ...
+
+    @abstractmethod
+    async def _insert_batch(self, rows: List[Dict[str, Any]]) -> None:
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Fecha o pool de conexões."""
+
+    async def bulk_update(self, updates: Iterable[ChunkUpdate], release_claims: bool = True) -> int:
+        """
+        Aplica `updates` em lotes de `batch_size`. Retorna o número de linhas atualizadas.
+
+        Com `release_claims=False`, os chunks continuam reservados (para uma
+        etapa seguinte do mesmo lote, como a indexação no R2R).
+        """
+        payloads = [update.to_payload() for update in updates]
+        updated = 0
+        for batch in _batches(payloads, self.batch_size):
+            updated += await self._execute(self._bulk_update_batch, list(batch), release_claims)
+        return updated
+
+    async def insert_chunks(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """Insere `rows` em lotes de `batch_size`. Retorna o número de linhas inseridas."""
+        if not rows:
+            return 0
+        _check_insert_columns(rows)
+        for batch in _batches(rows, self.batch_size):
+            await self._execute(self._insert_batch, list(batch))
+        return len(rows)
+
+
+class PostgrestDocumentsDAL(DocumentsDAL):
+    """
+    Backend PostgREST: um único `httpx.AsyncClient` compartilhado por todas as
+    chamadas, com conexões keep-alive e HTTP/2 (multiplexa as requisições
+    concorrentes em poucas conexões).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.client = client or httpx.AsyncClient(
+            base_url=f"{url.rstrip('/')}/rest/v1",
+            headers={
+                "apikey": key,
+                "Authorization": f"Bearer {key}",
+                "Content-Type": "application/json",
+            },
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+        )
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        response = await self.client.request(method, path, **kwargs)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableDALError(f"{method} {path}: {response.status_code} {response.text}", response.status_code)
+        if response.status_code >= 400:
+            raise DALError(f"{method} {path}: {response.status_code} {response.text}", response.status_code)
+        return response
+
+    async def _get_json(self, method: str, path: str, **kwargs: Any) -> Any:
+        response = await self._execute(self._request, method, path, **kwargs)
+        return response.json()
+
+    async def select_pending(
+        self,
+        limit: int,
+        document_id: Optional[str] = None,
+        include_reannotation: bool = False,
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {
+            "select": ",".join(PIPELINE_COLUMNS),
+            "order": "updated_at.asc",
+            "limit": limit,
+        }
+        if document_id:
+            params["document_id"] = f"eq.{document_id}"
+        elif include_reannotation:
+            params["or"] = "(needs_processing.is.true,annotation_status.neq.done,keep.neq.false)"
+        else:
+            params["needs_processing"] = "is.true"
+        return await self._get_json("GET", f"/{DOCUMENTS_TABLE}", params=params)
+
+    async def claim_pending(self, limit: int, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> List[Dict[str, Any]]:
+        return await self._get_json(
+            "POST",
+            "/rpc/claim_pending_documents",
+            params={"select": ",".join(PIPELINE_COLUMNS)},
+            json={"p_worker_id": self.worker_id, "p_limit": limit, "p_lease_seconds": lease_seconds},
+        )
+
+    async def _bulk_update_batch(self, payloads: List[Dict[str, Any]], release_claims: bool) -> int:
+        response = await self._request(
+            "POST",
+            "/rpc/bulk_update_documents",
+            content=json.dumps({"p_updates": payloads, "p_release_claims": release_claims}, default=str),
+        )
+        return int(response.json())
+
+    async def _insert_batch(self, rows: List[Dict[str, Any]]) -> None:
+        await self._request(
+            "POST",
+            f"/{DOCUMENTS_TABLE}",
+            content=json.dumps(rows, default=str),
+            # missing=default: colunas ausentes numa linha usam o DEFAULT da tabela
+            headers={"Prefer": "return=minimal,missing=default"},
+            params={"columns": ",".join(_check_insert_columns(rows))},
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class AsyncpgDocumentsDAL(DocumentsDAL):
+    """Backend Postgres direto, por um pool do asyncpg criado em `connect()`."""
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = DEFAULT_MAX_CONNECTIONS, **kwargs: Any):
+        if asyncpg is None:
+            raise ImportError("AsyncpgDocumentsDAL requer o pacote asyncpg (`pip install asyncpg`).")
+        super().__init__(**kwargs)
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.pool = None
+
+    @staticmethod
+    async def _init_connection(connection) -> None:
+        for json_type in ("json", "jsonb"):
+            await connection.set_type_codec(json_type, encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+
+    async def connect(self) -> "AsyncpgDocumentsDAL":
+        if self.pool is None:
+            # statement_cache_size=0: compatível com o pooler do Supabase (pgbouncer em modo transaction)
+            self.pool = await asyncpg.create_pool(
+                self.dsn, min_size=self.min_size, max_size=self.max_size,
+                init=self._init_connection, statement_cache_size=0,
+            )
+        return self
+
+    async def __aenter__(self) -> "AsyncpgDocumentsDAL":
+        return await self.connect()
+
+    async def _fetch(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        await self.connect()
+        async with self.pool.acquire() as connection:
+            rows = await connection.fetch(query, *args)
+        return [dict(row) for row in rows]
+
+    async def select_pending(
+        self,
+        limit: int,
+        document_id: Optional[str] = None,
+        include_reannotation: bool = False,
+    ) -> List[Dict[str, Any]]:
+        if document_id:
+            condition, args = "document_id = $2", [document_id]
+        elif include_reannotation:
+            condition, args = "needs_processing OR annotation_status IS DISTINCT FROM 'done' OR keep IS DISTINCT FROM FALSE", []
+        else:
+            condition, args = "needs_processing", []
+        query = f"""
+            SELECT {", ".join(PIPELINE_COLUMNS)}
+            FROM {DOCUMENTS_TABLE}
+            WHERE {condition}
+            ORDER BY updated_at
+            LIMIT $1
+        """
+        return await self._execute(self._fetch, query, limit, *args)
+
+    async def claim_pending(self, limit: int, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> List[Dict[str, Any]]:
+        query = f"SELECT {', '.join(PIPELINE_COLUMNS)} FROM claim_pending_documents($1, $2, $3)"
+        return await self._execute(self._fetch, query, self.worker_id, limit, lease_seconds)
+
+    async def _bulk_update_batch(self, payloads: List[Dict[str, Any]], release_claims: bool) -> int:
+        await self.connect()
+        async with self.pool.acquire() as connection:
+            return await connection.fetchval(
+                "SELECT bulk_update_documents($1::jsonb, $2)",
+                json.loads(json.dumps(payloads, default=str)),
+                release_claims,
+            )
+
+    async def _insert_batch(self, rows: List[Dict[str, Any]]) -> None:
+        columns = ", ".join(_check_insert_columns(rows))
+        query = f"""
+            INSERT INTO {DOCUMENTS_TABLE} ({columns})
+            SELECT {columns} FROM jsonb_populate_recordset(NULL::{DOCUMENTS_TABLE}, $1::jsonb)
+        """
+        await self.connect()
+        async with self.pool.acquire() as connection:
+            await connection.execute(query, json.loads(json.dumps(rows, default=str)))
+
+    async def close(self) -> None:
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+
+def create_documents_dal(**kwargs: Any) -> DocumentsDAL:
+    """
+    Cria a DAL a partir das variáveis de ambiente.
+
+    - `SUPABASE_DB_DSN` (com asyncpg instalado): backend Postgres direto.
+    - Caso contrário, `SUPABASE_URL` e `SUPABASE_SERVICE_KEY`: backend PostgREST.
+      `SUPABASE_HTTP2=false` força HTTP/1.1.
+    - `SUPABASE_MAX_CONNECTIONS`: tamanho máximo do pool (padrão 20).
+
+    Raises:
+        ValueError: Se nenhum backend estiver configurado.
+    """
+    max_connections = int(os.getenv("SUPABASE_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS))
+    dsn = os.getenv("SUPABASE_DB_DSN")
+    if dsn:
+        if asyncpg is not None:
+            logger.info("DAL do Supabase usando Postgres direto (asyncpg).")
+            return AsyncpgDocumentsDAL(dsn, max_size=max_connections, **kwargs)
+        logger.warning("SUPABASE_DB_DSN configurado, mas asyncpg não está instalado. Usando PostgREST.")
+
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_KEY")
+    if not url or not key:
+        raise ValueError("Configure SUPABASE_DB_DSN ou SUPABASE_URL e SUPABASE_SERVICE_KEY.")
+    http2 = os.getenv("SUPABASE_HTTP2", "true").lower() not in {"0", "false", "no"}
+    logger.info(f"DAL do Supabase usando PostgREST (http2={http2}, max_connections={max_connections}).")
+    return PostgrestDocumentsDAL(url, key, http2=http2, max_connections=max_connections, **kwargs)